@@ -59,6 +59,9 @@ Item {
     property var threeDState: ({})
     property var flowTelemetry: ({})
     property var receiverTelemetry: ({})
+    // Typed per-frame state (SimulationStateModel) forwarded from main.qml; while
+    // set, rigAnimation follows its notify signals instead of the animation payload
+    property QtObject simulationModel: null
 
     property bool geometryStateReceived: false
     property bool simulationStateReceived: false
@@ -110,7 +113,7 @@ Item {
     function _flushDebouncedBatches() {
         if (!_pendingBatchQueue.length) return
         var merged = ({})
-        for (var i=0;i<_pendingBatchQueue.length;++i){ var b=_pendingBatchQueue[i]; for (var k in b){ if (!b.hasOwnProperty(k)) continue; merged[k]=b[k] } }
+        for (var i=0;i<_pendingBatchQueue.length;++i){ var b=_pendingBatchQueue[i]; for (var k in b){ if (!b.hasOwnProperty(k)) continue; merged[k]=(_isPlainObject(merged[k])&&_isPlainObject(b[k]))?_deepMerge(merged[k],b[k]):b[k] } }
         _pendingBatchQueue = []
         _dispatchBatchedUpdates(merged)
         _batchDispatchTimer = null
@@ -246,12 +249,6 @@ Item {
         snapshot[category] = payload && typeof payload === "object" ? _normaliseState(payload) : payload
         lastUpdateByCategory = snapshot
     }
-    function _acknowledgeBatch(categories, batchId) {
-        if (categories && categories.length) batchFlashOpacity = 1.0
-        var summary = { timestamp: Date.now(), categories: categories ? categories.slice() : [], source: "python" }
-        if (batchId !== undefined && batchId !== null) summary.local_batch_id = batchId
-        batchUpdatesApplied(summary)
-    }
 
     // Batch dispatcher ------------------------------------------
     function applyBatchedUpdates(updates) {
@@ -277,7 +274,7 @@ Item {
     // Category handlers -----------------------------------------
     function applyGeometryUpdates(p){ var n=_normaliseState(p); if(!_isEmptyMap(n)){ geometryState=_deepMerge(geometryState,n); geometryStateReceived=true } _storeLastUpdate('geometry', n); geometryUpdatesApplied(n) }
     function applySimulationUpdates(p){ var n=_normaliseState(p); if(!_isEmptyMap(n)){ simulationState=_deepMerge(simulationState,n); simulationStateReceived=true } if(n.animation) applyAnimationUpdates(n.animation); if(n.threeD) applyThreeDUpdates(n.threeD); _storeLastUpdate('simulation', n) }
-    function applyAnimationUpdates(p){ var d=p||{}; var prev=isRunning; function _num(v,f){ if(v===undefined||v===null) return f; var c=Number(v); return isNaN(c)?f:c } function _bool(v,f){ if(v===undefined||v===null) return f; return !!v } animationTime=_num(d.animation_time, animationTime); animationTime=_num(d.animationTime, animationTime); isRunning=_bool(d.is_running, isRunning); isRunning=_bool(d.isRunning, isRunning); pythonAnimationActive=_bool(d.python_driven, pythonAnimationActive); pythonAnimationActive=_bool(d.pythonDriven, pythonAnimationActive); if(isRunning!==prev) animationToggled(isRunning); _storeLastUpdate('animation', d) }
+    function applyAnimationUpdates(p){ var d=p||{}; var prev=isRunning; function _num(v,f){ if(v===undefined||v===null) return f; var c=Number(v); return isNaN(c)?f:c } function _bool(v,f){ if(v===undefined||v===null) return f; return !!v } animationTime=_num(d.animation_time, animationTime); animationTime=_num(d.animationTime, animationTime); isRunning=_bool(d.is_running, isRunning); isRunning=_bool(d.isRunning, isRunning); pythonAnimationActive=_bool(d.python_driven, pythonAnimationActive); pythonAnimationActive=_bool(d.pythonDriven, pythonAnimationActive); if(!simulationModel) _applyRigPayload(d); if(isRunning!==prev) animationToggled(isRunning); _storeLastUpdate('animation', d) }
     function applyLightingUpdates(p){ _storeLastUpdate('lighting', _normaliseState(p)) }
     function applyMaterialUpdates(p){ var n=_normaliseState(p); previousMaterialsState=_cloneObject(materialsState); materialsState=_deepMerge(materialsState,n); _storeLastUpdate('materials', n); return materialsState }
     function applyEnvironmentUpdates(p){ var n=_normaliseState(p); var base=environmentState&&typeof environmentState==='object'? environmentState : {}; var merged=_deepMerge(base,n); environmentState = Object.keys(base).length===0 ? p : merged; if(n.reflection_enabled!==undefined){ envController.reflectionProbeEnabled=!!n.reflection_enabled; _applyReflectionProbeEnabledOverride(n.reflection_enabled) } _storeLastUpdate('environment', n); _refreshReflectionProbeObject() }
@@ -287,9 +284,18 @@ Item {
     function applyEffectsUpdates(p){ var n=_normaliseState(p); effectsState=_deepMerge(effectsState,n); if(n.effects_bypass!==undefined) _applyEffectsBypassOverride(n.effects_bypass, n.effects_bypass_reason); else if(n.effects_bypass_reason!==undefined) _applyEffectsBypassOverride(effectsBypassRequested, n.effects_bypass_reason); _storeLastUpdate('effects', n) }
     function rollbackMaterials(){ if(_isEmptyMap(previousMaterialsState)) return materialsState; materialsState=_cloneObject(previousMaterialsState); _storeLastUpdate('materials', materialsState); return materialsState }
     function applyRenderSettings(p){ var d=p||{}; if(d.environment) applyEnvironmentUpdates(d.environment); if(d.quality) applyQualityUpdates(d.quality); if(d.effects) applyEffectsUpdates(d.effects); if(d.camera) applyCameraUpdates(d.camera); var direct=_normaliseState(d.render); if(!_isEmptyMap(direct)) renderState=_deepMerge(renderState,direct); _syncRenderSettingsState(); _storeLastUpdate('render', d) }
-    function applyThreeDUpdates(p){ var n=_normaliseState(p); threeDState=_deepMerge(threeDState,n); flowTelemetry=_normaliseState(n.flowNetwork||n.flownetwork); receiverTelemetry=_resolveReceiverTelemetry(n); var reflectionNode=n.reflectionProbe||n.reflection_probe||n.reflection; if(_isPlainObject(reflectionNode)){ if(reflectionNode.enabled!==undefined) _applyReflectionProbeEnabledOverride(reflectionNode.enabled); if(reflectionNode.padding!==undefined) reflectionProbePaddingM = sanitizeReflectionProbePadding(reflectionNode.padding); if(reflectionNode.quality!==undefined){ var qc=String(reflectionNode.quality).toLowerCase(); var known=["low","medium","high","veryhigh"]; if(known.indexOf(qc)!==-1) reflectionProbeQualitySetting=qc; else console.warn("[SimulationRoot] Unknown reflectionProbe quality value:", qc) } if(reflectionNode.refreshMode||reflectionNode.refresh_mode) reflectionProbeRefreshModeSetting=String(reflectionNode.refreshMode||reflectionNode.refresh_mode).toLowerCase(); if(reflectionNode.timeSlicing||reflectionNode.time_slicing) reflectionProbeTimeSlicingSetting=String(reflectionNode.timeSlicing||reflectionNode.time_slicing).toLowerCase() } _storeLastUpdate('threeD', n); _refreshReflectionProbeObject() }
+    function applyThreeDUpdates(p){ var n=_normaliseState(p); threeDState=_deepMerge(threeDState,n); if(n.flowNetwork||n.flownetwork) flowTelemetry=_normaliseState(threeDState.flowNetwork||threeDState.flownetwork); if(n.receiver||n.flowNetwork||n.flownetwork) receiverTelemetry=_resolveReceiverTelemetry(threeDState); var reflectionNode=n.reflectionProbe||n.reflection_probe||n.reflection; if(_isPlainObject(reflectionNode)){ if(reflectionNode.enabled!==undefined) _applyReflectionProbeEnabledOverride(reflectionNode.enabled); if(reflectionNode.padding!==undefined) reflectionProbePaddingM = sanitizeReflectionProbePadding(reflectionNode.padding); if(reflectionNode.quality!==undefined){ var qc=String(reflectionNode.quality).toLowerCase(); var known=["low","medium","high","veryhigh"]; if(known.indexOf(qc)!==-1) reflectionProbeQualitySetting=qc; else console.warn("[SimulationRoot] Unknown reflectionProbe quality value:", qc) } if(reflectionNode.refreshMode||reflectionNode.refresh_mode) reflectionProbeRefreshModeSetting=String(reflectionNode.refreshMode||reflectionNode.refresh_mode).toLowerCase(); if(reflectionNode.timeSlicing||reflectionNode.time_slicing) reflectionProbeTimeSlicingSetting=String(reflectionNode.timeSlicing||reflectionNode.time_slicing).toLowerCase() } _storeLastUpdate('threeD', n); _refreshReflectionProbeObject() }
     function apply3DUpdates(p){ applyThreeDUpdates(p) }
 
+    // Rig motion -------------------------------------------------
+    function _applyRigPayload(d){ if(_isPlainObject(d.frame)) pythonFrameActive=rigController.applyFrameMotion(d.frame)||pythonFrameActive; if(_isPlainObject(d.leverAngles)) pythonLeverAnglesActive=rigController.applyLeverAnglesRadians(d.leverAngles)||pythonLeverAnglesActive; if(_isPlainObject(d.pistonPositions)) pythonPistonsActive=rigController.applyPistonPositions(d.pistonPositions)||pythonPistonsActive }
+    function _applyModelFrame(){ var m=simulationModel; if(!m) return; pythonFrameActive=rigController.applyFrameMotion({ heave: m.heave, roll: m.roll, pitch: m.pitch })||pythonFrameActive }
+    function _applyModelCorners(){ var m=simulationModel; if(!m) return; pythonLeverAnglesActive=rigController.applyLeverAnglesRadians({ fl: m.flLeverAngle, fr: m.frLeverAngle, rl: m.rlLeverAngle, rr: m.rrLeverAngle })||pythonLeverAnglesActive; pythonPistonsActive=rigController.applyPistonPositions({ fl: m.flPistonPosition, fr: m.frPistonPosition, rl: m.rlPistonPosition, rr: m.rrPistonPosition })||pythonPistonsActive }
+    onSimulationModelChanged: { _applyModelFrame(); _applyModelCorners() }
+    Connections { target: root.simulationModel; enabled: !!target; ignoreUnknownSignals: true; function onFrameChanged(){ root._applyModelFrame() } function onFlChanged(){ root._applyModelCorners() } function onFrChanged(){ root._applyModelCorners() } function onRlChanged(){ root._applyModelCorners() } function onRrChanged(){ root._applyModelCorners() } }
+    RigAnimationController { id: rigController; objectName: "rigAnimation" }
+    property alias rigAnimation: rigController
+
     // Legacy aliases
     function updateGeometry(p){ applyGeometryUpdates(p) }
     function updateAnimation(p){ applyAnimationUpdates(p) }
@@ -339,7 +345,7 @@ Item {
     Effects.SceneEnvironmentController { id: envController; objectName: "sceneEnvironment"; fogEnabled:false; fogDensity:0.0; iblLightingEnabled:false; skyboxToggleFlag:false; reflectionProbeEnabled: root.reflectionProbeEnabled; ssaoEnabled: root.ssaoEnabled; ssaoRadius: root.ssaoRadius; ssaoIntensity: root.ssaoIntensity; ssaoSoftness: root.ssaoSoftness; ssaoBias: root.ssaoBias; ssaoDither: root.ssaoDither; ssaoSampleRate: root.ssaoSampleRate }
     Connections { target: envController; function onSsaoEnabledChanged(){ if(ssaoEnabled !== envController.ssaoEnabled) ssaoEnabled = envController.ssaoEnabled } function onSsaoRadiusChanged(){ if(ssaoRadius !== envController.ssaoRadius) ssaoRadius = envController.ssaoRadius } function onSsaoIntensityChanged(){ if(ssaoIntensity !== envController.ssaoIntensity) ssaoIntensity = envController.ssaoIntensity } function onSsaoSoftnessChanged(){ if(ssaoSoftness !== envController.ssaoSoftness) ssaoSoftness = envController.ssaoSoftness } function onSsaoBiasChanged(){ if(ssaoBias !== envController.ssaoBias) ssaoBias = envController.ssaoBias } function onSsaoDitherChanged(){ if(ssaoDither !== envController.ssaoDither) ssaoDither = envController.ssaoDither } function onSsaoSampleRateChanged(){ if(ssaoSampleRate !== envController.ssaoSampleRate) ssaoSampleRate = envController.ssaoSampleRate } }
 
-    QtObject { id: suspensionAssembly; objectName: "sceneSuspensionAssembly"; property bool reflectionProbeEnabled: root.reflectionProbeEnabled; property real reflectionProbePaddingM: root.reflectionProbePaddingM; property real sceneScaleFactor: root.sceneScaleFactor; property real rodWarningThreshold: root.suspensionRodWarningThresholdM; property QtObject reflectionProbe: QtObject { property bool enabled: suspensionAssembly.reflectionProbeEnabled; property bool visible: enabled; property int quality: 0; property int refreshMode: 0; property int timeSlicing: 0 } }
+    QtObject { id: suspensionAssembly; objectName: "sceneSuspensionAssembly"; property bool reflectionProbeEnabled: root.reflectionProbeEnabled; property real reflectionProbePaddingM: root.reflectionProbePaddingM; property real sceneScaleFactor: root.sceneScaleFactor; property real rodWarningThreshold: root.suspensionRodWarningThresholdM; property var leverAngles: rigController.leverAnglesRad; property var pistonPositions: rigController.pistonPositions; property QtObject reflectionProbe: QtObject { property bool enabled: suspensionAssembly.reflectionProbeEnabled; property bool visible: enabled; property int quality: 0; property int refreshMode: 0; property int timeSlicing: 0 } }
     property alias sceneEnvironment: envController
     property alias sceneSuspensionAssembly: suspensionAssembly
 
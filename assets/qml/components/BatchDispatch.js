@@ -93,5 +93,3 @@ function dedupeEffects(list) {
     return out;
 }
 
-// Экспортируем API
-export { isPlainObject, cloneObject, deepMerge, normaliseState, isEmptyMap, CategoryFlags, collectCategoriesMask, expandMask, dedupeEffects };
@@ -428,6 +428,9 @@ Item {
     function refreshSeriesFromBridge() {
         if (!root.telemetryBridge) { root.resetPanel(); return }
         var ids = root.asArray(root.telemetryBridge.activeMetrics || [])
+        // Мост прореживает экспорт до ширины области графика (min/max на пиксель)
+        if (typeof root.telemetryBridge.setExportResolution === "function" && root.chartViewItem.plotArea)
+            root.telemetryBridge.setExportResolution(Math.round(root.chartViewItem.plotArea.width))
         var response = root.telemetryBridge.exportSeries(ids)
         root.oldestTimestamp = Number(response.oldestTimestamp || 0)
         root.latestTimestamp = Number(response.latestTimestamp || 0)
@@ -48,6 +48,8 @@ Item {
 
     // --- Состояние батчей
     property var pendingPythonUpdates: ({})
+    // Типизированное состояние кадра (SimulationStateModel) от Python; пробрасывается в SimulationRoot
+    property QtObject simulationModel: null
     property bool postProcessingBypassed: false
     property string postProcessingBypassReason: ""
     property var _queuedBatchedUpdates: []
@@ -273,13 +275,12 @@ Item {
     function _onRootAckTimeout(id){ var entry=_inflightRootBatches[id]; if(!entry) return; console.warn('[main.qml] Root batch ACK timeout', id, entry.categories); delete _inflightRootBatches[id]; _enqueueRootDebouncedBatch(_reconstructRetryPayload(entry.categories)) }
     function _reconstructRetryPayload(categories){ var p=({}); for(var i=0;i<categories.length;++i){ var c=categories[i]; if(c==='effects') continue; p[c]=({ retry:true }) } return p }
 
-    function batchUpdatesApplied(summary){ // перехват ACK из SimulationRoot и дополнение root_batch_id
+    onBatchUpdatesApplied: function(summary){ // ACK из SimulationRoot: дополняем root_batch_id и снимаем watchdog
         if(!summary || typeof summary!=="object") return
         if(summary.local_batch_id !== undefined && summary.root_batch_id === undefined) {
             // пробрасываем в Python как root_batch_id если отсутствует
             summary.root_batch_id = summary.local_batch_id
         }
-        root.batchUpdatesApplied(summary)
         _onRootAck(summary)
     }
     function _onRootAck(summary){
@@ -361,7 +362,6 @@ Item {
     function applyPneumaticSettings(p){ return _invokeSimulationPanel("applyPneumaticSettings",p) }
     function applySimulationSettings(p){ return _invokeSimulationPanel("applySimulationSettings",p) }
     function applyCylinderSettings(p){ return _invokeSimulationPanel("applyCylinderSettings",p) }
-    function applyGeometryUpdates(p){ return _invokeSimulationPanel("applyGeometryUpdates",p) }
     function updateGeometry(p){ return _invokeSimulationPanel("updateGeometry",p) }
 
     function _applyInitialGraphicsUpdatesFromBridge(){ if(!hasSceneBridge||!contextSceneBridge) return; try{ var initBatch=contextSceneBridge.initialGraphicsUpdates; if(!initBatch||typeof initBatch!=="object"||!Object.keys(initBatch).length) return; if(!_deliverBatchedUpdates(initBatch)) _enqueueBatchedPayload(initBatch) } catch(e){ console.debug("[main.qml] Initial graphics updates apply failed", e) } }
@@ -370,7 +370,7 @@ Item {
 
     Component.onCompleted: { postProcessingBypassed=false; postProcessingBypassReason=""; _syncPostProcessingState(); _installProxyMethodStubs(); _flushSimulationPanelCalls(); _applyInitialGraphicsUpdatesFromBridge() }
 
-    Loader { id: simulationLoader; objectName: "simulationLoader"; anchors.fill: parent; active: true; sourceComponent: SimulationRoot { id: simulationRoot; sceneBridge: contextSceneBridge } onStatusChanged: { if (status===Loader.Error){ var loadError=simulationLoader.sourceComponent ? simulationLoader.sourceComponent.errorString() : ""; console.error("Failed to load SimulationRoot:", loadError); var reason= loadError && loadError.length ? loadError : "SimulationRoot load failure"; simpleFallbackReason=reason; if(!simpleFallbackActive) console.warn("[main.qml] Switching to simplified fallback after SimulationRoot load failure"); simpleFallbackActive=true } if(status===Loader.Ready){ if(item) item.visible=!simpleFallbackActive; _syncPostProcessingState(); _flushQueuedBatches() } } onLoaded: { if(item&&item.batchUpdatesApplied) item.batchUpdatesApplied.connect(root.batchUpdatesApplied); if(item&&item.animationToggled) item.animationToggled.connect(root.animationToggled); if(item) item.visible=!simpleFallbackActive } }
+    Loader { id: simulationLoader; objectName: "simulationLoader"; anchors.fill: parent; active: true; sourceComponent: SimulationRoot { id: simulationRoot; sceneBridge: contextSceneBridge; simulationModel: root.simulationModel } onStatusChanged: { if (status===Loader.Error){ var loadError=simulationLoader.sourceComponent ? simulationLoader.sourceComponent.errorString() : ""; console.error("Failed to load SimulationRoot:", loadError); var reason= loadError && loadError.length ? loadError : "SimulationRoot load failure"; simpleFallbackReason=reason; if(!simpleFallbackActive) console.warn("[main.qml] Switching to simplified fallback after SimulationRoot load failure"); simpleFallbackActive=true } if(status===Loader.Ready){ if(item) item.visible=!simpleFallbackActive; _syncPostProcessingState(); _flushQueuedBatches() } } onLoaded: { if(item&&item.batchUpdatesApplied) item.batchUpdatesApplied.connect(root.batchUpdatesApplied); if(item&&item.animationToggled) item.animationToggled.connect(root.animationToggled); if(item) item.visible=!simpleFallbackActive } }
 
     Connections { target: simulationLoader.item; ignoreUnknownSignals: true; function onSimpleFallbackRequested(reason){ var normalized=reason&&reason.length?reason:"Rendering pipeline failure"; if(!simpleFallbackActive) console.warn("[main.qml] Simplified rendering fallback activated:", normalized); else if(simpleFallbackReason!==normalized) console.warn("[main.qml] Simplified rendering reason обновлена:", normalized); simpleFallbackReason=normalized; simpleFallbackActive=true; if(simulationLoader.item) simulationLoader.item.visible=false } function onSimpleFallbackRecovered(){ if(!simpleFallbackActive) return; simpleFallbackActive=false; simpleFallbackReason=""; if(simulationLoader.item) simulationLoader.item.visible=true; console.log("[main.qml] Simplified rendering fallback cleared") } function onShaderStatusDumpRequested(payload){ shaderStatusDumpRequested(payload) } }
 
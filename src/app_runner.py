@@ -389,6 +389,10 @@ class ApplicationRunner:
                     manager.save()
                     if logger:
                         logger.info("SettingsManager state saved on exit")
+                # Write deferred saves before SettingsService re-reads the file
+                close = getattr(manager, "close", None)
+                if callable(close):
+                    close()
             except Exception as exc:  # pragma: no cover - persistence issues are rare
                 if logger:
                     logger.error(
@@ -1103,6 +1107,9 @@ class ApplicationRunner:
         if self.app_logger:
             self.app_logger.debug("Settings schema and structure validated")
 
+        # UI panels save on every change; keep file writes off the GUI thread
+        sm.enable_write_behind()
+
     def setup_test_mode(self, enabled: bool) -> None:
         """
         Настройка тестового режима (автозакрытие через 5 секунд).
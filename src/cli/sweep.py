@@ -0,0 +1,183 @@
+"""Command line interface for headless parameter sweeps."""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from src.pneumo.enums import ThermoMode
+from src.simulation.sweep import (
+    SWEEP_PARAMETERS,
+    SweepBaseline,
+    expand_grid,
+    latin_hypercube,
+    run_sweep,
+)
+
+
+def _print_error(message: str) -> None:
+    print(f"Error: {message}")
+
+
+def _parse_scalar(text: str) -> Any:
+    value = text.strip()
+    lowered = value.lower()
+    if lowered in {"true", "false"}:
+        return lowered == "true"
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _split_assignment(text: str) -> tuple[str, str]:
+    name, sep, value = text.partition("=")
+    name = name.strip()
+    if not sep or not name or not value.strip():
+        raise ValueError(f"Expected NAME=VALUE, got '{text}'")
+    return name, value
+
+
+def _parse_grid(entries: Sequence[str]) -> dict[str, list[Any]]:
+    grid: dict[str, list[Any]] = {}
+    for entry in entries:
+        name, values = _split_assignment(entry)
+        grid[name] = [_parse_scalar(item) for item in values.split(",") if item]
+    return grid
+
+
+def _parse_bounds(entries: Sequence[str]) -> dict[str, tuple[float, float]]:
+    bounds: dict[str, tuple[float, float]] = {}
+    for entry in entries:
+        name, values = _split_assignment(entry)
+        low, sep, high = values.partition(":")
+        if not sep:
+            raise ValueError(f"Expected NAME=LOW:HIGH, got '{entry}'")
+        bounds[name] = (float(low), float(high))
+    return bounds
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="PneumoStabSim parameter sweep runner",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        epilog="Supported parameters: " + ", ".join(sorted(SWEEP_PARAMETERS)),
+    )
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="Full-factorial values for a parameter (can be repeated).",
+    )
+    parser.add_argument(
+        "--lhs",
+        action="append",
+        default=[],
+        metavar="NAME=LOW:HIGH",
+        help="Latin-hypercube range for a numeric parameter (can be repeated).",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=16,
+        help="Number of Latin-hypercube samples.",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Latin-hypercube random seed."
+    )
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        dest="fixed",
+        metavar="NAME=VALUE",
+        help="Fixed override applied to every case (can be repeated).",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=2.0, help="Simulated seconds per case."
+    )
+    parser.add_argument("--dt", type=float, default=1e-3, help="Physics time step.")
+    parser.add_argument(
+        "--record-every",
+        type=int,
+        default=1,
+        help="Record one sample every N physics steps.",
+    )
+    parser.add_argument(
+        "--road",
+        default="test_sine",
+        help="Road preset name, or 'none' to run without road excitation.",
+    )
+    parser.add_argument(
+        "--thermo-mode",
+        choices=[mode.name for mode in ThermoMode],
+        default=ThermoMode.ISOTHERMAL.name,
+        help="Default thermodynamic mode.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (defaults to all CPU cores).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/sweeps/sweep_results.npz"),
+        help="Results file (.npz or .csv).",
+    )
+    return parser
+
+
+def _build_cases(args: argparse.Namespace) -> list[dict[str, Any]]:
+    if args.grid and args.lhs:
+        raise ValueError("Use either --grid or --lhs, not both")
+
+    if args.lhs:
+        cases: list[dict[str, Any]] = list(
+            latin_hypercube(_parse_bounds(args.lhs), args.samples, seed=args.seed)
+        )
+    elif args.grid:
+        cases = expand_grid(_parse_grid(args.grid))
+    else:
+        cases = [{}]
+
+    fixed = dict(_split_assignment(entry) for entry in args.fixed)
+    for case in cases:
+        for name, value in fixed.items():
+            case.setdefault(name, _parse_scalar(value))
+    return cases
+
+
+def run(argv: Sequence[str] | None = None) -> int:
+    parser = _build_parser()
+    try:
+        args = parser.parse_args(list(argv) if argv is not None else None)
+    except SystemExit as exc:
+        return int(exc.code)
+
+    try:
+        cases = _build_cases(args)
+        road = None if args.road.strip().lower() == "none" else args.road
+        baseline = SweepBaseline(
+            duration=args.duration,
+            dt=args.dt,
+            record_every=args.record_every,
+            road_preset=road,
+            thermo_mode=ThermoMode[args.thermo_mode],
+        )
+        columns = run_sweep(cases, baseline, workers=args.workers, output=args.output)
+    except (ValueError, KeyError, OSError) as exc:
+        _print_error(str(exc))
+        return 1
+
+    failed = int((columns["status"] != "ok").sum())
+    print(f"Completed {len(cases)} cases ({failed} failed) -> {args.output}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(run())
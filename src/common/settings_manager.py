@@ -12,6 +12,12 @@ rely on:
 * coercing the ``units_version`` metadata to ``si_v2`` when legacy payloads are
   encountered;
 * basic dotted-path ``get`` and ``set`` helpers;
+* copy-on-write settings trees: ``set`` copies only the dictionaries along the
+  changed path, so :meth:`SettingsManager.snapshot` and
+  :meth:`SettingsManager.get_view` are O(1) and share untouched sections with
+  every earlier version;
+* :meth:`SettingsManager.batch` for grouping changes into one save and an
+  optional write-behind mode that persists saves from a background thread;
 * an opt-in singleton accessor exposed via :func:`get_settings_manager`.
 
 The implementation intentionally stays conservative – it validates the presence
@@ -27,7 +33,8 @@ import logging
 import math
 import os
 import re
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from importlib import import_module, util
@@ -36,6 +43,7 @@ from typing import Any, TYPE_CHECKING
 from collections.abc import Iterable
 
 from src.core.settings_defaults import load_default_settings_payload
+from src.core.settings_persister import SettingsPersister, write_json_atomic
 from src.core.settings_manager import (
     ProfileSettingsManager as _CoreProfileSettingsManager,
 )
@@ -268,6 +276,173 @@ def _deep_update(target: dict[str, Any], source: dict[str, Any]) -> None:
             target[key] = _deep_copy(value)
 
 
+def _assoc_in(root: dict[str, Any], path: Sequence[str], value: Any) -> dict[str, Any]:
+    """Return a copy of ``root`` with ``value`` stored at ``path``.
+
+    Only the dictionaries along ``path`` are copied; all other subtrees are
+    shared with ``root``. Missing or non-dict intermediate nodes are replaced
+    by new dictionaries.
+    """
+
+    head, *rest = path
+    updated = dict(root)
+    if rest:
+        child = root.get(head)
+        updated[head] = _assoc_in(child if isinstance(child, dict) else {}, rest, value)
+    else:
+        updated[head] = value
+    return updated
+
+
+class SettingsView(Mapping[str, Any]):
+    """Read-only view over a settings subtree; nested nodes are wrapped lazily."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: dict[str, Any]) -> None:
+        self._node = node
+
+    def __getitem__(self, key: str) -> Any:
+        return _view(self._node[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node)
+
+    def __len__(self) -> int:
+        return len(self._node)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._node!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a detached, mutable deep copy."""
+
+        return _deep_copy(self._node)
+
+
+class SettingsListView(Sequence[Any]):
+    """Read-only view over a list stored in the settings tree."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: list[Any]) -> None:
+        self._node = node
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return SettingsListView(self._node[index])
+        return _view(self._node[index])
+
+    def __len__(self) -> int:
+        return len(self._node)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SettingsListView):
+            other = other._node
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self._node) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._node!r})"
+
+    def to_list(self) -> list[Any]:
+        """Return a detached, mutable deep copy."""
+
+        return _deep_copy(self._node)
+
+
+def _view(value: Any) -> Any:
+    if isinstance(value, dict):
+        return SettingsView(value)
+    if isinstance(value, list):
+        return SettingsListView(value)
+    return value
+
+
+_MISSING = object()
+
+_Sections = tuple[dict[str, Any], dict[str, Any], dict[str, Any], dict[str, Any]]
+
+
+def _lookup(sections: _Sections, dotted_path: str) -> Any:
+    """Resolve ``dotted_path`` against ``(metadata, current, defaults, extra)``."""
+
+    metadata, data, defaults, extra = sections
+    parts = dotted_path.split(".") if dotted_path else []
+    if not parts:
+        return data
+
+    head = parts[0]
+    node: Any
+    if head == "metadata":
+        node = metadata
+        parts = parts[1:]
+    elif head == "defaults_snapshot":
+        node = defaults
+        parts = parts[1:]
+    elif head == "current":
+        node = data
+        parts = parts[1:]
+    elif head in extra:
+        node = extra[head]
+        parts = parts[1:]
+    else:
+        node = data
+
+    for part in parts:
+        if not isinstance(node, dict) or part not in node:
+            return _MISSING
+        node = node[part]
+    return node
+
+
+class SettingsSnapshot(Mapping[str, Any]):
+    """Immutable settings version returned by :meth:`SettingsManager.snapshot`.
+
+    Snapshots share structure with the manager and with each other, so keeping
+    one per undo step costs only the dictionaries a change actually copied.
+    Top-level keys are ``metadata``, ``current``, ``defaults_snapshot`` and any
+    extra sections; :meth:`get` also accepts dotted paths like the manager.
+    """
+
+    __slots__ = ("_sections",)
+
+    def __init__(self, sections: _Sections) -> None:
+        self._sections = sections
+
+    def _top_level(self) -> dict[str, Any]:
+        metadata, current, defaults, extra = self._sections
+        return {
+            "metadata": metadata,
+            "current": current,
+            "defaults_snapshot": defaults,
+            **extra,
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        return _view(self._top_level()[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._top_level())
+
+    def __len__(self) -> int:
+        return len(self._top_level())
+
+    def get(self, dotted_path: str, default: Any = None) -> Any:  # type: ignore[override]
+        node = _lookup(self._sections, dotted_path)
+        return default if node is _MISSING else _view(node)
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return a detached deep copy in the settings file layout."""
+
+        return _deep_copy(self._top_level())
+
+
 def _camel_to_snake(name: Any) -> Any:
     if not isinstance(name, str):
         return name
@@ -447,6 +622,10 @@ class SettingsManager:
         self._orbit_presets_path = orbit_presets_path()
         self._access_control = get_access_control()
         self._runtime_defaults: dict[str, Any] | None = None
+        self._persister: SettingsPersister | None = None
+        self._batch_depth = 0
+        self._batch_snapshot: tuple[SettingsSnapshot, bool] | None = None
+        self._batch_save_requested = False
         self.load()
 
     # ------------------------------------------------------------------ helpers
@@ -486,10 +665,18 @@ class SettingsManager:
         mm_source_map: dict[str, bool] = {}
         if legacy_mode:
             for src, dst in _GEOMETRY_KEY_ALIASES.items():
-                if src.endswith("_mm") and dst in _GEOMETRY_LINEAR_KEYS and src in original_keys:
+                if (
+                    src.endswith("_mm")
+                    and dst in _GEOMETRY_LINEAR_KEYS
+                    and src in original_keys
+                ):
                     mm_source_map[dst] = True
             for src, dst in _GEOMETRY_KEY_ALIASES.items():
-                if src.endswith("_visual_mm") and dst in _GEOMETRY_LINEAR_KEYS and src in original_keys:
+                if (
+                    src.endswith("_visual_mm")
+                    and dst in _GEOMETRY_LINEAR_KEYS
+                    and src in original_keys
+                ):
                     mm_source_map[dst] = True
         for key in _GEOMETRY_LINEAR_KEYS:
             if key not in section:
@@ -727,7 +914,8 @@ class SettingsManager:
 
     def _normalise_hdr_paths(self) -> bool:
         changed = False
-        for container in (self._data, self._defaults):
+        for attribute in ("_data", "_defaults"):
+            container = getattr(self, attribute)
             if not isinstance(container, dict):
                 continue
             graphics = container.get("graphics")
@@ -740,8 +928,16 @@ class SettingsManager:
                 current_value = environment.get("ibl_source")
                 normalised = self._normalise_hdr_path_value(current_value)
                 if normalised != current_value:
-                    environment["ibl_source_original_raw"] = current_value
-                    environment["ibl_source"] = normalised
+                    updated = {
+                        **environment,
+                        "ibl_source_original_raw": current_value,
+                        "ibl_source": normalised,
+                    }
+                    setattr(
+                        self,
+                        attribute,
+                        _assoc_in(container, ("graphics", "environment"), updated),
+                    )
                     changed = True
         return changed
 
@@ -965,6 +1161,7 @@ class SettingsManager:
     def load(self) -> None:
         payload: dict[str, Any]
         used_fallback = False
+        self.flush()
 
         if not self._settings_path.exists():
             logger.warning(
@@ -1009,27 +1206,99 @@ class SettingsManager:
             self._dirty = True
 
     def save(self) -> None:
+        if self._batch_depth:
+            # Persisted once when the outermost batch() exits
+            self._batch_save_requested = True
+            return
         if not isinstance(self._metadata, dict):
             self._metadata = {}
 
-        self._metadata["last_modified"] = _last_modified_timestamp()
+        self._metadata = {
+            **self._metadata,
+            "last_modified": _last_modified_timestamp(),
+        }
 
+        # Published trees are never mutated, so the payload can share them
         payload: dict[str, Any] = {
-            "metadata": _deep_copy(self._metadata),
-            "current": _deep_copy(self._data),
-            "defaults_snapshot": _deep_copy(self._defaults),
+            "metadata": self._metadata,
+            "current": self._data,
+            "defaults_snapshot": self._defaults,
         }
         payload.update(self._extra)
-        self._settings_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        if self._persister is not None:
+            self._persister.submit(payload)
+        else:
+            write_json_atomic(self._settings_path, payload)
         self._dirty = False
 
     def save_if_dirty(self) -> None:
         if self._dirty:
             self.save()
 
+    @contextmanager
+    def batch(self) -> Iterator[SettingsManager]:
+        """Group changes made inside the block into a single save.
+
+        ``auto_save`` and explicit :meth:`save` calls are deferred until the
+        outermost block exits. When the block raises, the in-memory settings
+        are restored to their state at entry and nothing is saved; change
+        notifications already emitted are not retracted.
+        """
+
+        if self._batch_depth == 0:
+            self._batch_save_requested = False
+            self._batch_snapshot = (self.snapshot(), self._dirty)
+        self._batch_depth += 1
+        completed = False
+        try:
+            yield self
+            completed = True
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                snapshot, self._batch_snapshot = self._batch_snapshot, None
+                save_requested, self._batch_save_requested = (
+                    self._batch_save_requested,
+                    False,
+                )
+                if not completed and snapshot is not None:
+                    self._sections = snapshot[0]._sections
+                    self._dirty = snapshot[1]
+                elif completed and save_requested:
+                    self.save()
+
+    def enable_write_behind(self, interval: float = 0.25) -> None:
+        """Persist saves from a background thread, coalesced per ``interval``.
+
+        :meth:`save` then only snapshots the payload; the file is written
+        atomically by the persister thread. Call :meth:`flush` before reading
+        the file from elsewhere.
+        """
+
+        if self._persister is not None:
+            self._persister.interval = float(interval)
+            return
+        settings_path = self._settings_path
+        self._persister = SettingsPersister(
+            lambda payload: write_json_atomic(settings_path, payload),
+            interval=interval,
+            name="settings-manager-writer",
+        )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until deferred saves are on disk."""
+
+        if self._persister is None:
+            return True
+        return self._persister.flush(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush deferred saves and return to synchronous writes."""
+
+        persister, self._persister = self._persister, None
+        if persister is not None:
+            persister.close(timeout)
+
     def validate_dependencies(self) -> "ParameterSnapshot":
         """Validate cross-parameter constraints using :class:`ParameterManager`."""
 
@@ -1120,8 +1389,8 @@ class SettingsManager:
             "path": change.path,
             "category": change.category,
             "changeType": change.changeType,
-            "newValue": _deep_copy(change.newValue),
-            "oldValue": _deep_copy(change.oldValue),
+            "newValue": _view(change.newValue),
+            "oldValue": _view(change.oldValue),
             "timestamp": change.timestamp,
         }
         _settings_event_bus.emit_setting_changed(payload)
@@ -1137,8 +1406,8 @@ class SettingsManager:
                     "path": change.path,
                     "category": change.category,
                     "changeType": change.changeType,
-                    "newValue": _deep_copy(change.newValue),
-                    "oldValue": _deep_copy(change.oldValue),
+                    "newValue": _view(change.newValue),
+                    "oldValue": _view(change.oldValue),
                     "timestamp": change.timestamp,
                 }
                 for change in changes
@@ -1148,58 +1417,61 @@ class SettingsManager:
         _settings_event_bus.emit_settings_batch(payload)
 
     # Dotted-path helpers -----------------------------------------------------
-    def _traverse(
-        self, root: dict[str, Any], path: Iterable[str], create: bool
-    ) -> dict[str, Any]:
-        node = root
-        for key in path:
-            if key not in node:
-                if not create:
-                    return {}
-                node[key] = {}
-            value = node[key]
-            if not isinstance(value, dict):
-                if create:
-                    node[key] = {}
-                    value = node[key]
-                else:
-                    return {}
-            node = value
-        return node
-
     def _check_permission(self, dotted_path: str, *, intent: str) -> None:
         self._access_control.require_permission(dotted_path, intent=intent)
 
+    @property
+    def _sections(self) -> _Sections:
+        return self._metadata, self._data, self._defaults, self._extra
+
+    @_sections.setter
+    def _sections(self, sections: _Sections) -> None:
+        self._metadata, self._data, self._defaults, self._extra = sections
+
     def get(self, dotted_path: str, default: Any = None) -> Any:
-        parts = dotted_path.split(".") if dotted_path else []
-        if not parts:
-            return _deep_copy(self._data)
-
-        head = parts[0]
-        if head == "metadata":
-            node: Any = self._metadata
-            parts = parts[1:]
-        elif head == "defaults_snapshot":
-            node = self._defaults
-            parts = parts[1:]
-        elif head == "current":
-            node = self._data
-            parts = parts[1:]
-        elif head in self._extra:
-            node = self._extra[head]
-            parts = parts[1:]
-        else:
-            node = self._data
+        """Return a detached copy of the value at ``dotted_path``.
 
-        if not parts:
-            return _deep_copy(node)
+        Use :meth:`get_view` for copy-free reads.
+        """
 
-        for part in parts:
-            if not isinstance(node, dict) or part not in node:
-                return default
-            node = node[part]
+        node = _lookup(self._sections, dotted_path)
+        if node is _MISSING:
+            return default
         return _deep_copy(node)
 
+    def get_view(self, dotted_path: str = "", default: Any = None) -> Any:
+        """Return a read-only view of the value at ``dotted_path`` without copying."""
+
+        node = _lookup(self._sections, dotted_path)
+        if node is _MISSING:
+            return default
+        return _view(node)
+
+    def snapshot(self) -> SettingsSnapshot:
+        """Return the current settings version in O(1)."""
+
+        return SettingsSnapshot(self._sections)
+
+    def restore(self, snapshot: SettingsSnapshot, *, auto_save: bool = True) -> None:
+        """Make ``snapshot`` the current version again (for undo/redo)."""
+
+        self._check_permission("current", intent="restore")
+        previous = self._data
+        self._sections = snapshot._sections
+        self._dirty = True
+        if auto_save:
+            self.save()
+        self._notify_change(
+            _SettingsChange(
+                path="current",
+                category="*",
+                changeType="restore",
+                newValue=self._data,
+                oldValue=previous,
+                timestamp=_utc_now(),
+            )
+        )
+
     def set(self, dotted_path: str, value: Any, auto_save: bool = True) -> bool:
         if not dotted_path:
             raise ValueError("Path must be non-empty")
@@ -1209,7 +1481,10 @@ class SettingsManager:
         tail = segments[1:]
         timestamp = _utc_now()
         category = dotted_path.split(".", 1)[0]
-        def _emit_change(path: str, category_name: str, new_value: Any, previous: Any) -> None:
+
+        def _emit_change(
+            path: str, category_name: str, new_value: Any, previous: Any
+        ) -> None:
             self._notify_change(
                 _SettingsChange(
                     path=path,
@@ -1220,10 +1495,11 @@ class SettingsManager:
                     timestamp=timestamp,
                 )
             )
+
         if head == "current" and not tail:
             if not isinstance(value, Mapping):
                 raise TypeError("The 'current' section must be a mapping")
-            previous = _deep_copy(self._data)
+            previous = self._data
             new_payload = _deep_copy(value)
             self._data = new_payload
             self._dirty = True
@@ -1235,7 +1511,7 @@ class SettingsManager:
         if head == "defaults_snapshot" and not tail:
             if not isinstance(value, Mapping):
                 raise TypeError("The 'defaults_snapshot' section must be a mapping")
-            previous = _deep_copy(self._defaults)
+            previous = self._defaults
             new_payload = _deep_copy(value)
             self._defaults = new_payload
             self._dirty = True
@@ -1249,77 +1525,67 @@ class SettingsManager:
         if head == "metadata" and not tail:
             if not isinstance(value, Mapping):
                 raise TypeError("The 'metadata' section must be a mapping")
-            previous = _deep_copy(self._metadata)
+            previous = self._metadata
             self._metadata = _deep_copy(value)
             self._ensure_units_version()
             self._dirty = True
-            normalised = _deep_copy(self._metadata)
+            normalised = self._metadata
             if auto_save:
                 self.save()
             _emit_change("metadata", "metadata", normalised, previous)
             return True
 
         if head in self._extra and not tail:
-            previous = _deep_copy(self._extra[head])
+            previous = self._extra[head]
             new_payload = _deep_copy(value)
-            self._extra[head] = new_payload
+            self._extra = {**self._extra, head: new_payload}
             self._dirty = True
             if auto_save:
                 self.save()
             _emit_change(head, head, new_payload, previous)
             return True
 
+        # Copy-on-write: only the dictionaries along the path are replaced,
+        # so earlier snapshots and change events keep seeing their version.
         if head == "current":
-            root = self._data
-            target_segments = tail
+            attribute, target_segments = "_data", tail
         elif head == "defaults_snapshot":
-            root = self._defaults
-            target_segments = tail
+            attribute, target_segments = "_defaults", tail
         elif head == "metadata":
-            root = self._metadata
-            target_segments = tail
+            attribute, target_segments = "_metadata", tail
         elif head in self._extra:
-            section = self._extra.get(head)
-            if not isinstance(section, dict):
-                section = {}
-                self._extra[head] = section
-            root = section
-            target_segments = tail
+            attribute, target_segments = "_extra", segments
         elif len(segments) == 1:
             if head in self._data or head in self._defaults:
-                root = self._data
+                attribute = "_data"
             else:
-                root = self._extra
-            target_segments = segments
-        else:
-            root = self._data
+                attribute = "_extra"
             target_segments = segments
-
-        if not target_segments:
-            leaf = head
-            node = root
         else:
-            *parents, leaf = target_segments
-            node = self._traverse(root, parents, create=True) if parents else root
-
-        previous = (
-            _deep_copy(node.get(leaf))
-            if isinstance(node, dict) and leaf in node
-            else None
+            attribute, target_segments = "_data", segments
+
+        def _node_at(root: Any) -> Any:
+            for key in target_segments:
+                if not isinstance(root, dict):
+                    return None
+                root = root.get(key)
+            return root
+
+        previous = _node_at(getattr(self, attribute))
+        setattr(
+            self,
+            attribute,
+            _assoc_in(getattr(self, attribute), target_segments, _deep_copy(value)),
         )
-        if not isinstance(node, dict):
-            raise TypeError("The 'current' section must be a mapping")
-        node[leaf] = _deep_copy(value)
         # Условная нормализация HDR путей — только если ключ касается ibl_source или содержит 'hdr'
         if "ibl_source" in dotted_path or "hdr" in dotted_path:
             self._normalise_hdr_paths()
         self._dirty = True
         if auto_save:
             self.save()
-        stored_value = (
-            _deep_copy(node[leaf]) if isinstance(node, dict) else _deep_copy(value)
+        _emit_change(
+            dotted_path, category, _node_at(getattr(self, attribute)), previous
         )
-        _emit_change(dotted_path, category, stored_value, previous)
         return True
 
     def _migrate_known_extras(self) -> bool:
@@ -1430,9 +1696,9 @@ class SettingsManager:
         if not category:
             raise ValueError("Category name must be non-empty")
         self._check_permission(f"current.{category}", intent="set_category")
-        previous = _deep_copy(self._data.get(category))
+        previous = self._data.get(category)
 
-        self._data[category] = _deep_copy(payload)
+        self._data = {**self._data, category: _deep_copy(payload)}
 
         self._dirty = True
         if auto_save:
@@ -1443,7 +1709,7 @@ class SettingsManager:
                 path=f"current.{category}",
                 category=category,
                 changeType="set_category",
-                newValue=payload,
+                newValue=self._data[category],
                 oldValue=previous,
                 timestamp=_utc_now(),
             )
@@ -1459,8 +1725,9 @@ class SettingsManager:
 
         if category is None:
             self._check_permission("current", intent="reset_all")
-            before = _deep_copy(self._data)
-            self._data = _deep_copy(self._defaults)
+            before = self._data
+            # Sections are immutable once published, so they can be shared
+            self._data = self._defaults
             changes.append(
                 _SettingsChange(
                     path="current",
@@ -1475,8 +1742,8 @@ class SettingsManager:
             if category not in self._defaults:
                 raise KeyError(f"Unknown defaults category: {category}")
             self._check_permission(f"current.{category}", intent="reset")
-            before = _deep_copy(self._data.get(category))
-            self._data[category] = _deep_copy(self._defaults[category])
+            before = self._data.get(category)
+            self._data = {**self._data, category: self._defaults[category]}
             changes.append(
                 _SettingsChange(
                     path=f"current.{category}",
@@ -1513,8 +1780,8 @@ class SettingsManager:
 
         if category is None:
             self._check_permission("defaults_snapshot", intent="save_defaults_all")
-            before = _deep_copy(self._defaults)
-            self._defaults = _deep_copy(self._data)
+            before = self._defaults
+            self._defaults = self._data
             changes.append(
                 _SettingsChange(
                     path="defaults_snapshot",
@@ -1531,8 +1798,8 @@ class SettingsManager:
             self._check_permission(
                 f"defaults_snapshot.{category}", intent="save_defaults"
             )
-            before = _deep_copy(self._defaults.get(category))
-            self._defaults[category] = _deep_copy(self._data[category])
+            before = self._defaults.get(category)
+            self._defaults = {**self._defaults, category: self._data[category]}
             changes.append(
                 _SettingsChange(
                     path=f"defaults_snapshot.{category}",
@@ -1581,7 +1848,10 @@ def get_settings_event_bus() -> SettingsEventBus:
 __all__ = [
     "ProfileSettingsManager",
     "SettingsEventBus",
+    "SettingsListView",
     "SettingsManager",
+    "SettingsSnapshot",
+    "SettingsView",
     "get_settings_event_bus",
     "get_settings_manager",
 ]
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
 
 @dataclass(slots=True)
 class HistoryCommand:
-    """Snapshot of a state transition stored in :class:`HistoryStack`."""
+    """Snapshot of a state transition stored in :class:`HistoryStack`.
 
-    before: dict[str, Any]
-    after: dict[str, Any]
+    ``before``/``after`` may be plain dictionaries or immutable
+    :class:`~src.common.settings_manager.SettingsSnapshot` versions, which
+    share structure and cost almost nothing to keep.
+    """
+
+    before: Mapping[str, Any]
+    after: Mapping[str, Any]
     description: str
     metadata: dict[str, Any] = field(default_factory=dict)
 
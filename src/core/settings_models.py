@@ -10,7 +10,7 @@ Pydantic's forward compatibility.
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Literal, Protocol, runtime_checkable
 
 from pydantic import BaseModel, Field, RootModel, model_validator
 
@@ -61,6 +61,10 @@ class SimulationSettings(_StrictModel):
     render_vsync_hz: float
     max_steps_per_frame: int
     max_frame_time: float
+    road_streaming: bool = False
+    low_allocation: bool = False
+    # None — публикация с частотой render_vsync_hz
+    state_publish_hz: float | None = Field(default=None, ge=0)
 
 
 class ReceiverVolumeLimits(_StrictModel):
@@ -173,6 +177,12 @@ class ModesPhysicsSettings(_StrictModel):
     damper_force_threshold_n: float
     spring_rest_position_m: float
     integrator_method: str
+    kinematics_kernel: Literal["vectorized", "scalar"] = "vectorized"
+    kinematics_lookup: Literal["off", "cubic", "linear"] = "off"
+    kinematics_lookup_tolerance: float = Field(default=1e-9, gt=0)
+    body_integrator: Literal[
+        "radau", "semi_implicit_euler", "rk4", "implicit_midpoint"
+    ] = "rk4"
 
 
 class ModesSettings(_StrictModel):
@@ -726,9 +736,16 @@ class CameraHUDSettings(_StrictModel):
     showTimestamp: bool = False
 
 
+class PhysicsTraceSettings(_StrictModel):
+    sample_every: int = Field(default=1, ge=1)
+    # None — все подсистемы из TRACE_SUBSYSTEMS
+    subsystems: list[Literal["kinematics", "gas", "body", "pneumatics"]] | None = None
+
+
 class DiagnosticsSettings(_StrictModel):
     signal_trace: SignalTraceSettings
     camera_hud: CameraHUDSettings
+    physics_trace: PhysicsTraceSettings | None = None
 
 
 class SystemDependencyVariant(_StrictModel):
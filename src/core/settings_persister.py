@@ -0,0 +1,198 @@
+"""Write-behind persistence for settings payloads.
+
+:class:`SettingsPersister` moves validation and file writes off the calling
+thread.  Submitted payloads replace each other until the background thread
+picks the latest one up, so a burst of changes (for example a slider drag)
+costs one validate-and-write per interval.  Pending payloads are flushed on
+:meth:`SettingsPersister.flush`, :meth:`SettingsPersister.close` and at
+interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WRITE_BEHIND_INTERVAL = 0.25
+
+_persisters: weakref.WeakSet[SettingsPersister] = weakref.WeakSet()
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Write ``payload`` as indented JSON via a temporary file and rename."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as stream:
+        json.dump(payload, stream, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class SettingsPersister:
+    """Coalescing background writer for settings payloads.
+
+    Args:
+        write: Callable validating and writing one payload; runs on the
+            persister thread and must not mutate the payload
+        interval: Seconds to collect further submissions before writing
+        name: Thread name used in diagnostics
+        merge: Optional ``merge(pending, new)`` combining a payload that was
+            not written yet with its replacement; by default the new payload
+            simply wins
+
+    Errors raised by ``write`` are logged and kept in :attr:`last_error`;
+    :meth:`flush` re-raises the error of the payload it waited for.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Any], None],
+        *,
+        interval: float = DEFAULT_WRITE_BEHIND_INTERVAL,
+        name: str = "settings-persister",
+        merge: Callable[[Any, Any], Any] | None = None,
+    ) -> None:
+        if interval < 0.0:
+            raise ValueError("Write-behind interval must not be negative")
+        self._write = write
+        self._merge = merge
+        self.interval = float(interval)
+        self._name = name
+        self._condition = threading.Condition()
+        self._pending: Any = None
+        self._has_pending = False
+        self._pending_since = 0.0
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.submitted = 0
+        self.writes = 0
+        self.last_error: BaseException | None = None
+        _persisters.add(self)
+
+    @property
+    def pending(self) -> bool:
+        """Whether a payload is queued or being written."""
+
+        with self._condition:
+            return self._has_pending or self._writing
+
+    def submit(self, payload: Any) -> None:
+        """Queue ``payload``, replacing any payload that was not written yet."""
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Settings persister is closed")
+            if not self._has_pending:
+                self._pending_since = time.monotonic()
+            elif self._merge is not None:
+                payload = self._merge(self._pending, payload)
+            self._pending = payload
+            self._has_pending = True
+            self.submitted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Write the pending payload now and wait for it.
+
+        Returns False when ``timeout`` expired before the write finished.
+        """
+
+        with self._condition:
+            if not (self._has_pending or self._writing):
+                return True
+            errors_before = self.last_error
+            self._flush_requested = True
+            self._condition.notify_all()
+            done = self._condition.wait_for(
+                lambda: not (self._has_pending or self._writing), timeout
+            )
+            error = self.last_error
+        if done and error is not None and error is not errors_before:
+            raise error
+        return done
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush pending writes and stop the background thread."""
+
+        try:
+            self.flush(timeout)
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+                thread = self._thread
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(timeout)
+
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._has_pending and not self._closed:
+                    condition.wait()
+                if not self._has_pending:
+                    return
+                # Coalesce submissions until the interval since the first one
+                while not (self._flush_requested or self._closed):
+                    remaining = self._pending_since + self.interval - time.monotonic()
+                    if remaining <= 0.0:
+                        break
+                    condition.wait(remaining)
+                payload = self._pending
+                self._pending = None
+                self._has_pending = False
+                self._flush_requested = False
+                self._writing = True
+
+            error: BaseException | None = None
+            try:
+                self._write(payload)
+            except Exception as exc:
+                error = exc
+                logger.error("Deferred settings write failed: %s", exc, exc_info=True)
+
+            with condition:
+                self._writing = False
+                if error is None:
+                    self.writes += 1
+                else:
+                    self.last_error = error
+                condition.notify_all()
+
+
+def flush_all_persisters(timeout: float | None = 5.0) -> None:
+    """Flush every live persister (registered to run at interpreter exit)."""
+
+    for persister in list(_persisters):
+        try:
+            persister.flush(timeout)
+        except Exception as exc:  # pragma: no cover - best effort at shutdown
+            logger.error("Settings flush on exit failed: %s", exc)
+
+
+atexit.register(flush_all_persisters)
+
+
+__all__ = [
+    "DEFAULT_WRITE_BEHIND_INTERVAL",
+    "SettingsPersister",
+    "flush_all_persisters",
+    "write_json_atomic",
+]
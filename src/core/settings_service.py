@@ -20,10 +20,13 @@ import math
 import logging
 import os
 import re
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import UTC, datetime
 from functools import lru_cache
 from pathlib import Path, PureWindowsPath
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING
 from collections.abc import Iterable, Mapping, MutableMapping
 from collections.abc import Mapping as MappingABC
@@ -45,6 +48,7 @@ from src.core.settings_validation import (
     FORBIDDEN_MATERIAL_ALIASES,
 )
 from src.core.settings_models import AppSettings, dump_settings
+from src.core.settings_persister import SettingsPersister
 
 # Совместимый алиас для использования ниже
 ValidationError = _PydanticValidationError
@@ -68,6 +72,24 @@ LEGACY_GEOMETRY_ALLOWED_KEYS: set[str] = {
     "max_susp_travel",
     "lever_length_m",
 }
+# Ключевые слова JSON Schema, из-за которых объект нельзя проверять по частям:
+# они накладывают ограничения на вложенные значения в обход ``properties``.
+_NON_LOCAL_SCHEMA_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "not",
+        "if",
+        "dependentSchemas",
+        "patternProperties",
+        "unevaluatedProperties",
+    }
+)
+# Разделы, которые миграции save() синхронизируют с изменённым разделом
+_LINKED_VALIDATION_SCOPES: dict[tuple[str, ...], tuple[tuple[str, ...], ...]] = {
+    ("current", "pneumatic"): (("defaults_snapshot", "pneumatic"),),
+}
 
 
 class _RelaxedAppSettings(AppSettings):
@@ -107,6 +129,26 @@ class _LooseAppSettings:
 _MISSING = object()
 
 
+def _copy_tree(value: Any) -> Any:
+    """Copy the dict/list containers of a dumped settings value."""
+
+    if isinstance(value, dict):
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(item) for item in value]
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    """Return an immutable view of a dumped settings value."""
+
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 @lru_cache(maxsize=1)
 def _default_metadata_snapshot() -> dict[str, Any]:
     """Return a deep copy of the baseline metadata section.
@@ -180,6 +222,9 @@ class SettingsService:
             ``config/app_settings.json``.
         env_var: Имя переменной окружения с альтернативным путём
             (по умолчанию ``PSS_SETTINGS_FILE``).
+        write_behind_interval: Если задан, валидация схемы и запись файла
+            выполняются фоновым потоком не чаще одного раза за интервал
+            (секунды); см. :meth:`enable_write_behind`.
     """
 
     def __init__(
@@ -190,6 +235,7 @@ class SettingsService:
         schema_path: str | os.PathLike[str] | None = None,
         schema_env_var: str = "PSS_SETTINGS_SCHEMA",
         validate_schema: bool = True,
+        write_behind_interval: float | None = None,
     ) -> None:
         self._explicit_path = (
             Path(settings_path).expanduser().resolve() if settings_path else None
@@ -202,12 +248,27 @@ class SettingsService:
         self._validate_schema = validate_schema
         self._cache_dict: dict[str, Any] | None = None
         self._cache_model: AppSettings | _LooseAppSettings | None = None
+        # Flattened dot-path -> (value, frozen view) index of the cached model
+        self._path_index: dict[str, tuple[Any, Any]] | None = None
         self._schema_cache: dict[str, Any] | None = None
         self._schema_mtime: float | None = None
         self._schema_path_cached: Path | None = None
         self._validator: Any | None = None
+        # Requested scope -> (resolved schema prefix, validator for that subtree)
+        self._subtree_validators: dict[
+            tuple[str, ...], tuple[tuple[str, ...], Any]
+        ] = {}
         self._unknown_paths: set[str] = set()
         self._last_modified_snapshot: str | None = None
+        self._persister: SettingsPersister | None = None
+        # Working copy and collected changes of an open batch()
+        self._batch_payload: dict[str, Any] | None = None
+        self._batch_depth = 0
+        self._batch_paths: list[str] = []
+        self._batch_changed_paths: list[str] = []
+        self._batch_unknown_paths: list[str] = []
+        if write_behind_interval is not None:
+            self.enable_write_behind(write_behind_interval)
 
     # --- PRE-SCHEMA GUARDS -------------------------------------------------
     def _guard_unknown_geometry_keys(self, payload: MappingABC[str, Any]) -> None:
@@ -973,6 +1034,7 @@ class SettingsService:
         """Load and return the typed settings payload."""
 
         if not use_cache or self._cache_model is None:
+            self.flush()
             payload_dict = self._read_file()
             model_payload = self._build_model_payload(payload_dict)
             try:
@@ -980,18 +1042,27 @@ class SettingsService:
             except SettingsValidationError:
                 if self._validate_schema:
                     raise
-                self._cache_dict = payload_dict
-                self._cache_model = _LooseAppSettings(payload_dict)
+                self._store_cache(payload_dict, _LooseAppSettings(payload_dict))
             else:
-                self._cache_dict = payload_dict
-                self._cache_model = model
+                self._store_cache(payload_dict, model)
         return self._cache_model
 
+    def _store_cache(
+        self,
+        payload: dict[str, Any] | None,
+        model: AppSettings | _LooseAppSettings | None,
+    ) -> None:
+        """Replace the cached model and drop the path index built from it."""
+
+        self._cache_dict = payload
+        self._cache_model = model
+        self._path_index = None
+
     def reload(self) -> dict[str, Any]:
         """Сбросить кэш и перечитать файл."""
 
-        self._cache_dict = None
-        self._cache_model = None
+        self.flush()
+        self._store_cache(None, None)
         settings = self.load(use_cache=True)
         return dump_settings(settings)
 
@@ -1082,8 +1153,15 @@ class SettingsService:
         *,
         metadata: dict[str, Any] | None = None,
         pending_unknown_paths: Iterable[str] | None = None,
+        changed_paths: Iterable[str] | None = None,
     ) -> None:
-        """Сохранить payload на диск и обновить кэш."""
+        """Сохранить payload на диск и обновить кэш.
+
+        ``changed_paths`` перечисляет dot‑пути, изменённые относительно
+        закэшированного (уже проверенного) состояния. Тогда по схеме
+        проверяются только затронутые поддеревья (:meth:`validate_paths`),
+        иначе — весь документ.
+        """
         if isinstance(payload, (AppSettings, _LooseAppSettings)):
             payload_dict = dump_settings(payload)
         else:
@@ -1102,9 +1180,12 @@ class SettingsService:
         self._normalise_hdr_paths(payload_dict)
         self._strip_null_slider_metadata(payload_dict)
         last_modified = self._ensure_last_modified(payload_dict)
-        if self._validate_schema:
-            self.validate(payload_dict)
-        self._write_file(payload_dict)
+        incremental = changed_paths is not None and self._cache_dict is not None
+        if incremental and self._validate_schema:
+            self.validate_paths(payload_dict, changed_paths)  # type: ignore[arg-type]
+        persister = self._persister
+        if persister is None:
+            self._persist_payload(payload_dict, validate=not incremental)
         model_payload = self._build_model_payload(
             payload_dict,
             extra_unknown_paths=pending_unknown_paths,
@@ -1114,18 +1195,152 @@ class SettingsService:
         except SettingsValidationError:
             if self._validate_schema:
                 raise
-            self._cache_dict = payload_dict
-            self._cache_model = _LooseAppSettings(payload_dict)
+            self._store_cache(payload_dict, _LooseAppSettings(payload_dict))
         else:
-            self._cache_dict = payload_dict
-            self._cache_model = model
+            self._store_cache(payload_dict, model)
         if last_modified is not None:
             self._last_modified_snapshot = last_modified
         if pending_unknown_paths:
             for candidate in pending_unknown_paths:
                 self._record_unknown_path(candidate)
+        if persister is not None:
+            # payload_dict is only read from here on, so it is handed over as is
+            persister.submit((payload_dict, not incremental))
         self._publish_update_event(metadata or {})
 
+    def _persist_payload(self, payload: dict[str, Any], validate: bool = True) -> None:
+        """Validate ``payload`` against the schema and write it to disk."""
+
+        if validate and self._validate_schema:
+            self.validate(payload)
+        self._write_file(payload)
+
+    def _write_behind(self, item: tuple[dict[str, Any], bool]) -> None:
+        self._persist_payload(*item)
+
+    @staticmethod
+    def _merge_write_behind(
+        pending: tuple[dict[str, Any], bool], new: tuple[dict[str, Any], bool]
+    ) -> tuple[dict[str, Any], bool]:
+        # The newest payload wins, but a pending full validation is kept
+        return new[0], pending[1] or new[1]
+
+    # ------------------------------------------------------------------
+    # Batching and write-behind persistence
+    # ------------------------------------------------------------------
+    def enable_write_behind(self, interval: float = 0.25) -> None:
+        """Перенести валидацию схемы и запись файла в фоновый поток.
+
+        ``save()`` по-прежнему синхронно нормализует payload, обновляет кэш и
+        публикует событие, но файл записывается не чаще одного раза за
+        ``interval`` секунд последним сохранённым состоянием. Ошибки
+        отложенной записи поднимаются из :meth:`flush`.
+        """
+
+        if self._persister is not None:
+            self._persister.interval = float(interval)
+            return
+        self._persister = SettingsPersister(
+            self._write_behind,
+            interval=interval,
+            name="settings-service-writer",
+            merge=self._merge_write_behind,
+        )
+
+    @property
+    def write_behind(self) -> bool:
+        """Whether saves are persisted by the background writer."""
+
+        return self._persister is not None
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Дождаться записи отложенных изменений на диск."""
+
+        if self._persister is None:
+            return True
+        return self._persister.flush(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Записать отложенные изменения и вернуться к синхронной записи."""
+
+        persister, self._persister = self._persister, None
+        if persister is not None:
+            persister.close(timeout)
+
+    @contextmanager
+    def batch(self) -> Iterator[SettingsService]:
+        """Сгруппировать ``set``/``update`` в одно сохранение.
+
+        Изменения внутри блока применяются к рабочей копии и видны через
+        ``get``/``get_view``; миграции, валидация и запись выполняются один
+        раз при выходе. Исключение внутри блока отменяет все его изменения.
+        Вложенные блоки присоединяются к внешнему.
+        """
+
+        if self._batch_depth == 0:
+            self._batch_payload = dump_settings(self.load())
+            self._batch_paths = []
+            self._batch_changed_paths = []
+            self._batch_unknown_paths = []
+            self._path_index = None
+        self._batch_depth += 1
+        completed = False
+        try:
+            yield self
+            completed = True
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                payload = self._batch_payload
+                paths = self._batch_paths
+                changed_paths = self._batch_changed_paths
+                unknown_paths = self._batch_unknown_paths
+                self._batch_payload = None
+                self._batch_paths = []
+                self._batch_changed_paths = []
+                self._batch_unknown_paths = []
+                self._path_index = None
+                if completed and paths and payload is not None:
+                    self.save(
+                        payload,
+                        metadata={"action": "batch", "paths": paths},
+                        pending_unknown_paths=unknown_paths,
+                        changed_paths=changed_paths,
+                    )
+
+    def _edit_payload(self) -> dict[str, Any]:
+        """Return the payload that ``set``/``update`` should modify."""
+
+        if self._batch_payload is not None:
+            return self._batch_payload
+        return dump_settings(self.load())
+
+    def _commit_edit(
+        self,
+        payload: dict[str, Any],
+        path: str,
+        action: str,
+        unknown: list[str],
+        changed: list[str],
+    ) -> None:
+        """Save an edited payload, or record it in the open batch."""
+
+        if self._batch_payload is not None:
+            self._batch_paths.append(path)
+            self._batch_changed_paths.extend(changed)
+            self._batch_unknown_paths.extend(unknown)
+            self._path_index = None
+            return
+        self.save(
+            payload,
+            metadata={
+                "path": path,
+                "action": action,
+            },
+            pending_unknown_paths=unknown,
+            changed_paths=changed,
+        )
+
     def _strip_null_slider_metadata(self, payload: MutableMapping[str, Any]) -> None:
         """Remove optional slider metadata fields that were serialised as ``null``."""
 
@@ -1161,29 +1376,93 @@ class SettingsService:
     # Helper utilities
     # ------------------------------------------------------------------
     def get(self, path: str, default: Any = None) -> Any:
-        """Получить значение по dot‑пути."""
+        """Получить значение по dot‑пути.
 
-        segments = list(self._split_path(path))
+        Словари и списки возвращаются копией, которую можно изменять; для
+        чтения без копирования используйте :meth:`get_view`.
+        """
+
+        segments = self._split_path(path)
         if not segments:
             return default
 
-        payload = self.load()
-        data: Any = dump_settings(payload)
-        result = self._traverse_mapping(data, segments, _MISSING)
-        if result is not _MISSING:
-            return result
+        entry = self._lookup(segments)
+        if entry is _MISSING:
+            return default
+        value = entry[0]
+        if isinstance(value, (dict, list)):
+            return _copy_tree(value)
+        return value
+
+    def get_view(self, path: str = "", default: Any = None) -> Any:
+        """Вернуть неизменяемое представление значения по dot‑пути.
+
+        Словари возвращаются как ``MappingProxyType``, списки — как кортежи.
+        Представления берутся из индекса без сериализации модели и остаются
+        валидными до следующей загрузки или сохранения. Пустой путь
+        возвращает всё дерево настроек.
+        """
+
+        entry = self._lookup(self._split_path(path))
+        if entry is _MISSING:
+            return default
+        return entry[1]
 
-        if not self._validate_schema and self._cache_dict is not None:
+    def _lookup(self, segments: tuple[str, ...]) -> Any:
+        """Return the ``(value, view)`` index entry for ``segments``."""
+
+        index = self._path_index
+        if index is None:
+            index = self._build_path_index()
+        entry = index.get(".".join(segments), _MISSING)
+        if entry is not _MISSING or self._validate_schema:
+            return entry
+
+        # Loose mode: fall back to raw keys that the model did not keep
+        if self._cache_dict is not None:
             fallback = self._traverse_mapping(self._cache_dict, segments, _MISSING)
             if fallback is not _MISSING:
-                return fallback
-        return default
+                return fallback, _freeze(fallback)
+        return _MISSING
+
+    def _build_path_index(self) -> dict[str, tuple[Any, Any]]:
+        """Dump the cached model once and index every reachable dot-path."""
+
+        data = self._batch_payload
+        if data is None:
+            data = dump_settings(self.load())
+        index: dict[str, tuple[Any, Any]] = {}
+
+        def _walk(prefix: str, value: Any) -> Any:
+            if isinstance(value, dict):
+                frozen: dict[str, Any] = {}
+                for key, item in value.items():
+                    # Keys with dots or padding cannot be addressed by a dot-path
+                    if (
+                        isinstance(key, str)
+                        and key
+                        and key == key.strip()
+                        and "." not in key
+                    ):
+                        frozen[key] = _walk(f"{prefix}.{key}" if prefix else key, item)
+                    else:
+                        frozen[key] = _freeze(item)
+                view: Any = MappingProxyType(frozen)
+            elif isinstance(value, list):
+                view = _freeze(value)
+            else:
+                view = value
+            index[prefix] = (value, view)
+            return view
+
+        _walk("", data)
+        self._path_index = index
+        return index
 
     def set(self, path: str, value: Any) -> None:
         """Установить значение по dot‑пути и сохранить изменения."""
 
-        payload_model = self.load()
-        payload = dump_settings(payload_model)
+        payload = self._edit_payload()
         segments = list(self._split_path(path))
         if not segments:
             raise ValueError("path must not be empty")
@@ -1195,20 +1474,12 @@ class SettingsService:
             pending_unknown_paths.append(path)
 
         parent[final_key] = value
-        self.save(
-            payload,
-            metadata={
-                "path": path,
-                "action": "set",
-            },
-            pending_unknown_paths=pending_unknown_paths,
-        )
+        self._commit_edit(payload, path, "set", pending_unknown_paths, [path])
 
     def update(self, path: str, patch: MutableMapping[str, Any]) -> None:
         """Слить (merge) словарь patch в целевой mapping по dot‑пути."""
 
-        payload_model = self.load()
-        payload = dump_settings(payload_model)
+        payload = self._edit_payload()
         data = self._get_existing_mapping(payload, path)
         pending_unknown_paths: list[str] = []
         for key in patch:
@@ -1216,13 +1487,12 @@ class SettingsService:
                 pending_unknown_paths.append(f"{path}.{key}")
 
         data.update(patch)
-        self.save(
+        self._commit_edit(
             payload,
-            metadata={
-                "path": path,
-                "action": "update",
-            },
-            pending_unknown_paths=pending_unknown_paths,
+            path,
+            "update",
+            pending_unknown_paths,
+            [f"{path}.{key}" for key in patch],
         )
 
     # ------------------------------------------------------------------
@@ -1285,6 +1555,7 @@ class SettingsService:
         self._schema_mtime = mtime
         self._schema_path_cached = path
         self._validator = None
+        self._subtree_validators = {}
         return schema_payload
 
     def _get_validator(self) -> Any:
@@ -1342,9 +1613,28 @@ class SettingsService:
             except SettingsValidationError as override_error:
                 raise override_error
 
+        formatted = self._format_schema_errors(errors)
+
+        try:
+            self._validate_graphics_materials(payload)
+        except SettingsValidationError as graphics_exc:
+            formatted.append(str(graphics_exc))
+
+        joined = "; ".join(formatted)
+        raise SettingsValidationError(
+            f"Settings payload failed JSON Schema validation: {joined}",
+            errors=formatted,
+        )
+
+    @staticmethod
+    def _format_schema_errors(
+        errors: Iterable[Any], prefix: tuple[str, ...] = ()
+    ) -> list[str]:
+        """Format JSON Schema errors as ``dot.path: message`` strings."""
+
         formatted: list[str] = []
         for error in errors:
-            path_parts = [str(part) for part in error.path]
+            path_parts = [*prefix, *(str(part) for part in error.path)]
             message = error.message
 
             if error.validator == "required":
@@ -1354,17 +1644,153 @@ class SettingsService:
 
             location = ".".join(path_parts) or "<root>"
             formatted.append(f"{location}: {message}")
+        return formatted
 
-        try:
-            self._validate_graphics_materials(payload)
-        except SettingsValidationError as graphics_exc:
-            formatted.append(str(graphics_exc))
+    def validate_paths(self, payload: dict[str, Any], paths: Iterable[str]) -> None:
+        """Проверить по схеме только поддеревья, затронутые ``paths``.
 
-        joined = "; ".join(formatted)
-        raise SettingsValidationError(
-            f"Settings payload failed JSON Schema validation: {joined}",
-            errors=formatted,
-        )
+        Предполагается, что остальная часть ``payload`` уже прошла проверку
+        (при загрузке или предыдущем сохранении). Для каждого изменённого
+        пути проверяется объект‑родитель, связанные разделы из
+        ``_LINKED_VALIDATION_SCOPES`` и ``metadata``; для разделов
+        ``geometry``/``graphics`` дополнительно выполняются их перекрёстные
+        проверки. Если поддерево выделить нельзя, проверяется весь документ.
+        """
+
+        sections = ("current", "defaults_snapshot")
+        scopes = self._validation_scopes(paths)
+        resolved = [self._get_subtree_validator(scope) for scope in scopes]
+        if any(
+            not prefix or (prefix[0] in sections and len(prefix) < 2)
+            for prefix, _ in resolved
+        ):
+            self.validate(payload)
+            return
+
+        categories = {prefix[1] for prefix, _ in resolved if prefix[0] in sections}
+        for category in sorted(categories):
+            for guard in self._section_guards(category):
+                guard(payload)
+
+        formatted: list[str] = []
+        for prefix, validator in resolved:
+            instance = self._traverse_mapping(payload, prefix, _MISSING)
+            if instance is _MISSING:
+                # set()/update() never remove keys, so an absent linked
+                # subtree cannot have been invalidated by this change
+                continue
+            errors = sorted(validator.iter_errors(instance), key=lambda err: err.path)
+            formatted.extend(self._format_schema_errors(errors, prefix))
+
+        if "graphics" in categories:
+            try:
+                self._validate_graphics_materials(payload)
+            except SettingsValidationError as graphics_exc:
+                if not formatted:
+                    raise
+                formatted.append(str(graphics_exc))
+
+        if formatted:
+            joined = "; ".join(formatted)
+            raise SettingsValidationError(
+                f"Settings payload failed JSON Schema validation: {joined}",
+                errors=formatted,
+            )
+
+    def _section_guards(
+        self, category: str
+    ) -> tuple[Callable[[MappingABC[str, Any]], None], ...]:
+        """Cross-field checks that must run when ``category`` changes."""
+
+        if category == "geometry":
+            return (
+                self._guard_legacy_geometry_mesh_extras,
+                self._guard_unknown_geometry_keys,
+                self._guard_geometry_ranges,
+            )
+        if category == "graphics":
+            return (self._guard_legacy_material_aliases,)
+        return ()
+
+    def _validation_scopes(self, paths: Iterable[str]) -> list[tuple[str, ...]]:
+        """Map changed dot-paths to the minimal set of subtrees to validate."""
+
+        # save() always refreshes metadata.last_modified
+        scopes: set[tuple[str, ...]] = {("metadata",)}
+        for path in paths:
+            scope = self._split_path(path)[:-1]
+            scopes.add(scope)
+            for linked_prefix, linked in _LINKED_VALIDATION_SCOPES.items():
+                depth = min(len(scope), len(linked_prefix))
+                if scope[:depth] == linked_prefix[:depth]:
+                    scopes.update(linked)
+
+        minimal: list[tuple[str, ...]] = []
+        for scope in sorted(scopes, key=len):
+            if not any(scope[: len(kept)] == kept for kept in minimal):
+                minimal.append(scope)
+        return minimal
+
+    def _get_subtree_validator(
+        self, scope: tuple[str, ...]
+    ) -> tuple[tuple[str, ...], Any]:
+        """Return ``(prefix, validator)`` for the deepest checkable part of ``scope``.
+
+        Validators are compiled once per scope from the root validator, so
+        ``$ref`` inside a subtree still resolves against the full schema.
+        """
+
+        cached = self._subtree_validators.get(scope)
+        if cached is not None:
+            return cached
+
+        root_validator = self._get_validator()
+        schema = self._read_schema()
+        node: Any = schema
+        prefix: tuple[str, ...] = ()
+        for segment in scope:
+            resolved = self._resolve_local_ref(schema, node)
+            if resolved is None or _NON_LOCAL_SCHEMA_KEYWORDS & resolved.keys():
+                break
+            properties = resolved.get("properties")
+            if isinstance(properties, MappingABC) and segment in properties:
+                node = properties[segment]
+            elif isinstance(resolved.get("additionalProperties"), MappingABC):
+                node = resolved["additionalProperties"]
+            else:
+                break
+            prefix += (segment,)
+
+        validator = root_validator.evolve(schema=node) if prefix else root_validator
+        self._subtree_validators[scope] = (prefix, validator)
+        return prefix, validator
+
+    @staticmethod
+    def _resolve_local_ref(
+        schema: MappingABC[str, Any], node: Any
+    ) -> MappingABC[str, Any] | None:
+        """Follow ``#/...`` references; None when ``node`` cannot be descended."""
+
+        seen = 0
+        while isinstance(node, MappingABC) and "$ref" in node:
+            ref = node["$ref"]
+            # Sibling keywords next to $ref would also apply to the children
+            if (
+                not isinstance(ref, str)
+                or not ref.startswith("#/")
+                or set(node) - {"$ref", "title", "description"}
+                or seen > 32
+            ):
+                return None
+            target: Any = schema
+            for part in ref[2:].split("/"):
+                part = part.replace("~1", "/").replace("~0", "~")
+                if not isinstance(target, MappingABC) or part not in target:
+                    return None
+                target = target[part]
+            node = target
+            seen += 1
+        return node if isinstance(node, MappingABC) else None
 
     def _guard_legacy_material_aliases(self, payload: MappingABC[str, Any]) -> None:
         """Pre-validate payload to surface legacy material aliases before JSON Schema."""
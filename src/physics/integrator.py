@@ -23,7 +23,14 @@ from config.constants import refresh_cache as refresh_settings_cache
 from src.core.settings_validation import SettingsValidationError
 from src.pneumo.enums import ThermoMode, Wheel
 
-from .odes import RigidBody3DOF, f_rhs, validate_state
+from .odes import (
+    RigidBody3DOF,
+    RigidBodyArrays,
+    f_rhs,
+    f_rhs_jacobian,
+    validate_state,
+    wheel_pneumatic_forces,
+)
 
 
 def _require_number(mapping: Mapping[str, Any], key: str, context: str) -> float:
@@ -199,6 +206,10 @@ def refresh_physics_loop_defaults() -> None:
     _LOOP_DEFAULTS = _load_loop_defaults()
 
 
+# solve_ivp methods that accept an analytic Jacobian
+_IMPLICIT_METHODS = frozenset({"Radau", "BDF", "LSODA"})
+
+
 @dataclass
 class IntegrationResult:
     """Result of integration step"""
@@ -312,9 +323,24 @@ def step_dynamics(
     if max_step is None:
         max_step = dt / _LOOP_DEFAULTS["solver_max_step_divisor"]
 
-    # Define RHS function with fixed parameters
+    # Line pressures do not change during the step, so resolve the cylinder
+    # forces once instead of on every RHS evaluation
+    pneumatic_forces = (
+        wheel_pneumatic_forces(system, gas) if system is not None else None
+    )
+
+    # Define RHS function with fixed parameters. Calls are counted directly:
+    # ``sol.nfev`` omits evaluations spent on finite-difference Jacobians
+    evaluations = 0
+
     def rhs_func(t, y):
-        return f_rhs(t, y, params, system, gas)
+        nonlocal evaluations
+        evaluations += 1
+        return f_rhs(t, y, params, system, gas, pneumatic_forces)
+
+    # The Jacobian is constant; implicit solvers use it instead of estimating
+    # it by finite differences
+    jacobian = f_rhs_jacobian(t0, y0, params, system, gas)
 
     # Integration time span
     t_span = (t0, t0 + dt)
@@ -341,6 +367,7 @@ def step_dynamics(
                 max_step=max_step,
                 dense_output=False,
                 vectorized=False,
+                **({"jac": jacobian} if method_attempt in _IMPLICIT_METHODS else {}),
             )
 
             solve_time = time.perf_counter() - start_time
@@ -366,7 +393,7 @@ def step_dynamics(
                     t_final=sol.t[-1],
                     message=f"Integration successful with {method_attempt}",
                     method_used=method_attempt,
-                    n_evaluations=sol.nfev,
+                    n_evaluations=evaluations,
                     solve_time=solve_time,
                 )
 
@@ -390,21 +417,23 @@ def step_dynamics(
     )
 
 
-def clamp_state(y: np.ndarray, params: RigidBody3DOF) -> np.ndarray:
+def clamp_state(y: np.ndarray, params: RigidBody3DOF | RigidBodyArrays) -> np.ndarray:
     """Clamp state vector to valid ranges
 
     Args:
-        y: State vector [Y, ?z, ?x, dY, d?z, d?x]
+        y: State vector [Y, ?z, ?x, dY, d?z, d?x], or a stack of them with
+            shape ``(members, 6)`` when ``params`` holds per-member limits
         params: System parameters with limits
 
     Returns:
         Clamped state vector
     """
     y_clamped = y.copy()
+    angle_limit = params.angle_limit
 
     # Clamp angles to limits
-    y_clamped[1] = np.clip(y[1], -params.angle_limit, params.angle_limit)
-    y_clamped[2] = np.clip(y[2], -params.angle_limit, params.angle_limit)
+    y_clamped[..., 1] = np.clip(y[..., 1], -angle_limit, angle_limit)
+    y_clamped[..., 2] = np.clip(y[..., 2], -angle_limit, angle_limit)
 
     # Clamp velocities to reasonable ranges
     max_velocity = float(_LOOP_DEFAULTS["max_linear_velocity_m_s"])
@@ -413,9 +442,9 @@ def clamp_state(y: np.ndarray, params: RigidBody3DOF) -> np.ndarray:
     posinf_replacement = float(_LOOP_DEFAULTS["posinf_replacement_value"])
     neginf_replacement = float(_LOOP_DEFAULTS["neginf_replacement_value"])
 
-    y_clamped[3] = np.clip(y[3], -max_velocity, max_velocity)
-    y_clamped[4] = np.clip(y[4], -max_angular_velocity, max_angular_velocity)
-    y_clamped[5] = np.clip(y[5], -max_angular_velocity, max_angular_velocity)
+    y_clamped[..., 3] = np.clip(y[..., 3], -max_velocity, max_velocity)
+    y_clamped[..., 4] = np.clip(y[..., 4], -max_angular_velocity, max_angular_velocity)
+    y_clamped[..., 5] = np.clip(y[..., 5], -max_angular_velocity, max_angular_velocity)
 
     # Remove NaN/inf
     y_clamped = np.nan_to_num(
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 
 from config.constants import (
     get_current_section,
@@ -207,6 +208,12 @@ def _default_attachment_points() -> dict[str, tuple[float, float]]:
     return {wheel: (float(x), float(z)) for wheel, (x, z) in attachments.items()}
 
 
+def _frozen(values: list[float]) -> np.ndarray:
+    array = np.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
 @dataclass
 class RigidBody3DOF:
     """3-DOF rigid body parameters, geometry, and static load state."""
@@ -241,6 +248,9 @@ class RigidBody3DOF:
     _static_total_load: float = field(init=False, repr=False)
     _static_pitch_moment: float = field(init=False, repr=False)
     _static_roll_moment: float = field(init=False, repr=False)
+    _static_load_vector: np.ndarray = field(init=False, repr=False)
+    _attachment_x: np.ndarray = field(init=False, repr=False)
+    _attachment_z: np.ndarray = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialise geometry defaults and normalise static loads."""
@@ -263,6 +273,8 @@ class RigidBody3DOF:
             raise ValueError("load_sum_tolerance_scale must be non-negative")
 
         self.attachment_points = points
+        self._attachment_x = _frozen([points[wheel][0] for wheel in _WHEEL_ORDER])
+        self._attachment_z = _frozen([points[wheel][1] for wheel in _WHEEL_ORDER])
         self._initialise_static_loads()
 
     def _initialise_static_loads(self) -> None:
@@ -307,6 +319,9 @@ class RigidBody3DOF:
                 resolved[wheel] *= scale
 
         self._static_wheel_loads = resolved
+        self._static_load_vector = _frozen(
+            [resolved[Wheel[wheel]] for wheel in _WHEEL_ORDER]
+        )
         self._static_total_load = target_sum
         self._static_pitch_moment = sum(
             resolved[wheel] * self.attachment_points[wheel.value][1] for wheel in Wheel
@@ -325,6 +340,24 @@ class RigidBody3DOF:
                 raise KeyError(f"Unknown wheel identifier {wheel!r}") from exc
         return self._static_wheel_loads[wheel]
 
+    @property
+    def static_load_vector(self) -> np.ndarray:
+        """Static reactions ordered like ``_WHEEL_ORDER`` (read-only array)."""
+
+        return self._static_load_vector
+
+    @property
+    def attachment_x(self) -> np.ndarray:
+        """Lateral attachment coordinates ordered like ``_WHEEL_ORDER``."""
+
+        return self._attachment_x
+
+    @property
+    def attachment_z(self) -> np.ndarray:
+        """Longitudinal attachment coordinates ordered like ``_WHEEL_ORDER``."""
+
+        return self._attachment_z
+
     @property
     def static_total_load(self) -> float:
         """Sum of static suspension reactions (should equal ``-M*g``)."""
@@ -432,8 +465,39 @@ def _resolve_line_pressure(system: Any, gas: Any, wheel: Wheel, port: Port) -> f
     return float(getattr(tank, "p", 0.0))
 
 
+def wheel_pneumatic_forces(system: Any, gas: Any) -> np.ndarray:
+    """Cylinder forces at each wheel in ``_WHEEL_ORDER`` (N, positive down)
+
+    The forces depend only on line pressures, so they stay constant while the
+    body state is integrated across one physics step.
+    """
+    forces = np.zeros(len(_WHEEL_ORDER))
+    if system is None:
+        return forces
+
+    cylinders = getattr(system, "cylinders", {})
+    for i, wheel_name in enumerate(_WHEEL_ORDER):
+        wheel_enum = Wheel[wheel_name]
+        cylinder = cylinders.get(wheel_enum)
+        if cylinder is None:
+            continue
+        geom = cylinder.spec.geometry
+        area_head = geom.area_head(cylinder.spec.is_front)
+        area_rod = geom.area_rod(cylinder.spec.is_front)
+        head_pressure = _resolve_line_pressure(system, gas, wheel_enum, Port.HEAD)
+        rod_pressure = _resolve_line_pressure(system, gas, wheel_enum, Port.ROD)
+        forces[i] = compute_cylinder_force(
+            head_pressure, rod_pressure, area_head, area_rod
+        )
+    return forces
+
+
 def assemble_forces(
-    system: Any, gas: Any, y: np.ndarray, params: RigidBody3DOF
+    system: Any,
+    gas: Any,
+    y: np.ndarray,
+    params: RigidBody3DOF,
+    pneumatic_forces: np.ndarray | None = None,
 ) -> tuple[np.ndarray, float, float]:
     """Assemble forces and moments from suspension system
 
@@ -442,6 +506,8 @@ def assemble_forces(
         gas: Gas network (provides pressures)
         y: State vector [Y, phi_z, theta_x, dY, dphi_z, dtheta_x]
         params: Rigid body parameters
+        pneumatic_forces: Precomputed :func:`wheel_pneumatic_forces`; resolved
+            from ``system`` and ``gas`` when omitted
 
     Returns:
         Tuple of (vertical_forces[4], tau_x, tau_z)
@@ -450,9 +516,8 @@ def assemble_forces(
         tau_z: Moment around Z-axis (roll) (N*m)
     """
     Y, phi_z, theta_x, dY, dphi_z, dtheta_x = y
-
-    wheel_names = _WHEEL_ORDER  # Left Front, Right Front, Left Rear, Right Rear
-    vertical_forces = np.zeros(len(_WHEEL_ORDER))
+    x = params.attachment_x  # Lateral arms, ordered like _WHEEL_ORDER
+    z = params.attachment_z  # Longitudinal arms
 
     suspension_config = _SUSPENSION_SETTINGS
     k_spring = suspension_config["spring_constant"]  # N/m (spring stiffness per wheel)
@@ -460,85 +525,35 @@ def assemble_forces(
         "damper_coefficient"
     ]  # N*s/m (damping coefficient per wheel)
 
-    # Calculate forces at each wheel
-    include_static = system is None and gas is None
+    # Small-angle wheel displacement and velocity from heave, roll and pitch.
+    # Springs and dampers resist compression (positive displacement = upward
+    # force, i.e. negative in the Y-down convention)
+    wheel_displacement = Y + x * phi_z + z * theta_x
+    wheel_velocity = dY + x * dphi_z + z * dtheta_x
+    vertical_forces = -k_spring * wheel_displacement - c_damper * wheel_velocity
 
-    for i, wheel_name in enumerate(wheel_names):
-        # Get attachment point
-        try:
-            x_i, z_i = params.attachment_points[wheel_name]
-        except KeyError as exc:
-            raise SettingsValidationError(
-                "Отсутствует точка крепления для колеса"
-                f" {wheel_name} в параметрах подвески"
-            ) from exc
-
-        # Calculate wheel vertical displacement accounting for frame angles
-        # Simplified: assume small angles, so wheel displacement ? Y
-        wheel_displacement = Y
-
-        # Add contribution from roll (z-axis rotation)
-        # Wheel moves up/down based on lateral distance and roll angle
-        wheel_displacement += x_i * phi_z
-
-        # Add contribution from pitch (x-axis rotation)
-        # Wheel moves up/down based on longitudinal distance and pitch angle
-        wheel_displacement += z_i * theta_x
-
-        # Spring force (resists compression, acts upward = negative force)
-        # Positive displacement = compression = upward force
-        F_spring = -k_spring * wheel_displacement
-
-        # Damper force (resists velocity)
-        # Calculate wheel velocity including angular contributions
-        wheel_velocity = dY + x_i * dphi_z + z_i * dtheta_x
-        F_damper = -c_damper * wheel_velocity
-
-        F_pneumatic = 0.0
-        cylinder = None
-        try:
-            wheel_enum = Wheel[wheel_name]
-        except KeyError:
-            wheel_enum = None
-
-        if wheel_enum is not None and system is not None:
-            cylinders = getattr(system, "cylinders", {})
-            cylinder = cylinders.get(wheel_enum)
-
-        if cylinder is not None:
-            geom = cylinder.spec.geometry
-            area_head = geom.area_head(cylinder.spec.is_front)
-            area_rod = geom.area_rod(cylinder.spec.is_front)
-            head_pressure = _resolve_line_pressure(system, gas, wheel_enum, Port.HEAD)
-            rod_pressure = _resolve_line_pressure(system, gas, wheel_enum, Port.ROD)
-            F_pneumatic = compute_cylinder_force(
-                head_pressure, rod_pressure, area_head, area_rod
-            )
-
-        # Total vertical force (positive downward)
-        static_reaction = 0.0
-        if include_static:
-            static_reaction = params.static_load_for(wheel_enum or wheel_name)
-
-        vertical_forces[i] = F_spring + F_damper + F_pneumatic + static_reaction
+    if pneumatic_forces is not None:
+        vertical_forces += pneumatic_forces
+    elif system is not None:
+        vertical_forces += wheel_pneumatic_forces(system, gas)
 
-    # Calculate moments about center of mass
-    tau_x = 0.0  # Pitch moment
-    tau_z = 0.0  # Roll moment
+    if system is None and gas is None:
+        vertical_forces += params.static_load_vector
 
-    for i, wheel_name in enumerate(wheel_names):
-        if wheel_name in params.attachment_points:
-            x_i, z_i = params.attachment_points[wheel_name]
-
-            # Moment arms for pitch (about X-axis) and roll (about Z-axis)
-            tau_x += vertical_forces[i] * z_i  # Pitch: force x longitudinal arm
-            tau_z += vertical_forces[i] * x_i  # Roll: force x lateral arm
+    # Moments about center of mass: pitch uses longitudinal, roll lateral arms
+    tau_x = float(vertical_forces @ z)
+    tau_z = float(vertical_forces @ x)
 
     return vertical_forces, tau_x, tau_z
 
 
 def f_rhs(
-    t: float, y: np.ndarray, params: RigidBody3DOF, system: Any, gas: Any
+    t: float,
+    y: np.ndarray,
+    params: RigidBody3DOF,
+    system: Any,
+    gas: Any,
+    pneumatic_forces: np.ndarray | None = None,
 ) -> np.ndarray:
     """Right-hand side of 3-DOF ODE system
 
@@ -550,43 +565,33 @@ def f_rhs(
         params: Rigid body parameters
         system: Pneumatic system
         gas: Gas network
+        pneumatic_forces: Optional precomputed :func:`wheel_pneumatic_forces`
 
     Returns:
         Derivative vector dy/dt
     """
-    # Unpack state
-    Y, phi_z, theta_x, dY, dphi_z, dtheta_x = y
-
-    # Clamp angles to prevent numerical issues
-    phi_z = np.clip(phi_z, -params.angle_limit, params.angle_limit)
-    theta_x = np.clip(theta_x, -params.angle_limit, params.angle_limit)
-
     # Get suspension forces
-    vertical_forces, tau_x, tau_z = assemble_forces(system, gas, y, params)
-
-    static_forces = np.array([params.static_load_for(name) for name in _WHEEL_ORDER])
-    includes_static = system is None and gas is None
+    vertical_forces, tau_x, tau_z = assemble_forces(
+        system, gas, y, params, pneumatic_forces
+    )
 
-    if includes_static:
-        total_vertical_forces = vertical_forces
-    else:
-        total_vertical_forces = vertical_forces + static_forces
-        for idx, wheel_name in enumerate(_WHEEL_ORDER):
-            x_i, z_i = params.attachment_points[wheel_name]
-            tau_x += static_forces[idx] * z_i
-            tau_z += static_forces[idx] * x_i
+    # Sum of vertical forces from suspension (dynamic + static reactions)
+    F_suspension_total = float(vertical_forces.sum())
+    if system is not None or gas is not None:
+        static_forces = params.static_load_vector
+        F_suspension_total += float(static_forces.sum())
+        tau_x += float(static_forces @ params.attachment_z)
+        tau_z += float(static_forces @ params.attachment_x)
 
     # Gravitational force (positive downward)
     F_gravity = params.M * params.g
 
-    # Sum of vertical forces from suspension (dynamic + static reactions)
-    F_suspension_total = np.sum(total_vertical_forces)
-
     # Remove static reaction moments so that neutral pose stays stable
     tau_x -= params.static_pitch_moment
     tau_z -= params.static_roll_moment
 
     # Equations of motion
+    dY, dphi_z, dtheta_x = y[3], y[4], y[5]
     # Heave: vertical acceleration
     d2Y = (F_gravity + F_suspension_total) / params.M
 
@@ -600,6 +605,290 @@ def f_rhs(
     return np.array([dY, dphi_z, dtheta_x, d2Y, d2phi_z, d2theta_x])
 
 
+def f_rhs_jacobian(
+    t: float, y: np.ndarray, params: RigidBody3DOF, system: Any = None, gas: Any = None
+) -> np.ndarray:
+    """Analytic Jacobian ``d f_rhs / d y``
+
+    Spring and damper forces are linear in the state and pneumatic forces
+    depend only on line pressures, so the Jacobian is constant for a given
+    body and suspension configuration; ``t``, ``y``, ``system`` and ``gas``
+    are accepted for solver signature compatibility.
+
+    Returns:
+        (6, 6) matrix
+    """
+    k_spring = _SUSPENSION_SETTINGS["spring_constant"]
+    c_damper = _SUSPENSION_SETTINGS["damper_coefficient"]
+
+    # Rows: heave, roll, pitch generalised forces; columns: Y, phi_z, theta_x
+    arms = np.vstack(
+        (np.ones(len(_WHEEL_ORDER)), params.attachment_x, params.attachment_z)
+    )
+    coupling = (arms @ arms.T) / np.array([[params.M], [params.Iz], [params.Ix]])
+
+    jacobian = np.zeros((6, 6))
+    jacobian[0:3, 3:6] = np.eye(3)
+    jacobian[3:6, 0:3] = -k_spring * coupling
+    jacobian[3:6, 3:6] = -c_damper * coupling
+    jacobian[4, 4] -= params.damping_coefficient
+    jacobian[5, 5] -= params.damping_coefficient
+    return jacobian
+
+
+@dataclass(frozen=True)
+class RigidBodyArrays:
+    """Rigid body parameters of several vehicles stacked for :func:`f_rhs_batch`.
+
+    Scalar parameters become ``(members,)`` arrays and per-wheel quantities
+    ``(members, 4)`` arrays ordered like ``_WHEEL_ORDER``.  Frame spring and
+    damper coefficients are captured from the suspension settings at build
+    time.
+    """
+
+    M: np.ndarray
+    Ix: np.ndarray
+    Iz: np.ndarray
+    g: np.ndarray
+    angle_limit: np.ndarray
+    damping_coefficient: np.ndarray
+    x: np.ndarray  # lateral attachment coordinates
+    z: np.ndarray  # longitudinal attachment coordinates
+    static_loads: np.ndarray
+    static_pitch_residual: np.ndarray  # Σ static·z - static_pitch_moment
+    static_roll_residual: np.ndarray  # Σ static·x - static_roll_moment
+    spring_constant: float
+    damper_coefficient: float
+
+    @classmethod
+    def from_bodies(cls, bodies: "list[RigidBody3DOF]") -> "RigidBodyArrays":
+        """Stack ``bodies`` into array form."""
+
+        bodies = list(bodies)
+        if not bodies:
+            raise ValueError("At least one rigid body is required")
+
+        def _column(name: str) -> np.ndarray:
+            return np.array([float(getattr(body, name)) for body in bodies])
+
+        points = np.array(
+            [[body.attachment_points[name] for name in _WHEEL_ORDER] for body in bodies]
+        )
+        x = points[..., 0]
+        z = points[..., 1]
+        static = np.array(
+            [[body.static_load_for(name) for name in _WHEEL_ORDER] for body in bodies]
+        )
+        return cls(
+            M=_column("M"),
+            Ix=_column("Ix"),
+            Iz=_column("Iz"),
+            g=_column("g"),
+            angle_limit=_column("angle_limit"),
+            damping_coefficient=_column("damping_coefficient"),
+            x=x,
+            z=z,
+            static_loads=static,
+            static_pitch_residual=(static * z).sum(axis=1)
+            - _column("static_pitch_moment"),
+            static_roll_residual=(static * x).sum(axis=1)
+            - _column("static_roll_moment"),
+            spring_constant=float(_SUSPENSION_SETTINGS["spring_constant"]),
+            damper_coefficient=float(_SUSPENSION_SETTINGS["damper_coefficient"]),
+        )
+
+    def __len__(self) -> int:
+        return int(self.M.shape[0])
+
+
+def f_rhs_batch(
+    y: np.ndarray, params: RigidBodyArrays, pneumatic_forces: np.ndarray
+) -> np.ndarray:
+    """Evaluate :func:`f_rhs` for a stack of vehicles at once.
+
+    Args:
+        y: State vectors, shape ``(members, 6)``
+        params: Stacked rigid body parameters
+        pneumatic_forces: Cylinder forces (gauge pressures, N), shape
+            ``(members, 4)`` ordered like ``_WHEEL_ORDER``
+
+    Returns:
+        Derivatives with the same shape as ``y``
+    """
+    Y = y[:, 0:1]
+    phi_z = y[:, 1:2]
+    theta_x = y[:, 2:3]
+    dY = y[:, 3:4]
+    dphi_z = y[:, 4:5]
+    dtheta_x = y[:, 5:6]
+
+    wheel_displacement = Y + params.x * phi_z + params.z * theta_x
+    wheel_velocity = dY + params.x * dphi_z + params.z * dtheta_x
+    vertical_forces = (
+        -params.spring_constant * wheel_displacement
+        - params.damper_coefficient * wheel_velocity
+        + pneumatic_forces
+    )
+
+    tau_x = (vertical_forces * params.z).sum(axis=1) + params.static_pitch_residual
+    tau_z = (vertical_forces * params.x).sum(axis=1) + params.static_roll_residual
+    total_vertical = (vertical_forces + params.static_loads).sum(axis=1)
+
+    derivative = np.empty_like(y)
+    derivative[:, :3] = y[:, 3:]
+    derivative[:, 3] = (params.M * params.g + total_vertical) / params.M
+    derivative[:, 4] = tau_z / params.Iz - params.damping_coefficient * y[:, 4]
+    derivative[:, 5] = tau_x / params.Ix - params.damping_coefficient * y[:, 5]
+    return derivative
+
+
+BODY_INTEGRATION_SCHEMES = ("semi_implicit_euler", "rk4", "implicit_midpoint")
+
+
+class RigidBodyStepper:
+    """Persistent fixed-step integrator for :func:`f_rhs`.
+
+    Replaces a per-step adaptive ``solve_ivp`` call with one fixed step of the
+    selected scheme. Stage buffers are allocated once and reused; the implicit
+    midpoint scheme also keeps the LU factorisation of its Newton matrix until
+    ``dt`` changes, ``jacobian_refresh_steps`` steps have passed or Newton
+    stalls.
+
+    Schemes:
+        semi_implicit_euler: symplectic Euler (velocities first), one
+            evaluation per step
+        rk4: classical fourth-order Runge-Kutta, four evaluations per step
+        implicit_midpoint: A-stable second-order implicit scheme solved with a
+            simplified Newton iteration
+    """
+
+    def __init__(
+        self,
+        params: RigidBody3DOF,
+        scheme: str = "rk4",
+        *,
+        jacobian_refresh_steps: int = 1000,
+        newton_tolerance: float = 1e-10,
+        max_newton_iterations: int = 6,
+    ) -> None:
+        scheme = str(scheme).strip().lower()
+        if scheme not in BODY_INTEGRATION_SCHEMES:
+            raise ValueError(f"Unsupported rigid body integration scheme: {scheme}")
+        if jacobian_refresh_steps <= 0:
+            raise ValueError("jacobian_refresh_steps must be positive")
+
+        self.params = params
+        self.scheme = scheme
+        self.jacobian_refresh_steps = int(jacobian_refresh_steps)
+        self.newton_tolerance = float(newton_tolerance)
+        self.max_newton_iterations = int(max_newton_iterations)
+
+        self.n_evaluations = 0  # RHS evaluations of the last step
+        self.jacobian_updates = 0
+
+        self._stages = np.zeros((4, 6))
+        self._work = np.zeros(6)
+        self._lu: tuple[np.ndarray, np.ndarray] | None = None
+        self._lu_dt = 0.0
+        self._lu_age = 0
+        self._pneumatic_forces: np.ndarray | None = None
+
+    def reset(self) -> None:
+        """Drop the cached Jacobian factorisation."""
+
+        self._lu = None
+        self._lu_age = 0
+
+    def step(
+        self, y: np.ndarray, t: float, dt: float, system: Any, gas: Any
+    ) -> np.ndarray:
+        """Advance ``y`` from ``t`` to ``t + dt`` and return the new state."""
+
+        self.n_evaluations = 0
+        y = np.asarray(y, dtype=float)
+        # Line pressures are frozen for the step, so cylinder forces are too
+        self._pneumatic_forces = (
+            wheel_pneumatic_forces(system, gas) if system is not None else None
+        )
+        if self.scheme == "rk4":
+            return self._step_rk4(y, t, dt, system, gas)
+        if self.scheme == "semi_implicit_euler":
+            return self._step_semi_implicit_euler(y, t, dt, system, gas)
+        return self._step_implicit_midpoint(y, t, dt, system, gas)
+
+    def _rhs(self, t: float, y: np.ndarray, system: Any, gas: Any) -> np.ndarray:
+        self.n_evaluations += 1
+        return f_rhs(t, y, self.params, system, gas, self._pneumatic_forces)
+
+    def _step_semi_implicit_euler(
+        self, y: np.ndarray, t: float, dt: float, system: Any, gas: Any
+    ) -> np.ndarray:
+        derivative = self._rhs(t, y, system, gas)
+        y_new = np.empty(6)
+        y_new[3:] = y[3:] + dt * derivative[3:]
+        y_new[:3] = y[:3] + dt * y_new[3:]
+        return y_new
+
+    def _step_rk4(
+        self, y: np.ndarray, t: float, dt: float, system: Any, gas: Any
+    ) -> np.ndarray:
+        k = self._stages
+        work = self._work
+        half = 0.5 * dt
+
+        k[0] = self._rhs(t, y, system, gas)
+        np.multiply(k[0], half, out=work)
+        work += y
+        k[1] = self._rhs(t + half, work, system, gas)
+        np.multiply(k[1], half, out=work)
+        work += y
+        k[2] = self._rhs(t + half, work, system, gas)
+        np.multiply(k[2], dt, out=work)
+        work += y
+        k[3] = self._rhs(t + dt, work, system, gas)
+
+        return y + (dt / 6.0) * (k[0] + 2.0 * (k[1] + k[2]) + k[3])
+
+    def _factorise(self, t: float, y: np.ndarray, dt: float) -> None:
+        """LU factorisation of ``I - dt/2 J`` with the analytic Jacobian."""
+
+        jacobian = f_rhs_jacobian(t, y, self.params)
+        self._lu = lu_factor(np.eye(6) - 0.5 * dt * jacobian)
+        self._lu_dt = dt
+        self._lu_age = 0
+        self.jacobian_updates += 1
+
+    def _step_implicit_midpoint(
+        self, y: np.ndarray, t: float, dt: float, system: Any, gas: Any
+    ) -> np.ndarray:
+        # Solve m = y + dt/2 * f(t + dt/2, m); then y_new = 2m - y
+        t_mid = t + 0.5 * dt
+        f0 = self._rhs(t_mid, y, system, gas)
+        if (
+            self._lu is None
+            or self._lu_dt != dt
+            or self._lu_age >= self.jacobian_refresh_steps
+        ):
+            self._factorise(t_mid, y, dt)
+        self._lu_age += 1
+
+        for attempt in range(2):
+            midpoint = y + (0.5 * dt) * f0
+            for _ in range(self.max_newton_iterations):
+                residual = (
+                    midpoint - y - (0.5 * dt) * self._rhs(t_mid, midpoint, system, gas)
+                )
+                delta = lu_solve(self._lu, residual)
+                midpoint -= delta
+                scale = self.newton_tolerance * (1.0 + np.abs(midpoint).max())
+                if np.abs(delta).max() <= scale:
+                    return 2.0 * midpoint - y
+            if attempt == 0:
+                # A stale Jacobian slows simplified Newton down; refresh once
+                self._factorise(t_mid, y, dt)
+        raise RuntimeError("Implicit midpoint Newton iteration did not converge")
+
+
 def create_initial_conditions(
     heave: float = 0.0,
     roll: float = 0.0,
@@ -669,6 +958,18 @@ def validate_state(y: np.ndarray, params: RigidBody3DOF) -> tuple[bool, str]:
     return True, ""
 
 
+def validate_state_batch(y: np.ndarray, params: RigidBodyArrays) -> np.ndarray:
+    """Vectorised :func:`validate_state` returning one flag per member."""
+
+    angles = np.abs(y[:, 1:3])
+    return (
+        np.isfinite(y).all(axis=1)
+        & (angles <= params.angle_limit[:, None]).all(axis=1)
+        & (np.abs(y[:, 3]) <= 100.0)
+        & (np.abs(y[:, 4:6]) <= 50.0).all(axis=1)
+    )
+
+
 # Legacy API compatibility
 def rigid_body_3dof_ode(
     t: float, y: np.ndarray, params: RigidBody3DOF, system: Any = None, gas: Any = None
@@ -691,12 +992,19 @@ def rigid_body_3dof_ode(
 
 
 __all__ = [
+    "BODY_INTEGRATION_SCHEMES",
     "RigidBody3DOF",
+    "RigidBodyArrays",
+    "RigidBodyStepper",
     "SuspensionPointState",
     "axis_vertical_projection",
     "assemble_forces",
     "f_rhs",
+    "f_rhs_batch",
+    "f_rhs_jacobian",
+    "wheel_pneumatic_forces",
     "rigid_body_3dof_ode",  # Legacy API
     "create_initial_conditions",
     "validate_state",
+    "validate_state_batch",
 ]
@@ -4,6 +4,9 @@ Handles both incompressible and compressible flow regimes
 """
 
 import math
+
+import numpy as np
+
 from src.common.units import R_AIR, GAMMA_AIR
 
 
@@ -121,7 +124,7 @@ def mass_flow_subsonic(
     T_up: float,
     p_down: float,
     d_eq: float,
-    C_d: float = 0.7,
+    C_d: np.ndarray | float = 0.7,
     gamma: float = GAMMA_AIR,
 ) -> float:
     """Calculate subsonic compressible mass flow rate
@@ -166,7 +169,7 @@ def mass_flow_orifice(
     p_down: float,
     T_down: float,
     d_eq: float,
-    C_d: float = 0.7,
+    C_d: np.ndarray | float = 0.7,
     gamma: float = GAMMA_AIR,
 ) -> float:
     """Calculate mass flow through orifice (high-level function)
@@ -231,3 +234,63 @@ def mass_flow_unlimited(p_tank: float, T_tank: float) -> float:
     d_eq_large = 0.05  # 50mm
 
     return mass_flow_orifice(p_tank, T_tank, PA_ATM, T_tank, d_eq_large, C_d=0.9)
+
+
+def mass_flow_orifice_array(
+    p_up: np.ndarray | float,
+    T_up: np.ndarray | float,
+    p_down: np.ndarray | float,
+    T_down: np.ndarray | float,
+    d_eq: np.ndarray | float,
+    C_d: np.ndarray | float = 0.7,
+    gamma: float = GAMMA_AIR,
+) -> np.ndarray:
+    """Vectorised :func:`mass_flow_orifice` over broadcastable arrays.
+
+    Every element follows the same regime selection and arithmetic as the
+    scalar function, so results agree with it element by element.
+    """
+
+    p_up = np.asarray(p_up, dtype=float)
+    T_up = np.asarray(T_up, dtype=float)
+    p_down = np.asarray(p_down, dtype=float)
+    valid = (
+        (p_up >= 0)
+        & (p_down >= 0)
+        & (T_up > 0)
+        & (np.asarray(T_down) > 0)
+        & (np.asarray(d_eq) >= 0)
+        & (p_down < p_up)
+    )
+    # Placeholders keep the unused branches finite for invalid elements.
+    p_up = np.where(valid, p_up, 1.0)
+    T_up = np.where(valid, T_up, 1.0)
+    p_down = np.where(valid, p_down, 0.0)
+    A = math.pi * (np.asarray(d_eq, dtype=float) / 2.0) ** 2
+
+    pressure_ratio = p_down / p_up
+    critical_ratio = (2.0 / (gamma + 1.0)) ** (gamma / (gamma - 1.0))
+    power_term = (2.0 / (gamma + 1.0)) ** ((gamma + 1.0) / (2.0 * (gamma - 1.0)))
+
+    choked = C_d * A * p_up * np.sqrt(gamma / (R_AIR * T_up)) * power_term
+
+    sqrt_coeff = np.sqrt((2.0 * gamma) / (R_AIR * T_up * (gamma - 1.0)))
+    term1 = pressure_ratio ** (2.0 / gamma)
+    term2 = pressure_ratio ** ((gamma + 1.0) / gamma)
+    subsonic = np.where(
+        term1 <= term2,
+        0.0,
+        C_d * A * p_up * sqrt_coeff * np.sqrt(np.maximum(term1 - term2, 0.0)),
+    )
+
+    rho_up = p_up / (R_AIR * T_up)
+    delta_p = np.maximum(p_up - p_down, 0.0)
+    incompressible = C_d * rho_up * A * np.sqrt(2.0 * delta_p / rho_up)
+
+    flow = np.where(
+        pressure_ratio <= critical_ratio,
+        choked,
+        np.where(pressure_ratio < 0.9, subsonic, incompressible),
+    )
+    result: np.ndarray = np.where(valid, flow, 0.0)
+    return result
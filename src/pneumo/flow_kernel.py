@@ -0,0 +1,421 @@
+"""Array-backed valve and flow update for one or more gas networks.
+
+:class:`VectorizedFlowKernel` mirrors :meth:`GasNetwork.apply_valves_and_flows`
+with line masses, temperatures, pressures and volumes held in ``(members, 4)``
+NumPy arrays and the tank state in ``(members,)`` arrays.  Check valves
+(including their hysteresis state), leaks and receiver relief valves are
+evaluated as batched array operations.  Line to tank transfers are applied one
+line column at a time, vectorised across members, because every transfer
+changes the receiver state seen by the next line exactly as in the scalar
+update.
+
+The kernel binds to its networks once and caches valve and relief parameters;
+call :meth:`VectorizedFlowKernel.refresh_parameters` after changing them.
+:meth:`~VectorizedFlowKernel.load` and :meth:`~VectorizedFlowKernel.store`
+synchronise the arrays with the line/tank dataclasses, while
+:meth:`~VectorizedFlowKernel.step` works on the arrays alone.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.common.units import PA_ATM, R_AIR
+
+from .flow import mass_flow_orifice_array
+from .valves import check_valve_states
+
+if TYPE_CHECKING:
+    from .network import GasNetwork
+    from .valves import CheckValve
+
+_SAFETY_ORIFICE_DIAMETER = 0.05
+_RELIEF_DISCHARGE = np.array((0.7, 0.7, 0.9))
+_RELIEF_KEYS = ("flow_min", "flow_stiff", "flow_safety")
+
+
+@dataclass
+class FlowArrays:
+    """Mass flows (kg/s) produced by :meth:`VectorizedFlowKernel.step`."""
+
+    atmo: np.ndarray  # (members, 4)
+    tank: np.ndarray  # (members, 4)
+    leak: np.ndarray  # (members, 4)
+    relief: np.ndarray  # (members, 3): min, stiff, safety
+
+
+class VectorizedFlowKernel:
+    """Evaluate valve flows for a fixed stack of gas networks in one pass."""
+
+    def __init__(self, networks: Sequence[GasNetwork]) -> None:
+        self.networks = tuple(networks)
+        if not self.networks:
+            raise ValueError("VectorizedFlowKernel requires at least one network")
+        self.line_names = [tuple(net.lines.keys()) for net in self.networks]
+        if any(len(names) != 4 for names in self.line_names):
+            raise ValueError("Every gas network must have exactly four lines")
+
+        shape = (len(self.networks), 4)
+        self.line_mass = np.zeros(shape)
+        self.line_temperature = np.zeros(shape)
+        self.line_pressure = np.zeros(shape)
+        self.line_volume = np.ones(shape)
+        self.tank_mass = np.zeros(shape[0])
+        self.tank_temperature = np.ones(shape[0])
+        self.tank_pressure = np.zeros(shape[0])
+        self.tank_volume = np.ones(shape[0])
+        self.atmo_open = np.zeros(shape, dtype=bool)
+        self.tank_open = np.zeros(shape, dtype=bool)
+        self._atmo_line_pressure = np.zeros(shape)
+        self._tank_valve_pressures = np.zeros((2, *shape))
+        self.refresh_parameters()
+
+    # ------------------------------------------------------------- parameters
+    def refresh_parameters(self) -> None:
+        """Re-read valve, leak and relief settings from the bound networks."""
+
+        pneumo_lines = [
+            [net.system_ref.lines[name] for name in names]
+            for net, names in zip(self.networks, self.line_names)
+        ]
+        self._atmo_valves = [[line.cv_atmo for line in row] for row in pneumo_lines]
+        self._tank_valves = [[line.cv_tank for line in row] for row in pneumo_lines]
+
+        def _valve_params(valves: list[list[CheckValve]]) -> np.ndarray:
+            return np.array(
+                [
+                    [(*valve.hysteresis_thresholds(), valve.d_eq) for valve in row]
+                    for row in valves
+                ],
+                dtype=float,
+            )
+
+        atmo = _valve_params(self._atmo_valves)
+        tank = _valve_params(self._tank_valves)
+        self._atmo_thresholds = (atmo[..., 0], atmo[..., 1])
+        self._atmo_diameter = atmo[..., 2]
+        self._tank_thresholds = (tank[..., 0], tank[..., 1])
+        self._tank_diameter = tank[..., 2]
+
+        networks = self.networks
+        self._ambient = np.array([[net.ambient_temperature] for net in networks])
+        self._leak_rate_coeff = np.array(
+            [
+                [max(0.0, net.leak_coefficient) * max(0.0, net.leak_reference_area)]
+                for net in networks
+            ]
+        )
+        self._relief_thresholds = np.array(
+            [
+                (
+                    net.relief_min_threshold,
+                    net.relief_stiff_threshold,
+                    max(net.relief_safety_threshold, PA_ATM),
+                )
+                for net in networks
+            ]
+        )
+        self._relief_diameters = np.array(
+            [
+                (
+                    net.relief_min_orifice_diameter,
+                    net.relief_stiff_orifice_diameter,
+                    _SAFETY_ORIFICE_DIAMETER,
+                )
+                for net in networks
+            ]
+        )
+
+    # ------------------------------------------------------------------ state
+    def load(self) -> None:
+        """Copy line, tank and check valve state into the kernel arrays."""
+
+        lines = np.array(
+            [
+                [
+                    (state.m, state.T, state.p, state.V_curr)
+                    for state in net.lines.values()
+                ]
+                for net in self.networks
+            ],
+            dtype=float,
+        )
+        self.line_mass = lines[..., 0].copy()
+        self.line_temperature = lines[..., 1].copy()
+        self.line_pressure = lines[..., 2].copy()
+        self.line_volume = lines[..., 3].copy()
+
+        tank = np.array(
+            [(net.tank.m, net.tank.T, net.tank.p, net.tank.V) for net in self.networks],
+            dtype=float,
+        )
+        self.tank_mass = tank[:, 0].copy()
+        self.tank_temperature = tank[:, 1].copy()
+        self.tank_pressure = tank[:, 2].copy()
+        self.tank_volume = tank[:, 3].copy()
+
+        self.atmo_open = np.array(
+            [[valve.state_open for valve in row] for row in self._atmo_valves],
+            dtype=bool,
+        )
+        self.tank_open = np.array(
+            [[valve.state_open for valve in row] for row in self._tank_valves],
+            dtype=bool,
+        )
+
+    def store(self) -> None:
+        """Write the kernel arrays back into line, tank and valve objects."""
+
+        tanks = zip(
+            self.tank_mass.tolist(),
+            self.tank_temperature.tolist(),
+            self.tank_pressure.tolist(),
+        )
+        rows = zip(
+            self.networks,
+            self.line_mass.tolist(),
+            self.line_temperature.tolist(),
+            self.line_pressure.tolist(),
+            tanks,
+        )
+        for net, m_row, t_row, p_row, (tank_m, tank_t, tank_p) in rows:
+            for state, m, T, p in zip(net.lines.values(), m_row, t_row, p_row):
+                state.m = m
+                state.T = T
+                state.p = p
+            net.tank.m = tank_m
+            net.tank.T = tank_t
+            net.tank.p = tank_p
+
+        valve_rows = zip(
+            self._atmo_valves,
+            self._tank_valves,
+            self.atmo_open.tolist(),
+            self.tank_open.tolist(),
+            self._atmo_line_pressure.tolist(),
+            self._tank_valve_pressures[0].tolist(),
+            self._tank_valve_pressures[1].tolist(),
+        )
+        for (
+            atmo_row,
+            tank_row,
+            atmo_flags,
+            tank_flags,
+            p_atmo,
+            p_up,
+            p_down,
+        ) in valve_rows:
+            for valve, flag, p_line in zip(atmo_row, atmo_flags, p_atmo):
+                valve.record_state(PA_ATM, p_line, flag)
+            for valve, flag, up, down in zip(tank_row, tank_flags, p_up, p_down):
+                valve.record_state(up, down, flag)
+
+    # ------------------------------------------------------------------- step
+    def step(self, dt: float) -> FlowArrays:
+        """Advance the array state by ``dt`` without touching the networks."""
+
+        if dt <= 0:
+            raise ValueError(f"Time step must be positive: {dt}")
+
+        m = self.line_mass
+        T = self.line_temperature
+        p = self.line_pressure
+        V = self.line_volume
+        ambient = self._ambient
+
+        # Atmosphere -> line check valves
+        self._atmo_line_pressure = p
+        self.atmo_open = check_valve_states(
+            PA_ATM - p, *self._atmo_thresholds, self.atmo_open
+        )
+        flow_atmo = np.where(
+            self.atmo_open,
+            mass_flow_orifice_array(PA_ATM, ambient, p, T, self._atmo_diameter),
+            0.0,
+        )
+        mass_added = flow_atmo * dt
+        adding = self.atmo_open & (mass_added > 0)
+        if adding.any():
+            new_mass = m + mass_added
+            T = np.where(adding, (m * T + mass_added * ambient) / new_mass, T)
+            m = np.where(adding, new_mass, m)
+            p = np.where(adding, (m * R_AIR * T) / V, p)
+
+        # Line -> tank check valves, one line column at a time
+        tank_m = self.tank_mass
+        tank_T = self.tank_temperature
+        tank_p = self.tank_pressure
+        tank_V = self.tank_volume
+        flow_tank = np.zeros_like(m)
+        m = m.copy()
+        p = p.copy()
+        tank_open = self.tank_open.copy()
+        valve_pressures = self._tank_valve_pressures
+        open_threshold, close_threshold = self._tank_thresholds
+        for column in range(m.shape[1]):
+            line_m = m[:, column]
+            line_T = T[:, column]
+            line_p = p[:, column]
+            valve_pressures[0, :, column] = line_p
+            valve_pressures[1, :, column] = tank_p
+            is_open = check_valve_states(
+                line_p - tank_p,
+                open_threshold[:, column],
+                close_threshold[:, column],
+                tank_open[:, column],
+            )
+            tank_open[:, column] = is_open
+            if not is_open.any():
+                continue
+            requested = (
+                mass_flow_orifice_array(
+                    line_p, line_T, tank_p, tank_T, self._tank_diameter[:, column]
+                )
+                * dt
+            )
+            moving = is_open & (requested > 0.0) & (line_m > 0.0)
+            if not moving.any():
+                continue
+            actual = np.where(moving, np.minimum(requested, line_m), 0.0)
+            remaining = np.maximum(line_m - actual, 0.0)
+            new_tank_m = tank_m + actual
+            tank_T = np.where(
+                moving & (new_tank_m > 0.0),
+                (tank_m * tank_T + actual * line_T) / np.where(moving, new_tank_m, 1.0),
+                tank_T,
+            )
+            tank_m = np.where(moving, new_tank_m, tank_m)
+            flow_tank[:, column] = np.where(moving & (actual > 0.0), actual / dt, 0.0)
+            p[:, column] = np.where(
+                moving,
+                np.where(
+                    remaining > 0.0, (remaining * R_AIR * line_T) / V[:, column], 0.0
+                ),
+                line_p,
+            )
+            m[:, column] = np.where(moving, remaining, line_m)
+            tank_p = np.where(
+                moving,
+                np.where(tank_m > 0.0, (tank_m * R_AIR * tank_T) / tank_V, 0.0),
+                tank_p,
+            )
+        self.tank_open = tank_open
+
+        # Distributed leaks
+        flow_leak = np.zeros_like(m)
+        if (self._leak_rate_coeff > 0.0).any():
+            pressure_drop = np.maximum(p - PA_ATM, 0.0)
+            leak_rate = self._leak_rate_coeff * pressure_drop
+            mass_loss = np.minimum(leak_rate * dt, m)
+            leaking = (m > 0.0) & (pressure_drop > 0.0) & (leak_rate > 0.0)
+            leaking &= mass_loss > 0.0
+            if leaking.any():
+                remaining = np.maximum(m - mass_loss, 0.0)
+                p = np.where(
+                    leaking,
+                    np.where(remaining > 0.0, (remaining * R_AIR * T) / V, 0.0),
+                    p,
+                )
+                m = np.where(leaking, remaining, m)
+                flow_leak = np.where(leaking, mass_loss / dt, 0.0)
+
+        # Receiver relief valves: minimum pressure, stiffness and safety
+        relief_open = tank_p[:, None] > self._relief_thresholds
+        relief = np.zeros(relief_open.shape)
+        if relief_open.any():
+            downstream_T = np.column_stack((ambient[:, 0], ambient[:, 0], tank_T))
+            relief = np.where(
+                relief_open,
+                mass_flow_orifice_array(
+                    tank_p[:, None],
+                    tank_T[:, None],
+                    PA_ATM,
+                    downstream_T,
+                    self._relief_diameters,
+                    _RELIEF_DISCHARGE,
+                ),
+                0.0,
+            )
+            masses = relief * dt
+            total_out = masses[:, 0] + masses[:, 1] + masses[:, 2]
+            venting = total_out > 0.0
+            tank_m = np.where(venting, np.maximum(0.0, tank_m - total_out), tank_m)
+            tank_p = np.where(
+                venting,
+                np.where(tank_m > 0.0, (tank_m * R_AIR * tank_T) / tank_V, 0.0),
+                tank_p,
+            )
+
+        self.line_mass = m
+        self.line_temperature = T
+        self.line_pressure = p
+        self.tank_mass = tank_m
+        self.tank_temperature = tank_T
+        self.tank_pressure = tank_p
+        return FlowArrays(atmo=flow_atmo, tank=flow_tank, leak=flow_leak, relief=relief)
+
+    def update_valve_states(self) -> None:
+        """Re-evaluate check valve hysteresis at the current array pressures.
+
+        Mirrors the ``is_open`` queries :func:`~src.runtime.steps.update_gas_state`
+        issues when it reports line states after the flow update.
+        """
+
+        p = self.line_pressure
+        tank_p = np.broadcast_to(self.tank_pressure[:, None], p.shape)
+        self._atmo_line_pressure = p
+        self._tank_valve_pressures = np.stack((p, tank_p))
+        self.atmo_open = check_valve_states(
+            PA_ATM - p, *self._atmo_thresholds, self.atmo_open
+        )
+        self.tank_open = check_valve_states(
+            p - tank_p, *self._tank_thresholds, self.tank_open
+        )
+
+    def apply(
+        self, dt: float, log: logging.Logger | None = None
+    ) -> list[dict[str, dict]]:
+        """Load, step and store the bound networks; return per-network logs.
+
+        Each log has the structure returned by
+        :meth:`GasNetwork.apply_valves_and_flows`.
+        """
+
+        self.load()
+        flows = self.step(dt)
+        self.store()
+
+        if log:
+            log.debug(
+                "Vectorised valve update: members=%d, atmo=%.6fkg/s, "
+                "tank=%.6fkg/s, relief=%.6fkg/s",
+                len(self.networks),
+                float(flows.atmo.sum()),
+                float(flows.tank.sum()),
+                float(flows.relief.sum()),
+            )
+
+        results: list[dict[str, dict]] = []
+        for names, atmo_row, tank_row, leak_row, relief_row in zip(
+            self.line_names,
+            flows.atmo.tolist(),
+            flows.tank.tolist(),
+            flows.leak.tolist(),
+            flows.relief.tolist(),
+        ):
+            line_flows = {
+                name: {"flow_atmo": atmo, "flow_tank": tank, "flow_leak": leak}
+                for name, atmo, tank, leak in zip(names, atmo_row, tank_row, leak_row)
+            }
+            results.append(
+                {"lines": line_flows, "relief": dict(zip(_RELIEF_KEYS, relief_row))}
+            )
+        return results
+
+
+__all__ = ["FlowArrays", "VectorizedFlowKernel"]
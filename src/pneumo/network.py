@@ -7,6 +7,7 @@ import logging
 from dataclasses import dataclass, field
 from functools import lru_cache
 from collections.abc import Mapping, Sequence
+from typing import TypeVar
 from .enums import Line, ThermoMode
 from .gas_state import (
     LineGasState,
@@ -17,6 +18,7 @@ from .gas_state import (
     p_from_mTV,
 )
 from .flow import mass_flow_orifice, mass_flow_unlimited
+from .flow_kernel import VectorizedFlowKernel
 from .system import PneumaticSystem
 from .thermo import PolytropicParameters
 from config.constants import (
@@ -67,6 +69,27 @@ def _default_relief_stiff_orifice() -> float:
     return _relief_orifice_defaults()["stiff"]
 
 
+_LogT = TypeVar("_LogT")
+
+
+def debug_logger(log: _LogT | None) -> _LogT | None:
+    """Return ``log`` only when it would emit DEBUG records.
+
+    Callers guard their diagnostic formatting with ``if log:``; dropping
+    loggers that filter DEBUG keeps that formatting off the hot path.
+    """
+
+    if log is None:
+        return None
+    is_enabled_for = getattr(log, "isEnabledFor", None)
+    if is_enabled_for is None:
+        return log
+    try:
+        return log if is_enabled_for(logging.DEBUG) else None
+    except Exception:
+        return log
+
+
 @dataclass
 class GasNetwork:
     """Complete gas network with lines, tank, and valves.
@@ -98,6 +121,10 @@ class GasNetwork:
     leak_coefficient: float = 0.0
     leak_reference_area: float = 0.0
     master_equalization_diameter: float = 0.0
+    flow_kernel: str = "scalar"
+    _vectorized_flows: VectorizedFlowKernel | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate network configuration"""
@@ -132,6 +159,11 @@ class GasNetwork:
                 f"got {self.master_equalization_diameter}"
             )
 
+        if self.flow_kernel not in {"scalar", "vectorized"}:
+            raise ValueError(
+                f"flow_kernel must be 'scalar' or 'vectorized', got {self.flow_kernel}"
+            )
+
     def compute_line_volumes(self) -> dict[Line, float]:
         """Compute current volumes for all lines from cylinder states
 
@@ -175,6 +207,9 @@ class GasNetwork:
     ) -> dict[str, dict[str, float]]:
         """Apply valve flows for one time step
 
+        ``flow_kernel="vectorized"`` routes the update through
+        :class:`~src.pneumo.flow_kernel.VectorizedFlowKernel`.
+
         Args:
             dt: Time step (s)
             log: Optional logger for diagnostics
@@ -182,6 +217,15 @@ class GasNetwork:
         if dt <= 0:
             raise ValueError(f"Time step must be positive: {dt}")
 
+        log = debug_logger(log)
+        if self.flow_kernel == "vectorized":
+            kernel = self._vectorized_flows
+            if kernel is None or kernel.line_names[0] != tuple(self.lines):
+                kernel = self._vectorized_flows = VectorizedFlowKernel((self,))
+            else:
+                kernel.refresh_parameters()
+            return kernel.apply(dt, log)[0]
+
         # Process flows for each line
         line_flows: dict[Line, dict[str, float]] = {
             line_name: {"flow_atmo": 0.0, "flow_tank": 0.0, "flow_leak": 0.0}
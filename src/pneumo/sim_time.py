@@ -4,7 +4,7 @@ Advances gas state without body dynamics (no ODE solver)
 """
 
 import logging
-from .network import GasNetwork
+from .network import GasNetwork, debug_logger
 from .system import PneumaticSystem
 from .enums import ThermoMode, Line
 
@@ -16,7 +16,7 @@ def advance_gas(
     thermo_mode: ThermoMode,
     log: logging.Logger | None = None,
     volumes_override: dict[Line, float] | None = None,
-):
+) -> dict[str, dict]:
     """Advance gas simulation by one time step
 
     Args:
@@ -27,10 +27,15 @@ def advance_gas(
         log: Optional logger for diagnostics
         volumes_override: Optional mapping of line volumes to use instead of
             querying the pneumatic system (e.g. to account for stop penetration)
+
+    Returns:
+        Valve flow log from :meth:`GasNetwork.apply_valves_and_flows`
+        (``{"lines": {...}, "relief": {...}}``, mass flows in kg/s)
     """
     if dt <= 0:
         raise ValueError(f"Time step must be positive: {dt}")
 
+    log = debug_logger(log)
     if log:
         log.debug(f"=== Gas step: dt={dt:.4f}s, mode={thermo_mode.value} ===")
 
@@ -53,7 +58,7 @@ def advance_gas(
     if log:
         log.debug("Step 2: Applying valve flows")
 
-    net.apply_valves_and_flows(dt, log)
+    flows = net.apply_valves_and_flows(dt, log)
 
     # Step 3: Enforce master isolation if enabled
     if net.master_isolation_open:
@@ -72,6 +77,8 @@ def advance_gas(
                 f"  {line_name.value}: p={line_state.p:.0f}Pa, T={line_state.T:.1f}K, m={line_state.m:.6f}kg"
             )
 
+    return flows
+
 
 def run_gas_simulation(
     total_time: float,
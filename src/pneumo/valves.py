@@ -13,6 +13,8 @@ from __future__ import annotations
 from functools import lru_cache
 from collections.abc import Mapping
 
+import numpy as np
+
 from .enums import CheckValveKind, ReliefValveKind
 from .types import ValidationResult
 from src.common.errors import ModelConfigError
@@ -233,6 +235,38 @@ class CheckValve:
             self._is_open = False
         return self._is_open
 
+    def hysteresis_thresholds(self) -> tuple[float, float]:
+        """Return ``(open, close)`` pressure differentials for batched updates.
+
+        Valve kinds without a flow direction never open, which is encoded as
+        an infinite opening threshold.
+        """
+
+        if self.kind not in (
+            None,
+            CheckValveKind.ATMO_TO_LINE,
+            CheckValveKind.LINE_TO_TANK,
+        ):
+            return (float("inf"), float("inf"))
+        return (
+            self.delta_open_min,
+            self._closing_threshold(self.delta_open_min),
+        )
+
+    @property
+    def state_open(self) -> bool:
+        """Open state left by the most recent evaluation."""
+
+        return self._is_open
+
+    def record_state(
+        self, p_upstream: float, p_downstream: float, is_open: bool
+    ) -> None:
+        """Store the outcome of a batched evaluation of this valve."""
+
+        self.set_pressures(p_upstream, p_downstream)
+        self._is_open = bool(is_open)
+
     def validate_invariants(self) -> ValidationResult:
         """Validate valve configuration and return a structured report."""
 
@@ -260,6 +294,26 @@ class CheckValve:
         }
 
 
+def check_valve_states(
+    delta_p: np.ndarray,
+    open_threshold: np.ndarray | float,
+    close_threshold: np.ndarray | float,
+    was_open: np.ndarray,
+) -> np.ndarray:
+    """Vectorised hysteresis rule of :meth:`CheckValve.is_open`.
+
+    Closing thresholds are never negative, so reverse flow always closes a
+    directional valve just like the scalar implementation.
+    """
+
+    states: np.ndarray = np.where(
+        delta_p >= open_threshold,
+        True,
+        np.where(delta_p <= close_threshold, False, was_open),
+    )
+    return states
+
+
 class ReliefValve:
     """Pressure relief valve with throttling and hysteresis."""
 
@@ -13,6 +13,7 @@ from .types import (
     RoadConfig,
     ISO8608_PARAMETERS,
     WHEEL_POSITIONS,
+    WHEEL_KEYS,
     validate_wheel_excitation,
 )
 
@@ -27,6 +28,7 @@ from .generators import (
 )
 
 from .csv_io import detect_csv_format, load_csv_profile, save_csv_profile
+from .binary_io import is_binary_profile, load_binary_profile, save_binary_profile
 
 from .scenarios import (
     create_highway_preset,
@@ -43,6 +45,7 @@ from .scenarios import (
 )
 
 from .engine import RoadInput, create_road_input_from_preset
+from .streaming import StreamingRoadInput
 
 # Version info
 __version__ = "4.9.8"
@@ -51,6 +54,7 @@ __version__ = "4.9.8"
 __all__ = [
     # Main classes
     "RoadInput",
+    "StreamingRoadInput",
     # Configuration types
     "SourceKind",
     "Iso8608Class",
@@ -68,6 +72,10 @@ __all__ = [
     "load_csv_profile",
     "save_csv_profile",
     "detect_csv_format",
+    # Binary profile containers
+    "is_binary_profile",
+    "load_binary_profile",
+    "save_binary_profile",
     # Scenario presets
     "create_highway_preset",
     "create_urban_preset",
@@ -86,6 +94,7 @@ __all__ = [
     # Constants and reference data
     "ISO8608_PARAMETERS",
     "WHEEL_POSITIONS",
+    "WHEEL_KEYS",
     "ISO3888_DLC_GEOMETRY",
     "TRL_SPEED_BUMP_SPECS",
 ]
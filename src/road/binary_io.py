@@ -0,0 +1,179 @@
+"""
+Binary road profile container
+Fixed-size header followed by row-major records (time, LF, RF, LR, RR) that can
+be memory-mapped directly, so multi-hour measured profiles load without parsing
+"""
+
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from .types import WHEEL_KEYS
+
+PROFILE_SUFFIX = ".psrp"
+
+_MAGIC = b"PSRP"
+_VERSION = 1
+# magic, version, itemsize, columns, samples; padded to _HEADER_SIZE bytes
+_HEADER = struct.Struct("<4sHHIQ")
+_HEADER_SIZE = 64
+_COLUMNS = 1 + len(WHEEL_KEYS)
+_DTYPES: dict[int, np.dtype[np.floating]] = {
+    4: np.dtype("<f4"),
+    8: np.dtype("<f8"),
+}
+# Time stamps may deviate from the ideal grid by this fraction of a sample
+_GRID_TOLERANCE = 1e-3
+_CHECK_CHUNK = 1 << 16
+
+
+def is_binary_profile(filepath: str | os.PathLike) -> bool:
+    """Return True when ``filepath`` starts with the binary profile magic"""
+    try:
+        with open(filepath, "rb") as f:
+            return f.read(len(_MAGIC)) == _MAGIC
+    except OSError:
+        return False
+
+
+def _check_time_grid(time: np.ndarray, eps: float) -> None:
+    """Raise ValueError unless ``time`` is strictly increasing and uniform
+
+    RoadInput looks samples up from the first and last stamp and the sample
+    count only, so every stamp has to sit on that grid. ``eps`` is the storage
+    precision; mapped files are checked chunk by chunk.
+    """
+    samples = time.shape[0]
+    if samples < 2:
+        return
+    t0, t1 = float(time[0]), float(time[-1])
+    if not t1 > t0:
+        raise ValueError("Binary road profile time must be strictly increasing")
+    step = (t1 - t0) / (samples - 1)
+    tolerance = _GRID_TOLERANCE * step + 4.0 * eps * max(abs(t0), abs(t1))
+    for start in range(0, samples - 1, _CHECK_CHUNK):
+        stop = min(start + _CHECK_CHUNK + 1, samples)
+        chunk = np.asarray(time[start:stop], dtype=float)
+        if not (np.diff(chunk) > 0.0).all():
+            raise ValueError("Binary road profile time must be strictly increasing")
+        grid = t0 + step * np.arange(start, stop)
+        if not (np.abs(chunk - grid) <= tolerance).all():
+            raise ValueError(
+                f"Binary road profile time is not uniform (expected step {step:g} s)"
+            )
+
+
+def save_binary_profile(
+    filepath: str | os.PathLike,
+    time: np.ndarray,
+    wheel_profiles: dict[str, np.ndarray],
+    dtype: DTypeLike = np.float64,
+) -> Path:
+    """Write wheel profiles to a binary profile container
+
+    The file is written to a temporary name and renamed into place, so readers
+    never observe a partially written container.
+
+    Args:
+        filepath: Output file path
+        time: Uniform, strictly increasing time array (s)
+        wheel_profiles: Dictionary with 'LF', 'RF', 'LR', 'RR' profiles (m)
+        dtype: Storage precision, float32 or float64 (float32 halves the file
+            but keeps only ~7 significant digits of time)
+
+    Returns:
+        Path of the written container
+    """
+    storage = np.dtype(dtype).newbyteorder("<")
+    if storage.itemsize not in _DTYPES or storage.kind != "f":
+        raise ValueError(f"Unsupported profile dtype: {storage}")
+
+    time = np.asarray(time, dtype=float)
+    records = np.empty((time.size, _COLUMNS), dtype=storage)
+    records[:, 0] = time
+    for column, wheel in enumerate(WHEEL_KEYS, start=1):
+        profile = np.asarray(wheel_profiles[wheel], dtype=float)
+        if profile.shape != time.shape:
+            raise ValueError(
+                f"{wheel} profile has {profile.size} samples, expected {time.size}"
+            )
+        records[:, column] = profile
+    if not np.isfinite(records).all():
+        raise ValueError("Binary road profiles must contain only finite values")
+    # Checked after the cast: float32 may merge stamps of long profiles
+    _check_time_grid(records[:, 0], float(np.finfo(_DTYPES[storage.itemsize]).eps))
+
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    header = _HEADER.pack(_MAGIC, _VERSION, storage.itemsize, _COLUMNS, time.size)
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header.ljust(_HEADER_SIZE, b"\0"))
+            records.tofile(f)
+        os.replace(tmp_path, filepath)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return filepath
+
+
+def load_binary_profile(
+    filepath: str | os.PathLike,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Memory-map a binary profile container
+
+    Args:
+        filepath: Path to container
+
+    Returns:
+        (time_array, wheel_table) read-only views of the mapped file;
+        ``wheel_table`` has shape (samples, 4) with columns in WHEEL_KEYS order
+
+    Raises:
+        ValueError: Invalid container or a time column that is not strictly
+            increasing on a uniform grid
+    """
+    filepath = Path(filepath)
+    with open(filepath, "rb") as f:
+        header = f.read(_HEADER_SIZE)
+    if not header.startswith(_MAGIC):
+        raise ValueError(f"Not a binary road profile: {filepath}")
+    if len(header) < _HEADER.size:
+        raise ValueError(f"Truncated binary road profile: {filepath}")
+
+    _magic, version, itemsize, columns, samples = _HEADER.unpack_from(header)
+    if version != _VERSION:
+        raise ValueError(f"Unsupported binary road profile version {version}")
+    if itemsize not in _DTYPES or columns != _COLUMNS:
+        raise ValueError(
+            f"Invalid binary road profile layout: itemsize={itemsize}, "
+            f"columns={columns}"
+        )
+
+    expected_size = _HEADER_SIZE + samples * columns * itemsize
+    if filepath.stat().st_size != expected_size:
+        raise ValueError(
+            f"Binary road profile size mismatch: {filepath} "
+            f"(expected {expected_size} bytes)"
+        )
+
+    records = np.memmap(
+        filepath,
+        dtype=_DTYPES[itemsize],
+        mode="r",
+        offset=_HEADER_SIZE,
+        shape=(samples, columns),
+    )
+    _check_time_grid(records[:, 0], float(np.finfo(records.dtype).eps))
+    return records[:, 0], records[:, 1:]
+
+
+__all__ = [
+    "PROFILE_SUFFIX",
+    "is_binary_profile",
+    "load_binary_profile",
+    "save_binary_profile",
+]
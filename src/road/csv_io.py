@@ -2,16 +2,27 @@
 CSV road profile input/output
 Supports RFC 4180 compliant CSV parsing with auto-detection
 Handles formats: time,z and time,LF,RF,LR,RR
+Parsed profiles are cached as memory-mapped binary containers keyed by content
 """
 
 import csv
+import hashlib
+import os
 import numpy as np
 from pathlib import Path
 from typing import Any
 import warnings
 from scipy.interpolate import interp1d
 
-from .types import CorrelationSpec
+from .binary_io import (
+    PROFILE_SUFFIX,
+    is_binary_profile,
+    load_binary_profile,
+    save_binary_profile,
+)
+from .types import WHEEL_KEYS, CorrelationSpec
+
+CACHE_DIR_ENV = "PSS_ROAD_CACHE_DIR"
 
 
 def detect_csv_format(filepath: str, max_preview_lines: int = 10) -> dict[str, Any]:
@@ -116,6 +127,18 @@ def detect_csv_format(filepath: str, max_preview_lines: int = 10) -> dict[str, A
     return format_info
 
 
+def default_cache_dir() -> Path:
+    """Return the binary profile cache directory
+
+    Uses ``$PSS_ROAD_CACHE_DIR`` when set, otherwise
+    ``~/.cache/pneumostabsim/road_profiles``.
+    """
+    override = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "pneumostabsim" / "road_profiles"
+
+
 def load_csv_profile(
     filepath: str,
     format_type: str = "auto",
@@ -123,21 +146,145 @@ def load_csv_profile(
     velocity: float = 25.0,
     correlation: CorrelationSpec | None = None,
     resample_hz: float = 1000.0,
+    cache_dir: str | os.PathLike | None = None,
+    use_cache: bool = True,
 ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
     """Load road profile from CSV file
 
+    The first load converts the CSV into a binary container in ``cache_dir``;
+    later loads of the same content with the same parameters memory-map it.
+    Cached profiles are returned as read-only arrays.
+
     Args:
-        filepath: Path to CSV file
+        filepath: Path to CSV file (or binary profile container)
         format_type: 'auto', 'time_z', 'time_wheels', 'wheels_only'
         wheelbase: Vehicle wheelbase for rear axle delay (m)
         velocity: Vehicle velocity for time/distance conversion (m/s)
         correlation: Correlation spec for generating right track from left
         resample_hz: Target sampling frequency (Hz)
+        cache_dir: Binary cache directory (default: :func:`default_cache_dir`)
+        use_cache: Read and populate the binary cache
 
     Returns:
         (time_array, wheel_profiles_dict)
         wheel_profiles_dict keys: 'LF', 'RF', 'LR', 'RR'
     """
+    time, table = load_profile_table(
+        filepath,
+        format_type=format_type,
+        wheelbase=wheelbase,
+        velocity=velocity,
+        correlation=correlation,
+        resample_hz=resample_hz,
+        cache_dir=cache_dir,
+        use_cache=use_cache,
+    )
+    return time, {wheel: table[:, i] for i, wheel in enumerate(WHEEL_KEYS)}
+
+
+def load_profile_table(
+    filepath: str,
+    format_type: str = "auto",
+    wheelbase: float = 3.2,
+    velocity: float = 25.0,
+    correlation: CorrelationSpec | None = None,
+    resample_hz: float = 1000.0,
+    cache_dir: str | os.PathLike | None = None,
+    use_cache: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Load road profile as a (samples, 4) wheel table
+
+    Same arguments as :func:`load_csv_profile`. Binary containers are mapped
+    directly; cached CSV conversions are mapped from ``cache_dir``.
+
+    Returns:
+        (time_array, wheel_table) with table columns in WHEEL_KEYS order
+    """
+    if is_binary_profile(filepath):
+        return load_binary_profile(filepath)
+
+    if correlation is None:
+        correlation = CorrelationSpec()
+
+    def parse() -> tuple[np.ndarray, np.ndarray]:
+        time, profiles = _parse_csv_profile(
+            filepath, format_type, wheelbase, velocity, correlation, resample_hz
+        )
+        return time, np.column_stack([profiles[wheel] for wheel in WHEEL_KEYS])
+
+    if not use_cache:
+        return parse()
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    key = hashlib.blake2b(
+        repr(
+            (
+                _content_digest(Path(filepath), cache_dir),
+                format_type,
+                float(wheelbase),
+                float(velocity),
+                (correlation.rho_LR, correlation.seed, correlation.method),
+                float(resample_hz),
+            )
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+    cached = cache_dir / f"{key}{PROFILE_SUFFIX}"
+
+    if cached.exists():
+        try:
+            return load_binary_profile(cached)
+        except ValueError:
+            pass  # corrupt entry: rebuild below
+
+    time, table = parse()
+    profiles = {wheel: table[:, i] for i, wheel in enumerate(WHEEL_KEYS)}
+    try:
+        return load_binary_profile(save_binary_profile(cached, time, profiles))
+    except (OSError, ValueError) as e:
+        warnings.warn(f"Could not cache road profile {filepath}: {e}")
+        return time, table
+
+
+def _content_digest(filepath: Path, cache_dir: Path) -> str:
+    """Hash file content, memoised by (size, mtime) in ``cache_dir``"""
+    stat = filepath.stat()
+    stamp = f"{stat.st_size} {stat.st_mtime_ns}"
+    path_key = hashlib.blake2b(
+        str(filepath.resolve()).encode(), digest_size=16
+    ).hexdigest()
+    stamp_file = cache_dir / "sources" / path_key
+
+    try:
+        recorded_stamp, digest = stamp_file.read_text().rsplit(" ", 1)
+        if recorded_stamp == stamp:
+            return digest
+    except (OSError, ValueError):
+        pass
+
+    hasher = hashlib.blake2b(digest_size=32)
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(block)
+    digest = hasher.hexdigest()
+
+    try:
+        stamp_file.parent.mkdir(parents=True, exist_ok=True)
+        stamp_file.write_text(f"{stamp} {digest}")
+    except OSError:
+        pass
+    return digest
+
+
+def _parse_csv_profile(
+    filepath: str,
+    format_type: str,
+    wheelbase: float,
+    velocity: float,
+    correlation: CorrelationSpec,
+    resample_hz: float,
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Parse and resample a CSV road profile"""
     # Auto-detect format if needed
     if format_type == "auto":
         format_info = detect_csv_format(filepath)
@@ -154,9 +301,6 @@ def load_csv_profile(
         delimiter = ","
         encoding = "utf-8"
 
-    if correlation is None:
-        correlation = CorrelationSpec()
-
     # Read CSV data
     try:
         with open(filepath, encoding=encoding, newline="") as f:
@@ -439,4 +583,10 @@ def save_csv_profile(
 
 
 # Export functions
-__all__ = ["detect_csv_format", "load_csv_profile", "save_csv_profile"]
+__all__ = [
+    "default_cache_dir",
+    "detect_csv_format",
+    "load_csv_profile",
+    "load_profile_table",
+    "save_csv_profile",
+]
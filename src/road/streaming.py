@@ -0,0 +1,461 @@
+"""
+Streaming road excitation for unbounded simulation runs
+Generates left/right track profiles in fixed-size chunks on demand and keeps
+only a bounded ring buffer of recent samples
+"""
+
+import math
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from scipy import signal
+
+from .types import (
+    ISO8608_PARAMETERS,
+    CorrelationSpec,
+    Iso8608Class,
+    RoadConfig,
+    WHEEL_KEYS,
+    SourceKind,
+)
+
+_ISO_REFERENCE_FREQUENCY = 0.1  # n0 (cycles/m)
+
+# Track displacement (m) as a function of sample times (s)
+_Profile = Callable[[np.ndarray], np.ndarray]
+
+
+class _ChunkSource:
+    """Produce consecutive chunks of the left/right track profiles."""
+
+    def reset(self) -> None:
+        """Restart the source from its initial state."""
+
+    def generate(self, start: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``count`` samples of both tracks starting at sample ``start``."""
+
+        raise NotImplementedError
+
+
+class _AnalyticSource(_ChunkSource):
+    """Deterministic profile evaluated directly at the chunk sample times."""
+
+    def __init__(
+        self,
+        profile: _Profile,
+        sample_rate: float,
+        correlation: CorrelationSpec | None,
+    ) -> None:
+        self._profile = profile
+        self._sample_rate = sample_rate
+        self._correlation = correlation
+        self._rng = np.random.default_rng(correlation.seed if correlation else None)
+
+    def reset(self) -> None:
+        seed = self._correlation.seed if self._correlation else None
+        self._rng = np.random.default_rng(seed)
+
+    def generate(self, start: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+        t = (start + np.arange(count)) / self._sample_rate
+        left = self._profile(t)
+        correlation = self._correlation
+        if correlation is None or correlation.rho_LR >= 1.0:
+            return left, left.copy()
+
+        # Same construction as RoadInput._apply_correlation, scaled per chunk.
+        rho = correlation.rho_LR
+        noise = self._rng.standard_normal(count) * np.std(left) * math.sqrt(1 - rho**2)
+        return left, rho * left + noise
+
+
+class _Iso8608Source(_ChunkSource):
+    """ISO 8608 random profile synthesised by windowed overlap-add.
+
+    Every segment spans two chunks and is shaped with a sine window whose
+    squares sum to one at 50 % overlap, so consecutive chunks join without
+    jumps and the profile variance stays stationary.
+    """
+
+    def __init__(
+        self,
+        iso_class: Iso8608Class,
+        velocity: float,
+        sample_rate: float,
+        chunk_size: int,
+        correlation: CorrelationSpec,
+    ) -> None:
+        self._correlation = correlation
+        self._chunk_size = chunk_size
+        segment = 2 * chunk_size
+        dz = velocity / sample_rate
+
+        # One-sided amplitudes sqrt(Gd(n)·dn) for n = k·dn, dn = 1/(segment·dz).
+        params = ISO8608_PARAMETERS[iso_class]
+        freqs = np.fft.rfftfreq(segment, dz)[1:]
+        psd = params["Gd"] * (freqs / _ISO_REFERENCE_FREQUENCY) ** (-params["w"])
+        self._amplitude = np.sqrt(psd * freqs[0])
+        self._segment = segment
+        self._window = np.sin(np.pi * (np.arange(segment) + 0.5) / segment)
+        self.reset()
+
+    def reset(self) -> None:
+        self._rng = np.random.default_rng(self._correlation.seed)
+        self._pending = self._next_segment()[:, self._chunk_size :]
+
+    def _synthesise(self) -> np.ndarray:
+        noise = self._rng.standard_normal((2, self._amplitude.size))
+        spectrum = np.zeros(self._segment // 2 + 1, dtype=complex)
+        spectrum[1:] = self._amplitude * (noise[0] + 1j * noise[1])
+        # irfft carries a 1/N factor and folds the conjugate half: N/2 restores
+        # x(z) = Σ Re(A_k e^{i·2π·n_k·z}).
+        return np.fft.irfft(spectrum, self._segment) * (self._segment / 2)
+
+    def _next_segment(self) -> np.ndarray:
+        left = self._synthesise()
+        correlation = self._correlation
+        rho = correlation.rho_LR
+        if rho >= 1.0:
+            right = left.copy()
+        elif correlation.method == "coherence":
+            right = rho * left + math.sqrt(1 - rho**2) * self._synthesise()
+        else:
+            noise = self._rng.standard_normal(self._segment)
+            right = rho * left + noise * math.sqrt(1 - rho**2)
+        segment: np.ndarray = np.vstack((left, right)) * self._window
+        return segment
+
+    def generate(self, start: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+        if count != self._chunk_size:
+            raise ValueError(f"ISO 8608 chunks must have {self._chunk_size} samples")
+        segment = self._next_segment()
+        chunk = self._pending + segment[:, :count]
+        self._pending = segment[:, count:]
+        return chunk[0], chunk[1]
+
+
+class StreamingRoadInput:
+    """Unbounded road input generated chunk by chunk
+
+    Drop-in replacement for :class:`~src.road.engine.RoadInput` that never
+    materialises the whole profile: left and right track samples are produced
+    ``chunk_size`` at a time when :meth:`get_wheel_excitation` moves past the
+    generated window and are kept in a ring buffer of two chunks.
+    Rear wheels follow ``RoadInput``: its rear tracks are stored
+    ``int(axle_delay * rate)`` samples behind the front ones and read at
+    ``t + axle_delay``, so both inputs give the same four wheel signals.
+    Memory use is independent of the run length and :meth:`prime` does no
+    generation work.  Querying a time older than the buffer restarts the
+    stream from the beginning (seeded sources replay identically).
+
+    CSV recordings are finite by nature and remain served by ``RoadInput``.
+    """
+
+    def __init__(self, chunk_size: int = 4096):
+        """Initialize empty streaming road input
+
+        Args:
+            chunk_size: Samples generated per track and refill
+        """
+        if chunk_size < 2:
+            raise ValueError(f"chunk_size must be at least 2, got {chunk_size}")
+        self.chunk_size = int(chunk_size)
+        self.is_configured = False
+        self.config: RoadConfig | None = None
+
+        # Timing parameters
+        self.duration: float = 0.0
+        self.velocity: float = 0.0
+        self.wheelbase: float = 0.0
+        self.track: float = 0.0
+        self.axle_delay: float = 0.0
+        self.sample_rate: float = 0.0
+
+        self._system: Any = None
+        self._source: _ChunkSource | None = None
+        self._buffer: np.ndarray | None = None  # (2, capacity) left/right
+        self._wheel_state = np.zeros((2, len(WHEEL_KEYS)))
+        self._rear_offset = 0.0  # rear read position relative to front (samples)
+        self._start = 0  # absolute index of the first sample ever generated
+        self._end = 0  # absolute index one past the newest sample
+
+    def configure(self, config: RoadConfig, system: Any = None) -> None:
+        """Configure road input from configuration
+
+        Args:
+            config: Road configuration
+            system: Optional pneumatic system for geometry (wheelbase, track)
+        """
+        if config.source == SourceKind.CSV:
+            raise ValueError("CSV profiles are finite; use RoadInput for CSV sources")
+
+        self.config = config
+        self._system = system
+        params = config.get_effective_params()
+
+        if system is not None and hasattr(system, "frame_geom"):
+            self.wheelbase = getattr(system.frame_geom, "L_wb", params["wheelbase"])
+        else:
+            self.wheelbase = params["wheelbase"]
+
+        self.track = params["track"]
+        self.velocity = params["velocity"]
+        self.duration = params["duration"]
+        self.sample_rate = float(params["resample_hz"])
+        self.axle_delay = self.wheelbase / self.velocity
+        delay = self.axle_delay * self.sample_rate
+        self._rear_offset = delay - int(delay)
+
+        self._source = self._create_source(config, params)
+        self._buffer = None
+        self.is_configured = True
+
+    def prime(self, duration: float | None = None) -> None:
+        """Reset the stream; no samples are generated up front
+
+        Args:
+            duration: Nominal scenario duration used to place step, pothole and
+                speed bump features (uses config duration if None)
+        """
+        config = self.config
+        if not self.is_configured or config is None:
+            raise RuntimeError("RoadInput not configured. Call configure() first.")
+
+        if duration is not None and duration != self.duration:
+            self.duration = duration
+            self._source = self._create_source(config, config.get_effective_params())
+
+        self._restart()
+
+    @property
+    def buffer_capacity(self) -> int:
+        """Samples held per track: two chunks."""
+
+        return 2 * self.chunk_size + 2
+
+    def _require_source(self) -> _ChunkSource:
+        if self._source is None:
+            raise RuntimeError("RoadInput not configured")
+        return self._source
+
+    def _restart(self) -> np.ndarray:
+        self._require_source().reset()
+        buffer = np.zeros((2, self.buffer_capacity))
+        self._buffer = buffer
+        self._start = 0
+        self._end = self._start
+        return buffer
+
+    def _fill_until(self, buffer: np.ndarray, index: int) -> None:
+        """Generate chunks until sample ``index`` is available."""
+
+        source = self._require_source()
+        capacity = buffer.shape[1]
+        while self._end <= index:
+            left, right = source.generate(self._end, self.chunk_size)
+            slots = np.arange(self._end, self._end + self.chunk_size) % capacity
+            buffer[0, slots] = left
+            buffer[1, slots] = right
+            self._end += self.chunk_size
+
+    def _sample(
+        self, buffer: np.ndarray, position: float
+    ) -> tuple[float, float, float, float]:
+        """Interpolate both tracks at fractional sample ``position``.
+
+        Returns:
+            (left, right, left_velocity, right_velocity)
+        """
+
+        index = math.floor(position)
+        frac = position - index
+        capacity = buffer.shape[1]
+        left_lo, right_lo = buffer[:, index % capacity].tolist()
+        left_hi, right_hi = buffer[:, (index + 1) % capacity].tolist()
+        delta_left = left_hi - left_lo
+        delta_right = right_hi - right_lo
+        rate = self.sample_rate
+        return (
+            left_lo + delta_left * frac,
+            right_lo + delta_right * frac,
+            delta_left * rate,
+            delta_right * rate,
+        )
+
+    def get_wheel_excitation(self, t: float) -> dict[str, float]:
+        """Get road excitation for all wheels at given time
+
+        Args:
+            t: Time (seconds), expected to advance monotonically
+
+        Returns:
+            Dictionary with wheel excitations: {'LF': y, 'RF': y, 'LR': y, 'RR': y}
+            Values in meters (positive = upward road displacement)
+        """
+        state = self.get_wheel_state(t)
+        return dict(zip(WHEEL_KEYS, state[0].tolist()))
+
+    def get_wheel_state(self, t: float, out: np.ndarray | None = None) -> np.ndarray:
+        """Get road displacement and velocity for all wheels at given time
+
+        Args:
+            t: Time (seconds), expected to advance monotonically
+            out: Optional ``(2, 4)`` array to write into
+
+        Returns:
+            ``(2, 4)`` array: row 0 displacements (m), row 1 velocities (m/s),
+            columns in ``WHEEL_KEYS`` order. Without ``out`` the same internal
+            array is reused on every call; copy it to keep values.
+        """
+        if not self.is_configured:
+            raise RuntimeError("RoadInput not configured")
+        buffer = self._buffer
+        if buffer is None:
+            raise RuntimeError("RoadInput not primed. Call prime() first.")
+        if out is None:
+            out = self._wheel_state
+
+        # Rear tracks shifted by whole delay samples, read at t + axle_delay
+        front = float(t) * self.sample_rate
+        rear = front + self._rear_offset
+        if front < max(self._start, self._end - buffer.shape[1]):
+            buffer = self._restart()
+        self._fill_until(buffer, math.floor(rear) + 1)
+
+        lf, rf, v_lf, v_rf = self._sample(buffer, front)
+        lr, rr, v_lr, v_rr = self._sample(buffer, rear)
+        out[0] = (lf, rf, lr, rr)
+        out[1] = (v_lf, v_rf, v_lr, v_rr)
+        return out
+
+    def get_profile_preview(
+        self, duration: float = 10.0, dt: float = 0.01
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """Get preview of road profiles for plotting
+
+        The preview replays the stream from the start on a separate instance,
+        leaving the live stream position untouched.
+
+        Args:
+            duration: Preview duration (s)
+            dt: Time step (s)
+
+        Returns:
+            (time_array, wheel_profiles_dict)
+        """
+        if not self.is_configured or self.config is None:
+            raise RuntimeError("RoadInput not configured")
+
+        preview = StreamingRoadInput(self.chunk_size)
+        preview.configure(self.config, system=self._system)
+        preview.prime(self.duration)
+
+        t_preview = np.arange(0, duration, dt)
+        displacement = np.zeros((t_preview.size, len(WHEEL_KEYS)))
+        state = np.zeros((2, len(WHEEL_KEYS)))
+        for i, t in enumerate(t_preview):
+            displacement[i] = preview.get_wheel_state(float(t), out=state)[0]
+        profiles = {
+            wheel: displacement[:, column].copy()
+            for column, wheel in enumerate(WHEEL_KEYS)
+        }
+        return t_preview, profiles
+
+    def _create_source(
+        self, config: RoadConfig, params: dict[str, Any]
+    ) -> _ChunkSource:
+        source = config.source
+        correlation = params["correlation"]
+        amplitude = float(params["amplitude"])
+        frequency = float(params["frequency"])
+        phase = float(params["phase"])
+        velocity = float(params["velocity"])
+        duration = self.duration
+        preset = config.preset
+        profile: _Profile
+
+        if source == SourceKind.SINE:
+
+            def profile(t: np.ndarray) -> np.ndarray:
+                return amplitude * np.sin(2 * np.pi * frequency * t + phase)
+
+        elif source == SourceKind.SWEEP:
+            # Decade sweep repeated every ``duration`` seconds.
+            def profile(t: np.ndarray) -> np.ndarray:
+                sweep: np.ndarray = signal.chirp(
+                    np.mod(t, duration),
+                    frequency,
+                    duration,
+                    frequency * 10,
+                    method="logarithmic",
+                    phi=phase,
+                )
+                return amplitude * sweep
+
+        elif source == SourceKind.STEP:
+            step_time = duration / 3
+            rise_time = 0.1
+
+            def profile(t: np.ndarray) -> np.ndarray:
+                return (
+                    amplitude * 0.5 * (1 + np.tanh((t - step_time) / (rise_time / 4)))
+                )
+
+        elif source in (SourceKind.POTHOLE, SourceKind.SPEED_BUMP):
+            if source == SourceKind.POTHOLE:
+                length, height, sign = 2.0, params.get("amplitude", 0.1), -1.0
+            else:
+                length, height, sign = 3.7, params.get("amplitude", 0.1), 1.0
+            if preset:
+                length, height = preset.feature_length, preset.feature_height
+            feature_duration = length / velocity
+            t_start = duration / 2 - feature_duration / 2
+
+            def profile(t: np.ndarray) -> np.ndarray:
+                phase_in = (t - t_start) / feature_duration
+                inside = (phase_in >= 0.0) & (phase_in <= 1.0)
+                return np.where(inside, sign * height * np.sin(np.pi * phase_in), 0.0)
+
+        elif source == SourceKind.ISO8608:
+            iso_class = (
+                preset.iso_class if preset and preset.iso_class else Iso8608Class.C
+            )
+            return _Iso8608Source(
+                iso_class,
+                velocity,
+                self.sample_rate,
+                self.chunk_size,
+                correlation or CorrelationSpec(),
+            )
+
+        else:
+            raise ValueError(f"Unsupported source type: {source}")
+
+        return _AnalyticSource(profile, self.sample_rate, correlation)
+
+    def get_info(self) -> dict[str, Any]:
+        """Get information about current configuration
+
+        Returns:
+            Dictionary with configuration and status info
+        """
+        return {
+            "configured": self.is_configured,
+            "primed": self._buffer is not None,
+            "streaming": True,
+            "source": self.config.source.name if self.config else None,
+            "duration": self.duration,
+            "velocity": self.velocity,
+            "wheelbase": self.wheelbase,
+            "track": self.track,
+            "axle_delay": self.axle_delay,
+            "sample_rate": self.sample_rate,
+            "chunk_size": self.chunk_size,
+            "buffer_capacity": self.buffer_capacity if self.is_configured else 0,
+            "generated_until": self._end / self.sample_rate
+            if self.sample_rate
+            else 0.0,
+        }
+
+
+__all__ = ["StreamingRoadInput"]
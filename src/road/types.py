@@ -191,6 +191,9 @@ WHEEL_POSITIONS = {
     "RR": {"name": "Right Rear", "x": +0.8, "z": +1.6},  # Right rear
 }
 
+# Column order of array-valued wheel lookups
+WHEEL_KEYS: tuple[str, ...] = tuple(WHEEL_POSITIONS)
+
 
 def validate_wheel_excitation(excitation: dict[str, float]) -> bool:
     """Validate wheel excitation dictionary format"""
@@ -213,6 +216,7 @@ __all__ = [
     "RoadConfig",
     "ISO8608_PARAMETERS",
     "WHEEL_POSITIONS",
+    "WHEEL_KEYS",
     "WheelPosition",
     "validate_wheel_excitation",
 ]
@@ -22,9 +22,22 @@ _LAZY_EXPORTS = {
     "TimingAccumulator": ".sync",
     "ThreadSafeCounter": ".sync",
     "create_state_queue": ".sync",
+    # Fixed-layout snapshot records
+    "SNAPSHOT_DTYPE": ".snapshot_ring",
+    "SnapshotRing": ".snapshot_ring",
+    "snapshot_from_record": ".snapshot_ring",
+    # Render-rate presentation
+    "StateInterpolator": ".presentation",
     # Simulation loop
     "PhysicsWorker": ".sim_loop",
     "SimulationManager": ".sim_loop",
+    # Headless batch execution
+    "BatchSimulator": ".batch",
+    "BatchResult": ".batch",
+    # Many-vehicle ensembles
+    "EnsembleMember": ".ensemble",
+    "EnsembleResult": ".ensemble",
+    "EnsembleSimulator": ".ensemble",
 }
 
 __all__ = list(_LAZY_EXPORTS.keys())
@@ -0,0 +1,359 @@
+"""Headless batch execution of the coupled physics pipeline.
+
+:class:`BatchSimulator` drives the same :mod:`src.runtime.steps` helpers as
+:class:`~src.runtime.sim_loop.PhysicsWorker` (road → kinematics → gas → rigid
+body → pneumatic frame forces) but without Qt timers, signals or the settings
+singleton.  Steps are executed back to back as fast as the CPU allows and the
+results are collected into preallocated NumPy time series, which makes the
+class suitable for regression runs and parameter studies.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from src.diagnostics.logger_factory import LoggerProtocol, get_logger
+from src.physics.odes import BODY_INTEGRATION_SCHEMES, RigidBodyStepper
+from src.pneumo.enums import Line, Port, ReceiverVolumeMode, ThermoMode, Wheel
+from src.pneumo.network import GasNetwork
+from src.runtime.state import LineState, TankState, WheelState
+from src.runtime.steps import (
+    PhysicsStepState,
+    apply_pneumatic_update,
+    compute_kinematics,
+    integrate_body,
+    update_gas_state,
+)
+from src.runtime.steps.context import LeverDynamicsConfig
+from src.runtime.sync import PerformanceMetrics
+
+ROAD_KEYS: tuple[str, ...] = ("LF", "RF", "LR", "RR")
+WHEEL_ORDER: tuple[Wheel, ...] = (Wheel.LP, Wheel.PP, Wheel.LZ, Wheel.PZ)
+LINE_ORDER: tuple[Line, ...] = (Line.A1, Line.B1, Line.A2, Line.B2)
+#: Accepted ``body_integrator`` values (``modes.physics.body_integrator``).
+BODY_INTEGRATORS: tuple[str, ...] = ("radau", *BODY_INTEGRATION_SCHEMES)
+
+
+@dataclass
+class BatchResult:
+    """Time series recorded by :meth:`BatchSimulator.run`.
+
+    Per-wheel columns follow :data:`WHEEL_ORDER` (road inputs use
+    :data:`ROAD_KEYS`), per-line columns follow :data:`LINE_ORDER`.
+    """
+
+    time: np.ndarray
+    frame_state: np.ndarray  # (n, 6) [Y, φz, θx, dY, dφz, dθx]
+    frame_accel: np.ndarray  # (n, 3)
+    frame_forces: np.ndarray  # (n, 3) [F_z, τx, τz]
+    road_inputs: np.ndarray  # (n, 4)
+    lever_angles: np.ndarray  # (n, 4)
+    piston_positions: np.ndarray  # (n, 4)
+    line_pressures: np.ndarray  # (n, 4)
+    line_masses: np.ndarray  # (n, 4)
+    tank_pressure: np.ndarray  # (n,)
+    tank_mass: np.ndarray  # (n,)
+    relief_mass: np.ndarray  # (n,) cumulative mass vented by relief valves
+    steps: int = 0
+    wall_time: float = 0.0
+    integration_failures: int = 0
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def allocate(cls, samples: int) -> BatchResult:
+        """Return a result with zero-filled arrays for ``samples`` records."""
+
+        samples = max(int(samples), 0)
+        return cls(
+            time=np.zeros(samples),
+            frame_state=np.zeros((samples, 6)),
+            frame_accel=np.zeros((samples, 3)),
+            frame_forces=np.zeros((samples, 3)),
+            road_inputs=np.zeros((samples, len(ROAD_KEYS))),
+            lever_angles=np.zeros((samples, len(WHEEL_ORDER))),
+            piston_positions=np.zeros((samples, len(WHEEL_ORDER))),
+            line_pressures=np.zeros((samples, len(LINE_ORDER))),
+            line_masses=np.zeros((samples, len(LINE_ORDER))),
+            tank_pressure=np.zeros(samples),
+            tank_mass=np.zeros(samples),
+            relief_mass=np.zeros(samples),
+        )
+
+    def __len__(self) -> int:
+        return int(self.time.shape[0])
+
+    @property
+    def simulated_time(self) -> float:
+        """Return the simulated span covered by the recorded samples."""
+
+        if len(self) == 0:
+            return 0.0
+        return float(self.time[-1])
+
+    @property
+    def realtime_factor(self) -> float:
+        """Return simulated seconds per wall-clock second."""
+
+        if self.wall_time <= 0.0:
+            return 0.0
+        return self.simulated_time / self.wall_time
+
+    def as_columns(self) -> dict[str, np.ndarray]:
+        """Flatten the series into named one-dimensional columns."""
+
+        columns: dict[str, np.ndarray] = {"time": self.time}
+        for idx, name in enumerate(
+            ("heave", "roll", "pitch", "heave_rate", "roll_rate", "pitch_rate")
+        ):
+            columns[name] = self.frame_state[:, idx]
+        for idx, name in enumerate(("heave_accel", "roll_accel", "pitch_accel")):
+            columns[name] = self.frame_accel[:, idx]
+        for idx, name in enumerate(("force_z", "moment_x", "moment_z")):
+            columns[name] = self.frame_forces[:, idx]
+        for idx, key in enumerate(ROAD_KEYS):
+            columns[f"road_{key}"] = self.road_inputs[:, idx]
+        for idx, wheel in enumerate(WHEEL_ORDER):
+            columns[f"lever_angle_{wheel.value}"] = self.lever_angles[:, idx]
+            columns[f"piston_{wheel.value}"] = self.piston_positions[:, idx]
+        for idx, line in enumerate(LINE_ORDER):
+            columns[f"pressure_{line.value}"] = self.line_pressures[:, idx]
+            columns[f"mass_{line.value}"] = self.line_masses[:, idx]
+        columns["tank_pressure"] = self.tank_pressure
+        columns["tank_mass"] = self.tank_mass
+        columns["relief_mass"] = self.relief_mass
+        return columns
+
+
+class BatchSimulator:
+    """Run the runtime step pipeline without Qt at full CPU speed."""
+
+    def __init__(
+        self,
+        *,
+        pneumatic_system: Any,
+        gas_network: GasNetwork,
+        dt: float,
+        rigid_body: Any | None = None,
+        road_input: Any | None = None,
+        lever_config: LeverDynamicsConfig | None = None,
+        body_integrator: str = "rk4",
+        initial_state: np.ndarray | None = None,
+        thermo_mode: ThermoMode = ThermoMode.ISOTHERMAL,
+        master_isolation_open: bool = False,
+        receiver_volume: float | None = None,
+        receiver_mode: ReceiverVolumeMode | None = None,
+        logger: LoggerProtocol | None = None,
+    ) -> None:
+        if dt <= 0.0:
+            raise ValueError(f"Time step must be positive: {dt}")
+        body_integrator = str(body_integrator).strip().lower()
+        if body_integrator not in BODY_INTEGRATORS:
+            raise ValueError(f"Unsupported body integrator: {body_integrator}")
+
+        self.pneumatic_system = pneumatic_system
+        self.gas_network = gas_network
+        self.rigid_body = rigid_body
+        self.road_input = road_input
+        self.dt = float(dt)
+        self.body_integrator = body_integrator
+        self.logger: LoggerProtocol = logger or get_logger("runtime.batch").bind(
+            component="BatchSimulator"
+        )
+
+        self.simulation_time = 0.0
+        self.step_counter = 0
+        self.relief_mass = 0.0
+        self.performance = PerformanceMetrics(target_dt=self.dt)
+        self.latest_frame_forces: tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self.latest_vertical_forces = np.zeros(len(Wheel))
+
+        physics_state = (
+            np.zeros(6)
+            if initial_state is None
+            else np.asarray(initial_state, dtype=float).copy()
+        )
+        if physics_state.shape != (6,):
+            raise ValueError(
+                f"initial_state must have shape (6,), got {physics_state.shape}"
+            )
+
+        wheel_states = {wheel: WheelState(wheel=wheel) for wheel in Wheel}
+        prev_piston_positions: dict[Wheel, float] = {}
+        for wheel, cylinder in pneumatic_system.cylinders.items():
+            prev_piston_positions[wheel] = float(cylinder.x)
+            wheel_states[wheel].piston_position = float(cylinder.x)
+
+        tank = gas_network.tank
+        tank_state = TankState(
+            pressure=float(tank.p),
+            temperature=float(tank.T),
+            mass=float(tank.m),
+            volume=float(tank.V),
+        )
+
+        # Same selection as PhysicsWorker._current_body_stepper: "radau" keeps
+        # the adaptive solve_ivp path of integrate_body
+        body_stepper = None
+        if body_integrator != "radau" and rigid_body is not None:
+            body_stepper = RigidBodyStepper(rigid_body, body_integrator)
+
+        self.state = PhysicsStepState(
+            dt=self.dt,
+            pneumatic_system=pneumatic_system,
+            gas_network=gas_network,
+            rigid_body=rigid_body,
+            physics_state=physics_state,
+            simulation_time=0.0,
+            master_isolation_open=bool(master_isolation_open),
+            thermo_mode=thermo_mode,
+            receiver_volume=float(
+                tank.V if receiver_volume is None else receiver_volume
+            ),
+            receiver_mode=receiver_mode if receiver_mode is not None else tank.mode,
+            prev_piston_positions=prev_piston_positions,
+            wheel_states=wheel_states,
+            line_states={line: LineState(line=line) for line in Line},
+            tank_state=tank_state,
+            last_road_inputs={key: 0.0 for key in ROAD_KEYS},
+            prev_road_inputs={key: 0.0 for key in ROAD_KEYS},
+            latest_frame_accel=np.zeros(3),
+            prev_frame_velocities=np.zeros(3),
+            performance=self.performance,
+            logger=self.logger,
+            get_line_pressure=self._get_line_pressure,
+            lever_config=lever_config or LeverDynamicsConfig(),
+            body_stepper=body_stepper,
+        )
+
+    # ------------------------------------------------------------------ stepping
+    def _get_road_inputs(self) -> dict[str, float]:
+        if self.road_input is not None:
+            try:
+                excitation: dict[str, float] = self.road_input.get_wheel_excitation(
+                    self.simulation_time
+                )
+                return excitation
+            except Exception as exc:
+                self.logger.warning(
+                    "WARNING: road input error",
+                    error=str(exc),
+                    exc_info=True,
+                )
+        return {key: 0.0 for key in ROAD_KEYS}
+
+    def _get_line_pressure(self, wheel: Wheel, port: Port) -> float:
+        return float(
+            self.pneumatic_system.line_pressure(
+                wheel,
+                port,
+                default=float(self.gas_network.tank.p),
+                logger=self.logger,
+            )
+        )
+
+    def step(self) -> None:
+        """Advance the coupled model by a single ``dt``."""
+
+        step_start = time.perf_counter()
+        state = self.state
+
+        road_inputs = self._get_road_inputs()
+        state.prev_road_inputs = state.last_road_inputs
+        state.last_road_inputs = {
+            key: float(value) for key, value in road_inputs.items()
+        }
+        state.simulation_time = self.simulation_time
+
+        compute_kinematics(state, road_inputs)
+        update_gas_state(state)
+        tank_state = state.tank_state
+        self.relief_mass += self.dt * (
+            tank_state.flow_min + tank_state.flow_stiff + tank_state.flow_safety
+        )
+        integrate_body(state)
+
+        frame_forces = apply_pneumatic_update(state)
+        if frame_forces is not None:
+            self.latest_vertical_forces, self.latest_frame_forces = frame_forces
+
+        self.simulation_time += self.dt
+        self.step_counter += 1
+        self.performance.update_step_time(time.perf_counter() - step_start)
+
+    def run(
+        self,
+        duration: float | None = None,
+        *,
+        steps: int | None = None,
+        record_every: int = 1,
+    ) -> BatchResult:
+        """Execute ``steps`` (or ``duration / dt``) steps and record time series.
+
+        Args:
+            duration: Simulated span in seconds. Ignored when ``steps`` is given.
+            steps: Exact number of physics steps to execute.
+            record_every: Store one sample every ``record_every`` steps.
+        """
+
+        if steps is None:
+            if duration is None:
+                raise ValueError("Either duration or steps must be provided")
+            steps = int(round(float(duration) / self.dt))
+        steps = max(int(steps), 0)
+        record_every = max(int(record_every), 1)
+
+        result = BatchResult.allocate(steps // record_every)
+        failures_before = self.performance.integration_failures
+        state = self.state
+        sample = 0
+
+        wall_start = time.perf_counter()
+        for index in range(1, steps + 1):
+            self.step()
+            if index % record_every:
+                continue
+
+            result.time[sample] = self.simulation_time
+            result.frame_state[sample] = state.physics_state
+            result.frame_accel[sample] = state.latest_frame_accel
+            result.frame_forces[sample] = self.latest_frame_forces
+            for col, key in enumerate(ROAD_KEYS):
+                result.road_inputs[sample, col] = state.last_road_inputs.get(key, 0.0)
+            for col, wheel in enumerate(WHEEL_ORDER):
+                wheel_state = state.wheel_states[wheel]
+                result.lever_angles[sample, col] = wheel_state.lever_angle
+                result.piston_positions[sample, col] = wheel_state.piston_position
+            for col, line in enumerate(LINE_ORDER):
+                gas_state = self.gas_network.lines[line]
+                result.line_pressures[sample, col] = gas_state.p
+                result.line_masses[sample, col] = gas_state.m
+            result.tank_pressure[sample] = self.gas_network.tank.p
+            result.tank_mass[sample] = self.gas_network.tank.m
+            result.relief_mass[sample] = self.relief_mass
+            sample += 1
+
+        result.wall_time = time.perf_counter() - wall_start
+        result.steps = steps
+        result.integration_failures = (
+            self.performance.integration_failures - failures_before
+        )
+        result.metadata = {
+            "dt": self.dt,
+            "record_every": record_every,
+            "thermo_mode": state.thermo_mode.name,
+            "master_isolation_open": state.master_isolation_open,
+        }
+        return result
+
+
+__all__ = [
+    "BatchResult",
+    "BatchSimulator",
+    "LINE_ORDER",
+    "ROAD_KEYS",
+    "WHEEL_ORDER",
+]
@@ -0,0 +1,542 @@
+"""Many-vehicle ensemble execution of the coupled physics pipeline.
+
+:class:`EnsembleSimulator` advances ``N`` independent suspension
+configurations in one time loop.  Instead of one :class:`PhysicsStepState` per
+vehicle, the members' state lives in stacked NumPy arrays: frame state
+``(N, 6)``, lever angles, piston positions and line gas state ``(N, 4)`` and
+the receiver state ``(N,)``.  Every stage of the
+:class:`~src.runtime.batch.BatchSimulator` step (road → levers → cylinder
+volumes → gas → rigid body) is evaluated once per step with broadcasting, so
+the per-step Python overhead is shared by all members.
+
+Members may differ in rigid body parameters, cylinder and lever geometry,
+valve settings and initial gas state, but must share the line topology of the
+first member.  The rigid body is advanced with one fixed step of
+:func:`~src.physics.odes.f_rhs_batch` per ``dt`` using the
+:class:`~src.physics.odes.RigidBodyStepper` schemes; the adaptive Radau path
+of :func:`~src.runtime.steps.integrate_body` has no batched counterpart.
+Member objects are only read during construction.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from src.common.units import GAMMA_AIR, PA_ATM, R_AIR
+from src.diagnostics.logger_factory import LoggerProtocol, get_logger
+from src.physics.integrator import clamp_state
+from src.physics.odes import (
+    BODY_INTEGRATION_SCHEMES,
+    RigidBodyArrays,
+    f_rhs_batch,
+    f_rhs_jacobian,
+    validate_state_batch,
+)
+from src.pneumo.enums import Line, Port, ThermoMode
+from src.pneumo.flow_kernel import VectorizedFlowKernel
+from src.pneumo.network import GasNetwork
+from src.runtime.batch import ROAD_KEYS, WHEEL_ORDER
+from src.runtime.steps.context import LeverDynamicsConfig
+from src.runtime.steps.lever_kernel import VectorizedLeverKernel
+
+_CP_AIR = GAMMA_AIR * R_AIR / (GAMMA_AIR - 1.0)
+
+
+@dataclass
+class EnsembleMember:
+    """One vehicle configuration of an ensemble."""
+
+    pneumatic_system: Any
+    gas_network: GasNetwork
+    rigid_body: Any
+    initial_state: np.ndarray | None = None
+
+
+@dataclass
+class EnsembleResult:
+    """Time series recorded by :meth:`EnsembleSimulator.run`.
+
+    The second axis indexes members; per-wheel columns follow
+    :data:`~src.runtime.batch.WHEEL_ORDER` and per-line columns follow
+    :attr:`EnsembleSimulator.line_names`.
+    """
+
+    time: np.ndarray  # (n,)
+    frame_state: np.ndarray  # (n, N, 6) [Y, φz, θx, dY, dφz, dθx]
+    lever_angles: np.ndarray  # (n, N, 4)
+    piston_positions: np.ndarray  # (n, N, 4)
+    line_pressures: np.ndarray  # (n, N, 4)
+    tank_pressure: np.ndarray  # (n, N)
+    relief_mass: np.ndarray  # (n, N) cumulative mass vented by relief valves
+    steps: int = 0
+    wall_time: float = 0.0
+    integration_failures: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def allocate(cls, samples: int, members: int) -> EnsembleResult:
+        """Return a result with zero-filled arrays for ``samples`` records."""
+
+        samples = max(int(samples), 0)
+        wheels = len(WHEEL_ORDER)
+        return cls(
+            time=np.zeros(samples),
+            frame_state=np.zeros((samples, members, 6)),
+            lever_angles=np.zeros((samples, members, wheels)),
+            piston_positions=np.zeros((samples, members, wheels)),
+            line_pressures=np.zeros((samples, members, 4)),
+            tank_pressure=np.zeros((samples, members)),
+            relief_mass=np.zeros((samples, members)),
+            integration_failures=np.zeros(members, dtype=int),
+        )
+
+    def __len__(self) -> int:
+        return int(self.time.shape[0])
+
+    @property
+    def members(self) -> int:
+        """Return the number of simulated vehicles."""
+
+        return int(self.frame_state.shape[1])
+
+    @property
+    def member_steps_per_second(self) -> float:
+        """Return physics steps completed per wall-clock second and member."""
+
+        if self.wall_time <= 0.0:
+            return 0.0
+        return self.steps * self.members / self.wall_time
+
+
+class EnsembleSimulator:
+    """Advance many vehicle configurations together with array operations."""
+
+    def __init__(
+        self,
+        members: Sequence[EnsembleMember],
+        *,
+        dt: float,
+        road_input: Any | None = None,
+        lever_config: LeverDynamicsConfig | None = None,
+        body_integrator: str = "rk4",
+        thermo_mode: ThermoMode = ThermoMode.ISOTHERMAL,
+        master_isolation_open: bool = False,
+        logger: LoggerProtocol | None = None,
+    ) -> None:
+        if dt <= 0.0:
+            raise ValueError(f"Time step must be positive: {dt}")
+        body_integrator = str(body_integrator).strip().lower()
+        if body_integrator not in BODY_INTEGRATION_SCHEMES:
+            raise ValueError(
+                f"Unsupported ensemble body integrator: {body_integrator}; "
+                f"expected one of {', '.join(BODY_INTEGRATION_SCHEMES)}"
+            )
+        members = list(members)
+        if not members:
+            raise ValueError("Ensemble requires at least one member")
+        if thermo_mode not in (
+            ThermoMode.ISOTHERMAL,
+            ThermoMode.ADIABATIC,
+            ThermoMode.POLYTROPIC,
+        ):
+            raise ValueError(f"Unknown thermo mode: {thermo_mode}")
+
+        self.members = members
+        self.dt = float(dt)
+        self.road_input = road_input
+        self.lever_config = lever_config or LeverDynamicsConfig()
+        self.body_integrator = body_integrator
+        self.thermo_mode = thermo_mode
+        self.master_isolation_open = bool(master_isolation_open)
+        self.logger: LoggerProtocol = logger or get_logger("runtime.ensemble").bind(
+            component="EnsembleSimulator"
+        )
+        if self.master_isolation_open and any(
+            member.gas_network.master_equalization_diameter > 0.0 for member in members
+        ):
+            raise ValueError(
+                "Ensemble master isolation only supports instantaneous "
+                "equalisation (master_equalization_diameter == 0)"
+            )
+
+        count = len(members)
+        self.simulation_time = 0.0
+        self.step_counter = 0
+        self.integration_failures = np.zeros(count, dtype=int)
+        self.relief_mass = np.zeros(count)
+
+        self.body = RigidBodyArrays.from_bodies(
+            [member.rigid_body for member in members]
+        )
+        # f_rhs is affine in the state, so implicit midpoint reduces to one
+        # linear solve with the constant matrix (I - dt/2·J)⁻¹ per member
+        self._midpoint_inverse: np.ndarray | None = None
+        if body_integrator == "implicit_midpoint":
+            identity = np.eye(6)
+            self._midpoint_inverse = np.stack(
+                [
+                    np.linalg.inv(
+                        identity
+                        - 0.5
+                        * self.dt
+                        * f_rhs_jacobian(0.0, identity[0], member.rigid_body)
+                    )
+                    for member in members
+                ]
+            )
+        self.frame_state = np.zeros((count, 6))
+        for index, member in enumerate(members):
+            if member.initial_state is None:
+                continue
+            initial = np.asarray(member.initial_state, dtype=float)
+            if initial.shape != (6,):
+                raise ValueError(
+                    f"initial_state must have shape (6,), got {initial.shape}"
+                )
+            self.frame_state[index] = initial
+
+        self.levers = VectorizedLeverKernel.stack(
+            VectorizedLeverKernel(member.pneumatic_system) for member in members
+        )
+        self._min_angle_flags = self.levers.min_angle_flags()
+        self.lever_angles = np.zeros((count, len(WHEEL_ORDER)))
+        self.lever_velocities = np.zeros((count, len(WHEEL_ORDER)))
+        self.piston_positions = np.array(
+            [
+                [
+                    float(member.pneumatic_system.cylinders[wheel].x)
+                    for wheel in WHEEL_ORDER
+                ]
+                for member in members
+            ]
+        )
+        self._prev_road = np.zeros((count, len(ROAD_KEYS)))
+        # Array lookups return columns in ROAD_KEYS order
+        self._road_state = getattr(road_input, "get_wheel_state", None)
+
+        self.line_names = self._resolve_topology(members)
+        self.gas = VectorizedFlowKernel([member.gas_network for member in members])
+        self.gas.load()
+        self._ambient = np.array(
+            [[member.gas_network.ambient_temperature] for member in members]
+        )
+        polytropic = [member.gas_network.polytropic_params for member in members]
+        self._conduction = np.array(
+            [
+                [
+                    max(0.0, params.heat_transfer_coeff)
+                    * max(0.0, params.exchange_area)
+                    if params is not None
+                    else 0.0
+                ]
+                for params in polytropic
+            ]
+        )
+        self._polytropic_ambient = np.array(
+            [
+                [
+                    params.ambient_temperature
+                    if params is not None
+                    else member.gas_network.ambient_temperature
+                ]
+                for params, member in zip(polytropic, members)
+            ]
+        )
+
+    # ------------------------------------------------------------------ set-up
+    def _resolve_topology(self, members: list[EnsembleMember]) -> tuple[Line, ...]:
+        """Build wheel-port ↔ line column maps shared by every member."""
+
+        line_names = tuple(members[0].gas_network.lines)
+        reference = members[0].pneumatic_system.lines
+        endpoints = {name: tuple(reference[name].endpoints) for name in line_names}
+        for member in members[1:]:
+            lines = member.pneumatic_system.lines
+            if tuple(member.gas_network.lines) != line_names or any(
+                tuple(lines[name].endpoints) != endpoints[name] for name in line_names
+            ):
+                raise ValueError("Ensemble members must share the same line topology")
+
+        wheel_index = {wheel: index for index, wheel in enumerate(WHEEL_ORDER)}
+        head_columns = np.full(len(WHEEL_ORDER), -1)
+        rod_columns = np.full(len(WHEEL_ORDER), -1)
+        # incidence[p, w, l] is 1 when port p (head, rod) of wheel w feeds line l.
+        incidence = np.zeros((2, len(WHEEL_ORDER), len(line_names)))
+        for column, name in enumerate(line_names):
+            for wheel, port in endpoints[name]:
+                row = wheel_index[wheel]
+                if port == Port.HEAD:
+                    head_columns[row] = column
+                    incidence[0, row, column] = 1.0
+                else:
+                    rod_columns[row] = column
+                    incidence[1, row, column] = 1.0
+        if (head_columns < 0).any() or (rod_columns < 0).any():
+            raise ValueError("Every cylinder chamber must be connected to a line")
+
+        self._head_columns = head_columns
+        self._rod_columns = rod_columns
+        self._incidence = incidence.reshape(2 * len(WHEEL_ORDER), len(line_names))
+        return line_names
+
+    # ---------------------------------------------------------------- stepping
+    def _road_inputs(self) -> np.ndarray:
+        """Return road heights as ``(members, 4)`` in ``ROAD_KEYS`` order.
+
+        Road values may be scalars shared by all members or ``(members,)``
+        arrays with one profile per member.  Inputs exposing
+        ``get_wheel_state`` (:class:`~src.road.engine.RoadInput`) are read
+        as one array without building a dict.
+        """
+
+        shape = (len(self.members),)
+        if self.road_input is not None:
+            try:
+                if self._road_state is not None:
+                    state = self._road_state(self.simulation_time)
+                    return np.broadcast_to(state[0], (*shape, len(ROAD_KEYS))).copy()
+                excitation = self.road_input.get_wheel_excitation(self.simulation_time)
+                return np.column_stack(
+                    [
+                        np.broadcast_to(
+                            np.asarray(excitation.get(key, 0.0), dtype=float), shape
+                        )
+                        for key in ROAD_KEYS
+                    ]
+                )
+            except Exception as exc:
+                self.logger.warning(
+                    "WARNING: road input error",
+                    error=str(exc),
+                    exc_info=True,
+                )
+        return np.zeros((*shape, len(ROAD_KEYS)))
+
+    def _line_volumes(
+        self,
+        position: np.ndarray,
+        penetration_head: np.ndarray,
+        penetration_rod: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return raw and stop-corrected line volumes for piston ``position``."""
+
+        levers = self.levers
+        head, rod = levers.chamber_volumes(position)
+        raw = np.concatenate((head, rod), axis=1) @ self._incidence
+        penetration = (
+            np.concatenate(
+                (
+                    levers.area_head * penetration_head,
+                    levers.area_rod * penetration_rod,
+                ),
+                axis=1,
+            )
+            @ self._incidence
+        )
+        return raw, np.maximum(raw - penetration, 1e-9)
+
+    def _apply_volume_change(self, new_volume: np.ndarray) -> None:
+        """Vectorised ``update_pressures_with_explicit_volumes``."""
+
+        gas = self.gas
+        m = gas.line_mass
+        previous = gas.line_volume
+        if self.thermo_mode == ThermoMode.ISOTHERMAL:
+            T = np.broadcast_to(self._ambient, m.shape).copy()
+            p = (m * R_AIR * T) / new_volume
+        elif self.thermo_mode == ThermoMode.ADIABATIC:
+            T = gas.line_temperature * (previous / new_volume) ** (GAMMA_AIR - 1.0)
+            p = (m * R_AIR * T) / new_volume
+        else:
+            has_mass = m > 0.0
+            coupled = has_mass & (self._conduction > 0.0)
+            coupling = np.where(
+                coupled, self._conduction / np.maximum(m * _CP_AIR, 1e-12), 0.0
+            )
+            n_eff = np.where(
+                coupled, 1.0 + (GAMMA_AIR - 1.0) / (1.0 + coupling), GAMMA_AIR
+            )
+            base = gas.line_temperature * (previous / new_volume) ** (n_eff - 1.0)
+            relaxation = np.where(coupled, 1.0 - np.exp(-coupling), 0.0)
+            adjusted = np.where(
+                relaxation > 0.0,
+                base + (self._polytropic_ambient - base) * relaxation,
+                base,
+            )
+            T = np.where(has_mass, np.maximum(adjusted, 1.0), gas.line_temperature)
+            p = np.where(has_mass, (m * R_AIR * T) / new_volume, 0.0)
+
+        gas.line_volume = new_volume
+        gas.line_temperature = T
+        gas.line_pressure = p
+
+    def _equalise_lines(self, raw_volume: np.ndarray) -> None:
+        """Vectorised instantaneous master isolation equalisation."""
+
+        gas = self.gas
+        m = gas.line_mass
+        total_mass = m.sum(axis=1, keepdims=True)
+        total_volume = raw_volume.sum(axis=1, keepdims=True)
+        valid = (total_mass > 0.0) & (total_volume > 0.0)
+        if not valid.any():
+            return
+        safe_mass = np.where(valid, total_mass, 1.0)
+        safe_volume = np.where(valid, total_volume, 1.0)
+        temperature = (m * gas.line_temperature).sum(axis=1, keepdims=True) / safe_mass
+        pressure = (total_mass * R_AIR * temperature) / safe_volume
+        gas.line_mass = np.where(valid, total_mass * (raw_volume / safe_volume), m)
+        gas.line_temperature = np.where(valid, temperature, gas.line_temperature)
+        gas.line_pressure = np.where(valid, pressure, gas.line_pressure)
+        gas.line_volume = np.where(valid, raw_volume, gas.line_volume)
+
+    def _chamber_pressures(self) -> tuple[np.ndarray, np.ndarray]:
+        pressure = self.gas.line_pressure
+        return pressure[:, self._head_columns], pressure[:, self._rod_columns]
+
+    def _integrate_body(self, pneumatic_forces: np.ndarray) -> None:
+        """Advance the frame state with one step of ``body_integrator``."""
+
+        body = self.body
+        dt = self.dt
+        y0 = self.frame_state
+        valid = validate_state_batch(y0, body)
+
+        k1 = f_rhs_batch(y0, body, pneumatic_forces)
+        if self.body_integrator == "semi_implicit_euler":
+            y_new = np.empty_like(y0)
+            y_new[:, 3:] = y0[:, 3:] + dt * k1[:, 3:]
+            y_new[:, :3] = y0[:, :3] + dt * y_new[:, 3:]
+        elif self._midpoint_inverse is not None:
+            y_new = y0 + dt * np.einsum("nij,nj->ni", self._midpoint_inverse, k1)
+        else:
+            k2 = f_rhs_batch(y0 + 0.5 * dt * k1, body, pneumatic_forces)
+            k3 = f_rhs_batch(y0 + 0.5 * dt * k2, body, pneumatic_forces)
+            k4 = f_rhs_batch(y0 + dt * k3, body, pneumatic_forces)
+            y_new = y0 + (dt / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+        out_of_range = ~validate_state_batch(y_new, body)
+        if out_of_range.any():
+            y_new = np.where(out_of_range[:, None], clamp_state(y_new, body), y_new)
+            valid &= validate_state_batch(y_new, body)
+
+        if not valid.all():
+            failed = ~valid
+            self.integration_failures += failed
+            y_new = np.where(failed[:, None], y0, y_new)
+        self.frame_state = y_new
+
+    def step(self) -> None:
+        """Advance every member by a single ``dt``."""
+
+        dt = self.dt
+        levers = self.levers
+        flags = self._min_angle_flags
+
+        road = self._road_inputs()
+        x_road, x_prev = levers.road_displacement(
+            np.stack((road, self._prev_road)), flags
+        )
+        self._prev_road = road
+
+        head, rod = self._chamber_pressures()
+        batch = levers.integrate(
+            theta0=self.lever_angles,
+            omega0=self.lever_velocities,
+            dt=dt,
+            lever_config=self.lever_config,
+            road_displacement=x_road,
+            road_velocity=(x_road - x_prev) / dt,
+            pneumatic_force=head * levers.area_head - rod * levers.area_rod,
+            min_angle_active=flags,
+        )
+        self.lever_angles = batch.angle
+        self.lever_velocities = batch.angular_velocity
+
+        position, penetration_head, penetration_rod = levers.piston_state(
+            batch.angle, flags
+        )
+        self.piston_positions = position
+        raw_volume, line_volume = self._line_volumes(
+            position, penetration_head, penetration_rod
+        )
+
+        gas = self.gas
+        self._apply_volume_change(line_volume)
+        flows = gas.step(dt)
+        if self.master_isolation_open:
+            self._equalise_lines(raw_volume)
+        # ``update_gas_state`` queries the check valves once more when it
+        # reports line states, which advances their hysteresis.
+        gas.update_valve_states()
+        self.relief_mass += dt * flows.relief.sum(axis=1)
+
+        head, rod = self._chamber_pressures()
+        self._integrate_body(
+            (head - PA_ATM) * levers.area_head - (rod - PA_ATM) * levers.area_rod
+        )
+
+        self.simulation_time += dt
+        self.step_counter += 1
+
+    def run(
+        self,
+        duration: float | None = None,
+        *,
+        steps: int | None = None,
+        record_every: int = 1,
+    ) -> EnsembleResult:
+        """Execute ``steps`` (or ``duration / dt``) steps and record time series.
+
+        Args:
+            duration: Simulated span in seconds. Ignored when ``steps`` is given.
+            steps: Exact number of physics steps to execute.
+            record_every: Store one sample every ``record_every`` steps.
+        """
+
+        if steps is None:
+            if duration is None:
+                raise ValueError("Either duration or steps must be provided")
+            steps = int(round(float(duration) / self.dt))
+        steps = max(int(steps), 0)
+        record_every = max(int(record_every), 1)
+
+        result = EnsembleResult.allocate(steps // record_every, len(self.members))
+        failures_before = self.integration_failures.copy()
+        gas = self.gas
+        sample = 0
+
+        wall_start = time.perf_counter()
+        for index in range(1, steps + 1):
+            self.step()
+            if index % record_every:
+                continue
+
+            result.time[sample] = self.simulation_time
+            result.frame_state[sample] = self.frame_state
+            result.lever_angles[sample] = self.lever_angles
+            result.piston_positions[sample] = self.piston_positions
+            result.line_pressures[sample] = gas.line_pressure
+            result.tank_pressure[sample] = gas.tank_pressure
+            result.relief_mass[sample] = self.relief_mass
+            sample += 1
+
+        result.wall_time = time.perf_counter() - wall_start
+        result.steps = steps
+        result.integration_failures = self.integration_failures - failures_before
+        result.metadata = {
+            "dt": self.dt,
+            "record_every": record_every,
+            "members": len(self.members),
+            "line_order": [name.value for name in self.line_names],
+            "thermo_mode": self.thermo_mode.name,
+            "master_isolation_open": self.master_isolation_open,
+        }
+        return result
+
+
+__all__ = ["EnsembleMember", "EnsembleResult", "EnsembleSimulator"]
@@ -0,0 +1,159 @@
+"""Render-rate presentation of physics snapshots.
+
+The physics thread publishes :class:`~src.runtime.state.StateSnapshot` objects
+at a rate that is independent of the display (see
+``PhysicsWorker.state_publish_hz``).  :class:`StateInterpolator` keeps the two
+most recent snapshots and blends frame pose, lever/piston state and pressures
+at the render timestamp, so the scene moves smoothly at 60/120 Hz while only a
+fraction of the physics states crosses the thread boundary.
+
+Rendering runs one publish interval behind the newest snapshot: at the moment
+a snapshot is published the previous one is shown, and the view then advances
+linearly to the new one over the following interval.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+
+from .state import FrameState, LineState, StateSnapshot, TankState, WheelState
+
+__all__ = ["StateInterpolator"]
+
+
+def _lerp(a: float, b: float, alpha: float) -> float:
+    return a + (b - a) * alpha
+
+
+def _blend_frame(prev: FrameState, latest: FrameState, alpha: float) -> FrameState:
+    return dataclasses.replace(
+        latest,
+        heave=_lerp(prev.heave, latest.heave, alpha),
+        roll=_lerp(prev.roll, latest.roll, alpha),
+        pitch=_lerp(prev.pitch, latest.pitch, alpha),
+        heave_rate=_lerp(prev.heave_rate, latest.heave_rate, alpha),
+        roll_rate=_lerp(prev.roll_rate, latest.roll_rate, alpha),
+        pitch_rate=_lerp(prev.pitch_rate, latest.pitch_rate, alpha),
+    )
+
+
+def _blend_wheel(prev: WheelState, latest: WheelState, alpha: float) -> WheelState:
+    return dataclasses.replace(
+        latest,
+        lever_angle=_lerp(prev.lever_angle, latest.lever_angle, alpha),
+        piston_position=_lerp(prev.piston_position, latest.piston_position, alpha),
+        piston_velocity=_lerp(prev.piston_velocity, latest.piston_velocity, alpha),
+        pressure_head=_lerp(prev.pressure_head, latest.pressure_head, alpha),
+        pressure_rod=_lerp(prev.pressure_rod, latest.pressure_rod, alpha),
+        joint_x=_lerp(prev.joint_x, latest.joint_x, alpha),
+        joint_y=_lerp(prev.joint_y, latest.joint_y, alpha),
+        joint_z=_lerp(prev.joint_z, latest.joint_z, alpha),
+    )
+
+
+def _blend_line(prev: LineState, latest: LineState, alpha: float) -> LineState:
+    return dataclasses.replace(
+        latest,
+        pressure=_lerp(prev.pressure, latest.pressure, alpha),
+        temperature=_lerp(prev.temperature, latest.temperature, alpha),
+    )
+
+
+def _blend_tank(prev: TankState, latest: TankState, alpha: float) -> TankState:
+    return dataclasses.replace(
+        latest,
+        pressure=_lerp(prev.pressure, latest.pressure, alpha),
+        temperature=_lerp(prev.temperature, latest.temperature, alpha),
+    )
+
+
+class StateInterpolator:
+    """Blend the two latest published snapshots at render time.
+
+    Snapshots are ordered by ``simulation_time`` and placed on the wall clock
+    by their ``timestamp`` (``time.perf_counter`` at creation, shared by all
+    threads).  A snapshot whose simulation time goes backwards (reset) drops
+    the history.
+    """
+
+    def __init__(self) -> None:
+        self._prev: StateSnapshot | None = None
+        self._latest: StateSnapshot | None = None
+
+    @property
+    def latest(self) -> StateSnapshot | None:
+        return self._latest
+
+    def clear(self) -> None:
+        self._prev = None
+        self._latest = None
+
+    def push(self, snapshot: StateSnapshot | None) -> None:
+        """Record a newly published snapshot."""
+
+        if snapshot is None or snapshot is self._latest:
+            return
+        latest = self._latest
+        if latest is not None:
+            if snapshot.simulation_time == latest.simulation_time:
+                # Same physics state published again (pause, on-demand request)
+                self._latest = snapshot
+                return
+            if snapshot.simulation_time < latest.simulation_time:
+                latest = None
+        self._prev = latest
+        self._latest = snapshot
+
+    def alpha(self, now: float | None = None) -> float:
+        """Position between the previous (0.0) and latest (1.0) snapshot.
+
+        The blend spans the wall-clock interval between the two publishes, so
+        the view stays paced to the publish rate whatever the simulation speed.
+        """
+
+        prev, latest = self._prev, self._latest
+        if prev is None or latest is None:
+            return 1.0
+        span = latest.timestamp - prev.timestamp
+        if span <= 0.0:
+            return 1.0
+        if now is None:
+            now = time.perf_counter()
+        alpha = (now - latest.timestamp) / span
+        return min(max(alpha, 0.0), 1.0)
+
+    def sample(self, now: float | None = None) -> StateSnapshot | None:
+        """Return the state to render at ``now`` (``perf_counter`` seconds).
+
+        The latest snapshot itself is returned once the view has caught up,
+        so an idle simulation yields the same object on every call.
+        """
+
+        prev, latest = self._prev, self._latest
+        if prev is None or latest is None:
+            return latest
+        alpha = self.alpha(now)
+        if alpha >= 1.0:
+            return latest
+
+        wheels = {
+            key: _blend_wheel(prev.wheels[key], state, alpha)
+            if key in prev.wheels
+            else state
+            for key, state in latest.wheels.items()
+        }
+        lines = {
+            key: _blend_line(prev.lines[key], state, alpha)
+            if key in prev.lines
+            else state
+            for key, state in latest.lines.items()
+        }
+        return dataclasses.replace(
+            latest,
+            simulation_time=_lerp(prev.simulation_time, latest.simulation_time, alpha),
+            frame=_blend_frame(prev.frame, latest.frame, alpha),
+            wheels=wheels,
+            lines=lines,
+            tank=_blend_tank(prev.tank, latest.tank, alpha),
+        )
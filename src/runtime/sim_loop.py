@@ -9,6 +9,7 @@ import logging
 import math
 import sys
 import time
+from copy import copy
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any, cast
 
@@ -26,6 +27,7 @@ from .state import (
     TankState,
     SystemAggregates,
 )
+from .snapshot_ring import SnapshotRing
 from .sync import (
     LatestOnlyQueue,
     PerformanceMetrics,
@@ -35,7 +37,6 @@ from .sync import (
 )
 
 # Измененные импорты на абсолютные пути
-from src.physics.forces import project_forces_to_vertical_and_moments
 from src.pneumo.enums import (
     Wheel,
     Line,
@@ -53,14 +54,20 @@ from src.pneumo.gas_state import apply_instant_volume_change
 from src.pneumo.thermo import PolytropicParameters
 from src.road.engine import create_road_input_from_preset
 from src.road.scenarios import get_preset_by_name, resolve_preset_name
+from src.road.types import WHEEL_KEYS
 from src.common.units import KELVIN_0C, PA_ATM
 from src.runtime.steps import (
     PhysicsStepState,
+    StepTrace,
+    apply_pneumatic_update,
     compute_kinematics,
     integrate_body,
     update_gas_state,
 )
 from src.runtime.steps.context import LeverDynamicsConfig
+from src.runtime.steps.lever_kernel import VectorizedLeverKernel
+from src.runtime.steps.lever_table import LOOKUP_METHODS
+from src.physics.odes import BODY_INTEGRATION_SCHEMES, RigidBodyStepper
 
 from src.diagnostics.logger_factory import LoggerProtocol, get_logger
 
@@ -105,6 +112,16 @@ class PhysicsWorker(QObject):
         self.simulation_time = 0.0
         self.step_counter = 0
 
+        # Optional fixed-layout snapshot ring published alongside state_ready
+        self.snapshot_ring: SnapshotRing | None = None
+
+        # Snapshot publication cadence in simulation time: None follows
+        # vsync_render_hz, 0 publishes every timer tick.  The UI interpolates
+        # between published states.
+        self.state_publish_hz: float | None = None
+        self._last_publish_time: float | None = None
+        self._publish_requested = False
+
         # Physics objects (will be initialized in configure)
         self.rigid_body: RigidBody3DOF | None = None
         self.road_input: Any | None = None  # Changed type hint
@@ -147,6 +164,20 @@ class PhysicsWorker(QObject):
             k: 0.0 for k in ("LF", "RF", "LR", "RR")
         }
         self._lever_config = LeverDynamicsConfig()
+        self._lever_kernel: VectorizedLeverKernel | None = None
+        # Rigid-body integrator: "radau" or one of BODY_INTEGRATION_SCHEMES
+        self.body_integrator = "rk4"
+        self._body_stepper: RigidBodyStepper | None = None
+
+        # Low-allocation stepping: one reused step context and two road dicts
+        # alternating between the current and previous step
+        self.low_allocation = False
+        self._step_context: PhysicsStepState | None = None
+        self._road_buffers = tuple({key: 0.0 for key in WHEEL_KEYS} for _ in range(2))
+        self._receiver_mode_cache: tuple[str, ReceiverVolumeMode] | None = None
+
+        # Hot-path diagnostics: the DEBUG level is checked once per sampled step
+        self.trace = StepTrace(self.logger)
 
         # Threading objects (created in target thread)
         self.physics_timer: QTimer | None = None
@@ -162,6 +193,15 @@ class PhysicsWorker(QObject):
         # Load persisted configuration
         self._load_initial_settings()
         self._apply_timing_configuration()
+        self.low_allocation = bool(
+            self.settings_manager.get("simulation.low_allocation", False)
+        )
+        self.set_state_publish_rate(
+            self.settings_manager.get("simulation.state_publish_hz", None)
+        )
+        self._configure_trace(
+            self.settings_manager.get("diagnostics.physics_trace", None)
+        )
 
         self.logger.info(
             "PhysicsWorker initialised",
@@ -173,6 +213,20 @@ class PhysicsWorker(QObject):
             receiver_mode=self.receiver_volume_mode,
         )
 
+    def _configure_trace(self, options: Any) -> None:
+        """Apply ``diagnostics.physics_trace`` (``sample_every``, ``subsystems``)"""
+        if not isinstance(options, dict):
+            return
+        try:
+            self.trace.configure(
+                sample_every=options.get("sample_every"),
+                subsystems=options.get("subsystems"),
+            )
+        except (TypeError, ValueError) as exc:
+            self.logger.warning(
+                "Ignoring invalid physics trace settings", error=str(exc)
+            )
+
     def _load_initial_settings(self) -> None:
         """Load simulation-related settings from SettingsManager"""
         defaults = self.settings_manager.get_all_defaults()
@@ -422,6 +476,25 @@ class PhysicsWorker(QObject):
             )
             if integrator_method not in {"rk4", "euler"}:
                 integrator_method = "rk4"
+            kinematics_kernel = (
+                _modes_string("kinematics_kernel", "vectorized").strip().lower()
+            )
+            if kinematics_kernel not in {"vectorized", "scalar"}:
+                kinematics_kernel = "vectorized"
+            kinematics_lookup = (
+                _modes_string("kinematics_lookup", "off").strip().lower()
+            )
+            if kinematics_lookup not in {"off", *LOOKUP_METHODS}:
+                kinematics_lookup = "off"
+            kinematics_lookup_tolerance = _modes_number(
+                "kinematics_lookup_tolerance", 1e-9
+            )
+            if not kinematics_lookup_tolerance > 0.0:
+                kinematics_lookup_tolerance = 1e-9
+            body_integrator = _modes_string("body_integrator", "rk4").strip().lower()
+            if body_integrator not in {"radau", *BODY_INTEGRATION_SCHEMES}:
+                body_integrator = "rk4"
+            self.body_integrator = body_integrator
 
             base_inertia = wheel_mass * lever_length * lever_length
             lever_inertia = max(base_inertia * inertia_multiplier, 1e-6)
@@ -436,6 +509,9 @@ class PhysicsWorker(QObject):
                 spring_rest_position=spring_rest_position,
                 lever_inertia=lever_inertia,
                 integrator_method=integrator_method,
+                kinematics_kernel=kinematics_kernel,
+                kinematics_lookup=kinematics_lookup,
+                kinematics_lookup_tolerance=kinematics_lookup_tolerance,
             )
         except Exception as exc:
             self.logger.error(
@@ -683,7 +759,12 @@ class PhysicsWorker(QObject):
                 wheel_state.lever_angular_velocity = 0.0
 
             preset_name = self._select_road_preset()
-            road_input = create_road_input_from_preset(preset_name)
+            road_input = create_road_input_from_preset(
+                preset_name,
+                streaming=bool(
+                    self.settings_manager.get("simulation.road_streaming", False)
+                ),
+            )
             road_input.configure(road_input.config, system=self.pneumatic_system)
             road_input.prime()
             self.road_input = road_input
@@ -835,8 +916,12 @@ class PhysicsWorker(QObject):
             self.physics_state = self._create_initial_conditions()
 
         self.timing_accumulator.reset()
+        if self._body_stepper is not None:
+            self._body_stepper.reset()
         self.performance = PerformanceMetrics()
         self.performance.target_dt = self.dt_physics
+        self._last_publish_time = None
+        self._publish_requested = False
 
         self.logger.info("Simulation reset to initial state")
 
@@ -845,6 +930,9 @@ class PhysicsWorker(QObject):
         """Pause/unpause simulation"""
         if self.is_running:
             self.stop_simulation()
+            # The paused state may fall between two publication ticks
+            if self._last_publish_time != self.simulation_time:
+                self.request_state()
         else:
             self.start_simulation()
 
@@ -1174,7 +1262,7 @@ class PhysicsWorker(QObject):
             return
 
         step_start_time = time.perf_counter()
-        step_logger = self.logger.bind(step=self.step_counter)
+        step_number = self.step_counter
         steps_to_take = 0
 
         try:
@@ -1193,21 +1281,15 @@ class PhysicsWorker(QObject):
             if self.step_counter % 100 == 0:  # Every 100 steps
                 self.performance_update.emit(self.performance.get_summary())
 
-            # Create and emit state snapshot
-            snapshot = self._create_state_snapshot()
-            if snapshot and snapshot.validate():
-                self.state_ready.emit(snapshot)
-            else:
-                self.error_counter.increment()
-                if self.error_counter.get() > 10:  # Too many invalid states
-                    self.error_occurred.emit("Too many invalid state snapshots")
-                    self.stop_simulation()
+            if self._publish_requested or (steps_to_take and self._publish_due()):
+                self._publish_state()
 
         except Exception as exc:
             elapsed = time.perf_counter() - step_start_time
             error_message = f"{type(exc).__name__}: {exc}"
-            step_logger.error(
+            self.logger.error(
                 "ERROR: physics step failed",
+                step=step_number,
                 error=str(exc),
                 error_type=type(exc).__name__,
                 elapsed_s=elapsed,
@@ -1217,40 +1299,99 @@ class PhysicsWorker(QObject):
             self.error_occurred.emit(f"Physics step error: {error_message}")
             self.stop_simulation()
 
+    def _publish_due(self) -> bool:
+        rate = self.state_publish_hz
+        if rate is None:
+            rate = self.vsync_render_hz
+        if rate <= 0.0 or self._last_publish_time is None:
+            return True
+        interval = 1.0 / rate
+        # Half a step of slack keeps the cadence from slipping by one step
+        elapsed = self.simulation_time - self._last_publish_time
+        return elapsed + 0.5 * self.dt_physics >= interval
+
+    def _publish_state(self) -> None:
+        """Create, validate and emit a snapshot of the current state"""
+        self._publish_requested = False
+        snapshot = self._create_state_snapshot()
+        if snapshot and snapshot.validate():
+            self._last_publish_time = self.simulation_time
+            if self.snapshot_ring is not None:
+                self.snapshot_ring.write(snapshot)
+            self.state_ready.emit(snapshot)
+        else:
+            self.error_counter.increment()
+            if self.error_counter.get() > 10:  # Too many invalid states
+                self.error_occurred.emit("Too many invalid state snapshots")
+                self.stop_simulation()
+
+    @Slot(float)
+    def set_state_publish_rate(self, hz: float | None) -> None:
+        """Set the snapshot publication rate (Hz of simulation time)
+
+        ``None`` follows ``render_vsync_hz``; zero or a negative value
+        publishes a snapshot on every timer tick.
+        """
+        if isinstance(hz, bool) or not isinstance(hz, (int, float)):
+            self.state_publish_hz = None
+        elif not math.isfinite(hz):
+            self.state_publish_hz = 0.0
+        else:
+            self.state_publish_hz = max(0.0, float(hz))
+
+    @Slot()
+    def request_state(self) -> None:
+        """Publish the current state on demand
+
+        While running the snapshot goes out with the next timer tick;
+        otherwise it is emitted immediately.
+        """
+        if self.is_running:
+            self._publish_requested = True
+        elif self.is_configured:
+            self._publish_state()
+
     def _execute_physics_step(self):
         """Execute single physics timestep"""
         if not self.pneumatic_system or not self.gas_network or not self.road_input:
             raise RuntimeError("Physics dependencies are not initialized")
 
-        # 1. Get road inputs
-        prev_road_inputs = dict(self._last_road_inputs)
-        road_inputs = self._get_road_inputs()
-        current_road_inputs = {k: float(v) for k, v in road_inputs.items()}
-
-        step_state = PhysicsStepState(
-            dt=self.dt_physics,
-            pneumatic_system=self.pneumatic_system,
-            gas_network=self.gas_network,
-            rigid_body=self.rigid_body,
-            physics_state=self.physics_state,
-            simulation_time=self.simulation_time,
-            master_isolation_open=self.master_isolation_open,
-            thermo_mode=self.thermo_mode,
-            receiver_volume=self.receiver_volume,
-            receiver_mode=self._resolve_receiver_mode(self.receiver_volume_mode),
-            prev_piston_positions=self._prev_piston_positions,
-            wheel_states=self._latest_wheel_states,
-            line_states=self._latest_line_states,
-            tank_state=self._latest_tank_state,
-            last_road_inputs=current_road_inputs,
-            prev_road_inputs=prev_road_inputs,
-            latest_frame_accel=self._latest_frame_accel,
-            prev_frame_velocities=self._prev_frame_velocities,
-            performance=self.performance,
-            logger=self.logger,
-            get_line_pressure=self._get_line_pressure,
-            lever_config=replace(self._lever_config),
-        )
+        self.trace.begin_step(self.step_counter)
+        if self.low_allocation:
+            step_state = self._reuse_step_context()
+            road_inputs = step_state.last_road_inputs
+        else:
+            # 1. Get road inputs (a fresh dict per step; the previous one is only read)
+            prev_road_inputs = self._last_road_inputs
+            road_inputs = self._get_road_inputs()
+
+            step_state = PhysicsStepState(
+                dt=self.dt_physics,
+                pneumatic_system=self.pneumatic_system,
+                gas_network=self.gas_network,
+                rigid_body=self.rigid_body,
+                physics_state=self.physics_state,
+                simulation_time=self.simulation_time,
+                master_isolation_open=self.master_isolation_open,
+                thermo_mode=self.thermo_mode,
+                receiver_volume=self.receiver_volume,
+                receiver_mode=self._resolve_receiver_mode(self.receiver_volume_mode),
+                prev_piston_positions=self._prev_piston_positions,
+                wheel_states=self._latest_wheel_states,
+                line_states=self._latest_line_states,
+                tank_state=self._latest_tank_state,
+                last_road_inputs=road_inputs,
+                prev_road_inputs=prev_road_inputs,
+                latest_frame_accel=self._latest_frame_accel,
+                prev_frame_velocities=self._prev_frame_velocities,
+                performance=self.performance,
+                logger=self.logger,
+                get_line_pressure=self._get_line_pressure,
+                lever_config=replace(self._lever_config),
+                lever_kernel=self._lever_kernel,
+                body_stepper=self._current_body_stepper(),
+                trace=self.trace,
+            )
 
         compute_kinematics(step_state, road_inputs)
         update_gas_state(step_state)
@@ -1259,84 +1400,127 @@ class PhysicsWorker(QObject):
         self.physics_state = step_state.physics_state
         self._latest_frame_accel = step_state.latest_frame_accel
         self._prev_frame_velocities = step_state.prev_frame_velocities
-        self._last_road_inputs = dict(step_state.last_road_inputs)
+        self._last_road_inputs = step_state.last_road_inputs
+        self._lever_kernel = step_state.lever_kernel
 
-        try:
-            lever_angles_snapshot = {
-                wheel: float(step_state.wheel_states[wheel].lever_angle)
-                for wheel in Wheel
-            }
-            pneumo_update = self.pneumatic_system.update(
-                lever_angles_snapshot,
-                self.master_isolation_open,
-                step_state.thermo_mode,
-            )
-        except Exception as pneumo_exc:
-            self.logger.warning(
-                "WARNING: pneumatic runtime update failed",
-                error=str(pneumo_exc),
-                exc_info=True,
-            )
-        else:
-            suspension_states: dict[
-                str, dict[str, float | tuple[float, float, float]]
-            ] = {}
-            for wheel, volumes in pneumo_update.chamber_volumes.items():
-                wheel_state = self._latest_wheel_states[wheel]
-                wheel_state.vol_head = volumes[0]
-                wheel_state.vol_rod = volumes[1]
-                wheel_state.piston_position = pneumo_update.piston_positions.get(
-                    wheel, wheel_state.piston_position
-                )
-                wheel_state.force_pneumatic = pneumo_update.wheel_forces.get(
-                    wheel, wheel_state.force_pneumatic
-                )
-                head_pressure, rod_pressure = pneumo_update.pressures.get(
-                    wheel, (None, None)
-                )
-                if head_pressure is not None:
-                    wheel_state.pressure_head = head_pressure
-                if rod_pressure is not None:
-                    wheel_state.pressure_rod = rod_pressure
-
-                axis = pneumo_update.axis_directions.get(wheel)
-                if axis is not None:
-                    suspension_states[wheel.value] = {
-                        "F_total_axis": pneumo_update.wheel_forces.get(wheel, 0.0),
-                        "axis_unit_world": axis,
-                    }
-
-            if self.rigid_body is not None and suspension_states:
-                try:
-                    vertical_forces, tau_x, tau_z = (
-                        project_forces_to_vertical_and_moments(
-                            suspension_states, self.rigid_body.attachment_points
-                        )
-                    )
-                except Exception as exc:
-                    self.logger.warning(
-                        "WARNING: failed to project pneumatic forces",
-                        error=str(exc),
-                        exc_info=True,
-                    )
-                else:
-                    self._latest_vertical_forces = vertical_forces
-                    total_force = float(np.sum(vertical_forces))
-                    self._latest_frame_forces = (
-                        total_force,
-                        float(tau_x),
-                        float(tau_z),
-                    )
-            self.logger.debug(
-                "Pneumatic frame forces",
-                force_left_N=pneumo_update.left_force,
-                force_right_N=pneumo_update.right_force,
-            )
+        frame_forces = apply_pneumatic_update(step_state)
+        if frame_forces is not None:
+            self._latest_vertical_forces, self._latest_frame_forces = frame_forces
 
         # Update simulation time and step counter
         self.simulation_time += self.dt_physics
         self.step_counter += 1
 
+    def _reuse_step_context(self) -> PhysicsStepState:
+        """Refresh the reused step context for low-allocation stepping
+
+        Every field is re-pointed at the worker's current objects, so settings
+        changes made between steps are picked up without building a new
+        context.  Road inputs are written into whichever of the two road
+        buffers does not hold the previous step's values.
+        """
+
+        prev_road_inputs = self._last_road_inputs
+        first, second = self._road_buffers
+        road_inputs = second if prev_road_inputs is first else first
+        self._fill_road_inputs(road_inputs)
+
+        token = self.receiver_volume_mode
+        cached_mode = self._receiver_mode_cache
+        if cached_mode is None or cached_mode[0] != token:
+            cached_mode = (token, self._resolve_receiver_mode(token))
+            self._receiver_mode_cache = cached_mode
+
+        context = self._step_context
+        if context is None:
+            context = PhysicsStepState(
+                dt=self.dt_physics,
+                pneumatic_system=self.pneumatic_system,
+                gas_network=self.gas_network,
+                rigid_body=self.rigid_body,
+                physics_state=self.physics_state,
+                simulation_time=self.simulation_time,
+                master_isolation_open=self.master_isolation_open,
+                thermo_mode=self.thermo_mode,
+                receiver_volume=self.receiver_volume,
+                receiver_mode=cached_mode[1],
+                prev_piston_positions=self._prev_piston_positions,
+                wheel_states=self._latest_wheel_states,
+                line_states=self._latest_line_states,
+                tank_state=self._latest_tank_state,
+                last_road_inputs=road_inputs,
+                prev_road_inputs=prev_road_inputs,
+                latest_frame_accel=self._latest_frame_accel,
+                prev_frame_velocities=self._prev_frame_velocities,
+                performance=self.performance,
+                logger=self.logger,
+                get_line_pressure=self._get_line_pressure,
+                lever_config=self._lever_config,
+                lever_kernel=self._lever_kernel,
+                body_stepper=self._current_body_stepper(),
+                trace=self.trace,
+            )
+            self._step_context = context
+            return context
+
+        context.dt = self.dt_physics
+        context.pneumatic_system = self.pneumatic_system
+        context.gas_network = self.gas_network
+        context.rigid_body = self.rigid_body
+        context.physics_state = self.physics_state
+        context.simulation_time = self.simulation_time
+        context.master_isolation_open = self.master_isolation_open
+        context.thermo_mode = self.thermo_mode
+        context.receiver_volume = self.receiver_volume
+        context.receiver_mode = cached_mode[1]
+        context.prev_piston_positions = self._prev_piston_positions
+        context.wheel_states = self._latest_wheel_states
+        context.line_states = self._latest_line_states
+        context.tank_state = self._latest_tank_state
+        context.last_road_inputs = road_inputs
+        context.prev_road_inputs = prev_road_inputs
+        context.latest_frame_accel = self._latest_frame_accel
+        context.prev_frame_velocities = self._prev_frame_velocities
+        context.performance = self.performance
+        context.logger = self.logger
+        context.lever_config = self._lever_config
+        context.lever_kernel = self._lever_kernel
+        context.body_stepper = self._current_body_stepper()
+        context.trace = self.trace
+        return context
+
+    def _current_body_stepper(self) -> RigidBodyStepper | None:
+        """Return the persistent body integrator, or ``None`` for Radau"""
+        if self.body_integrator == "radau" or self.rigid_body is None:
+            return None
+        stepper = self._body_stepper
+        if (
+            stepper is None
+            or stepper.params is not self.rigid_body
+            or stepper.scheme != self.body_integrator
+        ):
+            stepper = RigidBodyStepper(self.rigid_body, self.body_integrator)
+            self._body_stepper = stepper
+        return stepper
+
+    def _fill_road_inputs(self, target: dict[str, float]) -> None:
+        """Write the current road excitation into ``target`` in place"""
+        get_state = getattr(self.road_input, "get_wheel_state", None)
+        if get_state is None:
+            target.update(self._get_road_inputs())
+            return
+        try:
+            displacement = get_state(self.simulation_time)[0].tolist()
+        except Exception as e:
+            self.logger.warning(
+                "WARNING: road input error",
+                error=str(e),
+                exc_info=True,
+            )
+            displacement = [0.0] * len(WHEEL_KEYS)
+        for key, value in zip(WHEEL_KEYS, displacement):
+            target[key] = value
+
     def _get_road_inputs(self) -> dict[str, float]:
         """Get road excitation for all wheels"""
         if self.road_input:
@@ -1355,12 +1539,40 @@ class PhysicsWorker(QObject):
     def _create_state_snapshot(self) -> StateSnapshot | None:
         """Create current state snapshot"""
         try:
-            snapshot = StateSnapshot()
+            # Road excitations
+            road_excitations = self._last_road_inputs
+
+            # Wheel, line and tank states: shallow copies of the cached states
+            # (cheaper than dataclasses.replace, which re-runs __init__)
+            wheels: dict[Wheel, WheelState] = {}
+            for wheel in (Wheel.LP, Wheel.PP, Wheel.LZ, Wheel.PZ):
+                wheel_state = copy(self._latest_wheel_states[wheel])
 
-            # Basic timing info
-            snapshot.simulation_time = self.simulation_time
-            snapshot.dt_physics = self.dt_physics
-            snapshot.step_number = self.step_counter
+                wheel_key = wheel.value  # LP, PP, LZ, PZ
+                if wheel_key in road_excitations:
+                    wheel_state.road_excitation = road_excitations[wheel_key]
+
+                wheels[wheel] = wheel_state
+
+            lines = {
+                line: copy(self._latest_line_states[line])
+                for line in (Line.A1, Line.B1, Line.A2, Line.B2)
+            }
+
+            # Built with all parts up front so no default states are created
+            snapshot = StateSnapshot(
+                simulation_time=self.simulation_time,
+                dt_physics=self.dt_physics,
+                step_number=self.step_counter,
+                wheels=wheels,
+                lines=lines,
+                tank=copy(self._latest_tank_state),
+                aggregates=SystemAggregates(
+                    physics_step_time=self.performance.avg_step_time,
+                    integration_steps=self.step_counter,
+                    integration_failures=self.performance.integration_failures,
+                ),
+            )
 
             # Frame state from physics integration
             if len(self.physics_state) >= 6:
@@ -1381,33 +1593,6 @@ class PhysicsWorker(QObject):
                     total_moment_z=float(self._latest_frame_forces[2]),
                 )
 
-            # Road excitations
-            road_excitations = self._last_road_inputs
-
-            # Wheel states
-            for wheel in [Wheel.LP, Wheel.PP, Wheel.LZ, Wheel.PZ]:
-                wheel_state = replace(self._latest_wheel_states[wheel])
-
-                wheel_key = wheel.value  # LP, PP, LZ, PZ
-                if wheel_key in road_excitations:
-                    wheel_state.road_excitation = road_excitations[wheel_key]
-
-                snapshot.wheels[wheel] = wheel_state
-
-            # Line states
-            for line in [Line.A1, Line.B1, Line.A2, Line.B2]:
-                snapshot.lines[line] = replace(self._latest_line_states[line])
-
-            # Tank state
-            snapshot.tank = replace(self._latest_tank_state)
-
-            # System aggregates
-            snapshot.aggregates = SystemAggregates(
-                physics_step_time=self.performance.avg_step_time,
-                integration_steps=self.step_counter,
-                integration_failures=self.performance.integration_failures,
-            )
-
             # Configuration
             snapshot.master_isolation_open = self.master_isolation_open
             snapshot.thermo_mode = (
@@ -1478,6 +1663,7 @@ class PhysicsWorker(QObject):
 
 
 SNAPSHOT_BUFFER_CAPACITY = 4096
+SNAPSHOT_RING_CAPACITY = 1024
 
 
 class SimulationManager(QObject):
@@ -1494,6 +1680,10 @@ class SimulationManager(QObject):
         self.physics_thread = QThread()
         self.physics_worker = PhysicsWorker()
 
+        # Lock-free record ring written by the physics thread (single producer);
+        # opt-in via enable_snapshot_ring() for readers outside the Qt signals
+        self.snapshot_ring: SnapshotRing | None = None
+
         # Move worker to physics thread
         self.physics_worker.moveToThread(self.physics_thread)
 
@@ -1556,11 +1746,32 @@ class SimulationManager(QObject):
         self.state_bus.set_receiver_volume.connect(
             self.physics_worker.set_receiver_volume, Qt.QueuedConnection
         )  # NEW!
+        self.state_bus.set_state_publish_rate.connect(
+            self.physics_worker.set_state_publish_rate, Qt.QueuedConnection
+        )
+        self.state_bus.request_state.connect(
+            self.physics_worker.request_state, Qt.QueuedConnection
+        )
 
         # Thread lifecycle
         self.physics_thread.started.connect(self._on_thread_started)
         self.physics_thread.finished.connect(self._on_thread_finished)
 
+    def enable_snapshot_ring(
+        self, capacity: int = SNAPSHOT_RING_CAPACITY, *, shared: bool = False
+    ) -> SnapshotRing:
+        """Publish every state into a :class:`SnapshotRing` and return it.
+
+        Off by default: the UI consumes ``state_ready``.  Readers such as
+        telemetry recorders or external processes (``shared=True``, attach
+        with :meth:`SnapshotRing.attach`) enable it explicitly.
+        """
+
+        if self.snapshot_ring is None:
+            self.snapshot_ring = SnapshotRing(capacity, shared=shared)
+            self.physics_worker.snapshot_ring = self.snapshot_ring
+        return self.snapshot_ring
+
     def start(self):
         """Start simulation manager"""
         if not self.physics_thread.isRunning():
@@ -0,0 +1,334 @@
+"""Fixed-layout snapshot records in a single-producer ring buffer.
+
+Each :class:`~src.runtime.state.StateSnapshot` is flattened into one record of
+:data:`SNAPSHOT_DTYPE` (frame, four wheels, four lines, tank and aggregates) and
+written into a preallocated slot. Consumers read the latest slot or a range of
+slots as NumPy views without copying and without taking a lock. The backing
+memory can be a POSIX shared-memory block, which lets a physics process publish
+snapshots to a GUI running in another process.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from multiprocessing import shared_memory
+from operator import attrgetter
+from typing import Any
+
+import numpy as np
+
+from src.pneumo.enums import Line, Wheel
+
+from .state import (
+    FrameState,
+    LineState,
+    StateSnapshot,
+    SystemAggregates,
+    TankState,
+    WheelState,
+)
+
+WHEEL_RECORD_ORDER: tuple[Wheel, ...] = (Wheel.LP, Wheel.PP, Wheel.LZ, Wheel.PZ)
+LINE_RECORD_ORDER: tuple[Line, ...] = (Line.A1, Line.B1, Line.A2, Line.B2)
+
+_HEADER_SIZE = 64
+_HEADER_DTYPE = np.dtype([("head", "<u8"), ("capacity", "<u8")])
+_THERMO_MODE_LENGTH = 16
+
+# Optional limits are stored as NaN and restored as ``None``
+_FIELD_DTYPES = {
+    "float": np.dtype("<f8"),
+    "float | None": np.dtype("<f8"),
+    "int": np.dtype("<i8"),
+    "bool": np.dtype("?"),
+}
+
+
+def _record_fields(cls: type) -> tuple[str, ...]:
+    return tuple(
+        field.name for field in dataclasses.fields(cls) if field.type in _FIELD_DTYPES
+    )
+
+
+def _section_dtype(cls: type) -> np.dtype:
+    types = {field.name: str(field.type) for field in dataclasses.fields(cls)}
+    return np.dtype(
+        [(name, _FIELD_DTYPES[types[name]]) for name in _record_fields(cls)]
+    )
+
+
+_FRAME_FIELDS = _record_fields(FrameState)
+_WHEEL_FIELDS = _record_fields(WheelState)
+_LINE_FIELDS = _record_fields(LineState)
+_TANK_FIELDS = _record_fields(TankState)
+_AGGREGATE_FIELDS = _record_fields(SystemAggregates)
+
+_OPTIONAL_FIELDS: dict[type, tuple[str, ...]] = {
+    cls: tuple(
+        field.name for field in dataclasses.fields(cls) if field.type == "float | None"
+    )
+    for cls in (WheelState, LineState, TankState)
+}
+
+SNAPSHOT_DTYPE = np.dtype(
+    [
+        ("seq", "<u8"),
+        ("timestamp", "<f8"),
+        ("simulation_time", "<f8"),
+        ("dt_physics", "<f8"),
+        ("step_number", "<i8"),
+        ("master_isolation_open", "?"),
+        ("thermo_mode", f"S{_THERMO_MODE_LENGTH}"),
+        ("frame", _section_dtype(FrameState)),
+        ("wheels", _section_dtype(WheelState), (len(WHEEL_RECORD_ORDER),)),
+        ("lines", _section_dtype(LineState), (len(LINE_RECORD_ORDER),)),
+        ("tank", _section_dtype(TankState)),
+        ("aggregates", _section_dtype(SystemAggregates)),
+    ],
+    align=True,
+)
+
+_frame_values = attrgetter(*_FRAME_FIELDS)
+_wheel_values = attrgetter(*_WHEEL_FIELDS)
+_line_values = attrgetter(*_LINE_FIELDS)
+_tank_values = attrgetter(*_TANK_FIELDS)
+_aggregate_values = attrgetter(*_AGGREGATE_FIELDS)
+
+
+def _thermo_mode_name(mode: Any) -> bytes:
+    name = getattr(mode, "name", mode)
+    return str(name).encode("ascii")[:_THERMO_MODE_LENGTH]
+
+
+def snapshot_record_values(snapshot: StateSnapshot, seq: int = 0) -> tuple[Any, ...]:
+    """Flatten ``snapshot`` into a nested tuple matching :data:`SNAPSHOT_DTYPE`.
+
+    Missing wheels and lines are written with default (zero) values so the
+    record layout never changes.
+    """
+
+    wheels = snapshot.wheels
+    lines = snapshot.lines
+    return (
+        seq,
+        snapshot.timestamp,
+        snapshot.simulation_time,
+        snapshot.dt_physics,
+        snapshot.step_number,
+        snapshot.master_isolation_open,
+        _thermo_mode_name(snapshot.thermo_mode),
+        _frame_values(snapshot.frame),
+        [
+            _wheel_values(wheels.get(wheel) or WheelState(wheel=wheel))
+            for wheel in WHEEL_RECORD_ORDER
+        ],
+        [
+            _line_values(lines.get(line) or LineState(line=line))
+            for line in LINE_RECORD_ORDER
+        ],
+        _tank_values(snapshot.tank),
+        _aggregate_values(snapshot.aggregates),
+    )
+
+
+def _restore(cls: type, names: tuple[str, ...], values: tuple, **extra: Any) -> Any:
+    kwargs = dict(zip(names, values))
+    for name in _OPTIONAL_FIELDS.get(cls, ()):
+        if kwargs[name] != kwargs[name]:  # NaN marks an unset limit
+            kwargs[name] = None
+    return cls(**kwargs, **extra)
+
+
+def snapshot_from_record(record: np.void | np.ndarray) -> StateSnapshot:
+    """Rebuild a :class:`StateSnapshot` from a :data:`SNAPSHOT_DTYPE` record."""
+
+    record = np.asarray(record, dtype=SNAPSHOT_DTYPE).reshape(())
+    # ``tolist`` yields Python scalars; ``item`` keeps NumPy scalars in subarrays
+    frame, tank, aggregates = (
+        record["frame"].tolist(),
+        record["tank"].tolist(),
+        record["aggregates"].tolist(),
+    )
+    wheels = record["wheels"].tolist()
+    lines = record["lines"].tolist()
+    return StateSnapshot(
+        timestamp=float(record["timestamp"]),
+        simulation_time=float(record["simulation_time"]),
+        dt_physics=float(record["dt_physics"]),
+        step_number=int(record["step_number"]),
+        frame=FrameState(**dict(zip(_FRAME_FIELDS, frame))),
+        wheels={
+            wheel: _restore(WheelState, _WHEEL_FIELDS, values, wheel=wheel)
+            for wheel, values in zip(WHEEL_RECORD_ORDER, wheels)
+        },
+        lines={
+            line: _restore(LineState, _LINE_FIELDS, values, line=line)
+            for line, values in zip(LINE_RECORD_ORDER, lines)
+        },
+        tank=_restore(TankState, _TANK_FIELDS, tank),
+        aggregates=SystemAggregates(**dict(zip(_AGGREGATE_FIELDS, aggregates))),
+        master_isolation_open=bool(record["master_isolation_open"]),
+        thermo_mode=record["thermo_mode"].item().decode("ascii"),
+    )
+
+
+class SnapshotRing:
+    """Lock-free single-producer ring of :data:`SNAPSHOT_DTYPE` records.
+
+    The producer publishes records with :meth:`write`; every record carries a
+    monotonically increasing sequence number (starting at 1) in its ``seq``
+    field and the header holds the sequence of the newest complete record.
+    Readers receive views into the ring, so a slot may be overwritten once the
+    producer has wrapped around: check :meth:`overwritten` after consuming a
+    range, or use :meth:`copy_latest` for a consistent private copy.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        *,
+        shared: bool = False,
+        name: str | None = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("Snapshot ring capacity must be positive")
+
+        size = _HEADER_SIZE + capacity * SNAPSHOT_DTYPE.itemsize
+        self._shm: shared_memory.SharedMemory | None = None
+        self._owner = True
+        if shared or name is not None:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            buffer: Any = self._shm.buf
+        else:
+            buffer = bytearray(size)
+        self._bind(buffer, capacity)
+        self._header["capacity"] = capacity
+
+    @classmethod
+    def attach(cls, name: str) -> SnapshotRing:
+        """Open a ring created with ``shared=True`` in another process."""
+
+        shm = shared_memory.SharedMemory(name=name)
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=shm.buf)
+        capacity = int(header["capacity"])
+        del header
+        if shm.size < _HEADER_SIZE + capacity * SNAPSHOT_DTYPE.itemsize:
+            shm.close()
+            raise ValueError(f"Shared memory block {name!r} is not a snapshot ring")
+
+        ring = cls.__new__(cls)
+        ring._shm = shm
+        ring._owner = False
+        ring._bind(shm.buf, capacity)
+        return ring
+
+    def _bind(self, buffer: Any, capacity: int) -> None:
+        self._header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=buffer)
+        self._records = np.ndarray(
+            (capacity,), dtype=SNAPSHOT_DTYPE, buffer=buffer, offset=_HEADER_SIZE
+        )
+        self._capacity = capacity
+
+    @property
+    def name(self) -> str | None:
+        """Shared-memory block name, or ``None`` for a process-private ring."""
+
+        return self._shm.name if self._shm is not None else None
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def head(self) -> int:
+        """Sequence number of the newest published record (0 when empty)."""
+
+        return int(self._header["head"])
+
+    @property
+    def records(self) -> np.ndarray:
+        """Raw slot array; slot ``(seq - 1) % capacity`` holds record ``seq``."""
+
+        return self._records
+
+    def write(self, snapshot: StateSnapshot) -> int:
+        """Publish ``snapshot`` and return its sequence number."""
+
+        seq = self.head + 1
+        slot = (seq - 1) % self._capacity
+        record = self._records[slot : slot + 1]
+        # A zero sequence marks the slot as being rewritten until it is complete
+        record["seq"] = 0
+        record[0] = snapshot_record_values(snapshot)
+        record["seq"] = seq
+        self._header["head"] = seq
+        return seq
+
+    def latest(self) -> np.void | None:
+        """Return a view of the newest record, or ``None`` if nothing is published."""
+
+        head = self.head
+        if head == 0:
+            return None
+        record: np.void = self._records[(head - 1) % self._capacity]
+        return record
+
+    def copy_latest(self, out: np.ndarray | None = None) -> np.ndarray | None:
+        """Copy the newest record into ``out`` (shape ``(1,)``), retrying torn reads."""
+
+        if out is None:
+            out = np.empty(1, dtype=SNAPSHOT_DTYPE)
+        while True:
+            head = self.head
+            if head == 0:
+                return None
+            out[0] = self._records[(head - 1) % self._capacity]
+            if int(out["seq"][0]) == head and not self.overwritten(head):
+                return out
+
+    def since(self, seq: int) -> tuple[np.ndarray, ...]:
+        """Return views of the records published after ``seq`` in order.
+
+        At most ``capacity - 1`` records are returned (older ones are
+        considered lost); the result has two views when the range wraps.
+        """
+
+        head = self.head
+        first = max(seq + 1, head - self._capacity + 2, 1)
+        if first > head:
+            return ()
+        start = (first - 1) % self._capacity
+        stop = start + head - first + 1
+        if stop <= self._capacity:
+            return (self._records[start:stop],)
+        return (
+            self._records[start:],
+            self._records[: stop - self._capacity],
+        )
+
+    def overwritten(self, seq: int) -> bool:
+        """Return True if record ``seq`` may have been replaced by the producer."""
+
+        return seq <= self.head + 1 - self._capacity
+
+    def close(self) -> None:
+        """Release this process's mapping; the owner also removes the block."""
+
+        if self._shm is None:
+            return
+        # Views must be dropped before the shared buffer can be released
+        self._header = self._records = None  # type: ignore[assignment]
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+
+__all__ = [
+    "LINE_RECORD_ORDER",
+    "SNAPSHOT_DTYPE",
+    "SnapshotRing",
+    "WHEEL_RECORD_ORDER",
+    "snapshot_from_record",
+    "snapshot_record_values",
+]
@@ -400,6 +400,8 @@ if QObject is not None and Signal is not None and Qt is not None:
         set_receiver_volume = Signal(
             float, str
         )  # NEW: Set receiver volume (m3) and mode ('MANUAL'/'GEOMETRIC')
+        set_state_publish_rate = Signal(float)  # Snapshot rate (Hz), 0 = every tick
+        request_state = Signal()  # Publish the current state on demand
 
         # Road input signals
         load_road_profile = Signal(str)  # Load CSV road profile
@@ -446,6 +448,8 @@ else:
         set_thermo_mode = _UnavailableSignal(str)
         set_master_isolation = _UnavailableSignal(bool)
         set_receiver_volume = _UnavailableSignal(float, str)
+        set_state_publish_rate = _UnavailableSignal(float)
+        request_state = _UnavailableSignal()
         load_road_profile = _UnavailableSignal(str)
         set_road_preset = _UnavailableSignal(str)
         physics_error = _UnavailableSignal(str)
@@ -4,10 +4,14 @@ from .context import PhysicsStepState
 from .dynamics import integrate_body
 from .gas import update_gas_state
 from .kinematics import compute_kinematics
+from .pneumatics import apply_pneumatic_update
+from .trace import StepTrace
 
 __all__ = [
     "PhysicsStepState",
     "compute_kinematics",
     "update_gas_state",
     "integrate_body",
+    "apply_pneumatic_update",
+    "StepTrace",
 ]
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-import logging
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 from collections.abc import Callable
 
 import numpy as np
 
-from src.physics.odes import RigidBody3DOF
+from src.diagnostics.logger_factory import LoggerProtocol
+from src.physics.odes import RigidBody3DOF, RigidBodyStepper
 from src.pneumo.enums import Line, Port, ReceiverVolumeMode, ThermoMode, Wheel
 from src.pneumo.network import GasNetwork
 from src.runtime.state import LineState, TankState, WheelState
 from src.runtime.sync import PerformanceMetrics
 
+if TYPE_CHECKING:
+    from .lever_kernel import VectorizedLeverKernel
+    from .trace import StepTrace
+
 
 @dataclass
 class LeverDynamicsConfig:
@@ -29,6 +33,10 @@ class LeverDynamicsConfig:
     spring_rest_position: float = 0.0
     lever_inertia: float = 1.0
     integrator_method: str = "rk4"
+    kinematics_kernel: str = "vectorized"
+    # Lever kinematics lookup tables: "off", "cubic" or "linear"
+    kinematics_lookup: str = "off"
+    kinematics_lookup_tolerance: float = 1e-9
 
 
 @dataclass
@@ -54,6 +62,13 @@ class PhysicsStepState:
     latest_frame_accel: np.ndarray
     prev_frame_velocities: np.ndarray
     performance: PerformanceMetrics
-    logger: logging.Logger
+    logger: LoggerProtocol
     get_line_pressure: Callable[[Wheel, Port], float]
     lever_config: LeverDynamicsConfig
+    lever_kernel: VectorizedLeverKernel | None = None
+    # Persistent fixed-step body integrator; ``None`` keeps the adaptive Radau solve
+    body_stepper: RigidBodyStepper | None = None
+    # Per-step diagnostics gate; ``None`` checks ``logger`` for DEBUG instead
+    trace: StepTrace | None = None
+    # Scratch mapping reused by the pneumatic update when the context is reused
+    lever_angles: dict[Wheel, float] = field(default_factory=dict)
@@ -2,40 +2,100 @@
 
 from __future__ import annotations
 
-from src.physics.integrator import step_dynamics
+import time
+
+import numpy as np
+
+from src.physics.integrator import clamp_state, step_dynamics
+from src.physics.odes import RigidBody3DOF, RigidBodyStepper, validate_state
 
 from .context import PhysicsStepState
+from .trace import step_logger
+
+
+def _step_with_stepper(
+    state: PhysicsStepState, stepper: RigidBodyStepper, rigid_body: RigidBody3DOF
+) -> tuple[np.ndarray | None, str]:
+    """Advance the body with the persistent fixed-step integrator."""
+
+    start = time.perf_counter()
+    y_final = stepper.step(
+        state.physics_state,
+        state.simulation_time,
+        state.dt,
+        state.pneumatic_system,
+        state.gas_network,
+    )
+    is_valid, message = validate_state(y_final, rigid_body)
+    if not is_valid:
+        y_final = clamp_state(y_final, rigid_body)
+        is_valid, message = validate_state(y_final, rigid_body)
+    state.performance.record_integration(
+        stepper.scheme, stepper.n_evaluations, time.perf_counter() - start
+    )
+    return y_final if is_valid else None, message
 
 
 def integrate_body(state: PhysicsStepState) -> None:
-    """Integrate rigid-body dynamics for the current step."""
+    """Integrate rigid-body dynamics for the current step.
 
-    if state.rigid_body is None:
-        return
+    Uses ``state.body_stepper`` when one is attached and falls back to a
+    per-step adaptive Radau solve otherwise.
+    """
 
-    try:
-        result = step_dynamics(
-            y0=state.physics_state,
-            t0=state.simulation_time,
-            dt=state.dt,
-            params=state.rigid_body,
-            system=state.pneumatic_system,
-            gas=state.gas_network,
-            method="Radau",
-        )
-    except Exception as exc:  # pragma: no cover - defensive logging
-        state.performance.integration_failures += 1
-        state.logger.error(f"Integration error: {exc}")
+    rigid_body = state.rigid_body
+    if rigid_body is None:
         return
 
-    if not result.success:
-        state.performance.integration_failures += 1
-        state.logger.warning(f"Integration failed: {result.message}")
-        return
+    stepper = state.body_stepper
+    if stepper is not None:
+        try:
+            y_final, message = _step_with_stepper(state, stepper, rigid_body)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            state.performance.integration_failures += 1
+            state.logger.error(f"Integration error: {exc}")
+            return
+        if y_final is None:
+            state.performance.integration_failures += 1
+            state.logger.warning(f"Integration failed: {message}")
+            return
+    else:
+        try:
+            result = step_dynamics(
+                y0=state.physics_state,
+                t0=state.simulation_time,
+                dt=state.dt,
+                params=rigid_body,
+                system=state.pneumatic_system,
+                gas=state.gas_network,
+                method="Radau",
+            )
+        except Exception as exc:  # pragma: no cover - defensive logging
+            state.performance.integration_failures += 1
+            state.logger.error(f"Integration error: {exc}")
+            return
+
+        if not result.success:
+            state.performance.integration_failures += 1
+            state.logger.warning(f"Integration failed: {result.message}")
+            return
+        state.performance.record_integration(
+            result.method_used, result.n_evaluations, result.solve_time
+        )
+        y_final = result.y_final
 
     prev_vel = state.physics_state[3:6].copy()
-    state.physics_state = result.y_final
+    state.physics_state = y_final
     velocities = state.physics_state[3:6]
     if state.dt > 0:
         state.latest_frame_accel = (velocities - prev_vel) / state.dt
     state.prev_frame_velocities = velocities.copy()
+
+    log = step_logger(state, "body")
+    if log:
+        log.debug(
+            "Rigid body: heave=%.6fm, roll=%.6frad, pitch=%.6frad",
+            float(y_final[0]),
+            float(y_final[1]),
+            float(y_final[2]),
+        )
@@ -8,6 +8,7 @@ from src.pneumo.gas_state import apply_instant_volume_change
 from src.pneumo.sim_time import advance_gas
 
 from .context import PhysicsStepState
+from .trace import step_logger
 
 
 def _compute_penetration_volume(state: PhysicsStepState, line_name: Line) -> float:
@@ -50,14 +51,16 @@ def update_gas_state(state: PhysicsStepState) -> None:
             gamma=state.gas_network.tank.gamma,
         )
 
-    advance_gas(
+    flows = advance_gas(
         state.dt,
         state.pneumatic_system,
         state.gas_network,
         state.thermo_mode,
-        state.logger,
+        step_logger(state, "gas"),
         corrected_volumes,
     )
+    line_flows = flows.get("lines", {}) if flows else {}
+    relief_flows = flows.get("relief", {}) if flows else {}
 
     for line_name, gas_state in state.gas_network.lines.items():
         line_state = state.line_states[line_name]
@@ -76,11 +79,18 @@ def update_gas_state(state: PhysicsStepState) -> None:
             )
         except Exception:
             line_state.cv_tank_open = False
-        line_state.flow_atmo = 0.0
-        line_state.flow_tank = 0.0
+        line_flow = line_flows.get(line_name, {})
+        line_state.flow_atmo = float(line_flow.get("flow_atmo", 0.0))
+        line_state.flow_tank = float(line_flow.get("flow_tank", 0.0))
 
     tank_state = state.gas_network.tank
     state.tank_state.pressure = tank_state.p
     state.tank_state.temperature = tank_state.T
     state.tank_state.mass = tank_state.m
     state.tank_state.volume = tank_state.V
+    state.tank_state.flow_min = float(relief_flows.get("flow_min", 0.0))
+    state.tank_state.flow_stiff = float(relief_flows.get("flow_stiff", 0.0))
+    state.tank_state.flow_safety = float(relief_flows.get("flow_safety", 0.0))
+    state.tank_state.relief_min_open = state.tank_state.flow_min > 0.0
+    state.tank_state.relief_stiff_open = state.tank_state.flow_stiff > 0.0
+    state.tank_state.relief_safety_open = state.tank_state.flow_safety > 0.0
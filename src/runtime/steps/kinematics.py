@@ -12,6 +12,9 @@ from src.common.units import to_gauge_pressure
 from src.pneumo.enums import Port, Wheel
 
 from .context import LeverDynamicsConfig, PhysicsStepState
+from .lever_kernel import WHEEL_ORDER, VectorizedLeverKernel
+from .lever_table import LeverCurve
+from .trace import step_logger
 
 
 @dataclass
@@ -38,10 +41,15 @@ _WHEEL_KEY_MAP: dict[Wheel, str] = {
 
 
 def _solve_angle_for_displacement(
-    lever_geom, target: float, initial_angle: float
+    lever_geom, target: float, initial_angle: float, curve: LeverCurve | None = None
 ) -> float:
-    """Return angle that produces ``target`` displacement using Newton iterations."""
+    """Return angle that produces ``target`` displacement using Newton iterations.
 
+    A lookup ``curve`` answers from its inverse table instead.
+    """
+
+    if curve is not None:
+        return curve.angle_for(target)
     angle = initial_angle
     for _ in range(12):
         displacement = lever_geom.angle_to_displacement(angle) - target
@@ -66,11 +74,17 @@ def _force_components(
     road_disp: float,
     road_vel: float,
     get_line_pressure,
+    curve: LeverCurve | None = None,
 ) -> tuple[float, float, float, float, float, float]:
     """Evaluate forces and resulting torque for a given lever state."""
 
-    displacement = lever_geom.angle_to_displacement(theta)
-    derivative = lever_geom.mechanical_advantage(theta)
+    if curve is not None:
+        displacement, derivative = curve.evaluate(
+            theta, getattr(lever_geom, "_min_angle_active", False)
+        )
+    else:
+        displacement = lever_geom.angle_to_displacement(theta)
+        derivative = lever_geom.mechanical_advantage(theta)
     piston_velocity = omega * derivative
 
     spring_force = 0.0
@@ -118,8 +132,12 @@ def integrate_lever_state(
     road_velocity: float,
     get_line_pressure: Callable[[Wheel, Port], float],
     method: str | None = None,
+    curve: LeverCurve | None = None,
 ) -> LeverIntegrationResult:
-    """Integrate lever angle/velocity for one timestep."""
+    """Integrate lever angle/velocity for one timestep.
+
+    ``curve`` replaces the lever geometry calls with table lookups.
+    """
 
     inertia = max(lever_config.lever_inertia, 1e-6)
 
@@ -141,6 +159,7 @@ def integrate_lever_state(
             road_displacement,
             road_velocity,
             get_line_pressure,
+            curve,
         )
         return torque / inertia
 
@@ -171,6 +190,7 @@ def integrate_lever_state(
             road_displacement,
             road_velocity,
             get_line_pressure,
+            curve,
         )
         return LeverIntegrationResult(
             angle=theta_new,
@@ -231,18 +251,21 @@ def integrate_lever_state(
     if hasattr(lever_geom, "_min_angle_active"):
         lever_geom._min_angle_active = use_min_angle
 
-    displacement = lever_geom.angle_to_displacement(theta_new)
+    if curve is not None:
+        displacement, _ = curve.evaluate(theta_new, use_min_angle)
+    else:
+        displacement = lever_geom.angle_to_displacement(theta_new)
     clamped = False
 
     if displacement > max_displacement:
         theta_new = _solve_angle_for_displacement(
-            lever_geom, max_displacement, theta_new
+            lever_geom, max_displacement, theta_new, curve
         )
         omega_new = 0.0
         clamped = True
     elif displacement < -max_displacement:
         theta_new = _solve_angle_for_displacement(
-            lever_geom, -max_displacement, theta_new
+            lever_geom, -max_displacement, theta_new, curve
         )
         omega_new = 0.0
         clamped = True
@@ -266,6 +289,7 @@ def integrate_lever_state(
             road_displacement,
             road_velocity,
             get_line_pressure,
+            curve,
         )
 
         if clamped:
@@ -294,13 +318,31 @@ def integrate_lever_state(
             lever_geom._min_angle_active = previous_min_flag
 
 
-def compute_kinematics(state: PhysicsStepState, road_inputs: dict[str, float]) -> None:
-    """Update pneumatic system and wheel states from road excitation."""
+def _lever_kernel(state: PhysicsStepState) -> VectorizedLeverKernel:
+    """Return the step's lever kernel with the configured lookup table attached."""
 
-    dt = float(state.dt)
+    kernel = state.lever_kernel
+    if kernel is None or kernel.pneumatic_system is not state.pneumatic_system:
+        kernel = VectorizedLeverKernel(state.pneumatic_system)
+        state.lever_kernel = kernel
+    kernel.use_lookup_table(
+        state.lever_config.kinematics_lookup,
+        state.lever_config.kinematics_lookup_tolerance,
+    )
+    return kernel
+
+
+def _integrate_levers_scalar(
+    state: PhysicsStepState, road_inputs: dict[str, float], dt: float
+) -> dict[Wheel, LeverIntegrationResult]:
     lever_config = state.lever_config
     results: dict[Wheel, LeverIntegrationResult] = {}
-    lever_angles: dict[Wheel, float] = {}
+
+    curves: dict[Wheel, LeverCurve] = {}
+    if str(lever_config.kinematics_lookup).strip().lower() != "off":
+        table = _lever_kernel(state).table
+        if table is not None:
+            curves = {wheel: table.curve(i) for i, wheel in enumerate(WHEEL_ORDER)}
 
     for wheel, key in _WHEEL_KEY_MAP.items():
         road_disp = float(road_inputs.get(key, 0.0))
@@ -309,13 +351,19 @@ def compute_kinematics(state: PhysicsStepState, road_inputs: dict[str, float]) -
         cylinder = state.pneumatic_system.cylinders[wheel]
         lever_geom = cylinder.spec.lever_geom
         lever_length = max(lever_geom.L_lever, 1e-6)
+        curve = curves.get(wheel)
 
         ratio = float(np.clip(road_disp / lever_length, -0.999, 0.999))
         prev_ratio = float(np.clip(prev_disp / lever_length, -0.999, 0.999))
         theta_road = math.asin(ratio)
         theta_prev = math.asin(prev_ratio)
-        x_road = lever_geom.angle_to_displacement(theta_road)
-        x_prev = lever_geom.angle_to_displacement(theta_prev)
+        if curve is not None:
+            min_angle_active = getattr(lever_geom, "_min_angle_active", False)
+            x_road, _ = curve.evaluate(theta_road, min_angle_active)
+            x_prev, _ = curve.evaluate(theta_prev, min_angle_active)
+        else:
+            x_road = lever_geom.angle_to_displacement(theta_road)
+            x_prev = lever_geom.angle_to_displacement(theta_prev)
         road_velocity = (x_road - x_prev) / dt if dt > 0.0 else 0.0
 
         wheel_state = state.wheel_states[wheel]
@@ -334,12 +382,81 @@ def compute_kinematics(state: PhysicsStepState, road_inputs: dict[str, float]) -
             road_velocity=road_velocity,
             get_line_pressure=state.get_line_pressure,
             method=lever_config.integrator_method,
+            curve=curve,
         )
 
-        lever_angles[wheel] = integration.angle
         state.last_road_inputs[key] = road_disp
         results[wheel] = integration
 
+    return results
+
+
+def _integrate_levers_vectorized(
+    state: PhysicsStepState, road_inputs: dict[str, float], dt: float
+) -> dict[Wheel, LeverIntegrationResult]:
+    kernel = _lever_kernel(state)
+
+    keys = [_WHEEL_KEY_MAP[wheel] for wheel in WHEEL_ORDER]
+    road = [float(road_inputs.get(key, 0.0)) for key in keys]
+    prev = [
+        float(state.prev_road_inputs.get(key, value)) for key, value in zip(keys, road)
+    ]
+    x_road, x_prev = kernel.road_displacement(
+        np.array((road, prev)), kernel.min_angle_flags()
+    )
+    road_velocity = (x_road - x_prev) / dt if dt > 0.0 else np.zeros_like(x_road)
+
+    wheel_states = [state.wheel_states[wheel] for wheel in WHEEL_ORDER]
+    batch = kernel.integrate(
+        theta0=np.array([float(ws.lever_angle) for ws in wheel_states]),
+        omega0=np.array(
+            [float(getattr(ws, "lever_angular_velocity", 0.0)) for ws in wheel_states]
+        ),
+        dt=dt,
+        lever_config=state.lever_config,
+        road_displacement=x_road,
+        road_velocity=road_velocity,
+        get_line_pressure=state.get_line_pressure,
+        method=state.lever_config.integrator_method,
+    )
+
+    for key, value in zip(keys, road):
+        state.last_road_inputs[key] = value
+
+    columns = zip(
+        batch.angle.tolist(),
+        batch.angular_velocity.tolist(),
+        batch.displacement.tolist(),
+        batch.piston_velocity.tolist(),
+        batch.spring_force.tolist(),
+        batch.damper_force.tolist(),
+        batch.pneumatic_force.tolist(),
+        batch.torque.tolist(),
+        batch.clamped.tolist(),
+    )
+    return {
+        wheel: LeverIntegrationResult(*values)
+        for wheel, values in zip(WHEEL_ORDER, columns)
+    }
+
+
+def compute_kinematics(state: PhysicsStepState, road_inputs: dict[str, float]) -> None:
+    """Update pneumatic system and wheel states from road excitation.
+
+    ``lever_config.kinematics_kernel`` selects between the struct-of-arrays
+    kernel (``"vectorized"``) and the per-wheel reference path (``"scalar"``).
+    """
+
+    dt = float(state.dt)
+    kernel_name = str(state.lever_config.kinematics_kernel).strip().lower()
+    if kernel_name == "vectorized":
+        results = _integrate_levers_vectorized(state, road_inputs, dt)
+    elif kernel_name == "scalar":
+        results = _integrate_levers_scalar(state, road_inputs, dt)
+    else:
+        raise ValueError(f"Unsupported kinematics kernel: {kernel_name}")
+
+    lever_angles = {wheel: metrics.angle for wheel, metrics in results.items()}
     state.pneumatic_system.update_system_from_lever_angles(lever_angles)
 
     for wheel, metrics in results.items():
@@ -381,3 +498,11 @@ def compute_kinematics(state: PhysicsStepState, road_inputs: dict[str, float]) -
         )
         wheel_state.force_spring = metrics.spring_force
         wheel_state.force_damper = metrics.damper_force
+
+    log = step_logger(state, "kinematics")
+    if log:
+        log.debug(
+            "Lever kinematics: angles=%s rad, clamped=%s",
+            {_WHEEL_KEY_MAP[wheel]: m.angle for wheel, m in results.items()},
+            [_WHEEL_KEY_MAP[wheel] for wheel, m in results.items() if m.clamped],
+        )
@@ -0,0 +1,360 @@
+"""Precomputed lever kinematics: displacement, derivative and inverse tables.
+
+:class:`LeverKinematicsTable` samples the closed-form lever kinematics of a
+:class:`~.lever_kernel.VectorizedLeverKernel` on a dense uniform angle grid and
+inverts the (monotone) curve on a uniform displacement grid.  Queries are
+answered by cubic Hermite or linear interpolation, so no trigonometry or
+Newton iterations run on the step path.  The grid is refined until the
+interpolation error at the interval midpoints is below the requested bound.
+
+Tables are cached by the lever geometry they were built from: a new kernel for
+an unchanged geometry (for example after a simulation reset) reuses the
+existing table, and a table is only rebuilt when ``CylinderGeom`` or
+``LeverGeom`` parameters change.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .lever_kernel import VectorizedLeverKernel
+
+LOOKUP_METHODS: tuple[str, ...] = ("cubic", "linear")
+
+_HALF_PI = math.pi / 2.0
+_MIN_POINTS = 257
+_MAX_POINTS = 65_537
+_NEWTON_STEPS = 4
+_TABLE_CACHE_SIZE = 8
+_TABLE_CACHE: dict[tuple, LeverKinematicsTable] = {}
+
+Evaluator = Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]
+
+
+class _UniformGrid:
+    """Piecewise polynomial ``y(x)`` on a uniform grid per lane.
+
+    Coefficients are stored flattened as ``lane * (points - 1) + interval`` so
+    every lane is addressed with a single ``take``.
+    """
+
+    def __init__(
+        self,
+        lower: np.ndarray,
+        step: np.ndarray,
+        values: np.ndarray,
+        slopes: np.ndarray | None,
+    ) -> None:
+        # ``values``/``slopes`` have shape (lanes, points)
+        lanes, points = values.shape
+        self.points = points
+        self.lower = lower
+        self.inv_step = 1.0 / step
+        self._base = np.arange(lanes) * (points - 1)
+
+        y0, y1 = values[:, :-1], values[:, 1:]
+        if slopes is None:
+            c2 = c3 = np.zeros_like(y0)
+            c1 = y1 - y0
+        else:
+            d0 = slopes[:, :-1] * step[:, None]
+            d1 = slopes[:, 1:] * step[:, None]
+            c1 = d0
+            c2 = 3.0 * (y1 - y0) - 2.0 * d0 - d1
+            c3 = 2.0 * (y0 - y1) + d0 + d1
+        self.coefficients = tuple(
+            np.ascontiguousarray(c).ravel() for c in (y0, c1, c2, c3)
+        )
+
+    def __call__(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        u = (x - self.lower) * self.inv_step
+        index = np.clip(np.floor(u), 0, self.points - 2).astype(np.intp)
+        t = u - index
+        index += self._base
+        c0, c1, c2, c3 = (c.take(index) for c in self.coefficients)
+        value = c0 + t * (c1 + t * (c2 + t * c3))
+        slope = (c1 + t * (2.0 * c2 + 3.0 * t * c3)) * self.inv_step
+        return value, slope
+
+    def lane(self, lane: int) -> tuple[float, float, list[tuple[float, ...]]]:
+        """Return ``(lower, inv_step, coefficient rows)`` for scalar lookups."""
+
+        start = lane * (self.points - 1)
+        stop = start + self.points - 1
+        rows = list(zip(*(c[start:stop].tolist() for c in self.coefficients)))
+        return float(self.lower[lane]), float(self.inv_step[lane]), rows
+
+
+class LeverCurve:
+    """Pure-Python view of one lever for the per-wheel reference path.
+
+    ``evaluate`` mirrors :meth:`LeverGeom.angle_to_displacement` together with
+    :meth:`LeverGeom.mechanical_advantage`, including the minimum effective
+    angle clamp when ``min_angle_active`` is set.
+    """
+
+    __slots__ = ("_forward", "_inverse", "_last", "min_effective_angle")
+
+    def __init__(
+        self,
+        forward: tuple[float, float, list[tuple[float, ...]]],
+        inverse: tuple[float, float, list[tuple[float, ...]]],
+        min_effective_angle: float,
+    ) -> None:
+        self._forward = forward
+        self._inverse = inverse
+        self._last = len(forward[2]) - 1
+        self.min_effective_angle = min_effective_angle
+
+    @staticmethod
+    def _lookup(
+        grid: tuple[float, float, list[tuple[float, ...]]], last: int, x: float
+    ) -> tuple[float, float]:
+        lower, inv_step, rows = grid
+        u = (x - lower) * inv_step
+        index = math.floor(u)
+        if index < 0:
+            index = 0
+        elif index > last:
+            index = last
+        t = u - index
+        c0, c1, c2, c3 = rows[index]
+        return (
+            c0 + t * (c1 + t * (c2 + t * c3)),
+            (c1 + t * (2.0 * c2 + 3.0 * t * c3)) * inv_step,
+        )
+
+    def evaluate(
+        self, angle: float, min_angle_active: bool = False
+    ) -> tuple[float, float]:
+        """Return rod displacement and ``d(displacement)/d(angle)`` at ``angle``."""
+
+        min_angle = self.min_effective_angle
+        if min_angle_active and min_angle and 0.0 < abs(angle) < min_angle:
+            displacement, _ = self._lookup(
+                self._forward, self._last, math.copysign(min_angle, angle)
+            )
+            return displacement, 0.0
+        return self._lookup(self._forward, self._last, angle)
+
+    def angle_for(self, displacement: float) -> float:
+        """Return the lever angle producing ``displacement``."""
+
+        angle, _ = self._lookup(self._inverse, self._last, displacement)
+        return min(_HALF_PI, max(-_HALF_PI, angle))
+
+
+class LeverKinematicsTable:
+    """Tabulated lever kinematics for every lane of a lever kernel.
+
+    Args:
+        evaluate: Exact ``angle -> (displacement, derivative)`` for angle
+            arrays of shape ``(points, *shape)``
+        shape: Lane shape, usually ``(4,)`` wheels or ``(members, 4)``
+        method: ``"cubic"`` (Hermite) or ``"linear"`` interpolation
+        tolerance: Maximum displacement error (m) for forward and inverse
+            lookups
+        min_effective_angle: Per-lane slack angle applied before lookups
+
+    ``within_tolerance`` is False when the bound could not be met with
+    ``_MAX_POINTS`` samples; callers should then keep the exact kinematics.
+    """
+
+    def __init__(
+        self,
+        evaluate: Evaluator,
+        shape: tuple[int, ...],
+        *,
+        method: str = "cubic",
+        tolerance: float = 1e-9,
+        min_effective_angle: np.ndarray | None = None,
+    ) -> None:
+        method = str(method).strip().lower()
+        if method not in LOOKUP_METHODS:
+            raise ValueError(f"Unsupported lookup method: {method}")
+        if not tolerance > 0.0:
+            raise ValueError("Lookup tolerance must be positive")
+
+        self.method = method
+        self.tolerance = float(tolerance)
+        self.shape = tuple(shape)
+        lanes = math.prod(self.shape)
+        self._lanes = lanes
+
+        def _evaluate(angles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            # (lanes, n) in, (lanes, n) out
+            flat = np.ascontiguousarray(angles.T).reshape((-1, *self.shape))
+            displacement, derivative = evaluate(flat)
+            return (
+                np.asarray(displacement).reshape(-1, lanes).T,
+                np.asarray(derivative).reshape(-1, lanes).T,
+            )
+
+        points = _MIN_POINTS
+        while True:
+            self._build(_evaluate, lanes, points)
+            if self.max_error <= self.tolerance or points >= _MAX_POINTS:
+                break
+            points = 2 * points - 1
+        self.points = points
+        self.within_tolerance = self.max_error <= self.tolerance
+
+        if min_effective_angle is None:
+            min_effective_angle = np.zeros(self.shape)
+        self.min_effective_angle = np.broadcast_to(
+            np.asarray(min_effective_angle, dtype=float), self.shape
+        )
+        self._curves: list[LeverCurve] | None = None
+
+    def _build(self, evaluate: Callable, lanes: int, points: int) -> None:
+        angles = np.broadcast_to(
+            np.linspace(-_HALF_PI, _HALF_PI, points), (lanes, points)
+        )
+        displacement, derivative = evaluate(angles)
+        if not (np.diff(displacement, axis=1) > 0.0).all():
+            raise ValueError("Lever displacement is not monotone in angle")
+
+        cubic = self.method == "cubic"
+        angle_step = np.full(lanes, math.pi / (points - 1))
+        self._forward = _UniformGrid(
+            np.full(lanes, -_HALF_PI),
+            angle_step,
+            displacement,
+            derivative if cubic else None,
+        )
+
+        # Inverse on a uniform displacement grid: start from the sampled curve
+        # and polish on the exact kinematics; slopes follow from the inverse
+        # function theorem.
+        lower = displacement[:, 0]
+        upper = displacement[:, -1]
+        targets = np.linspace(lower, upper, points, axis=1)
+        inverse_angles = np.array(
+            [
+                np.interp(target, curve, grid)
+                for target, curve, grid in zip(targets, displacement, angles)
+            ]
+        )
+        for _ in range(_NEWTON_STEPS):
+            residual, rate = evaluate(inverse_angles)
+            residual -= targets
+            step = np.where(rate > 1e-12, residual / np.maximum(rate, 1e-12), 0.0)
+            inverse_angles = np.clip(inverse_angles - step, -_HALF_PI, _HALF_PI)
+        inverse_slopes = None
+        if cubic:
+            _, rate = evaluate(inverse_angles)
+            inverse_slopes = 1.0 / np.maximum(rate, 1e-12)
+        self._inverse = _UniformGrid(
+            lower, (upper - lower) / (points - 1), inverse_angles, inverse_slopes
+        )
+
+        # Errors are largest between samples
+        mid_angles = 0.5 * (angles[:, 1:] + angles[:, :-1])
+        exact, _ = evaluate(mid_angles)
+        forward_error = np.abs(self._forward(mid_angles.T)[0].T - exact).max()
+        mid_targets = 0.5 * (targets[:, 1:] + targets[:, :-1])
+        recovered, _ = evaluate(self._inverse(mid_targets.T)[0].T)
+        inverse_error = np.abs(recovered - mid_targets).max()
+        self.forward_error = float(forward_error)
+        self.inverse_error = float(inverse_error)
+        self.max_error = max(self.forward_error, self.inverse_error)
+
+    def _lanes_of(self, values: np.ndarray) -> np.ndarray:
+        # Leading (batch) axes go last so the lane axis matches the grid
+        lead = values.shape[: values.ndim - len(self.shape)]
+        return values.reshape((*lead, self._lanes))
+
+    def evaluate(
+        self, angle: np.ndarray, min_angle_active: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return displacement and derivative for ``angle`` of shape ``(..., *shape)``."""
+
+        angle = np.asarray(angle, dtype=float)
+        snapped = None
+        if min_angle_active is not None:
+            abs_angle = np.abs(angle)
+            snapped = (
+                min_angle_active
+                & (abs_angle > 0.0)
+                & (abs_angle < self.min_effective_angle)
+            )
+            angle = np.where(
+                snapped, np.copysign(self.min_effective_angle, angle), angle
+            )
+        displacement, derivative = self._forward(self._lanes_of(angle))
+        displacement = displacement.reshape(angle.shape)
+        derivative = derivative.reshape(angle.shape)
+        if snapped is not None:
+            derivative = np.where(snapped, 0.0, derivative)
+        return displacement, derivative
+
+    def angle_for_displacement(self, displacement: np.ndarray) -> np.ndarray:
+        """Return lever angles producing ``displacement`` (shape ``(..., *shape)``)."""
+
+        displacement = np.asarray(displacement, dtype=float)
+        angle, _ = self._inverse(self._lanes_of(displacement))
+        return np.clip(angle.reshape(displacement.shape), -_HALF_PI, _HALF_PI)
+
+    def curve(self, lane: int) -> LeverCurve:
+        """Return the scalar view of flattened lane ``lane``."""
+
+        if self._curves is None:
+            self._curves = [
+                LeverCurve(
+                    self._forward.lane(index),
+                    self._inverse.lane(index),
+                    float(self.min_effective_angle.flat[index]),
+                )
+                for index in range(self._lanes)
+            ]
+        return self._curves[lane]
+
+
+def kernel_signature(kernel: VectorizedLeverKernel) -> tuple:
+    """Return a hashable key of the geometry arrays the kinematics depend on."""
+
+    arrays = (
+        kernel.attached,
+        kernel.lever_arm,
+        kernel.y_tail,
+        kernel.neutral_length,
+        kernel.blend,
+        kernel.min_effective_angle,
+    )
+    return (kernel.lever_arm.shape, *(array.tobytes() for array in arrays))
+
+
+def lever_table_for(
+    kernel: VectorizedLeverKernel, method: str = "cubic", tolerance: float = 1e-9
+) -> LeverKinematicsTable:
+    """Return the table for ``kernel``'s geometry, building it on first use."""
+
+    key = (kernel_signature(kernel), str(method).strip().lower(), float(tolerance))
+    table = _TABLE_CACHE.pop(key, None)
+    if table is None:
+        table = LeverKinematicsTable(
+            kernel.displacement_and_derivative,
+            kernel.lever_arm.shape,
+            method=method,
+            tolerance=tolerance,
+            min_effective_angle=kernel.min_effective_angle,
+        )
+        while len(_TABLE_CACHE) >= _TABLE_CACHE_SIZE:
+            _TABLE_CACHE.pop(next(iter(_TABLE_CACHE)))
+    # Re-inserting keeps the most recently used geometries at the end
+    _TABLE_CACHE[key] = table
+    return table
+
+
+__all__ = [
+    "LOOKUP_METHODS",
+    "LeverCurve",
+    "LeverKinematicsTable",
+    "kernel_signature",
+    "lever_table_for",
+]
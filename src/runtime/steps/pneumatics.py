@@ -0,0 +1,92 @@
+"""Pneumatic force aggregation helper for physics step execution."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.physics.forces import project_forces_to_vertical_and_moments
+from src.pneumo.enums import Wheel
+
+from .context import PhysicsStepState
+from .trace import step_logger
+
+
+FrameForces = tuple[np.ndarray, tuple[float, float, float]]
+
+
+def apply_pneumatic_update(state: PhysicsStepState) -> FrameForces | None:
+    """Synchronise runtime pneumatics and project cylinder forces onto the frame.
+
+    Returns the per-wheel vertical forces together with ``(F_z, tau_x, tau_z)``
+    when the projection succeeded, otherwise ``None`` so that callers keep the
+    previously published frame forces.
+    """
+
+    try:
+        lever_angles = state.lever_angles
+        for wheel in Wheel:
+            lever_angles[wheel] = float(state.wheel_states[wheel].lever_angle)
+        pneumo_update = state.pneumatic_system.update(
+            lever_angles,
+            state.master_isolation_open,
+            state.thermo_mode,
+        )
+    except Exception as pneumo_exc:
+        state.logger.warning(
+            "WARNING: pneumatic runtime update failed",
+            error=str(pneumo_exc),
+            exc_info=True,
+        )
+        return None
+
+    frame_forces: FrameForces | None = None
+    suspension_states: dict[str, dict[str, float | tuple[float, float, float]]] = {}
+    for wheel, volumes in pneumo_update.chamber_volumes.items():
+        wheel_state = state.wheel_states[wheel]
+        wheel_state.vol_head = volumes[0]
+        wheel_state.vol_rod = volumes[1]
+        wheel_state.piston_position = pneumo_update.piston_positions.get(
+            wheel, wheel_state.piston_position
+        )
+        wheel_state.force_pneumatic = pneumo_update.wheel_forces.get(
+            wheel, wheel_state.force_pneumatic
+        )
+        head_pressure, rod_pressure = pneumo_update.pressures.get(wheel, (None, None))
+        if head_pressure is not None:
+            wheel_state.pressure_head = head_pressure
+        if rod_pressure is not None:
+            wheel_state.pressure_rod = rod_pressure
+
+        axis = pneumo_update.axis_directions.get(wheel)
+        if axis is not None:
+            suspension_states[wheel.value] = {
+                "F_total_axis": pneumo_update.wheel_forces.get(wheel, 0.0),
+                "axis_unit_world": axis,
+            }
+
+    if state.rigid_body is not None and suspension_states:
+        try:
+            vertical_forces, tau_x, tau_z = project_forces_to_vertical_and_moments(
+                suspension_states, state.rigid_body.attachment_points
+            )
+        except Exception as exc:
+            state.logger.warning(
+                "WARNING: failed to project pneumatic forces",
+                error=str(exc),
+                exc_info=True,
+            )
+        else:
+            total_force = float(np.sum(vertical_forces))
+            frame_forces = (
+                vertical_forces,
+                (total_force, float(tau_x), float(tau_z)),
+            )
+
+    log = step_logger(state, "pneumatics")
+    if log:
+        log.debug(
+            "Pneumatic frame forces",
+            force_left_N=pneumo_update.left_force,
+            force_right_N=pneumo_update.right_force,
+        )
+    return frame_forces
@@ -0,0 +1,103 @@
+"""Level-gated, sampled diagnostics for the physics step helpers.
+
+:class:`StepTrace` checks the DEBUG level once per physics step and hands each
+subsystem either a logger or ``None``. Step helpers keep their message
+formatting behind ``if log:``, so tracing costs one attribute lookup per
+subsystem while it is disabled, filtered out, or skipped by sampling.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from src.pneumo.network import debug_logger
+
+if TYPE_CHECKING:
+    from .context import PhysicsStepState
+
+TRACE_SUBSYSTEMS: tuple[str, ...] = ("kinematics", "gas", "body", "pneumatics")
+
+
+class StepTrace:
+    """Per-step gate for hot-path debug output.
+
+    Args:
+        logger: Logger receiving the trace events
+        sample_every: Trace one step in ``sample_every``
+        subsystems: Subsystems to trace; ``None`` traces all of
+            :data:`TRACE_SUBSYSTEMS`
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | Any,
+        *,
+        sample_every: int = 1,
+        subsystems: Iterable[str] | None = None,
+    ) -> None:
+        self.logger = logger
+        self.sample_every = 1
+        self.subsystems: frozenset[str] = frozenset(TRACE_SUBSYSTEMS)
+        self._active: Any | None = None
+        self.configure(sample_every=sample_every, subsystems=subsystems)
+
+    def configure(
+        self,
+        *,
+        sample_every: int | None = None,
+        subsystems: Iterable[str] | None = None,
+    ) -> None:
+        """Update sampling and subsystem toggles."""
+
+        if sample_every is not None:
+            sample_every = int(sample_every)
+            if sample_every < 1:
+                raise ValueError("sample_every must be at least 1")
+            self.sample_every = sample_every
+        if subsystems is not None:
+            selected = frozenset(str(name).strip().lower() for name in subsystems)
+            unknown = selected.difference(TRACE_SUBSYSTEMS)
+            if unknown:
+                raise ValueError(f"Unknown trace subsystems: {sorted(unknown)}")
+            self.subsystems = selected
+
+    @property
+    def active(self) -> bool:
+        """Whether the current step is traced."""
+
+        return self._active is not None
+
+    def begin_step(self, step: int) -> bool:
+        """Resolve the gate for ``step``; returns True when it is traced."""
+
+        if not self.subsystems or step % self.sample_every:
+            self._active = None
+        else:
+            self._active = debug_logger(self.logger)
+        return self._active is not None
+
+    def logger_for(self, subsystem: str) -> Any | None:
+        """Return the trace logger for ``subsystem`` or ``None`` when muted."""
+
+        active = self._active
+        if active is None or subsystem not in self.subsystems:
+            return None
+        return active
+
+
+def step_logger(state: PhysicsStepState, subsystem: str) -> Any | None:
+    """Debug logger for ``subsystem`` in the current step, or ``None``.
+
+    Contexts without a :class:`StepTrace` fall back to a DEBUG-level check on
+    ``state.logger``.
+    """
+
+    trace = state.trace
+    if trace is None:
+        return debug_logger(state.logger)
+    return trace.logger_for(subsystem)
+
+
+__all__ = ["TRACE_SUBSYSTEMS", "StepTrace", "step_logger"]
@@ -132,6 +132,13 @@ class PerformanceMetrics:
     integration_failures: int = 0
     queue_overruns: int = 0
 
+    # Rigid-body integrator
+    integrator_method: str = ""
+    integration_steps: int = 0
+    integration_evaluations: int = 0
+    integration_time: float = 0.0
+    last_integration_time: float = 0.0
+
     # Real-time factors
     realtime_factor: float = 1.0  # sim_time / real_time
     cpu_usage_percent: float = 0.0
@@ -153,6 +160,16 @@ class PerformanceMetrics:
             delta = step_time - self.avg_step_time
             self.dt_variance += delta * delta / self.total_steps
 
+    def record_integration(
+        self, method: str, evaluations: int, solve_time: float
+    ) -> None:
+        """Record one rigid-body integration step"""
+        self.integrator_method = method
+        self.integration_steps += 1
+        self.integration_evaluations += evaluations
+        self.integration_time += solve_time
+        self.last_integration_time = solve_time
+
     def update_realtime_factor(self, sim_dt: float, real_dt: float):
         """Update real-time performance factor"""
         if real_dt > 0:
@@ -190,6 +207,12 @@ class PerformanceMetrics:
             "realtime_factor": self.realtime_factor,
             "frames_dropped": self.frames_dropped,
             "integration_failures": self.integration_failures,
+            "integrator": self.integrator_method,
+            "avg_integration_time_ms": self.integration_time
+            * 1000
+            / max(self.integration_steps, 1),
+            "evaluations_per_step": self.integration_evaluations
+            / max(self.integration_steps, 1),
             "efficiency": (self.total_steps - self.frames_dropped)
             / max(self.total_steps, 1),
         }
@@ -0,0 +1,696 @@
+"""Parameter sweeps over the headless physics pipeline.
+
+Design-of-experiments studies expand a full-factorial grid
+(:func:`expand_grid`) or a Latin hypercube (:func:`latin_hypercube`) into a
+list of cases.  Every case rebuilds the pneumatic structure with
+``create_standard_diagonal_system`` and its :class:`~src.pneumo.network.GasNetwork`,
+applies the case overrides and drives :class:`~src.runtime.batch.BatchSimulator`
+(the same :mod:`src.runtime.steps` pipeline as the interactive application).
+:func:`run_sweep` fans the cases out over a :class:`ProcessPoolExecutor` and
+collects one row of summary metrics per case into NumPy columns that
+:func:`write_results` stores as ``.npz`` or ``.csv``.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import math
+import os
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.pneumo.enums import ThermoMode
+from src.pneumo.gas_state import create_tank_gas_state
+from src.pneumo.network import GasNetwork
+from src.runtime.batch import (
+    BODY_INTEGRATORS,
+    LINE_ORDER,
+    BatchResult,
+    BatchSimulator,
+)
+from src.runtime.steps.context import LeverDynamicsConfig
+
+SystemFactory = Callable[[], tuple[Any, GasNetwork]]
+RigidBodyFactory = Callable[[], Any]
+
+#: Overrides applied to :class:`LeverDynamicsConfig` fields.
+LEVER_PARAMETERS: tuple[str, ...] = (
+    "spring_constant",
+    "damper_coefficient",
+    "damper_threshold",
+    "spring_rest_position",
+    "lever_inertia",
+)
+#: Overrides assigned to :class:`GasNetwork` attributes.
+NETWORK_PARAMETERS: tuple[str, ...] = (
+    "relief_min_threshold",
+    "relief_stiff_threshold",
+    "relief_safety_threshold",
+    "relief_min_orifice_diameter",
+    "relief_stiff_orifice_diameter",
+    "master_equalization_diameter",
+    "leak_coefficient",
+)
+#: Overrides of the line check-valve equivalent diameters.
+VALVE_PARAMETERS: tuple[str, ...] = (
+    "check_valve_diameter",
+    "atmo_valve_diameter",
+    "tank_valve_diameter",
+)
+#: Case-level switches handled by the sweep itself.
+CASE_PARAMETERS: tuple[str, ...] = (
+    "receiver_volume",
+    "thermo_mode",
+    "master_isolation_open",
+    "road_preset",
+)
+SWEEP_PARAMETERS: frozenset[str] = frozenset(
+    LEVER_PARAMETERS + NETWORK_PARAMETERS + VALVE_PARAMETERS + CASE_PARAMETERS
+)
+
+_CATEGORICAL_PARAMETERS = frozenset(
+    {"thermo_mode", "master_isolation_open", "road_preset"}
+)
+
+
+def _pneumatic_setting(settings: Any, key: str) -> Any:
+    value = settings.get(f"pneumatic.{key}", None)
+    if value is None:
+        value = settings.get(f"defaults_snapshot.pneumatic.{key}", None)
+    return value
+
+
+def _pneumatic_number(settings: Any, key: str, fallback: float | None = None) -> float:
+    value = _pneumatic_setting(settings, key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        if fallback is None:
+            raise RuntimeError(f"Missing numeric setting: pneumatic.{key}")
+        return float(fallback)
+    return float(value)
+
+
+def _modes_setting(settings: Any, key: str) -> Any:
+    value = settings.get(f"modes.physics.{key}", None)
+    if value is None:
+        value = settings.get(f"defaults_snapshot.modes.physics.{key}", None)
+    return value
+
+
+def _setting_number(settings: Any, path: str) -> float | None:
+    for key in (path, f"defaults_snapshot.{path}"):
+        value = settings.get(key, None)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return None
+
+
+def _modes_number(settings: Any, key: str, fallback: float) -> float:
+    value = _setting_number(settings, f"modes.physics.{key}")
+    return fallback if value is None else value
+
+
+def _modes_choice(
+    settings: Any, key: str, choices: Iterable[str], fallback: str
+) -> str:
+    value = _modes_setting(settings, key)
+    token = value.strip().lower() if isinstance(value, str) else ""
+    return token if token in choices else fallback
+
+
+def _default_lever_config() -> LeverDynamicsConfig:
+    """Build the lever dynamics like ``PhysicsWorker`` does.
+
+    Mirrors ``PhysicsWorker._load_initial_settings``: wheel mass and lever
+    length from ``geometry``, spring/damper values from ``physics.suspension``
+    overridden by ``modes.physics``, and the kinematics kernel options; invalid
+    choices fall back to the worker defaults.
+    """
+
+    from src.common.settings_manager import get_settings_manager
+    from src.runtime.steps.lever_table import LOOKUP_METHODS
+
+    settings = get_settings_manager()
+
+    def _suspension(key: str, fallback: float) -> float:
+        value = _setting_number(settings, f"physics.suspension.{key}")
+        return _modes_number(settings, key, fallback if value is None else value)
+
+    def _flag(key: str) -> bool:
+        value = _modes_setting(settings, key)
+        return value if isinstance(value, bool) else True
+
+    wheel_mass = _setting_number(settings, "geometry.wheel_mass")
+    lever_length = _setting_number(settings, "geometry.lever_length")
+    if lever_length is None:
+        lever_length = _setting_number(settings, "geometry.lever_length_m")
+    wheel_mass = 50.0 if wheel_mass is None else wheel_mass
+    lever_length = 0.75 if lever_length is None else lever_length
+    inertia_multiplier = max(
+        _modes_number(settings, "lever_inertia_multiplier", 1.0), 0.01
+    )
+
+    tolerance = _modes_number(settings, "kinematics_lookup_tolerance", 1e-9)
+    return LeverDynamicsConfig(
+        include_springs=_flag("include_springs"),
+        include_dampers=_flag("include_dampers"),
+        include_pneumatics=_flag("include_pneumatics"),
+        spring_constant=_suspension("spring_constant", 50_000.0),
+        damper_coefficient=_suspension("damper_coefficient", 2_000.0),
+        damper_threshold=_suspension("damper_force_threshold_n", 0.0),
+        spring_rest_position=_suspension("spring_rest_position_m", 0.0),
+        lever_inertia=max(wheel_mass * lever_length**2 * inertia_multiplier, 1e-6),
+        integrator_method=_modes_choice(
+            settings, "integrator_method", ("rk4", "euler"), "rk4"
+        ),
+        kinematics_kernel=_modes_choice(
+            settings, "kinematics_kernel", ("vectorized", "scalar"), "vectorized"
+        ),
+        kinematics_lookup=_modes_choice(
+            settings, "kinematics_lookup", ("off", *LOOKUP_METHODS), "off"
+        ),
+        kinematics_lookup_tolerance=tolerance if tolerance > 0.0 else 1e-9,
+    )
+
+
+def _default_system_factory() -> tuple[Any, GasNetwork]:
+    """Build the structure and gas network like ``PhysicsWorker`` does.
+
+    Mirrors ``PhysicsWorker._initialize_physics_objects``: receiver limits and
+    volume mode, relief thresholds, leak, polytropic exchange, ambient
+    temperature and the diagonal coupling all come from the application
+    settings.
+    """
+
+    from src.common.settings_manager import get_settings_manager
+    from src.common.units import KELVIN_0C, PA_ATM
+    from src.pneumo.receiver import ReceiverSpec, ReceiverState, ReceiverVolumeMode
+    from src.pneumo.system import create_standard_diagonal_system
+    from src.pneumo.thermo import PolytropicParameters
+
+    settings = get_settings_manager()
+    config_defaults = settings.create_default_system_configuration()
+
+    limits = _pneumatic_setting(settings, "receiver_volume_limits")
+    if not isinstance(limits, Mapping):
+        raise RuntimeError("Missing pneumatic.receiver_volume_limits")
+    spec = ReceiverSpec(V_min=float(limits["min_m3"]), V_max=float(limits["max_m3"]))
+    volume = _pneumatic_number(settings, "receiver_volume")
+    mode_token = str(_pneumatic_setting(settings, "volume_mode") or "MANUAL").upper()
+    receiver_modes = {
+        "MANUAL": ReceiverVolumeMode.NO_RECALC,
+        "GEOMETRIC": ReceiverVolumeMode.ADIABATIC_RECALC,
+    }
+    if mode_token not in receiver_modes:
+        raise RuntimeError(f"Unsupported receiver volume mode: {mode_token}")
+    receiver_mode = receiver_modes[mode_token]
+    ambient = max(_pneumatic_number(settings, "atmo_temp", 20.0) + KELVIN_0C, 1.0)
+
+    structure = create_standard_diagonal_system(
+        cylinder_specs=config_defaults["cylinder_specs"],
+        line_configs=config_defaults["line_configs"],
+        receiver=ReceiverState(
+            spec=spec, V=volume, p=PA_ATM, T=ambient, mode=receiver_mode
+        ),
+        master_isolation_open=bool(
+            _pneumatic_setting(settings, "master_isolation_open")
+        ),
+    )
+    gas_network = settings.create_default_gas_network(structure)
+
+    for name, key in (
+        ("relief_min_threshold", "relief_min_pressure"),
+        ("relief_stiff_threshold", "relief_stiff_pressure"),
+        ("relief_safety_threshold", "relief_safety_pressure"),
+    ):
+        setattr(
+            gas_network,
+            name,
+            _pneumatic_number(settings, key, float(getattr(gas_network, name))),
+        )
+    for name, key in (
+        ("leak_coefficient", "leak_coefficient"),
+        ("leak_reference_area", "leak_reference_area"),
+        ("master_equalization_diameter", "diagonal_coupling_dia"),
+    ):
+        value = _pneumatic_number(settings, key, float(getattr(gas_network, name)))
+        setattr(gas_network, name, max(value, 0.0))
+
+    polytropic = gas_network.polytropic_params
+    gas_network.polytropic_params = PolytropicParameters(
+        heat_transfer_coeff=max(
+            _pneumatic_number(
+                settings,
+                "polytropic_heat_transfer_coeff",
+                polytropic.heat_transfer_coeff if polytropic else 0.0,
+            ),
+            0.0,
+        ),
+        exchange_area=max(
+            _pneumatic_number(
+                settings,
+                "polytropic_exchange_area",
+                polytropic.exchange_area if polytropic else 0.0,
+            ),
+            0.0,
+        ),
+        ambient_temperature=ambient,
+    )
+    gas_network.ambient_temperature = ambient
+    for state in gas_network.lines.values():
+        state.T = ambient
+    gas_network.tank.mode = receiver_mode
+    gas_network.tank.T = ambient
+    gas_network.tank.p = PA_ATM
+    gas_network.tank.V = volume
+    return structure, gas_network
+
+
+def _dead_zone_fractions(
+    structure: Any, head_m3: float, rod_m3: float
+) -> tuple[float, float]:
+    """Convert dead-zone volumes into fractions of the full chamber volume."""
+
+    if not structure.cylinders:
+        return 0.0, 0.0
+    cylinder = next(iter(structure.cylinders.values()))
+    half_travel = cylinder.spec.geometry.L_travel_max / 2.0
+    max_head = cylinder.vol_head(-half_travel)
+    max_rod = cylinder.vol_rod(half_travel)
+    head = min(1.0, max(head_m3 / max_head, 0.0)) if max_head > 0.0 else 0.0
+    rod = min(1.0, max(rod_m3 / max_rod, 0.0)) if max_rod > 0.0 else 0.0
+    return head, rod
+
+
+def _default_rigid_body_factory() -> Any:
+    from src.physics.integrator import create_default_rigid_body
+
+    return create_default_rigid_body()
+
+
+@dataclass(frozen=True)
+class SweepBaseline:
+    """Shared configuration for every case of a sweep.
+
+    Factories must be module-level callables so the baseline can be pickled
+    into worker processes.  By default the pneumatic structure, rigid body and
+    lever dynamics are built from the application settings, exactly as the
+    physics worker does.
+    """
+
+    duration: float = 2.0
+    dt: float = 1e-3
+    record_every: int = 1
+    road_preset: str | None = "test_sine"
+    thermo_mode: ThermoMode = ThermoMode.ISOTHERMAL
+    master_isolation_open: bool = False
+    #: Lever dynamics; ``None`` builds them from the settings like the worker
+    lever_config: LeverDynamicsConfig | None = None
+    system_factory: SystemFactory = _default_system_factory
+    rigid_body_factory: RigidBodyFactory = _default_rigid_body_factory
+    #: Dead-zone volumes (m³); ``None`` reads ``pneumatic.dead_zone_*_m3``
+    dead_zone_head_m3: float | None = None
+    dead_zone_rod_m3: float | None = None
+    #: Rigid body scheme; ``None`` reads ``modes.physics.body_integrator``
+    body_integrator: str | None = None
+
+
+def validate_parameters(names: Iterable[str]) -> None:
+    """Raise :class:`ValueError` for parameter names the sweep cannot apply."""
+
+    unknown = sorted(set(names) - SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(
+            f"Unsupported sweep parameter(s): {', '.join(unknown)}; "
+            f"expected one of {', '.join(sorted(SWEEP_PARAMETERS))}"
+        )
+
+
+def expand_grid(parameters: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """Return the full-factorial combination of ``parameters``."""
+
+    validate_parameters(parameters)
+    names = list(parameters)
+    values = [list(parameters[name]) for name in names]
+    for name, options in zip(names, values):
+        if not options:
+            raise ValueError(f"Sweep parameter '{name}' has no values")
+    return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def latin_hypercube(
+    bounds: Mapping[str, tuple[float, float]],
+    samples: int,
+    *,
+    seed: int | None = None,
+) -> list[dict[str, float]]:
+    """Draw ``samples`` Latin-hypercube cases inside ``bounds``.
+
+    Each dimension is split into ``samples`` equal strata and every stratum
+    is used exactly once, so even small designs cover each range evenly.
+    """
+
+    validate_parameters(bounds)
+    categorical = sorted(_CATEGORICAL_PARAMETERS.intersection(bounds))
+    if categorical:
+        raise ValueError(
+            f"Latin hypercube requires numeric parameters, got {', '.join(categorical)}"
+        )
+    samples = int(samples)
+    if samples <= 0:
+        raise ValueError(f"samples must be positive, got {samples}")
+
+    names = list(bounds)
+    rng = np.random.default_rng(seed)
+    strata = rng.permuted(np.tile(np.arange(samples), (len(names), 1)), axis=1).T
+    unit = (strata + rng.random((samples, len(names)))) / samples
+
+    cases: list[dict[str, float]] = [{} for _ in range(samples)]
+    for column, name in enumerate(names):
+        low, high = (float(value) for value in bounds[name])
+        if not math.isfinite(low) or not math.isfinite(high) or high < low:
+            raise ValueError(f"Invalid bounds for '{name}': ({low}, {high})")
+        values = low + unit[:, column] * (high - low)
+        for row, value in enumerate(values):
+            cases[row][name] = float(value)
+    return cases
+
+
+def _resolve_thermo_mode(value: Any) -> ThermoMode:
+    if isinstance(value, ThermoMode):
+        return value
+    try:
+        return ThermoMode[str(value).strip().upper()]
+    except KeyError as exc:
+        raise ValueError(f"Unsupported thermo_mode: {value}") from exc
+
+
+def _resolve_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in {"1", "true", "yes", "on"}:
+            return True
+        if text in {"0", "false", "no", "off"}:
+            return False
+        raise ValueError(f"Cannot interpret '{value}' as a boolean")
+    return bool(value)
+
+
+def _resolve_dead_zones(baseline: SweepBaseline) -> tuple[float, float]:
+    head, rod = baseline.dead_zone_head_m3, baseline.dead_zone_rod_m3
+    if head is None or rod is None:
+        from src.common.settings_manager import get_settings_manager
+
+        settings = get_settings_manager()
+        if head is None:
+            head = _pneumatic_number(settings, "dead_zone_head_m3", 0.0)
+        if rod is None:
+            rod = _pneumatic_number(settings, "dead_zone_rod_m3", 0.0)
+    return float(head), float(rod)
+
+
+def _resolve_body_integrator(baseline: SweepBaseline) -> str:
+    if baseline.body_integrator is not None:
+        return baseline.body_integrator
+    from src.common.settings_manager import get_settings_manager
+
+    # Unknown values fall back to "rk4" like PhysicsWorker does
+    return _modes_choice(
+        get_settings_manager(), "body_integrator", BODY_INTEGRATORS, "rk4"
+    )
+
+
+def _resolve_lever_config(baseline: SweepBaseline) -> LeverDynamicsConfig:
+    if baseline.lever_config is not None:
+        return baseline.lever_config
+    return _default_lever_config()
+
+
+def build_simulator(
+    params: Mapping[str, Any], baseline: SweepBaseline
+) -> BatchSimulator:
+    """Build a :class:`BatchSimulator` for one case of the sweep."""
+
+    validate_parameters(params)
+
+    structure, gas_network = baseline.system_factory()
+
+    receiver_volume = params.get("receiver_volume")
+    if receiver_volume is not None:
+        receiver_volume = float(receiver_volume)
+        tank = gas_network.tank
+        gas_network.tank = create_tank_gas_state(
+            V_initial=receiver_volume,
+            p_initial=tank.p,
+            T_initial=tank.T,
+            mode=tank.mode,
+        )
+        structure.receiver.V = receiver_volume
+
+    for name in NETWORK_PARAMETERS:
+        if name in params:
+            setattr(gas_network, name, float(params[name]))
+
+    atmo_diameter = params.get(
+        "atmo_valve_diameter", params.get("check_valve_diameter")
+    )
+    tank_diameter = params.get(
+        "tank_valve_diameter", params.get("check_valve_diameter")
+    )
+    for line in structure.lines.values():
+        if atmo_diameter is not None:
+            line.cv_atmo.d_eq = float(atmo_diameter)
+        if tank_diameter is not None:
+            line.cv_tank.d_eq = float(tank_diameter)
+
+    lever_overrides: dict[str, Any] = {
+        name: float(params[name]) for name in LEVER_PARAMETERS if name in params
+    }
+    lever_config = replace(_resolve_lever_config(baseline), **lever_overrides)
+
+    thermo_mode = _resolve_thermo_mode(params.get("thermo_mode", baseline.thermo_mode))
+    master_isolation_open = _resolve_bool(
+        params.get("master_isolation_open", baseline.master_isolation_open)
+    )
+    gas_network.master_isolation_open = master_isolation_open
+
+    from src.physics.pneumo_system import PneumaticSystem as RuntimePneumaticSystem
+
+    head_fraction, rod_fraction = _dead_zone_fractions(
+        structure, *_resolve_dead_zones(baseline)
+    )
+    pneumatic_system = RuntimePneumaticSystem(
+        structure,
+        gas_network,
+        dead_zone_head_fraction=head_fraction,
+        dead_zone_rod_fraction=rod_fraction,
+    )
+
+    road_input = None
+    road_preset = params.get("road_preset", baseline.road_preset)
+    if road_preset:
+        from src.road.engine import create_road_input_from_preset
+
+        road_input = create_road_input_from_preset(str(road_preset))
+        road_config = road_input.config
+        if road_config is None:
+            raise RuntimeError(f"Road preset '{road_preset}' has no configuration")
+        road_input.configure(road_config, system=pneumatic_system)
+        road_input.prime()
+
+    return BatchSimulator(
+        pneumatic_system=pneumatic_system,
+        gas_network=gas_network,
+        dt=baseline.dt,
+        rigid_body=baseline.rigid_body_factory(),
+        road_input=road_input,
+        lever_config=lever_config,
+        body_integrator=_resolve_body_integrator(baseline),
+        thermo_mode=thermo_mode,
+        master_isolation_open=master_isolation_open,
+        receiver_volume=receiver_volume,
+    )
+
+
+def _rms(values: np.ndarray) -> float:
+    if values.size == 0:
+        return float("nan")
+    return float(np.sqrt(np.mean(np.square(values))))
+
+
+def _peak(values: np.ndarray) -> float:
+    if values.size == 0:
+        return float("nan")
+    return float(np.max(values))
+
+
+def summarize_result(result: BatchResult) -> dict[str, float]:
+    """Reduce a recorded run to scalar comparison metrics (SI units)."""
+
+    metrics: dict[str, float] = {}
+    for column, line in enumerate(LINE_ORDER):
+        metrics[f"peak_pressure_{line.value}"] = _peak(result.line_pressures[:, column])
+    metrics["peak_line_pressure"] = _peak(result.line_pressures)
+    metrics["peak_tank_pressure"] = _peak(result.tank_pressure)
+    metrics["rms_heave"] = _rms(result.frame_state[:, 0])
+    metrics["rms_roll"] = _rms(result.frame_state[:, 1])
+    metrics["rms_pitch"] = _rms(result.frame_state[:, 2])
+    metrics["rms_heave_accel"] = _rms(result.frame_accel[:, 0])
+    metrics["relief_mass"] = (
+        float(result.relief_mass[-1]) if len(result) else float("nan")
+    )
+    metrics["integration_failures"] = float(result.integration_failures)
+    metrics["wall_time"] = float(result.wall_time)
+    metrics["realtime_factor"] = float(result.realtime_factor)
+    return metrics
+
+
+METRIC_NAMES: tuple[str, ...] = tuple(
+    [f"peak_pressure_{line.value}" for line in LINE_ORDER]
+    + [
+        "peak_line_pressure",
+        "peak_tank_pressure",
+        "rms_heave",
+        "rms_roll",
+        "rms_pitch",
+        "rms_heave_accel",
+        "relief_mass",
+        "integration_failures",
+        "wall_time",
+        "realtime_factor",
+    ]
+)
+
+
+def run_case(params: Mapping[str, Any], baseline: SweepBaseline) -> dict[str, Any]:
+    """Simulate one case and return its parameters merged with its metrics.
+
+    Failures are reported in the ``status``/``error`` fields instead of being
+    raised so that a single diverging case does not abort the whole sweep.
+    """
+
+    row: dict[str, Any] = dict(params)
+    try:
+        simulator = build_simulator(params, baseline)
+        result = simulator.run(baseline.duration, record_every=baseline.record_every)
+    except Exception as exc:
+        row.update({name: float("nan") for name in METRIC_NAMES})
+        row["status"] = "error"
+        row["error"] = f"{type(exc).__name__}: {exc}"
+        return row
+
+    row.update(summarize_result(result))
+    row["status"] = "ok"
+    row["error"] = ""
+    return row
+
+
+def _column(values: list[Any]) -> np.ndarray:
+    present = [value for value in values if value is not None]
+    if present and all(
+        isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+        for value in present
+    ):
+        return np.array([np.nan if value is None else float(value) for value in values])
+    return np.array(["" if value is None else str(value) for value in values])
+
+
+def collect_columns(rows: Sequence[Mapping[str, Any]]) -> dict[str, np.ndarray]:
+    """Convert per-case rows into named NumPy columns."""
+
+    names: list[str] = []
+    for row in rows:
+        for name in row:
+            if name not in names:
+                names.append(name)
+
+    columns: dict[str, np.ndarray] = {"case": np.arange(len(rows))}
+    for name in names:
+        columns[name] = _column([row.get(name) for row in rows])
+    return columns
+
+
+def run_sweep(
+    cases: Sequence[Mapping[str, Any]],
+    baseline: SweepBaseline | None = None,
+    *,
+    workers: int | None = None,
+    output: str | Path | None = None,
+) -> dict[str, np.ndarray]:
+    """Run every case and return the columnar summary.
+
+    Args:
+        cases: Parameter overrides, one mapping per run.
+        baseline: Shared configuration; defaults to :class:`SweepBaseline`.
+        workers: Process count, ``None`` for all cores, ``1`` to run inline.
+        output: Optional ``.npz``/``.csv`` path passed to :func:`write_results`.
+    """
+
+    baseline = baseline or SweepBaseline()
+    for params in cases:
+        validate_parameters(params)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(int(workers), len(cases) or 1))
+
+    task = partial(run_case, baseline=baseline)
+    if workers == 1:
+        rows = [task(params) for params in cases]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(task, cases))
+
+    columns = collect_columns(rows)
+    if output is not None:
+        write_results(columns, output)
+    return columns
+
+
+def write_results(columns: Mapping[str, np.ndarray], path: str | Path) -> Path:
+    """Persist sweep columns as compressed ``.npz`` or ``.csv``."""
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    suffix = target.suffix.lower()
+    if suffix == ".npz":
+        np.savez_compressed(target, allow_pickle=False, **columns)
+    elif suffix == ".csv":
+        names = list(columns)
+        length = len(next(iter(columns.values()))) if columns else 0
+        with target.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(names)
+            for index in range(length):
+                writer.writerow([columns[name][index] for name in names])
+    else:
+        raise ValueError(
+            f"Unsupported results format '{target.suffix}' (use .npz or .csv)"
+        )
+    return target
+
+
+__all__ = [
+    "CASE_PARAMETERS",
+    "LEVER_PARAMETERS",
+    "METRIC_NAMES",
+    "NETWORK_PARAMETERS",
+    "SWEEP_PARAMETERS",
+    "SweepBaseline",
+    "VALVE_PARAMETERS",
+    "build_simulator",
+    "collect_columns",
+    "expand_grid",
+    "latin_hypercube",
+    "run_case",
+    "run_sweep",
+    "summarize_result",
+    "validate_parameters",
+    "write_results",
+]
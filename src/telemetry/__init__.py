@@ -1,6 +1,7 @@
 """Public telemetry API."""
 
 from .schema import EVENT_SCHEMA_VERSION, TelemetryRecord, parse_event_dict
+from .sink import TelemetrySink, TelemetrySinkStats
 from .tracker import (
     TelemetryRouter,
     TelemetryTracker,
@@ -14,6 +15,8 @@ __all__ = [
     "parse_event_dict",
     "TelemetryRecord",
     "TelemetryRouter",
+    "TelemetrySink",
+    "TelemetrySinkStats",
     "TelemetryTracker",
     "get_tracker",
     "track_simulation_event",
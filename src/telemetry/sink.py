@@ -0,0 +1,333 @@
+"""Buffered, asynchronous JSON Lines writer for telemetry records.
+
+:class:`TelemetrySink` accepts pre-serialised JSON lines into a bounded
+in-memory queue and writes them from a background thread in batches.  File
+handles stay open between batches; active files are rotated once they exceed
+``max_bytes`` or ``max_age`` seconds and closed segments can be gzip
+compressed.  When the queue is full new records are dropped and counted
+instead of blocking the caller, so UI interaction never waits on disk I/O.
+
+Rotated segments are named ``<stem>.<UTC timestamp>-<sequence>.jsonl`` (plus
+``.gz`` when compressed) next to the active file, which keeps the
+``*.jsonl`` naming expected by :mod:`tools.telemetry_exporter`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import os
+import shutil
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO
+
+from src.diagnostics.logger_factory import LoggerProtocol, get_logger
+
+__all__ = [
+    "TelemetrySink",
+    "TelemetrySinkStats",
+    "close_all_sinks",
+]
+
+
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_BATCH_SIZE = 1024
+
+_sinks: weakref.WeakSet[TelemetrySink] = weakref.WeakSet()
+
+
+@dataclass(slots=True)
+class TelemetrySinkStats:
+    """Counters describing the sink throughput and backpressure."""
+
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    batches: int = 0
+    rotations: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
+class _Segment:
+    handle: IO[str]
+    path: Path
+    opened_at: float
+    size: int
+
+
+@dataclass(slots=True)
+class _Batch:
+    lines: dict[str, list[str]] = field(default_factory=dict)
+    count: int = 0
+
+
+class TelemetrySink:
+    """Background writer for JSON Lines telemetry files.
+
+    Args:
+        base_dir: Directory receiving the JSONL files
+        max_queue: Records held in memory before new ones are dropped
+        flush_interval: Seconds the writer waits to collect a batch, counted
+            from the first record queued after the previous batch
+        batch_size: Write as soon as this many records are queued, without
+            waiting for ``flush_interval`` to expire
+        max_bytes: Rotate a file before it grows beyond this size; ``None``
+            disables size based rotation
+        max_age: Rotate a file once it has been open for this many seconds;
+            ``None`` disables age based rotation
+        compress: Gzip rotated segments
+        logger: Structured logger for rotation and error diagnostics
+    """
+
+    def __init__(
+        self,
+        base_dir: Path | str,
+        *,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        max_age: float | None = None,
+        compress: bool = False,
+        logger: LoggerProtocol | None = None,
+    ) -> None:
+        if max_queue <= 0:
+            raise ValueError("max_queue must be positive")
+        if flush_interval < 0.0:
+            raise ValueError("flush_interval must not be negative")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._base_dir = Path(base_dir)
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._max_queue = int(max_queue)
+        self._flush_interval = float(flush_interval)
+        self._batch_size = int(batch_size)
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._compress = compress
+        self._logger = logger or get_logger("telemetry.sink")
+        self._condition = threading.Condition()
+        self._queue: deque[tuple[str, str]] = deque()
+        self._pending_since = 0.0
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._segments: dict[str, _Segment] = {}
+        self._rotation_seq = 0
+        self._thread: threading.Thread | None = None
+        self.stats = TelemetrySinkStats()
+        _sinks.add(self)
+
+    @property
+    def base_dir(self) -> Path:
+        return self._base_dir
+
+    @property
+    def pending(self) -> int:
+        """Number of records queued or being written."""
+
+        with self._condition:
+            return len(self._queue) + (1 if self._writing else 0)
+
+    # ------------------------------------------------------------------ producer
+    def submit(self, file_name: str, line: str) -> bool:
+        """Queue one serialised JSON line; returns False when it was dropped."""
+
+        with self._condition:
+            if self._closed or len(self._queue) >= self._max_queue:
+                self.stats.dropped += 1
+                first_drop = self.stats.dropped == 1
+            else:
+                queue = self._queue
+                if not queue:
+                    self._pending_since = time.monotonic()
+                queue.append((file_name, line))
+                self.stats.enqueued += 1
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="telemetry-writer", daemon=True
+                    )
+                    self._thread.start()
+                # Wake the writer only to start a batch or to cut a full one
+                if len(queue) == 1 or len(queue) >= self._batch_size:
+                    self._condition.notify_all()
+                return True
+        if first_drop:
+            self._logger.warning(
+                "telemetry_records_dropped",
+                reason="closed" if self._closed else "queue_full",
+                max_queue=self._max_queue,
+            )
+        return False
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Write everything queued so far; False when ``timeout`` expired."""
+
+        with self._condition:
+            if not self._queue and not self._writing:
+                return True
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._writing, timeout
+            )
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush, stop the writer thread and close all file handles."""
+
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        # The writer thread closes its file handles when it exits
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    # -------------------------------------------------------------------- writer
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._queue and not self._closed:
+                    condition.wait()
+                if not self._queue:
+                    break
+                # Let a burst accumulate until the interval since its first
+                # record expires, the batch is full, or a flush/shutdown is due
+                while not (self._flush_requested or self._closed):
+                    if len(self._queue) >= self._batch_size:
+                        break
+                    remaining = (
+                        self._pending_since + self._flush_interval - time.monotonic()
+                    )
+                    if remaining <= 0.0:
+                        break
+                    condition.wait(remaining)
+                batch = _Batch()
+                while self._queue:
+                    file_name, line = self._queue.popleft()
+                    batch.lines.setdefault(file_name, []).append(line)
+                    batch.count += 1
+                self._flush_requested = False
+                self._writing = True
+
+            written = self._write_batch(batch)
+
+            with condition:
+                self._writing = False
+                self.stats.written += written
+                self.stats.batches += 1
+                condition.notify_all()
+        self._close_segments()
+
+    def _write_batch(self, batch: _Batch) -> int:
+        written = 0
+        for file_name, lines in batch.lines.items():
+            data = "\n".join(lines) + "\n"
+            size = len(data.encode("utf-8"))
+            try:
+                segment = self._segment_for(file_name, size)
+                segment.handle.write(data)
+                segment.handle.flush()
+                segment.size += size
+                written += len(lines)
+            except OSError as exc:
+                with self._condition:
+                    self.stats.errors += 1
+                    self.stats.dropped += len(lines)
+                self._logger.error(
+                    "telemetry_write_failed",
+                    file=file_name,
+                    records=len(lines),
+                    error=str(exc),
+                )
+                self._discard_segment(file_name)
+        return written
+
+    def _segment_for(self, file_name: str, incoming: int) -> _Segment:
+        segment = self._segments.get(file_name)
+        if segment is not None and self._needs_rotation(segment, incoming):
+            self._rotate(file_name, segment)
+            segment = None
+        if segment is None:
+            path = self._base_dir / file_name
+            handle = path.open("a", encoding="utf-8")
+            segment = _Segment(
+                handle=handle,
+                path=path,
+                opened_at=time.monotonic(),
+                size=path.stat().st_size,
+            )
+            self._segments[file_name] = segment
+            if self._needs_rotation(segment, incoming):
+                self._rotate(file_name, segment)
+                return self._segment_for(file_name, 0)
+        return segment
+
+    def _needs_rotation(self, segment: _Segment, incoming: int) -> bool:
+        if segment.size == 0:
+            return False
+        if self._max_bytes is not None and segment.size + incoming > self._max_bytes:
+            return True
+        if self._max_age is not None:
+            return time.monotonic() - segment.opened_at >= self._max_age
+        return False
+
+    def _rotate(self, file_name: str, segment: _Segment) -> None:
+        self._segments.pop(file_name, None)
+        segment.handle.close()
+        self._rotation_seq += 1
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        target = segment.path.with_name(
+            f"{segment.path.stem}.{stamp}-{self._rotation_seq:04d}{segment.path.suffix}"
+        )
+        os.replace(segment.path, target)
+        if self._compress:
+            compressed = target.with_name(target.name + ".gz")
+            with target.open("rb") as source, gzip.open(compressed, "wb") as sink:
+                shutil.copyfileobj(source, sink)
+            target.unlink()
+            target = compressed
+        with self._condition:
+            self.stats.rotations += 1
+        self._logger.info(
+            "telemetry_segment_rotated",
+            file=file_name,
+            segment=str(target),
+            size=segment.size,
+        )
+
+    def _discard_segment(self, file_name: str) -> None:
+        segment = self._segments.pop(file_name, None)
+        if segment is not None:
+            try:
+                segment.handle.close()
+            except OSError:
+                pass
+
+    def _close_segments(self) -> None:
+        for file_name in list(self._segments):
+            self._discard_segment(file_name)
+
+
+def close_all_sinks(timeout: float | None = 5.0) -> None:
+    """Flush and close every live sink (registered to run at interpreter exit)."""
+
+    for sink in list(_sinks):
+        try:
+            sink.close(timeout)
+        except Exception:  # pragma: no cover - best effort at shutdown
+            pass
+
+
+atexit.register(close_all_sinks)
@@ -4,6 +4,11 @@ The tracker writes JSON Lines artefacts to ``reports/telemetry`` so that
 diagnostics tooling can ingest structured histories without parsing ad-hoc log
 messages.  Each call records an event dictionary with a timestamp, event name,
 and arbitrary payload provided by the caller.
+
+Records are serialised on the calling thread and handed to a
+:class:`~src.telemetry.sink.TelemetrySink`, which batches the disk writes on a
+background thread.  Call :meth:`TelemetryTracker.flush` before reading the
+files back.
 """
 
 from __future__ import annotations
@@ -17,6 +22,7 @@ from collections.abc import Mapping
 
 from src.diagnostics.logger_factory import LoggerProtocol, get_logger
 from src.telemetry.schema import EVENT_SCHEMA_VERSION, TelemetryRecord
+from src.telemetry.sink import TelemetrySink, TelemetrySinkStats
 
 
 __all__ = [
@@ -35,34 +41,57 @@ _SIMULATION_EVENTS_FILE = "simulation_events.jsonl"
 
 
 class TelemetryRouter:
-    """Persist telemetry records as JSON lines."""
+    """Persist telemetry records as JSON lines.
+
+    By default records go through a buffered :class:`TelemetrySink`; pass
+    ``buffered=False`` to write each record synchronously instead.
+    """
 
     def __init__(
         self,
         base_dir: Path | str = _DEFAULT_BASE_DIR,
         *,
         logger: LoggerProtocol | None = None,
+        sink: TelemetrySink | None = None,
+        buffered: bool = True,
     ) -> None:
         self._base_dir = Path(base_dir)
         self._base_dir.mkdir(parents=True, exist_ok=True)
         self._logger = logger or get_logger("telemetry.router")
         self._lock = RLock()
+        if sink is None and buffered:
+            sink = TelemetrySink(self._base_dir, logger=self._logger)
+        self._sink = sink
+
+    @property
+    def stats(self) -> TelemetrySinkStats | None:
+        """Sink counters, or ``None`` for a synchronous router."""
+
+        return self._sink.stats if self._sink is not None else None
 
     def _append(self, file_name: str, record: TelemetryRecord) -> Path:
         target = self._base_dir / file_name
         payload = json.dumps(record.as_dict(), ensure_ascii=False)
+        if self._sink is not None:
+            self._sink.submit(file_name, payload)
+            return target
         with self._lock:
             with target.open("a", encoding="utf-8") as handle:
                 handle.write(payload)
                 handle.write("\n")
-        self._logger.info(
-            "telemetry_record_written",
-            channel=record.channel,
-            telemetry_event=record.event,
-            path=str(target),
-        )
         return target
 
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until buffered records reach disk."""
+
+        if self._sink is None:
+            return True
+        return self._sink.flush(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        if self._sink is not None:
+            self._sink.close(timeout)
+
     def route(self, record: TelemetryRecord) -> Path:
         if record.channel == "user":
             return self._append(_USER_ACTIONS_FILE, record)
@@ -105,14 +134,19 @@ class TelemetryTracker:
             timestamp=datetime.now(timezone.utc),
             payload=payload,
         )
-        path = self._router.route(record)
-        self._logger.info(
-            "telemetry_event_recorded",
-            channel=channel,
-            telemetry_event=event,
-            path=str(path),
-        )
-        return path
+        return self._router.route(record)
+
+    @property
+    def stats(self) -> TelemetrySinkStats | None:
+        return self._router.stats
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until recorded events are written to disk."""
+
+        return self._router.flush(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        self._router.close(timeout)
 
     def track_user_action(
         self,
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
+from .simulation_state_model import SimulationStateModel
 from .telemetry_bridge import TelemetryDataBridge
 from .training_bridge import TrainingPresetBridge
 
-__all__ = ["TelemetryDataBridge", "TrainingPresetBridge"]
+__all__ = ["SimulationStateModel", "TelemetryDataBridge", "TrainingPresetBridge"]
@@ -0,0 +1,242 @@
+"""Typed QObject mirror of the per-frame simulation state for QML bindings.
+
+:class:`SimulationStateModel` exposes the hot simulation values (body frame,
+per-corner lever/piston state, per-line and tank pressures) as fixed ``real``
+properties.  Values are written in bulk from a :class:`StateSnapshot`; every
+group (frame, each corner, each line, tank) has its own notify signal which is
+emitted at most once per snapshot and only when a value of that group changed,
+so QML bindings re-evaluate natively instead of unpacking a ``QVariantMap``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from PySide6.QtCore import Property, QObject, Signal
+
+from src.pneumo.enums import Line, Wheel
+from src.runtime.state import StateSnapshot
+
+__all__ = ["SimulationStateModel"]
+
+
+_CORNERS: tuple[tuple[Wheel, str], ...] = (
+    (Wheel.LP, "fl"),
+    (Wheel.PP, "fr"),
+    (Wheel.LZ, "rl"),
+    (Wheel.PZ, "rr"),
+)
+_LINES: tuple[tuple[Line, str], ...] = tuple(
+    (line, line.value.lower()) for line in Line
+)
+
+_FRAME_FIELDS = ("heave", "roll", "pitch", "heaveRate", "rollRate", "pitchRate")
+_CORNER_FIELDS = (
+    "leverAngle",
+    "pistonPosition",
+    "pistonVelocity",
+    "headPressure",
+    "rodPressure",
+)
+_LINE_FIELDS = ("pressure", "temperature", "netFlow")
+_TANK_FIELDS = ("pressure", "temperature")
+
+#: ``(group, fields)`` in storage order; group names double as signal prefixes
+_GROUPS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("time", ("simulationTime",)),
+    ("frame", _FRAME_FIELDS),
+    *((corner, _CORNER_FIELDS) for _, corner in _CORNERS),
+    *((line, _LINE_FIELDS) for _, line in _LINES),
+    ("tank", _TANK_FIELDS),
+)
+
+
+def _offsets() -> dict[str, tuple[int, int]]:
+    offsets: dict[str, tuple[int, int]] = {}
+    start = 0
+    for group, fields in _GROUPS:
+        offsets[group] = (start, start + len(fields))
+        start += len(fields)
+    return offsets
+
+
+_OFFSETS = _offsets()
+_SIZE = max(end for _, end in _OFFSETS.values())
+
+
+def _index(group: str, field: str) -> int:
+    start, _ = _OFFSETS[group]
+    return start + dict(_GROUPS)[group].index(field)
+
+
+def _real(group: str, field: str, notify: Signal) -> Property:
+    index = _index(group, field)
+
+    def getter(self: SimulationStateModel) -> float:
+        return self._values[index]
+
+    return Property(float, getter, notify=notify)
+
+
+def _extract(snapshot: StateSnapshot) -> list[float]:
+    frame = snapshot.frame
+    values = [
+        float(snapshot.simulation_time),
+        float(frame.heave),
+        float(frame.roll),
+        float(frame.pitch),
+        float(frame.heave_rate),
+        float(frame.roll_rate),
+        float(frame.pitch_rate),
+    ]
+    wheels = snapshot.wheels
+    for wheel_enum, _ in _CORNERS:
+        wheel = wheels.get(wheel_enum)
+        if wheel is None:
+            values.extend((0.0,) * len(_CORNER_FIELDS))
+            continue
+        values.extend(
+            (
+                float(wheel.lever_angle),
+                float(wheel.piston_position),
+                float(wheel.piston_velocity),
+                float(wheel.pressure_head),
+                float(wheel.pressure_rod),
+            )
+        )
+    lines = snapshot.lines
+    for line_enum, _ in _LINES:
+        line = lines.get(line_enum)
+        if line is None:
+            values.extend((0.0,) * len(_LINE_FIELDS))
+            continue
+        values.extend(
+            (
+                float(line.pressure),
+                float(line.temperature),
+                float(line.flow_atmo) - float(line.flow_tank),
+            )
+        )
+    values.append(float(snapshot.tank.pressure))
+    values.append(float(snapshot.tank.temperature))
+    return values
+
+
+class SimulationStateModel(QObject):
+    """Fixed-layout simulation state exposed to QML as typed properties.
+
+    Property names are ``<group><Field>`` in camelCase, e.g. ``heave``,
+    ``flLeverAngle``, ``a1Pressure`` or ``tankPressure``.
+    """
+
+    #: Payload paths already published by this model; the QML bridge leaves
+    #: them out of ``pendingPythonUpdates`` while a model is bound.
+    PAYLOAD_PATHS: tuple[tuple[str, ...], ...] = (
+        ("animation", "simulationTime"),
+        ("animation", "frame"),
+        ("animation", "leverAngles"),
+        ("animation", "pistonPositions"),
+        ("animation", "linePressures"),
+        ("animation", "tankPressure"),
+        ("threeD", "frame"),
+    )
+
+    timeChanged = Signal()
+    frameChanged = Signal()
+    flChanged = Signal()
+    frChanged = Signal()
+    rlChanged = Signal()
+    rrChanged = Signal()
+    a1Changed = Signal()
+    b1Changed = Signal()
+    a2Changed = Signal()
+    b2Changed = Signal()
+    tankChanged = Signal()
+    runningChanged = Signal()
+
+    simulationTime = _real("time", "simulationTime", timeChanged)
+
+    heave = _real("frame", "heave", frameChanged)
+    roll = _real("frame", "roll", frameChanged)
+    pitch = _real("frame", "pitch", frameChanged)
+    heaveRate = _real("frame", "heaveRate", frameChanged)
+    rollRate = _real("frame", "rollRate", frameChanged)
+    pitchRate = _real("frame", "pitchRate", frameChanged)
+
+    flLeverAngle = _real("fl", "leverAngle", flChanged)
+    flPistonPosition = _real("fl", "pistonPosition", flChanged)
+    flPistonVelocity = _real("fl", "pistonVelocity", flChanged)
+    flHeadPressure = _real("fl", "headPressure", flChanged)
+    flRodPressure = _real("fl", "rodPressure", flChanged)
+    frLeverAngle = _real("fr", "leverAngle", frChanged)
+    frPistonPosition = _real("fr", "pistonPosition", frChanged)
+    frPistonVelocity = _real("fr", "pistonVelocity", frChanged)
+    frHeadPressure = _real("fr", "headPressure", frChanged)
+    frRodPressure = _real("fr", "rodPressure", frChanged)
+    rlLeverAngle = _real("rl", "leverAngle", rlChanged)
+    rlPistonPosition = _real("rl", "pistonPosition", rlChanged)
+    rlPistonVelocity = _real("rl", "pistonVelocity", rlChanged)
+    rlHeadPressure = _real("rl", "headPressure", rlChanged)
+    rlRodPressure = _real("rl", "rodPressure", rlChanged)
+    rrLeverAngle = _real("rr", "leverAngle", rrChanged)
+    rrPistonPosition = _real("rr", "pistonPosition", rrChanged)
+    rrPistonVelocity = _real("rr", "pistonVelocity", rrChanged)
+    rrHeadPressure = _real("rr", "headPressure", rrChanged)
+    rrRodPressure = _real("rr", "rodPressure", rrChanged)
+
+    a1Pressure = _real("a1", "pressure", a1Changed)
+    a1Temperature = _real("a1", "temperature", a1Changed)
+    a1NetFlow = _real("a1", "netFlow", a1Changed)
+    b1Pressure = _real("b1", "pressure", b1Changed)
+    b1Temperature = _real("b1", "temperature", b1Changed)
+    b1NetFlow = _real("b1", "netFlow", b1Changed)
+    a2Pressure = _real("a2", "pressure", a2Changed)
+    a2Temperature = _real("a2", "temperature", a2Changed)
+    a2NetFlow = _real("a2", "netFlow", a2Changed)
+    b2Pressure = _real("b2", "pressure", b2Changed)
+    b2Temperature = _real("b2", "temperature", b2Changed)
+    b2NetFlow = _real("b2", "netFlow", b2Changed)
+
+    tankPressure = _real("tank", "pressure", tankChanged)
+    tankTemperature = _real("tank", "temperature", tankChanged)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._values: list[float] = [0.0] * _SIZE
+        self._running = False
+        self._notifiers: tuple[tuple[int, int, Callable[[], None]], ...] = tuple(
+            (*_OFFSETS[group], getattr(self, f"{group}Changed").emit)
+            for group, _ in _GROUPS
+        )
+
+    def _get_running(self) -> bool:
+        return self._running
+
+    isRunning = Property(bool, _get_running, notify=runningChanged)
+
+    def update_from_snapshot(
+        self, snapshot: StateSnapshot, *, is_running: bool | None = None
+    ) -> int:
+        """Write ``snapshot`` into the model; returns the number of signals emitted."""
+
+        new = _extract(snapshot)
+        old = self._values
+        dirty = [
+            emit
+            for start, end, emit in self._notifiers
+            if new[start:end] != old[start:end]
+        ]
+        # Store everything before notifying so handlers see a consistent frame
+        self._values = new
+        running_changed = is_running is not None and bool(is_running) != self._running
+        if running_changed:
+            self._running = bool(is_running)
+            dirty.append(self.runningChanged.emit)
+        for emit in dirty:
+            emit()
+        return len(dirty)
+
+    def value(self, group: str, field: str) -> float:
+        """Python-side accessor mirroring the ``<group><Field>`` properties."""
+
+        return self._values[_index(group, field)]
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-from collections import deque
+import math
 from dataclasses import dataclass
 from collections.abc import Callable
 from collections.abc import Iterable, Mapping, Sequence
 
+import numpy as np
 from PySide6.QtCore import QObject, Property, Signal, Slot
 
 from src.pneumo.enums import Line
 from src.runtime.state import StateSnapshot
 
+from .telemetry_buffer import TelemetryRingBuffer
+
 MetricExtractor = Callable[[StateSnapshot], float]
 
 
@@ -174,7 +177,14 @@ _DEFAULT_EXTRACTORS: Mapping[str, MetricExtractor] = {
 
 
 class TelemetryDataBridge(QObject):
-    """Expose buffered telemetry metrics to QML charts."""
+    """Expose buffered telemetry metrics to QML charts.
+
+    Samples live in a columnar :class:`TelemetryRingBuffer`.  When QML sets
+    :attr:`exportResolution` to the chart's pixel width, :meth:`exportSeries`
+    returns a min/max decimated view (two points per pixel) instead of every
+    retained sample, so large ``max_samples`` values do not slow down chart
+    refreshes.
+    """
 
     metricsChanged = Signal()
     sampleAppended = Signal("QVariantMap")
@@ -182,6 +192,7 @@ class TelemetryDataBridge(QObject):
     pausedChanged = Signal()
     updateIntervalChanged = Signal()
     activeMetricsChanged = Signal()
+    exportResolutionChanged = Signal()
 
     def __init__(
         self,
@@ -200,19 +211,20 @@ class TelemetryDataBridge(QObject):
         self._extractors: Mapping[str, MetricExtractor] = (
             extractors or _DEFAULT_EXTRACTORS
         )
-        self._buffers: dict[str, deque[float]] = {
-            descriptor.id: deque(maxlen=self._max_samples)
-            for descriptor in self._descriptors
+        metric_ids = [descriptor.id for descriptor in self._descriptors]
+        metric_ids.extend(key for key in self._extractors if key not in metric_ids)
+        self._columns: dict[str, int] = {
+            metric_id: index for index, metric_id in enumerate(metric_ids)
         }
-        self._time_buffer: deque[float] = deque(maxlen=self._max_samples)
+        self._buffer = TelemetryRingBuffer(self._max_samples, len(self._columns))
+        self._row = np.full(len(self._columns), np.nan)
+        self._export_resolution = 0
         self._active_metrics: tuple[str, ...] = tuple(
             descriptor.id for descriptor in self._descriptors[:3]
         )
         self._update_interval = 1
         self._skip_counter = 0
         self._paused = False
-        self._oldest_timestamp: float | None = None
-        self._latest_timestamp: float | None = None
 
     # ------------------------------------------------------------------ properties
     @Property("QVariantList", notify=metricsChanged)
@@ -235,6 +247,12 @@ class TelemetryDataBridge(QObject):
     def maxSamples(self) -> int:
         return self._max_samples
 
+    @Property(int, notify=exportResolutionChanged)
+    def exportResolution(self) -> int:
+        """Chart width in pixels used to decimate exports; 0 exports raw."""
+
+        return self._export_resolution
+
     # ------------------------------------------------------------------ mutators
     @Slot("QStringList")
     def setActiveMetrics(self, metric_ids: Iterable[str]) -> None:
@@ -242,7 +260,7 @@ class TelemetryDataBridge(QObject):
         seen = set()
         for metric_id in metric_ids:
             key = str(metric_id)
-            if key not in self._buffers or key in seen:
+            if key not in self._columns or key in seen:
                 continue
             normalized.append(key)
             seen.add(key)
@@ -261,6 +279,14 @@ class TelemetryDataBridge(QObject):
         self._skip_counter = 0
         self.updateIntervalChanged.emit()
 
+    @Slot(int)
+    def setExportResolution(self, pixels: int) -> None:
+        value = max(0, int(pixels))
+        if value == self._export_resolution:
+            return
+        self._export_resolution = value
+        self.exportResolutionChanged.emit()
+
     @Slot(bool)
     def setPaused(self, paused: bool) -> None:
         flag = bool(paused)
@@ -275,12 +301,8 @@ class TelemetryDataBridge(QObject):
 
     @Slot()
     def resetStream(self) -> None:
-        self._time_buffer.clear()
-        for buffer in self._buffers.values():
-            buffer.clear()
+        self._buffer.clear()
         self._skip_counter = 0
-        self._oldest_timestamp = None
-        self._latest_timestamp = None
         self.streamReset.emit()
 
     # ------------------------------------------------------------------ data flow
@@ -293,26 +315,21 @@ class TelemetryDataBridge(QObject):
         self._skip_counter = 0
 
         timestamp = float(snapshot.simulation_time)
+        row = self._row
+        row.fill(np.nan)
         values: dict[str, float] = {}
         for metric_id, extractor in self._extractors.items():
             try:
                 value = float(extractor(snapshot))
             except Exception:
                 continue
-            buffer = self._buffers.get(metric_id)
-            if buffer is None:
-                buffer = deque(maxlen=self._max_samples)
-                self._buffers[metric_id] = buffer
-            buffer.append(value)
+            row[self._columns[metric_id]] = value
             values[metric_id] = value
 
         if not values:
             return
 
-        self._time_buffer.append(timestamp)
-        if self._oldest_timestamp is None:
-            self._oldest_timestamp = timestamp
-        self._latest_timestamp = timestamp
+        self._buffer.append(timestamp, row)
 
         active_values = {
             metric_id: values[metric_id]
@@ -325,46 +342,39 @@ class TelemetryDataBridge(QObject):
         payload = {
             "timestamp": timestamp,
             "values": active_values,
-            "oldestTimestamp": float(self._oldest_timestamp or timestamp),
-            "latestTimestamp": float(self._latest_timestamp or timestamp),
+            "oldestTimestamp": float(self._buffer.oldest_time() or timestamp),
+            "latestTimestamp": timestamp,
         }
         self.sampleAppended.emit(payload)
 
     @Slot("QStringList", result="QVariantMap")
     def exportSeries(self, metric_ids: Iterable[str]) -> dict[str, object]:
-        metrics = [str(metric_id) for metric_id in metric_ids if metric_id]
-        if not metrics:
-            return {
-                "series": {},
-                "oldestTimestamp": float(self._oldest_timestamp or 0.0),
-                "latestTimestamp": float(self._latest_timestamp or 0.0),
-            }
-
-        time_points = list(self._time_buffer)
+        metrics = [
+            str(metric_id)
+            for metric_id in metric_ids
+            if metric_id and str(metric_id) in self._columns
+        ]
         series_payload: dict[str, list[dict[str, float]]] = {}
-
-        for metric_id in metrics:
-            buffer = self._buffers.get(metric_id)
-            if not buffer:
-                continue
-            values = list(buffer)
-            if not values:
-                continue
-            times = time_points
-            if len(values) < len(time_points):
-                times = time_points[-len(values) :]
-            elif len(values) > len(time_points) and time_points:
-                values = values[-len(time_points) :]
-                times = time_points
-            series_payload[metric_id] = [
-                {"timestamp": float(t), "value": float(v)}
-                for t, v in zip(times, values)
-            ]
+        if metrics:
+            window = self._buffer.window(
+                [self._columns[metric_id] for metric_id in metrics],
+                max_points=self._export_resolution * 2,
+            )
+            times = window.times.tolist()
+            for index, metric_id in enumerate(metrics):
+                # Missing samples are stored as NaN and skipped here
+                series = [
+                    {"timestamp": t, "value": v}
+                    for t, v in zip(times, window.values[:, index].tolist())
+                    if not math.isnan(v)
+                ]
+                if series:
+                    series_payload[metric_id] = series
 
         return {
             "series": series_payload,
-            "oldestTimestamp": float(self._oldest_timestamp or 0.0),
-            "latestTimestamp": float(self._latest_timestamp or 0.0),
+            "oldestTimestamp": float(self._buffer.oldest_time() or 0.0),
+            "latestTimestamp": float(self._buffer.latest_time() or 0.0),
         }
 
 
@@ -0,0 +1,245 @@
+"""Columnar ring buffer with a min/max pyramid for telemetry charts.
+
+:class:`TelemetryRingBuffer` keeps the timestamps and every metric column in
+preallocated NumPy arrays.  Appending a sample is two slice assignments, so the
+retention can grow to millions of samples without per-sample Python objects.
+
+For display, :meth:`TelemetryRingBuffer.window` returns either the raw samples
+or a min/max decimation sized to the chart's pixel width.  Decimation reads a
+multi-resolution pyramid (blocks of ``fanout ** k`` samples) which is brought
+up to date lazily, so the export cost depends on the requested resolution
+rather than on the retention.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+__all__ = ["TelemetryRingBuffer", "TelemetryWindow"]
+
+
+# Pyramid catch-up cadence; bounds the work left for the next export
+_REFRESH_EVERY = 4096
+
+
+class TelemetryWindow:
+    """Timestamps and column values selected by :meth:`TelemetryRingBuffer.window`."""
+
+    __slots__ = ("times", "values", "decimated")
+
+    def __init__(self, times: np.ndarray, values: np.ndarray, decimated: bool) -> None:
+        self.times = times
+        self.values = values
+        self.decimated = decimated
+
+    def __len__(self) -> int:
+        return int(self.times.shape[0])
+
+
+class _PyramidLevel:
+    __slots__ = ("block", "mins", "maxs", "built")
+
+    def __init__(self, block: int, blocks: int, columns: int) -> None:
+        self.block = block
+        self.mins = np.full((blocks, columns), np.nan)
+        self.maxs = np.full((blocks, columns), np.nan)
+        # Absolute number of leading blocks already reduced
+        self.built = 0
+
+
+class TelemetryRingBuffer:
+    """Fixed-capacity columnar buffer of ``(time, values...)`` samples.
+
+    Args:
+        capacity: Number of most recent samples retained
+        columns: Number of value columns per sample
+        fanout: Samples per block on the first pyramid level; every further
+            level groups ``fanout`` blocks of the previous one
+    """
+
+    def __init__(self, capacity: int, columns: int, *, fanout: int = 8) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if fanout < 2:
+            raise ValueError("fanout must be at least 2")
+        self._capacity = int(capacity)
+        self._columns = int(columns)
+        self._fanout = int(fanout)
+
+        block_sizes: list[int] = []
+        block = self._fanout
+        # Stop once a level would hold too few blocks to be worth reading
+        while block * 16 <= self._capacity:
+            block_sizes.append(block)
+            block *= self._fanout
+        top = block_sizes[-1] if block_sizes else 1
+        # Block aligned slot count keeps every block contiguous in the ring
+        self._slots = -(-self._capacity // top) * top
+
+        self._times = np.zeros(self._slots)
+        self._values = np.full((self._slots, self._columns), np.nan)
+        self._levels = [
+            _PyramidLevel(size, self._slots // size, self._columns)
+            for size in block_sizes
+        ]
+        self._count = 0
+
+    # ------------------------------------------------------------------ state
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def columns(self) -> int:
+        return self._columns
+
+    @property
+    def total(self) -> int:
+        """Number of samples appended since the last :meth:`clear`."""
+
+        return self._count
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    def clear(self) -> None:
+        self._count = 0
+        self._values.fill(np.nan)
+        for level in self._levels:
+            level.built = 0
+
+    def append(self, timestamp: float, values: np.ndarray | Sequence[float]) -> None:
+        """Store one sample; missing column values should be ``NaN``."""
+
+        slot = self._count % self._slots
+        self._times[slot] = timestamp
+        self._values[slot] = values
+        self._count += 1
+        if self._levels and self._count % _REFRESH_EVERY == 0:
+            self._refresh_pyramid()
+
+    def oldest_time(self) -> float | None:
+        if self._count == 0:
+            return None
+        start = self._count - len(self)
+        return float(self._times[start % self._slots])
+
+    def latest_time(self) -> float | None:
+        if self._count == 0:
+            return None
+        return float(self._times[(self._count - 1) % self._slots])
+
+    # ------------------------------------------------------------------ export
+    def window(
+        self, columns: Sequence[int] | None = None, max_points: int = 0
+    ) -> TelemetryWindow:
+        """Return the retained samples, min/max decimated to ``max_points``.
+
+        ``max_points <= 0`` returns every retained sample.  Decimated windows
+        emit each bucket's minimum at its first timestamp and its maximum at
+        its last one, so spikes survive at any zoom level.
+        """
+
+        cols = np.asarray(
+            range(self._columns) if columns is None else list(columns), dtype=np.intp
+        )
+        count = len(self)
+        start = self._count - count
+        if max_points <= 0 or count <= max_points:
+            index = np.arange(start, self._count) % self._slots
+            return TelemetryWindow(
+                self._times[index], self._values[np.ix_(index, cols)], False
+            )
+        return self._decimate(cols, start, max(1, max_points // 2 - 2))
+
+    def _decimate(self, cols: np.ndarray, start: int, buckets: int) -> TelemetryWindow:
+        end = self._count
+        per_bucket = (end - start) / buckets
+        self._refresh_pyramid()
+
+        level: _PyramidLevel | None = None
+        for candidate in self._levels:
+            if candidate.block <= per_bucket:
+                level = candidate
+        block = level.block if level is not None else 1
+
+        first_block = -(-start // block)
+        last_block = end // block
+        if last_block <= first_block:
+            level, block = None, 1
+            first_block, last_block = start, end
+
+        # Bucket edges expressed in blocks of the chosen level
+        edges = np.unique(
+            np.linspace(first_block, last_block, buckets + 1).astype(np.int64)
+        )
+        units = np.arange(first_block, last_block)
+        if level is not None:
+            slots = units % level.mins.shape[0]
+            unit_mins = level.mins[np.ix_(slots, cols)]
+            unit_maxs = level.maxs[np.ix_(slots, cols)]
+        else:
+            slots = units % self._slots
+            unit_mins = unit_maxs = self._values[np.ix_(slots, cols)]
+        offsets = edges[:-1] - first_block
+        mins = np.fmin.reduceat(unit_mins, offsets, axis=0)
+        maxs = np.fmax.reduceat(unit_maxs, offsets, axis=0)
+        firsts = edges[:-1] * block
+        lasts = edges[1:] * block - 1
+
+        # Samples outside whole blocks at either end form their own buckets
+        if start < first_block * block:
+            head_min, head_max = self._reduce_raw(cols, start, first_block * block)
+            mins = np.vstack((head_min, mins))
+            maxs = np.vstack((head_max, maxs))
+            firsts = np.concatenate(([start], firsts))
+            lasts = np.concatenate(([first_block * block - 1], lasts))
+        if last_block * block < end:
+            tail_min, tail_max = self._reduce_raw(cols, last_block * block, end)
+            mins = np.vstack((mins, tail_min))
+            maxs = np.vstack((maxs, tail_max))
+            firsts = np.concatenate((firsts, [last_block * block]))
+            lasts = np.concatenate((lasts, [end - 1]))
+
+        first_times = self._times[firsts % self._slots]
+        last_times = self._times[lasts % self._slots]
+        times = np.empty(first_times.shape[0] * 2)
+        times[0::2] = first_times
+        times[1::2] = last_times
+        values = np.empty((times.shape[0], len(cols)))
+        values[0::2] = mins
+        values[1::2] = maxs
+        return TelemetryWindow(times, values, True)
+
+    def _reduce_raw(
+        self, cols: np.ndarray, lo: int, hi: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        raw = self._values[np.ix_(np.arange(lo, hi) % self._slots, cols)]
+        return np.fmin.reduce(raw, axis=0), np.fmax.reduce(raw, axis=0)
+
+    def _refresh_pyramid(self) -> None:
+        source_mins = source_maxs = self._values
+        source_blocks = self._slots
+        source_block = 1
+        for level in self._levels:
+            complete = self._count // level.block
+            child = level.block // source_block
+            # Blocks whose samples were already overwritten are never shown
+            oldest = -(-max(0, self._count - self._slots) // level.block)
+            first = max(level.built, oldest)
+            if complete > first:
+                children = np.arange(first * child, complete * child) % source_blocks
+                shape = (complete - first, child, self._columns)
+                slots = np.arange(first, complete) % level.mins.shape[0]
+                level.mins[slots] = np.fmin.reduce(
+                    source_mins[children].reshape(shape), axis=1
+                )
+                level.maxs[slots] = np.fmax.reduce(
+                    source_maxs[children].reshape(shape), axis=1
+                )
+                level.built = complete
+            source_mins, source_maxs = level.mins, level.maxs
+            source_blocks = level.mins.shape[0]
+            source_block = level.block
@@ -2,54 +2,159 @@
 Charts widget using QtCharts for real-time data visualization
 """
 
+import math
+from collections import deque
+
+import numpy as np
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
 from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QPainter, QColor
-from collections import deque
 
+from src.pneumo.enums import Line
 from src.runtime.state import StateSnapshot
 
 
+_DEFAULT_PLOT_WIDTH = 800
+
+
+class _SeriesGroup:
+    """Feed the line series of one chart with per-pixel min/max points.
+
+    Samples are folded into the current pixel column (``time_window /
+    plot width`` seconds wide).  When a column completes, at most two points
+    per series are appended; columns that scroll out of the time window are
+    removed from the front.  Running window extremes are kept in monotonic
+    queues, so each sample costs O(1) whatever the history length.
+    """
+
+    def __init__(self, series, time_window: float):
+        self.series = list(series)
+        self._time_window = time_window
+        self._bucket_width = time_window / _DEFAULT_PLOT_WIDTH
+        self._columns: deque[tuple[float, int]] = deque()
+        self._lows: deque[tuple[float, float]] = deque()
+        self._highs: deque[tuple[float, float]] = deque()
+        size = len(self.series)
+        self._mins = np.empty(size)
+        self._maxs = np.empty(size)
+        self._bucket: int | None = None
+        self._first_time = 0.0
+        self._last_time = 0.0
+        self._samples = 0
+
+    def set_plot_width(self, pixels: float) -> None:
+        """Resize pixel columns; points already drawn keep their resolution."""
+
+        if pixels >= 1.0:
+            self._bucket_width = self._time_window / pixels
+
+    def add(self, time: float, values: np.ndarray) -> bool:
+        """Fold one sample in; True when a finished column was drawn."""
+
+        bucket = math.floor(time / self._bucket_width)
+        if bucket == self._bucket:
+            np.fmin(self._mins, values, out=self._mins)
+            np.fmax(self._maxs, values, out=self._maxs)
+            self._last_time = time
+            self._samples += 1
+            return False
+
+        flushed = self._flush()
+        self._bucket = bucket
+        self._mins[:] = values
+        self._maxs[:] = values
+        self._first_time = self._last_time = time
+        self._samples = 1
+        return flushed
+
+    def _flush(self) -> bool:
+        if self._bucket is None:
+            return False
+        first, last = self._first_time, self._last_time
+        if self._samples == 1:
+            points = 1
+            for series, value in zip(self.series, self._mins.tolist()):
+                series.append(first, value)
+        else:
+            points = 2
+            for series, low, high in zip(
+                self.series, self._mins.tolist(), self._maxs.tolist()
+            ):
+                # One call per series keeps chart repaint requests batched
+                series.append([QPointF(first, low), QPointF(last, high)])
+        self._columns.append((last, points))
+
+        low = float(self._mins.min())
+        high = float(self._maxs.max())
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((last, low))
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((last, high))
+        return True
+
+    def expire(self, min_time: float) -> None:
+        """Drop columns that ended before ``min_time``."""
+
+        stale = 0
+        while self._columns and self._columns[0][0] < min_time:
+            stale += self._columns.popleft()[1]
+        if stale:
+            for series in self.series:
+                series.removePoints(0, stale)
+        while self._lows and self._lows[0][0] < min_time:
+            self._lows.popleft()
+        while self._highs and self._highs[0][0] < min_time:
+            self._highs.popleft()
+
+    def extremes(self) -> tuple[float, float] | None:
+        """Minimum and maximum over the drawn columns."""
+
+        if not self._lows:
+            return None
+        return self._lows[0][1], self._highs[0][1]
+
+    def clear(self) -> None:
+        for series in self.series:
+            series.clear()
+        self._columns.clear()
+        self._lows.clear()
+        self._highs.clear()
+        self._bucket = None
+        self._samples = 0
+
+
 class ChartWidget(QWidget):
     """Widget containing QtCharts for real-time data visualization"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Data buffers (limited size for performance)
-        self.max_points = 5000
-        self.time_buffer = deque(maxlen=self.max_points)
-
-        # Pressure data buffers
-        self.pressure_buffers = {
-            "A1": deque(maxlen=self.max_points),
-            "B1": deque(maxlen=self.max_points),
-            "A2": deque(maxlen=self.max_points),
-            "B2": deque(maxlen=self.max_points),
-            "Tank": deque(maxlen=self.max_points),
-        }
-
-        # Frame dynamics buffers
-        self.frame_buffers = {
-            "heave": deque(maxlen=self.max_points),
-            "roll": deque(maxlen=self.max_points),
-            "pitch": deque(maxlen=self.max_points),
-        }
-
-        # Flow buffers
-        self.flow_buffers = {
-            "inflow": deque(maxlen=self.max_points),
-            "outflow": deque(maxlen=self.max_points),
-            "tank_relief": deque(maxlen=self.max_points),
-        }
+        # Visible time span (seconds); pixel columns are derived from it
+        self.time_window = 10.0
+        self._last_time: float | None = None
 
         # Setup UI
         self._setup_ui()
 
-        # Update counter for performance
-        self.update_counter = 0
-        self.update_interval = 5  # Update every 5 snapshots
+        self._groups = {
+            "pressure": _SeriesGroup(self.pressure_series.values(), self.time_window),
+            "dynamics": _SeriesGroup(self.dynamics_series.values(), self.time_window),
+            "flow": _SeriesGroup(self.flow_series.values(), self.time_window),
+        }
+        self._axes = {
+            "pressure": (self.pressure_x_axis, self.pressure_y_axis),
+            "dynamics": (self.dynamics_x_axis, self.dynamics_y_axis),
+            "flow": (self.flow_x_axis, self.flow_y_axis),
+        }
+        for name, chart in self._charts.items():
+            group = self._groups[name]
+            group.set_plot_width(chart.plotArea().width())
+            chart.plotAreaChanged.connect(
+                lambda area, group=group: group.set_plot_width(area.width())
+            )
 
     def _setup_ui(self):
         """Setup chart UI with tabs"""
@@ -60,6 +165,7 @@ class ChartWidget(QWidget):
         layout.addWidget(self.tab_widget)
 
         # Create individual chart tabs
+        self._charts: dict[str, QChart] = {}
         self._create_pressure_chart()
         self._create_dynamics_chart()
         self._create_flow_chart()
@@ -117,6 +223,7 @@ class ChartWidget(QWidget):
 
         # Add to tab widget
         self.tab_widget.addTab(chart_view, "Pressures")
+        self._charts["pressure"] = chart
 
     def _create_dynamics_chart(self):
         """Create frame dynamics chart"""
@@ -167,6 +274,7 @@ class ChartWidget(QWidget):
 
         # Add to tab widget
         self.tab_widget.addTab(chart_view, "Dynamics")
+        self._charts["dynamics"] = chart
 
     def _create_flow_chart(self):
         """Create mass flow chart"""
@@ -217,111 +325,52 @@ class ChartWidget(QWidget):
 
         # Add to tab widget
         self.tab_widget.addTab(chart_view, "Flows")
+        self._charts["flow"] = chart
 
     def update_from_snapshot(self, snapshot: StateSnapshot):
         """Update charts from state snapshot
 
+        Every snapshot is aggregated; the series only change when a pixel
+        column completes, so the cost per call does not depend on history.
+
         Args:
             snapshot: Current system state
         """
-        # Throttle updates for performance
-        self.update_counter += 1
-        if self.update_counter % self.update_interval != 0:
-            return
-
-        # Add time point
-        sim_time = snapshot.simulation_time
-        self.time_buffer.append(sim_time)
-
-        # Update pressure data
-        self._update_pressure_data(snapshot)
-
-        # Update dynamics data
-        self._update_dynamics_data(snapshot)
-
-        # Update flow data
-        self._update_flow_data(snapshot)
-
-        # Update chart ranges
-        self._update_chart_ranges(sim_time)
-
-    def _update_pressure_data(self, snapshot: StateSnapshot):
-        """Update pressure chart data"""
-        # Line pressures
-        for line_name, line_state in snapshot.lines.items():
-            buffer_key = line_name.value  # A1, B1, A2, B2
-            if buffer_key in self.pressure_buffers:
-                self.pressure_buffers[buffer_key].append(line_state.pressure)
-
-        # Tank pressure
-        self.pressure_buffers["Tank"].append(snapshot.tank.pressure)
-
-        # Update series
-        for name, series in self.pressure_series.items():
-            if name in self.pressure_buffers:
-                buffer = self.pressure_buffers[name]
-                time_buffer = self.time_buffer
-
-                if len(buffer) == len(time_buffer):
-                    # Convert to QPointF objects
-                    points = [
-                        QPointF(float(t), float(p)) for t, p in zip(time_buffer, buffer)
-                    ]
-                    series.replace(points)
-
-    def _update_dynamics_data(self, snapshot: StateSnapshot):
-        """Update dynamics chart data"""
+        sim_time = float(snapshot.simulation_time)
+        if self._last_time is not None and sim_time < self._last_time:
+            # Simulation restarted without an explicit clear
+            self.clear_data()
+        self._last_time = sim_time
+
+        lines = snapshot.lines
+        tank = snapshot.tank
         frame = snapshot.frame
+        pressures = [
+            lines[line].pressure if line in lines else 0.0
+            for line in (Line.A1, Line.B1, Line.A2, Line.B2)
+        ]
+        pressures.append(tank.pressure)
+        samples = {
+            "pressure": pressures,
+            "dynamics": [frame.heave, frame.roll, frame.pitch],
+            "flow": [
+                sum(line.flow_atmo for line in lines.values()),
+                sum(line.flow_tank for line in lines.values()),
+                tank.flow_min + tank.flow_stiff + tank.flow_safety,
+            ],
+        }
 
-        # Add new data points
-        self.frame_buffers["heave"].append(frame.heave)
-        self.frame_buffers["roll"].append(frame.roll)
-        self.frame_buffers["pitch"].append(frame.pitch)
-
-        # Update series
-        for name, series in self.dynamics_series.items():
-            buffer = self.frame_buffers[name]
-            time_buffer = self.time_buffer
-
-            if len(buffer) == len(time_buffer):
-                # Convert to QPointF objects
-                points = [
-                    QPointF(float(t), float(v)) for t, v in zip(time_buffer, buffer)
-                ]
-                series.replace(points)
-
-    def _update_flow_data(self, snapshot: StateSnapshot):
-        """Update flow chart data"""
-        # Calculate total flows
-        total_inflow = sum(line.flow_atmo for line in snapshot.lines.values())
-        total_outflow = sum(line.flow_tank for line in snapshot.lines.values())
-        tank_relief = (
-            snapshot.tank.flow_min
-            + snapshot.tank.flow_stiff
-            + snapshot.tank.flow_safety
-        )
-
-        # Add to buffers
-        self.flow_buffers["inflow"].append(total_inflow)
-        self.flow_buffers["outflow"].append(total_outflow)
-        self.flow_buffers["tank_relief"].append(tank_relief)
-
-        # Update series
-        for name, series in self.flow_series.items():
-            buffer = self.flow_buffers[name]
-            time_buffer = self.time_buffer
-
-            if len(buffer) == len(time_buffer):
-                # Convert to QPointF objects
-                points = [
-                    QPointF(float(t), float(f)) for t, f in zip(time_buffer, buffer)
-                ]
-                series.replace(points)
+        flushed = False
+        for name, values in samples.items():
+            if self._groups[name].add(sim_time, np.asarray(values, dtype=float)):
+                flushed = True
+        if flushed:
+            self._update_chart_ranges(sim_time)
 
     def _update_chart_ranges(self, current_time: float):
         """Update chart X-axis ranges to follow current time"""
         # Update time window (show last 10 seconds)
-        time_window = 10.0
+        time_window = self.time_window
 
         if current_time > time_window:
             min_time = current_time - time_window
@@ -330,66 +379,31 @@ class ChartWidget(QWidget):
             min_time = 0.0
             max_time = time_window
 
-        # Update all X axes
-        self.pressure_x_axis.setRange(min_time, max_time)
-        self.dynamics_x_axis.setRange(min_time, max_time)
-        self.flow_x_axis.setRange(min_time, max_time)
+        # Update all X axes and drop columns that scrolled out
+        for name, group in self._groups.items():
+            group.expire(min_time)
+            self._axes[name][0].setRange(min_time, max_time)
 
-        # Auto-scale Y axes occasionally
-        if self.update_counter % 100 == 0:  # Every 100 updates
-            self._auto_scale_y_axes()
+        self._auto_scale_y_axes()
 
     def _auto_scale_y_axes(self):
-        """Auto-scale Y axes based on current data"""
+        """Auto-scale Y axes from the running extremes of the visible window"""
         # Auto-scale pressure axis
-        if self.pressure_buffers["A1"] and len(self.pressure_buffers["A1"]) > 10:
-            all_pressures = []
-            for buffer in self.pressure_buffers.values():
-                if buffer:
-                    all_pressures.extend(list(buffer)[-100:])  # Last 100 points
-
-            if all_pressures:
-                min_p = min(all_pressures)
-                max_p = max(all_pressures)
-                margin = (max_p - min_p) * 0.1
-                self.pressure_y_axis.setRange(min_p - margin, max_p + margin)
+        extremes = self._groups["pressure"].extremes()
+        if extremes is not None:
+            min_p, max_p = extremes
+            margin = (max_p - min_p) * 0.1 or max(abs(max_p) * 0.01, 1.0)
+            self.pressure_y_axis.setRange(min_p - margin, max_p + margin)
 
         # Auto-scale dynamics axis
-        if self.frame_buffers["heave"] and len(self.frame_buffers["heave"]) > 10:
-            all_dynamics = []
-            for buffer in self.frame_buffers.values():
-                if buffer:
-                    all_dynamics.extend(list(buffer)[-100:])  # Last 100 points
-
-            if all_dynamics:
-                min_d = min(all_dynamics)
-                max_d = max(all_dynamics)
-                margin = max(abs(min_d), abs(max_d)) * 0.1
-                self.dynamics_y_axis.setRange(min_d - margin, max_d + margin)
+        extremes = self._groups["dynamics"].extremes()
+        if extremes is not None:
+            min_d, max_d = extremes
+            margin = max(abs(min_d), abs(max_d)) * 0.1 or 0.01
+            self.dynamics_y_axis.setRange(min_d - margin, max_d + margin)
 
     def clear_data(self):
         """Clear all chart data"""
-        # Clear buffers
-        self.time_buffer.clear()
-
-        for buffer in self.pressure_buffers.values():
-            buffer.clear()
-
-        for buffer in self.frame_buffers.values():
-            buffer.clear()
-
-        for buffer in self.flow_buffers.values():
-            buffer.clear()
-
-        # Clear series
-        for series in self.pressure_series.values():
-            series.clear()
-
-        for series in self.dynamics_series.values():
-            series.clear()
-
-        for series in self.flow_series.values():
-            series.clear()
-
-        # Reset counter
-        self.update_counter = 0
+        for group in self._groups.values():
+            group.clear()
+        self._last_time = None
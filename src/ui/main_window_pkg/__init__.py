@@ -30,6 +30,7 @@ __all__ = [
     "ui_setup",
     "state_sync",
     "menu_actions",
+    "render_scheduler",
 ]
 
 __version__ = "4.9.8"
@@ -40,6 +41,7 @@ _MODULE_EXPORTS = {
     "ui_setup": "ui_setup",
     "state_sync": "state_sync",
     "menu_actions": "menu_actions",
+    "render_scheduler": "render_scheduler",
 }
 
 _MAIN_WINDOW_CLASS: type[Any] | None = None
@@ -24,6 +24,7 @@ from .qml_bridge import QMLBridge
 from .signals_router import SignalsRouter
 from .state_sync import StateSync
 from .menu_actions import MenuActions
+from .render_scheduler import RenderScheduler
 from .profile_service import ProfileService
 from ._hdr_paths import normalise_hdr_path
 from src.common.settings_manager import get_settings_manager
@@ -31,6 +32,8 @@ from src.common.signal_trace import get_signal_trace_service
 from src.core.settings_manager import ProfileSettingsManager
 from src.services import FeedbackService
 from src.ui.feedback import FeedbackController
+from src.runtime.presentation import StateInterpolator
+from src.ui.bridge.simulation_state_model import SimulationStateModel
 from src.ui.bridge.telemetry_bridge import TelemetryDataBridge
 
 
@@ -185,6 +188,11 @@ class MainWindow(QMainWindow):
                 exc_info=telemetry_exc,
             )
 
+        # Typed per-frame state for QML bindings (bound by QMLBridge)
+        self.simulation_state_model = SimulationStateModel(self)
+        # Render-rate blending of the snapshots published by physics
+        self.state_interpolator = StateInterpolator()
+
         # IBL Logger
         from ..ibl_logger import get_ibl_logger, log_ibl_event
 
@@ -291,11 +299,14 @@ class MainWindow(QMainWindow):
         SignalsRouter.connect_all_signals(self)
         self.logger.info("  ✅ Signals connected")
 
-        # ====== RENDER TIMER ======
-        self.render_timer = QTimer(self)
-        self.render_timer.timeout.connect(self._update_render)
-        self.render_timer.start(16)  # ~60 FPS
-        self.logger.info("  ✅ Render timer started")
+        # ====== RENDER SCHEDULER ======
+        # Тик рендера по запросу: новое состояние, пакет QML, анимация
+        self.render_scheduler = RenderScheduler(
+            self._update_render, self, max_hz=self._display_refresh_hz()
+        )
+        self.render_scheduler.add_activity(self._render_animation_active)
+        self.render_scheduler.request_frame()
+        self.logger.info("  ✅ Render scheduler ready")
 
         # ====== RESTORE SETTINGS ======
         StateSync.restore_settings(self)
@@ -1155,6 +1166,20 @@ class MainWindow(QMainWindow):
         """Render tick → MenuActions"""
         MenuActions.update_render(self)
 
+    def _render_animation_active(self) -> bool:
+        """QML animation is running or the view still blends towards the latest state."""
+        if getattr(self, "_qml_animation_running", False):
+            return True
+        interpolator = getattr(self, "state_interpolator", None)
+        return interpolator is not None and interpolator.alpha() < 1.0
+
+    def _display_refresh_hz(self) -> float | None:
+        try:
+            screen = self.screen()
+            return float(screen.refreshRate()) if screen is not None else None
+        except Exception:
+            return None
+
     # ------------------------------------------------------------------
     # Menu Actions
     # ------------------------------------------------------------------
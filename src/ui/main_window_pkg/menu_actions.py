@@ -95,7 +95,7 @@ class MenuActions:
     # ------------------------------------------------------------------
     @staticmethod
     def update_render(window: MainWindow) -> None:
-        """Периодический тик UI/анимации (~60 FPS)
+        """Тик UI/анимации (по запросу RenderScheduler, 30/60/120 Hz)
 
         Updates:
         - QML animation time
@@ -112,9 +112,12 @@ class MenuActions:
         last_tick = getattr(window, "_last_animation_tick", None)
         window._last_animation_tick = now
 
+        was_running = getattr(window, "_qml_animation_running", False)
         try:
             is_running = bool(window._qml_root_object.property("isRunning"))
-            if is_running and last_tick is not None:
+            window._qml_animation_running = is_running
+            # После простоя планировщика last_tick устарел — не прыгаем вперёд
+            if is_running and was_running and last_tick is not None:
                 elapsed = now - last_tick
                 current = float(
                     window._qml_root_object.property("animationTime") or 0.0
@@ -165,6 +168,11 @@ class MenuActions:
         if latest_snapshot is not None:
             window.current_snapshot = latest_snapshot
 
-        SignalsRouter._queue_simulation_update(
-            window, getattr(window, "current_snapshot", None)
-        )
+        # Physics publishes below the render rate; blend the two latest states
+        rendered = getattr(window, "current_snapshot", None)
+        interpolator = getattr(window, "state_interpolator", None)
+        if interpolator is not None:
+            interpolator.push(rendered)
+            rendered = interpolator.sample(now) or rendered
+
+        SignalsRouter._queue_simulation_update(window, rendered)
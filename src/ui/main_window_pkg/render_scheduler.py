@@ -0,0 +1,166 @@
+"""Render Scheduler Module - demand-driven render tick for MainWindow
+
+Планировщик тика рендера: вместо постоянного таймера 16 мс тик запускается
+только по запросу (новое состояние симуляции, пакет обновлений QML, движение
+камеры) и продолжается, пока активен хотя бы один источник анимации.  В
+простое таймер остановлен полностью.
+
+Целевая частота выбирается из ``RATES_HZ`` по измеренной стоимости тика.
+
+Russian comments / English code.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+__all__ = ["RenderScheduler"]
+
+
+class RenderScheduler(QObject):
+    """Run ``tick`` only while there is something to render.
+
+    Wake-ups come from :meth:`request_frame` (one more frame) and from
+    activity predicates registered with :meth:`add_activity`, which are
+    polled after every tick; the timer stops once no frame is requested and
+    every predicate reports ``False``.
+
+    The target rate adapts between :attr:`RATES_HZ`: the exponential average
+    of the tick cost must fit into ``budget`` of the frame period, the rest is
+    left to the Qt Quick render pass sharing the GUI thread.
+    """
+
+    RATES_HZ: tuple[float, ...] = (30.0, 60.0, 120.0)
+    #: Weight of the newest sample in the frame-cost average
+    COST_SMOOTHING = 0.2
+    #: Step up only when the cost fits the faster rate with this margin
+    UPGRADE_MARGIN = 0.75
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        tick: Callable[[], object],
+        parent: QObject | None = None,
+        *,
+        max_hz: float | None = None,
+        initial_hz: float = 60.0,
+        budget: float = 0.5,
+    ) -> None:
+        super().__init__(parent)
+        self._tick = tick
+        self._budget = float(budget)
+        self._rates = self._usable_rates(self.RATES_HZ, max_hz)
+        self._target_hz = min(self._rates, key=lambda rate: abs(rate - initial_hz))
+        self._activities: list[Callable[[], bool]] = []
+        self._frame_requested = False
+        self._frame_cost = 0.0
+        self.tick_count = 0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @staticmethod
+    def _usable_rates(
+        rates: Iterable[float], max_hz: float | None
+    ) -> tuple[float, ...]:
+        ordered = tuple(sorted(float(rate) for rate in rates))
+        if max_hz is None or max_hz <= 0:
+            return ordered
+        # Faster than the display refresh is wasted work
+        capped = tuple(rate for rate in ordered if rate <= max_hz + 0.5)
+        return capped or ordered[:1]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def target_hz(self) -> float:
+        return self._target_hz
+
+    @property
+    def frame_cost(self) -> float:
+        """Averaged tick cost in seconds."""
+
+        return self._frame_cost
+
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+
+    def add_activity(self, predicate: Callable[[], bool]) -> None:
+        """Keep ticking while ``predicate()`` is true (animation, interpolation)."""
+
+        self._activities.append(predicate)
+
+    def request_frame(self) -> None:
+        """Schedule at least one more tick; cheap to call repeatedly."""
+
+        self._frame_requested = True
+        if not self._timer.isActive():
+            self._timer.start(self._interval_ms())
+
+    def stop(self) -> None:
+        self._frame_requested = False
+        self._timer.stop()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _interval_ms(self) -> int:
+        return max(1, int(1000.0 / self._target_hz))
+
+    def _on_timeout(self) -> None:
+        # Requests made by the tick itself (e.g. a queued QML batch) keep the
+        # loop alive for one more frame
+        self._frame_requested = False
+        started = time.perf_counter()
+        try:
+            self._tick()
+        except Exception as exc:
+            self.logger.debug("Render tick failed: %s", exc, exc_info=exc)
+        self.tick_count += 1
+        self._adapt(time.perf_counter() - started)
+
+        if self._frame_requested or self._has_activity():
+            return
+        self._timer.stop()
+
+    def _has_activity(self) -> bool:
+        for predicate in self._activities:
+            try:
+                if predicate():
+                    return True
+            except Exception as exc:
+                self.logger.debug("Render activity check failed: %s", exc, exc_info=exc)
+        return False
+
+    def _adapt(self, cost: float) -> None:
+        """Fold ``cost`` into the average and retarget the frame rate."""
+
+        if self._frame_cost <= 0.0:
+            self._frame_cost = cost
+        else:
+            self._frame_cost += (cost - self._frame_cost) * self.COST_SMOOTHING
+
+        rates = self._rates
+        index = rates.index(self._target_hz)
+        if index > 0 and self._frame_cost > self._budget / rates[index]:
+            index -= 1
+        elif (
+            index + 1 < len(rates)
+            and self._frame_cost
+            <= self._budget / rates[index + 1] * self.UPGRADE_MARGIN
+        ):
+            index += 1
+        else:
+            return
+
+        self._target_hz = rates[index]
+        self.logger.debug("Render target rate → %.0f Hz", self._target_hz)
+        if self._timer.isActive():
+            self._timer.setInterval(self._interval_ms())
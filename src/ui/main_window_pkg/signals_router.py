@@ -785,6 +785,15 @@ class SignalsRouter:
         if snapshot is None:
             return
 
+        # Typed model first: QML bindings follow every snapshot natively while
+        # the map payload below is debounced for the diagnostics panels
+        try:
+            QMLBridge.update_simulation_model(window, snapshot)
+        except Exception as exc:
+            SignalsRouter.logger.debug(
+                "Simulation state model update failed: %s", exc, exc_info=exc
+            )
+
         payload = SignalsRouter._build_simulation_payload(snapshot)
         if not payload:
             return
@@ -2037,6 +2046,7 @@ class SignalsRouter:
         """Persist animation toggle coming from QML."""
 
         window._apply_settings_update("animation", {"is_running": bool(running)})
+        SignalsRouter._request_render_frame(window)
 
     # ------------------------------------------------------------------
     # Signal Handlers - Simulation
@@ -2066,6 +2076,9 @@ class SignalsRouter:
             )
 
         window.current_snapshot = latest_snapshot
+        interpolator = getattr(window, "state_interpolator", None)
+        if interpolator is not None:
+            interpolator.push(latest_snapshot)
 
         try:
             if latest_snapshot:
@@ -2099,11 +2112,26 @@ class SignalsRouter:
                         exc_info=telemetry_exc,
                     )
 
-            # Push state to QML (meters/pascals/radians)
-            SignalsRouter._queue_simulation_update(window, latest_snapshot)
+            # Push state to QML (meters/pascals/radians); with an interpolator
+            # the render tick pushes the blended state instead
+            if interpolator is None:
+                SignalsRouter._queue_simulation_update(window, latest_snapshot)
+            SignalsRouter._request_render_frame(window)
         except Exception as e:
             SignalsRouter.logger.error(f"State update error: {e}")
 
+    @staticmethod
+    def _request_render_frame(window: MainWindow) -> None:
+        scheduler = getattr(window, "render_scheduler", None)
+        if scheduler is None:
+            return
+        try:
+            scheduler.request_frame()
+        except Exception as exc:
+            SignalsRouter.logger.debug(
+                "Render frame request failed: %s", exc, exc_info=exc
+            )
+
     @staticmethod
     def handle_physics_error(window: "MainWindow", message: str) -> None:
         """Handle physics engine error
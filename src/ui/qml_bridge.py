@@ -59,8 +59,13 @@ except Exception:  # pragma: no cover - fallback for headless environments
     QMetaObject = _DummyQMetaObject  # type: ignore[assignment]
     Qt = _DummyQt()  # type: ignore[assignment]
 
-from src.pneumo.enums import Line, Wheel
 from src.runtime.state import StateSnapshot
+from src.ui.qml_snapshot_encoder import SnapshotEncoder
+
+try:  # NumPy scalars/arrays are optional in payloads
+    import numpy as _np
+except Exception:  # pragma: no cover - optional dependency
+    _np = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:  # pragma: no cover - imported only for typing
     from .main_window import MainWindow
@@ -284,6 +289,11 @@ class QMLBridge:
         for key, methods in get_bridge_metadata().update_methods.items()
     }
 
+    #: Categories whose payloads are already QML-ready: camelCase keys and
+    #: plain Python scalars (``SignalsRouter._build_simulation_payload``).
+    #: The batch path hands them to QML without the recursive sanitise pass.
+    QML_READY_CATEGORIES: frozenset[str] = frozenset({"simulation"})
+
     @staticmethod
     def describe_routes() -> dict[str, tuple[str, ...]]:
         """Return the update categories declared in the metadata."""
@@ -336,6 +346,14 @@ class QMLBridge:
             except Exception:  # pragma: no cover - Qt specific failure
                 pass
 
+        # Сцена меняется (камера, материалы, анимация) → разбудить тик рендера
+        scheduler = getattr(window, "render_scheduler", None)
+        if scheduler is not None:
+            try:
+                scheduler.request_frame()
+            except Exception:  # pragma: no cover - Qt specific failure
+                pass
+
     @staticmethod
     def flush_updates(window: MainWindow) -> None:
         """Flush queued updates to QML, falling back to per-category calls."""
@@ -397,17 +415,13 @@ class QMLBridge:
 
         try:
             batch_id = QMLBridge._next_batch_id(window)
-            try:
-                payload = copy.deepcopy(updates)
-            except Exception:
-                payload = dict(updates)
-            sanitized = QMLBridge._prepare_for_qml(payload)
+            sanitized = QMLBridge._prepare_batch(updates)
             window._suppress_qml_feedback = True
             try:
                 window._qml_root_object.setProperty("pendingPythonUpdates", sanitized)
             finally:
                 window._suppress_qml_feedback = False
-            QMLBridge._track_pending_batch(window, batch_id, payload)
+            QMLBridge._track_pending_batch(window, batch_id, updates)
             return QMLBridge._make_update_result(True, detailed)
         except Exception as exc:  # pragma: no cover - Qt specific failure
             QMLBridge.logger.error(
@@ -434,28 +448,38 @@ class QMLBridge:
     # ------------------------------------------------------------------
     @staticmethod
     def set_simulation_state(window: MainWindow, snapshot: StateSnapshot) -> bool:
-        """Push an entire :class:`StateSnapshot` into QML."""
+        """Push a :class:`StateSnapshot` into QML.
+
+        Only the fields that changed since the last acknowledged push are sent;
+        a full frame is pushed first, whenever the QML root changes and after a
+        failed push.  Values mirrored by the window's
+        :class:`~src.ui.bridge.SimulationStateModel` are written to the model
+        and left out of the payload while the model is bound to the root.
+        """
 
-        if snapshot is None or not getattr(window, "_qml_root_object", None):
+        root = getattr(window, "_qml_root_object", None)
+        if snapshot is None or not root:
             return False
 
+        is_running = bool(getattr(window, "is_simulation_running", False))
         try:
-            payload = QMLBridge._snapshot_to_payload(snapshot)
-            payload.setdefault("animation", {})["isRunning"] = bool(
-                getattr(window, "is_simulation_running", False)
-            )
+            encoder = QMLBridge._snapshot_encoder_for(window, root)
+            QMLBridge.update_simulation_model(window, snapshot)
+            frame = encoder.encode(snapshot, is_running=is_running)
+            if not frame:
+                return True
 
-            sanitized = QMLBridge._prepare_for_qml(payload)
             window._suppress_qml_feedback = True
             try:
-                window._qml_root_object.setProperty(
-                    "pendingPythonUpdates",
-                    sanitized,
-                )
+                root.setProperty("pendingPythonUpdates", frame.payload)
             finally:
                 window._suppress_qml_feedback = False
+            encoder.acknowledge(frame)
             return True
         except Exception as exc:  # pragma: no cover - Qt specific failure
+            encoder = getattr(window, "_qml_snapshot_encoder", None)
+            if encoder is not None:
+                encoder.reset()
             QMLBridge.logger.error(
                 "Failed to push simulation state to QML", exc_info=True
             )
@@ -478,250 +502,60 @@ class QMLBridge:
             return False
 
     @staticmethod
-    def _snapshot_to_payload(snapshot: StateSnapshot) -> dict[str, Any]:
-        """Convert a :class:`StateSnapshot` into a QML friendly dict."""
-
-        wheel_key_map = {
-            Wheel.LP: "fl",
-            Wheel.PP: "fr",
-            Wheel.LZ: "rl",
-            Wheel.PZ: "rr",
-        }
+    def update_simulation_model(window: MainWindow, snapshot: StateSnapshot) -> bool:
+        """Write ``snapshot`` into the window's typed simulation state model.
 
-        wheels_payload: dict[str, dict[str, Any]] = {}
-        lever_angles: dict[str, float] = {}
-        piston_positions: dict[str, float] = {}
-
-        for wheel_enum, corner_key in wheel_key_map.items():
-            wheel_state = getattr(snapshot, "wheels", {}).get(wheel_enum)
-            if not wheel_state:
-                continue
-
-            lever_angle = float(getattr(wheel_state, "lever_angle", 0.0))
-            piston_position = float(getattr(wheel_state, "piston_position", 0.0))
-
-            wheels_payload[corner_key] = {
-                "leverAngle": lever_angle,
-                "pistonPosition": piston_position,
-                "pistonVelocity": float(getattr(wheel_state, "piston_velocity", 0.0)),
-                "joint": {
-                    "x": float(getattr(wheel_state, "joint_x", 0.0)),
-                    "y": float(getattr(wheel_state, "joint_y", 0.0)),
-                    "z": float(getattr(wheel_state, "joint_z", 0.0)),
-                },
-                "forces": {
-                    "pneumatic": float(getattr(wheel_state, "force_pneumatic", 0.0)),
-                    "spring": float(getattr(wheel_state, "force_spring", 0.0)),
-                    "damper": float(getattr(wheel_state, "force_damper", 0.0)),
-                },
-            }
-
-            lever_angles[corner_key] = lever_angle
-            piston_positions[corner_key] = piston_position
-
-        line_payload: dict[str, dict[str, Any]] = {}
-        line_flow_network: dict[str, dict[str, Any]] = {}
-        line_magnitudes: dict[str, float] = {}
-        for line_enum in Line:
-            line_state = getattr(snapshot, "lines", {}).get(line_enum)
-            if not line_state:
-                continue
-
-            key = line_enum.value.lower()
-            pressure = float(getattr(line_state, "pressure", 0.0))
-            temperature = float(getattr(line_state, "temperature", 0.0))
-            mass = float(getattr(line_state, "mass", 0.0))
-            flow_atmo = float(getattr(line_state, "flow_atmo", 0.0))
-            flow_tank = float(getattr(line_state, "flow_tank", 0.0))
-            net_flow = flow_atmo - flow_tank
-            direction = "intake" if net_flow >= 0.0 else "exhaust"
-            magnitude = abs(net_flow)
-            valves_state = {
-                "atmosphereOpen": bool(getattr(line_state, "cv_atmo_open", False)),
-                "tankOpen": bool(getattr(line_state, "cv_tank_open", False)),
-            }
-            flows_state = {
-                "fromAtmosphere": flow_atmo,
-                "toTank": flow_tank,
-                "net": net_flow,
-            }
-            line_entry = {
-                "pressure": pressure,
-                "temperature": temperature,
-                "mass": mass,
-                "flows": flows_state,
-                "valves": valves_state,
-                "direction": direction,
-                "netFlow": net_flow,
-                "intensity": magnitude,
-                "flowDirection": direction,
-                "flowIntensity": magnitude,
-            }
-            line_payload[key] = line_entry
-            line_flow_network[key] = {
-                "flows": flows_state,
-                "valves": valves_state,
-                "direction": direction,
-                "netFlow": net_flow,
-                "pressure": pressure,
-                "temperature": temperature,
-                "intensity": magnitude,
-            }
-            line_magnitudes[key] = magnitude
-
-        max_line_magnitude = max(line_magnitudes.values(), default=0.0)
-        line_pressures: dict[str, float] = {}
-        if max_line_magnitude > 0.0:
-            for line_key, magnitude in line_magnitudes.items():
-                speed_ratio = min(max(magnitude / max_line_magnitude, 0.0), 1.0)
-                line_payload[line_key]["animationSpeed"] = speed_ratio
-                line_flow_network[line_key]["animationSpeed"] = speed_ratio
-                line_pressures[line_key] = float(
-                    line_payload[line_key].get("pressure", 0.0)
-                )
-        else:
-            for line_key, entry in line_payload.items():
-                line_pressures[line_key] = float(entry.get("pressure", 0.0))
-
-        tank_state = getattr(snapshot, "tank", {})
-        tank_pressure = float(getattr(tank_state, "pressure", 0.0))
-        tank_temperature = float(getattr(tank_state, "temperature", 0.0))
-        relief_min_flow = float(getattr(tank_state, "flow_min", 0.0))
-        relief_stiff_flow = float(getattr(tank_state, "flow_stiff", 0.0))
-        relief_safety_flow = float(getattr(tank_state, "flow_safety", 0.0))
-        relief_magnitudes = {
-            "min": abs(relief_min_flow),
-            "stiff": abs(relief_stiff_flow),
-            "safety": abs(relief_safety_flow),
-        }
-        max_relief_magnitude = max(relief_magnitudes.values(), default=0.0)
-        relief_payload = {
-            "min": {
-                "open": bool(getattr(tank_state, "relief_min_open", False)),
-                "flow": relief_min_flow,
-                "intensity": relief_magnitudes["min"],
-                "direction": "exhaust" if relief_min_flow >= 0 else "intake",
-            },
-            "stiff": {
-                "open": bool(getattr(tank_state, "relief_stiff_open", False)),
-                "flow": relief_stiff_flow,
-                "intensity": relief_magnitudes["stiff"],
-                "direction": "exhaust" if relief_stiff_flow >= 0 else "intake",
-            },
-            "safety": {
-                "open": bool(getattr(tank_state, "relief_safety_open", False)),
-                "flow": relief_safety_flow,
-                "intensity": relief_magnitudes["safety"],
-                "direction": "exhaust" if relief_safety_flow >= 0 else "intake",
-            },
-        }
-        if max_relief_magnitude > 0.0:
-            for relief_key, magnitude in relief_magnitudes.items():
-                relief_payload[relief_key]["animationSpeed"] = min(
-                    max(magnitude / max_relief_magnitude, 0.0), 1.0
-                )
-        tank_flow_summary = {
-            "min": relief_min_flow,
-            "stiff": relief_stiff_flow,
-            "safety": relief_safety_flow,
-            "total": relief_min_flow + relief_stiff_flow + relief_safety_flow,
-        }
-        tank_valves_state = {
-            "min": relief_payload["min"]["open"],
-            "stiff": relief_payload["stiff"]["open"],
-            "safety": relief_payload["safety"]["open"],
-        }
-        master_isolation_open = bool(getattr(snapshot, "master_isolation_open", False))
+        The model is bound to the QML root's ``simulationModel`` property the
+        first time it is seen for a given root.  Returns ``True`` when the model
+        is bound, i.e. QML reads these values through native bindings.
+        """
 
-        min_line_pressure = (
-            min(line_pressures.values()) if line_pressures else tank_pressure
-        )
-        max_line_pressure = (
-            max(line_pressures.values()) if line_pressures else tank_pressure
+        model = getattr(window, "simulation_state_model", None)
+        if model is None or snapshot is None:
+            return False
+        bound = QMLBridge._bind_simulation_model(window)
+        model.update_from_snapshot(
+            snapshot,
+            is_running=bool(getattr(window, "is_simulation_running", False)),
         )
+        return bound
 
-        receiver_payload = {
-            "pressures": line_pressures,
-            "tankPressure": tank_pressure,
-            "minPressure": min_line_pressure,
-            "maxPressure": max_line_pressure,
-        }
+    @staticmethod
+    def _bind_simulation_model(window: MainWindow) -> bool:
+        model = getattr(window, "simulation_state_model", None)
+        root = getattr(window, "_qml_root_object", None)
+        if model is None or not root:
+            return False
+        binding = getattr(window, "_qml_simulation_model_binding", None)
+        if binding is None or binding[0] != id(root):
+            # setProperty returns False for roots without a declared property
+            binding = (id(root), bool(root.setProperty("simulationModel", model)))
+            window._qml_simulation_model_binding = binding
+        return binding[1]
 
-        check_valves_payload: dict[str, dict[str, Any]] = {}
-        for key, entry in line_flow_network.items():
-            valves = entry.get("valves", {}) if isinstance(entry, dict) else {}
-            check_valves_payload[key] = {
-                "atmosphereOpen": bool(valves.get("atmosphereOpen")),
-                "tankOpen": bool(valves.get("tankOpen")),
-                "netFlow": float(entry.get("netFlow", 0.0))
-                if isinstance(entry, dict)
-                else 0.0,
-                "direction": entry.get("direction", "intake")
-                if isinstance(entry, dict)
-                else "intake",
-            }
-
-        animation_payload = {
-            "timestamp": float(getattr(snapshot, "timestamp", 0.0)),
-            "simulationTime": float(getattr(snapshot, "simulation_time", 0.0)),
-            "frame": {
-                "heave": float(getattr(getattr(snapshot, "frame", {}), "heave", 0.0)),
-                "roll": float(getattr(getattr(snapshot, "frame", {}), "roll", 0.0)),
-                "pitch": float(getattr(getattr(snapshot, "frame", {}), "pitch", 0.0)),
-                "heaveRate": float(
-                    getattr(getattr(snapshot, "frame", {}), "heave_rate", 0.0)
-                ),
-                "rollRate": float(
-                    getattr(getattr(snapshot, "frame", {}), "roll_rate", 0.0)
-                ),
-                "pitchRate": float(
-                    getattr(getattr(snapshot, "frame", {}), "pitch_rate", 0.0)
-                ),
-            },
-            "leverAngles": lever_angles,
-            "pistonPositions": piston_positions,
-            "linePressures": {k: v.get("pressure") for k, v in line_payload.items()},
-            "tankPressure": tank_pressure,
-        }
+    @staticmethod
+    def _snapshot_encoder_for(window: MainWindow, root: Any) -> SnapshotEncoder:
+        """Return the window's encoder, rebuilt (full frame) for a new QML root."""
 
-        three_d_payload = {
-            "wheels": wheels_payload,
-            "lines": line_payload,
-            "tank": {
-                "pressure": tank_pressure,
-                "temperature": tank_temperature,
-                "flows": tank_flow_summary,
-                "valves": tank_valves_state,
-            },
-            "frame": {
-                "heave": float(getattr(getattr(snapshot, "frame", {}), "heave", 0.0)),
-                "roll": float(getattr(getattr(snapshot, "frame", {}), "roll", 0.0)),
-                "pitch": float(getattr(getattr(snapshot, "frame", {}), "pitch", 0.0)),
-            },
-            "valves": {
-                "relief": relief_payload,
-                "check": check_valves_payload,
-                "masterIsolationOpen": master_isolation_open,
-            },
-            "flowNetwork": {
-                "lines": line_flow_network,
-                "relief": relief_payload,
-                "tank": {
-                    "pressure": tank_pressure,
-                    "temperature": tank_temperature,
-                    "flows": tank_flow_summary,
-                    "valves": tank_valves_state,
-                },
-                "receiver": receiver_payload,
-                "masterIsolationOpen": master_isolation_open,
-                "maxLineIntensity": max_line_magnitude,
-                "maxReliefIntensity": max_relief_magnitude,
-                "timestamp": float(getattr(snapshot, "simulation_time", 0.0)),
-            },
-            "receiver": receiver_payload,
-        }
+        encoder = getattr(window, "_qml_snapshot_encoder", None)
+        if encoder is not None and encoder.target_id == id(root):
+            return encoder
 
-        return {"animation": animation_payload, "threeD": three_d_payload}
+        omit: tuple[tuple[str, ...], ...] = ()
+        if QMLBridge._bind_simulation_model(window):
+            omit = window.simulation_state_model.PAYLOAD_PATHS
+        encoder = SnapshotEncoder(omit=omit)
+        encoder.target_id = id(root)
+        window._qml_snapshot_encoder = encoder
+        return encoder
+
+    @staticmethod
+    def _snapshot_to_payload(
+        snapshot: StateSnapshot, *, is_running: bool = False
+    ) -> dict[str, Any]:
+        """Convert a :class:`StateSnapshot` into a complete QML friendly dict."""
+
+        return SnapshotEncoder.full_payload(snapshot, is_running=is_running)
 
     # ------------------------------------------------------------------
     # Function invocation
@@ -860,14 +694,11 @@ class QMLBridge:
     def _track_pending_batch(
         window: MainWindow, batch_id: int, payload: dict[str, Any]
     ) -> None:
-        try:
-            stored_payload = copy.deepcopy(payload)
-        except Exception:
-            stored_payload = dict(payload)
-
+        # Flushed batches are detached from the update queue and never mutated
+        # afterwards; retries copy the category they re-queue
         window._pending_batch_ack = {
             "batch_id": batch_id,
-            "payload": stored_payload,
+            "payload": dict(payload),
             "retries_left": _BATCH_RETRY_LIMIT,
             "issued_at": time.time(),
         }
@@ -983,6 +814,21 @@ class QMLBridge:
             )
         return False, False, failed, unknown, True
 
+    @staticmethod
+    def _prepare_batch(updates: dict[str, Any]) -> dict[str, Any]:
+        """Sanitise a batch, passing :attr:`QML_READY_CATEGORIES` through as-is."""
+
+        result: dict[str, Any] = {}
+        ready = QMLBridge.QML_READY_CATEGORIES
+        for key, raw in updates.items():
+            str_key = str(key)
+            prepared = raw if str_key in ready else QMLBridge._prepare_for_qml(raw)
+            result[str_key] = prepared
+            camel_key = QMLBridge._snake_to_camel(str_key)
+            if camel_key != str_key and camel_key not in result:
+                result[camel_key] = prepared
+        return result
+
     @staticmethod
     def _prepare_for_qml(value: Any) -> Any:
         """Normalise Python objects so they can be passed into QML."""
@@ -1003,15 +849,14 @@ class QMLBridge:
         if isinstance(value, (list, tuple)):
             return [QMLBridge._prepare_for_qml(i) for i in value]
 
-        try:  # NumPy conversion support
-            import numpy as np
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
 
-            if isinstance(value, np.generic):
+        if _np is not None:
+            if isinstance(value, _np.generic):
                 return value.item()
             if hasattr(value, "tolist") and callable(value.tolist):
                 return QMLBridge._prepare_for_qml(value.tolist())
-        except Exception:  # pragma: no cover - optional dependency
-            pass
 
         if isinstance(value, Path):
             return str(value)
@@ -1019,6 +864,7 @@ class QMLBridge:
         return value
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _snake_to_camel(key: str) -> str:
         if "_" not in key:
             return key
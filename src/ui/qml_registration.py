@@ -73,11 +73,18 @@ def register_qml_types() -> None:
 
     _call_qml_register_module(qml_register_module, "PneumoStabSim")
 
+    from src.ui.bridge.simulation_state_model import SimulationStateModel
     from src.ui.scene_bridge import SceneBridge
 
     _call_qml_register_type(
         qml_register_type, SceneBridge, "PneumoStabSim", "SceneBridge"
     )
+    _call_qml_register_type(
+        qml_register_type,
+        SimulationStateModel,
+        "PneumoStabSim",
+        "SimulationStateModel",
+    )
 
     for module_name in _QML_ELEMENT_MODULES:
         import_module(module_name)
@@ -124,13 +131,15 @@ def register_qml_types() -> None:
             scene_bridge = getattr(window, "_scene_bridge", None)
             if scene_bridge is not None and snapshot is not None:
                 try:
-                    payload = _qml_bridge.QMLBridge._snapshot_to_payload(snapshot)
-                    animation_section = payload.setdefault("animation", {})
-                    animation_section["isRunning"] = bool(
-                        getattr(window, "is_simulation_running", False)
+                    # SceneBridge replaces whole categories, so always send
+                    # complete frames (already QML-ready, no sanitising needed)
+                    payload = _qml_bridge.QMLBridge._snapshot_to_payload(
+                        snapshot,
+                        is_running=bool(
+                            getattr(window, "is_simulation_running", False)
+                        ),
                     )
-                    sanitized = _qml_bridge.QMLBridge._prepare_for_qml(payload)
-                    scene_bridge.dispatch_updates(sanitized)
+                    scene_bridge.dispatch_updates(payload)
                     return True
                 except Exception as exc:
                     _qml_bridge.QMLBridge.logger.error(
@@ -0,0 +1,432 @@
+"""Precompiled encoder turning :class:`StateSnapshot` objects into QML payloads.
+
+The payload layout consumed by ``SimulationRoot.qml`` (``animation`` and
+``threeD`` categories) is compiled once into a flat list of fields.  Each field
+knows every nested path it is published under (values such as line pressures
+appear in several sections) and the quantum below which a change is not worth
+sending.
+
+:class:`SnapshotEncoder` emits either a *full frame* containing every field or
+a *delta frame* containing only the fields that moved by more than their
+quantum since the last acknowledged frame.  Keys are camelCase only and all
+values are plain ``float``/``bool``/``str`` objects, so the payload can be
+handed to QML without further sanitising.  QML deep-merges ``threeD`` and
+reads ``animation`` field by field, which makes delta frames safe; callers fall
+back to full frames whenever the receiving side may have lost state.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from src.pneumo.enums import Line, Wheel
+from src.runtime.state import StateSnapshot
+
+__all__ = ["DEFAULT_QUANTA", "SnapshotEncoder", "SnapshotFrame"]
+
+
+#: Smallest change per field kind that is sent in a delta frame.  ``0.0``
+#: compares exactly (used for flags, labels and timestamps).
+DEFAULT_QUANTA: Mapping[str, float] = {
+    "angle": 1e-5,  # rad
+    "position": 1e-6,  # m
+    "velocity": 1e-5,  # m/s, rad/s
+    "force": 1e-2,  # N
+    "pressure": 0.5,  # Pa
+    "temperature": 1e-3,  # K
+    "mass": 1e-9,  # kg
+    "flow": 1e-7,  # kg/s
+    "ratio": 1e-3,
+    "exact": 0.0,
+}
+
+_CORNERS: tuple[tuple[Wheel, str], ...] = (
+    (Wheel.LP, "fl"),
+    (Wheel.PP, "fr"),
+    (Wheel.LZ, "rl"),
+    (Wheel.PZ, "rr"),
+)
+_LINES: tuple[tuple[Line, str], ...] = tuple(
+    (line, line.value.lower()) for line in Line
+)
+_RELIEFS: tuple[str, ...] = ("min", "stiff", "safety")
+
+_Path = tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Field:
+    paths: tuple[_Path, ...]
+    kind: str
+
+
+def _compile_schema() -> tuple[_Field, ...]:
+    """Describe every published value in the order :func:`_extract` emits them."""
+
+    fields: list[_Field] = []
+
+    def add(kind: str, *paths: _Path) -> None:
+        fields.append(_Field(paths=paths, kind=kind))
+
+    anim: _Path = ("animation",)
+    three: _Path = ("threeD",)
+    net: _Path = ("threeD", "flowNetwork")
+    receivers = (three + ("receiver",), net + ("receiver",))
+    tanks = (three + ("tank",), net + ("tank",))
+    reliefs = (three + ("valves", "relief"), net + ("relief",))
+
+    add("exact", anim + ("timestamp",))
+    add("exact", anim + ("simulationTime",), net + ("timestamp",))
+    add("exact", anim + ("isRunning",))
+    for name in ("heave", "roll", "pitch"):
+        kind = "position" if name == "heave" else "angle"
+        add(kind, anim + ("frame", name), three + ("frame", name))
+    for name in ("heaveRate", "rollRate", "pitchRate"):
+        add("velocity", anim + ("frame", name))
+
+    for _, corner in _CORNERS:
+        wheel = three + ("wheels", corner)
+        add("angle", wheel + ("leverAngle",), anim + ("leverAngles", corner))
+        add(
+            "position",
+            wheel + ("pistonPosition",),
+            anim + ("pistonPositions", corner),
+        )
+        add("velocity", wheel + ("pistonVelocity",))
+        for axis in ("x", "y", "z"):
+            add("position", wheel + ("joint", axis))
+        for force in ("pneumatic", "spring", "damper"):
+            add("force", wheel + ("forces", force))
+
+    for _, key in _LINES:
+        line = three + ("lines", key)
+        flow = net + ("lines", key)
+        check = three + ("valves", "check", key)
+        add(
+            "pressure",
+            line + ("pressure",),
+            flow + ("pressure",),
+            anim + ("linePressures", key),
+            *(receiver + ("pressures", key) for receiver in receivers),
+        )
+        add("temperature", line + ("temperature",), flow + ("temperature",))
+        add("mass", line + ("mass",))
+        add(
+            "flow",
+            line + ("flows", "fromAtmosphere"),
+            flow + ("flows", "fromAtmosphere"),
+        )
+        add("flow", line + ("flows", "toTank"), flow + ("flows", "toTank"))
+        add(
+            "flow",
+            line + ("flows", "net"),
+            line + ("netFlow",),
+            flow + ("flows", "net"),
+            flow + ("netFlow",),
+            check + ("netFlow",),
+        )
+        add(
+            "exact",
+            line + ("direction",),
+            line + ("flowDirection",),
+            flow + ("direction",),
+            check + ("direction",),
+        )
+        add(
+            "flow",
+            line + ("intensity",),
+            line + ("flowIntensity",),
+            flow + ("intensity",),
+        )
+        add("ratio", line + ("animationSpeed",), flow + ("animationSpeed",))
+        for valve in ("atmosphereOpen", "tankOpen"):
+            add(
+                "exact",
+                line + ("valves", valve),
+                flow + ("valves", valve),
+                check + (valve,),
+            )
+
+    add(
+        "pressure",
+        *(tank + ("pressure",) for tank in tanks),
+        *(receiver + ("tankPressure",) for receiver in receivers),
+        anim + ("tankPressure",),
+    )
+    add("temperature", *(tank + ("temperature",) for tank in tanks))
+    for relief in _RELIEFS:
+        add(
+            "flow",
+            *(tank + ("flows", relief) for tank in tanks),
+            *(group + (relief, "flow") for group in reliefs),
+        )
+        add(
+            "exact",
+            *(tank + ("valves", relief) for tank in tanks),
+            *(group + (relief, "open") for group in reliefs),
+        )
+        add("flow", *(group + (relief, "intensity") for group in reliefs))
+        add("exact", *(group + (relief, "direction") for group in reliefs))
+        add("ratio", *(group + (relief, "animationSpeed") for group in reliefs))
+    add("flow", *(tank + ("flows", "total") for tank in tanks))
+    add(
+        "exact",
+        three + ("valves", "masterIsolationOpen"),
+        net + ("masterIsolationOpen",),
+    )
+    add("pressure", *(receiver + ("minPressure",) for receiver in receivers))
+    add("pressure", *(receiver + ("maxPressure",) for receiver in receivers))
+    add("flow", net + ("maxLineIntensity",))
+    add("flow", net + ("maxReliefIntensity",))
+    return tuple(fields)
+
+
+_SCHEMA: tuple[_Field, ...] = _compile_schema()
+
+#: Values emitted per corner; a missing wheel is padded with exactly this many
+#: placeholders so every later field stays aligned with the schema
+_CORNER_WIDTH = sum(
+    1 for field in _SCHEMA if field.paths[0][:3] == ("threeD", "wheels", _CORNERS[0][1])
+)
+#: Placeholder values for a missing line, in :func:`_extract` order
+_MISSING_LINE: tuple[Any, ...] = (0.0,) * 6 + ("intake", 0.0, 0.0) + (False,) * 2
+
+
+def _extract(snapshot: StateSnapshot, is_running: bool) -> list[Any]:
+    """Read every schema value from ``snapshot`` in schema order."""
+
+    frame = snapshot.frame
+    values: list[Any] = [
+        float(snapshot.timestamp),
+        float(snapshot.simulation_time),
+        bool(is_running),
+        float(frame.heave),
+        float(frame.roll),
+        float(frame.pitch),
+        float(frame.heave_rate),
+        float(frame.roll_rate),
+        float(frame.pitch_rate),
+    ]
+    append = values.append
+
+    wheels = snapshot.wheels
+    for wheel_enum, _ in _CORNERS:
+        wheel = wheels.get(wheel_enum)
+        if wheel is None:
+            values.extend((0.0,) * _CORNER_WIDTH)
+            continue
+        append(float(wheel.lever_angle))
+        append(float(wheel.piston_position))
+        append(float(wheel.piston_velocity))
+        append(float(wheel.joint_x))
+        append(float(wheel.joint_y))
+        append(float(wheel.joint_z))
+        append(float(wheel.force_pneumatic))
+        append(float(wheel.force_spring))
+        append(float(wheel.force_damper))
+
+    lines = snapshot.lines
+    line_states = [lines.get(line_enum) for line_enum, _ in _LINES]
+    magnitudes = [
+        abs(float(state.flow_atmo) - float(state.flow_tank)) if state else 0.0
+        for state in line_states
+    ]
+    max_line = max(magnitudes, default=0.0)
+    pressures: list[float] = []
+    for state, magnitude in zip(line_states, magnitudes):
+        if state is None:
+            pressures.append(0.0)
+            values.extend(_MISSING_LINE)
+            continue
+        pressure = float(state.pressure)
+        flow_atmo = float(state.flow_atmo)
+        flow_tank = float(state.flow_tank)
+        net_flow = flow_atmo - flow_tank
+        pressures.append(pressure)
+        append(pressure)
+        append(float(state.temperature))
+        append(float(state.mass))
+        append(flow_atmo)
+        append(flow_tank)
+        append(net_flow)
+        append("intake" if net_flow >= 0.0 else "exhaust")
+        append(magnitude)
+        append(min(magnitude / max_line, 1.0) if max_line > 0.0 else 0.0)
+        append(bool(state.cv_atmo_open))
+        append(bool(state.cv_tank_open))
+
+    tank = snapshot.tank
+    tank_pressure = float(tank.pressure)
+    append(tank_pressure)
+    append(float(tank.temperature))
+    relief_flows = (
+        float(tank.flow_min),
+        float(tank.flow_stiff),
+        float(tank.flow_safety),
+    )
+    relief_open = (
+        bool(tank.relief_min_open),
+        bool(tank.relief_stiff_open),
+        bool(tank.relief_safety_open),
+    )
+    max_relief = max(abs(flow) for flow in relief_flows)
+    for flow, is_open in zip(relief_flows, relief_open):
+        append(flow)
+        append(is_open)
+        append(abs(flow))
+        append("exhaust" if flow >= 0 else "intake")
+        append(min(abs(flow) / max_relief, 1.0) if max_relief > 0.0 else 0.0)
+    append(sum(relief_flows))
+    append(bool(snapshot.master_isolation_open))
+    append(min(pressures) if pressures else tank_pressure)
+    append(max(pressures) if pressures else tank_pressure)
+    append(max_line)
+    append(max_relief)
+    return values
+
+
+@dataclass(slots=True)
+class SnapshotFrame:
+    """Encoded payload plus the bookkeeping needed to acknowledge it."""
+
+    payload: dict[str, Any]
+    full: bool
+    changed: tuple[int, ...]
+    values: list[Any]
+
+    def __bool__(self) -> bool:
+        return bool(self.payload)
+
+
+_PATHS: tuple[tuple[_Path, ...], ...] = tuple(field.paths for field in _SCHEMA)
+
+
+def _build(
+    indices: Any,
+    values: list[Any],
+    paths: tuple[tuple[_Path, ...], ...] = _PATHS,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {}
+    for index in indices:
+        value = values[index]
+        for path in paths[index]:
+            node = payload
+            for key in path[:-1]:
+                child = node.get(key)
+                if child is None:
+                    child = node[key] = {}
+                node = child
+            node[path[-1]] = value
+    return payload
+
+
+class SnapshotEncoder:
+    """Stateful snapshot encoder producing full or delta QML frames.
+
+    Args:
+        keyframe_interval: Send a full frame after this many delta frames so
+            QML state that was reset or lost converges again; ``0`` disables
+            periodic keyframes
+        quanta: Per-kind overrides for :data:`DEFAULT_QUANTA`
+        omit: Payload path prefixes published through another channel (for
+            example a bound :class:`~src.ui.bridge.SimulationStateModel`); they are never
+            encoded
+    """
+
+    def __init__(
+        self,
+        *,
+        keyframe_interval: int = 240,
+        quanta: Mapping[str, float] | None = None,
+        omit: Iterable[tuple[str, ...]] = (),
+    ) -> None:
+        merged = dict(DEFAULT_QUANTA)
+        if quanta:
+            merged.update(quanta)
+        prefixes = tuple(tuple(prefix) for prefix in omit)
+        self._paths = tuple(
+            tuple(
+                path
+                for path in paths
+                if not any(path[: len(prefix)] == prefix for prefix in prefixes)
+            )
+            for paths in _PATHS
+        )
+        self._active = tuple(index for index, paths in enumerate(self._paths) if paths)
+        self._checks = tuple(
+            (index, merged[_SCHEMA[index].kind]) for index in self._active
+        )
+        self._keyframe_interval = max(0, int(keyframe_interval))
+        self._acked: list[Any] | None = None
+        self._deltas_since_keyframe = 0
+        self.target_id: int | None = None
+
+    @property
+    def synchronised(self) -> bool:
+        """Whether a full frame has been acknowledged since the last reset."""
+
+        return self._acked is not None
+
+    @staticmethod
+    def full_payload(snapshot: StateSnapshot, *, is_running: bool = False) -> dict:
+        """Return a complete payload without touching any encoder state."""
+
+        return _build(range(len(_SCHEMA)), _extract(snapshot, is_running))
+
+    def encode(
+        self,
+        snapshot: StateSnapshot,
+        *,
+        is_running: bool = False,
+        full: bool = False,
+    ) -> SnapshotFrame:
+        """Encode ``snapshot`` against the last acknowledged frame."""
+
+        values = _extract(snapshot, is_running)
+        acked = self._acked
+        keyframe_due = (
+            self._keyframe_interval
+            and self._deltas_since_keyframe >= self._keyframe_interval
+        )
+        if full or acked is None or keyframe_due:
+            changed = self._active
+            return SnapshotFrame(
+                _build(changed, values, self._paths), True, changed, values
+            )
+
+        changed_list: list[int] = []
+        for index, quantum in self._checks:
+            new = values[index]
+            old = acked[index]
+            if new == old:
+                continue
+            if quantum and abs(new - old) <= quantum:
+                continue
+            changed_list.append(index)
+        changed = tuple(changed_list)
+        return SnapshotFrame(
+            _build(changed, values, self._paths), False, changed, values
+        )
+
+    def acknowledge(self, frame: SnapshotFrame) -> None:
+        """Record ``frame`` as delivered; later deltas are relative to it."""
+
+        if frame.full or self._acked is None:
+            self._acked = list(frame.values)
+            self._deltas_since_keyframe = 0
+            return
+        acked = self._acked
+        values = frame.values
+        # Unsent fields keep their old baseline so slow drift still crosses
+        # the quantum eventually
+        for index in frame.changed:
+            acked[index] = values[index]
+        self._deltas_since_keyframe += 1
+
+    def reset(self) -> None:
+        """Force the next frame to be a full frame (resync)."""
+
+        self._acked = None
+        self._deltas_since_keyframe = 0
@@ -0,0 +1,133 @@
+"""Per-step allocations and GC pressure of the PhysicsWorker step loop."""
+
+from __future__ import annotations
+
+import gc
+import json
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.physics.integrator import create_default_rigid_body
+from src.physics.pneumo_system import PneumaticSystem as RuntimePneumaticSystem
+from src.road.engine import create_road_input_from_preset
+from src.runtime import sim_loop
+from src.runtime.sim_loop import PhysicsWorker
+from src.runtime.steps.context import LeverDynamicsConfig
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+WARMUP_STEPS = 20
+MEASURED_STEPS = 300
+
+
+def _make_worker(monkeypatch: pytest.MonkeyPatch, *, low_allocation: bool):
+    # The persisted settings are not needed: physics objects are attached below.
+    monkeypatch.setattr(
+        PhysicsWorker,
+        "_load_initial_settings",
+        lambda self: setattr(self, "dt_physics", 1e-3),
+    )
+    worker = PhysicsWorker()
+    structure, gas_network = build_default_system_and_network()
+    worker.gas_network = gas_network
+    worker.pneumatic_system = RuntimePneumaticSystem(structure, gas_network)
+    worker.rigid_body = create_default_rigid_body()
+    worker.physics_state = np.zeros(6)
+    road_input = create_road_input_from_preset("test_sine")
+    road_input.prime()
+    worker.road_input = road_input
+    worker.receiver_volume = gas_network.tank.V
+    worker.receiver_volume_mode = "MANUAL"
+    worker._lever_config = LeverDynamicsConfig(
+        spring_constant=50_000.0,
+        damper_coefficient=2_000.0,
+        damper_threshold=50.0,
+        lever_inertia=50.0 * 0.75 * 0.75,
+    )
+    for wheel, cylinder in worker.pneumatic_system.cylinders.items():
+        worker._prev_piston_positions[wheel] = cylinder.x
+    worker.low_allocation = low_allocation
+    return worker
+
+
+def _measure(worker: PhysicsWorker, monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Count the objects the step loop builds and the GC runs they trigger.
+
+    Counted per run of ``MEASURED_STEPS``: step contexts, road-input dicts and
+    lever-config copies — the per-step objects low-allocation mode reuses.
+    """
+
+    for _ in range(WARMUP_STEPS):
+        worker._execute_physics_step()
+
+    allocations = {"step_contexts": 0, "road_inputs": 0, "lever_configs": 0}
+    collections = [0, 0, 0]
+
+    def _counted(name: str, factory: Callable[..., Any]) -> Callable[..., Any]:
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            allocations[name] += 1
+            return factory(*args, **kwargs)
+
+        return _wrapper
+
+    def _count(phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            collections[info["generation"]] += 1
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            sim_loop,
+            "PhysicsStepState",
+            _counted("step_contexts", sim_loop.PhysicsStepState),
+        )
+        patch.setattr(sim_loop, "replace", _counted("lever_configs", sim_loop.replace))
+        patch.setattr(
+            worker,
+            "_get_road_inputs",
+            _counted("road_inputs", worker._get_road_inputs),
+        )
+        gc.collect()
+        gc.callbacks.append(_count)
+        try:
+            for _ in range(MEASURED_STEPS):
+                worker._execute_physics_step()
+        finally:
+            gc.callbacks.remove(_count)
+
+    return {
+        "steps": MEASURED_STEPS,
+        "allocations": allocations,
+        "gc_collections": collections,
+    }
+
+
+@pytest.mark.performance
+def test_low_allocation_mode_matches_default_and_reuses_step_objects(
+    monkeypatch, tmp_path
+) -> None:
+    default = _make_worker(monkeypatch, low_allocation=False)
+    reused = _make_worker(monkeypatch, low_allocation=True)
+
+    before = _measure(default, monkeypatch)
+    after = _measure(reused, monkeypatch)
+
+    np.testing.assert_array_equal(reused.physics_state, default.physics_state)
+    for wheel, state in default._latest_wheel_states.items():
+        assert reused._latest_wheel_states[wheel].lever_angle == state.lever_angle
+    assert reused._step_context is not None
+    assert reused._step_context.last_road_inputs is reused._last_road_inputs
+
+    report_path = tmp_path / "physics_step_allocation.json"
+    report_path.write_text(
+        json.dumps({"default": before, "low_allocation": after}, indent=2),
+        encoding="utf-8",
+    )
+
+    assert before["allocations"] == dict.fromkeys(
+        ("step_contexts", "road_inputs", "lever_configs"), MEASURED_STEPS
+    )
+    assert after["allocations"] == dict.fromkeys(
+        ("step_contexts", "road_inputs", "lever_configs"), 0
+    )
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from jsonschema import Draft202012Validator
+
+from src.core.settings_models import (
+    DiagnosticsSettings,
+    ModesPhysicsSettings,
+    SimulationSettings,
+)
+from src.physics.odes import BODY_INTEGRATION_SCHEMES
+from src.runtime.steps.trace import TRACE_SUBSYSTEMS
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCHEMA_PATH = REPO_ROOT / "schemas" / "settings" / "app_settings.schema.json"
+BASELINE_PATH = REPO_ROOT / "config" / "baseline" / "app_settings.json"
+
+_SIMULATION = {
+    "physics_dt": 0.001,
+    "render_vsync_hz": 60.0,
+    "max_steps_per_frame": 10,
+    "max_frame_time": 0.05,
+}
+
+
+def _validator(definition: str) -> Draft202012Validator:
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return Draft202012Validator(
+        {"$defs": schema["$defs"], "$ref": f"#/$defs/{definition}"}
+    )
+
+
+def _baseline(*path: str) -> list[Any]:
+    payload = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    blocks = []
+    for section in ("current", "defaults_snapshot"):
+        node = payload[section]
+        for key in path:
+            node = node[key]
+        blocks.append(node)
+    return blocks
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"low_allocation": True}, {"state_publish_hz": 30.0}, {"state_publish_hz": None}],
+)
+def test_simulation_runtime_options_are_declared(options: dict[str, Any]) -> None:
+    payload = {**_SIMULATION, **options}
+    schema_payload = {**payload, "sim_speed": 1.0}
+    assert not list(_validator("SimulationSettings").iter_errors(schema_payload))
+
+    model = SimulationSettings.model_validate(payload)
+    for key, value in options.items():
+        assert getattr(model, key) == value
+
+
+def test_simulation_runtime_option_defaults_are_shipped() -> None:
+    for block in _baseline("simulation"):
+        assert block["low_allocation"] is False
+        assert block["state_publish_hz"] is None
+
+
+def test_negative_state_publish_rate_is_rejected() -> None:
+    payload = {**_SIMULATION, "sim_speed": 1.0, "state_publish_hz": -1.0}
+    assert list(_validator("SimulationSettings").iter_errors(payload))
+    with pytest.raises(ValueError):
+        SimulationSettings.model_validate({**_SIMULATION, "state_publish_hz": -1.0})
+
+
+def test_physics_trace_settings_are_declared() -> None:
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    subsystems = schema["$defs"]["PhysicsTraceSettings"]["properties"]["subsystems"]
+    assert tuple(subsystems["anyOf"][0]["items"]["enum"]) == TRACE_SUBSYSTEMS
+
+    validator = _validator("PhysicsTraceSettings")
+    assert not list(validator.iter_errors({"sample_every": 4, "subsystems": ["gas"]}))
+    assert list(validator.iter_errors({"sample_every": 0}))
+    assert list(validator.iter_errors({"subsystems": ["solver"]}))
+
+    for block in _baseline("diagnostics"):
+        assert not list(validator.iter_errors(block["physics_trace"]))
+        settings = DiagnosticsSettings.model_validate(block)
+        assert settings.physics_trace is not None
+        assert settings.physics_trace.sample_every == 1
+
+
+_MODES_PHYSICS = {
+    "include_springs": True,
+    "include_dampers": True,
+    "include_pneumatics": True,
+    "include_springs_kinematics": False,
+    "include_dampers_kinematics": False,
+    "spring_constant": 50_000.0,
+    "damper_coefficient": 2_000.0,
+    "lever_inertia_multiplier": 1.0,
+    "damper_force_threshold_n": 50.0,
+    "spring_rest_position_m": 0.0,
+    "integrator_method": "rk4",
+}
+
+
+@pytest.mark.parametrize(
+    ("options", "valid"),
+    [
+        ({"kinematics_kernel": "scalar"}, True),
+        ({"kinematics_kernel": "simd"}, False),
+        ({"kinematics_lookup": "cubic", "kinematics_lookup_tolerance": 1e-6}, True),
+        ({"kinematics_lookup": "spline"}, False),
+        ({"kinematics_lookup_tolerance": 0.0}, False),
+        ({"body_integrator": "radau"}, True),
+        ({"body_integrator": "implicit_midpoint"}, True),
+        ({"body_integrator": "rk45"}, False),
+    ],
+)
+def test_modes_physics_options_are_declared(
+    options: dict[str, Any], valid: bool
+) -> None:
+    payload = {**_MODES_PHYSICS, **options}
+    errors = list(_validator("ModesPhysicsSettings").iter_errors(payload))
+    assert not errors if valid else errors
+
+    if valid:
+        model = ModesPhysicsSettings.model_validate(payload)
+        for key, value in options.items():
+            assert getattr(model, key) == value
+    else:
+        with pytest.raises(ValueError):
+            ModesPhysicsSettings.model_validate(payload)
+
+
+def test_modes_physics_option_defaults_match_the_worker() -> None:
+    defaults = ModesPhysicsSettings.model_validate(_MODES_PHYSICS)
+    assert defaults.kinematics_kernel == "vectorized"
+    assert defaults.kinematics_lookup == "off"
+    assert defaults.kinematics_lookup_tolerance == pytest.approx(1e-9)
+    assert defaults.body_integrator == "rk4"
+    for block in _baseline("modes", "physics"):
+        assert block["kinematics_kernel"] == "vectorized"
+        assert block["kinematics_lookup"] == "off"
+        assert block["kinematics_lookup_tolerance"] == pytest.approx(1e-9)
+        assert block["body_integrator"] == "rk4"
+
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    body = schema["$defs"]["ModesPhysicsSettings"]["properties"]["body_integrator"]
+    assert body["enum"] == ["radau", *BODY_INTEGRATION_SCHEMES]
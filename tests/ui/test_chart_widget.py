@@ -0,0 +1,63 @@
+"""Incremental, pixel-decimated updates in the QtCharts ChartWidget."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip(
+    "PySide6.QtCharts",
+    reason="PySide6 QtCharts module is required for chart widget tests",
+    exc_type=ImportError,
+)
+
+from src.pneumo.enums import Line
+from src.runtime.state import StateSnapshot
+from src.ui.charts import ChartWidget
+
+
+def _snapshot(time_s: float, pressure: float, heave: float = 0.0) -> StateSnapshot:
+    snapshot = StateSnapshot()
+    snapshot.simulation_time = time_s
+    for line in Line:
+        snapshot.lines[line].pressure = pressure
+    snapshot.tank.pressure = pressure
+    snapshot.frame.heave = heave
+    return snapshot
+
+
+@pytest.mark.usefixtures("qapp")
+def test_series_hold_at_most_two_points_per_pixel_column() -> None:
+    widget = ChartWidget()
+    for group in widget._groups.values():
+        group.set_plot_width(20)
+
+    # 30 s at 1 kHz with a single spike; the window shows the last 10 s
+    for step in range(30_000):
+        pressure = 150_000.0 if step == 25_000 else 100_000.0 + step % 7
+        widget.update_from_snapshot(_snapshot(step * 0.001, pressure))
+
+    series = widget.pressure_series["A1"]
+    points = series.points()
+    assert len(points) <= 2 * 21
+    assert points[0].x() >= 20.0 - 0.5
+    assert max(point.y() for point in points) == 150_000.0
+    assert min(point.y() for point in points) == 100_000.0
+
+    # Y axis follows the running extremes of the visible window
+    assert widget.pressure_y_axis.max() > 150_000.0
+    assert widget.pressure_y_axis.min() < 100_000.0
+    assert widget.pressure_x_axis.max() == pytest.approx(29.99, abs=0.5)
+
+
+@pytest.mark.usefixtures("qapp")
+def test_time_reset_and_clear_drop_drawn_points() -> None:
+    widget = ChartWidget()
+    for step in range(20):
+        widget.update_from_snapshot(_snapshot(step * 0.05, 100_000.0, heave=0.01))
+    assert widget.dynamics_series["heave"].count() > 0
+
+    widget.update_from_snapshot(_snapshot(0.0, 100_000.0))
+    assert widget.dynamics_series["heave"].count() == 0
+
+    widget.clear_data()
+    assert all(series.count() == 0 for series in widget.flow_series.values())
@@ -0,0 +1,81 @@
+"""Typed SimulationStateModel and its binding through QMLBridge."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from PySide6.QtCore import QObject, QUrl
+from PySide6.QtQml import QQmlApplicationEngine
+
+from src.pneumo.enums import Line, Wheel
+from src.runtime.state import StateSnapshot
+from src.ui.bridge import SimulationStateModel
+from src.ui.qml_bridge import QMLBridge
+
+
+@pytest.mark.usefixtures("qapp")
+def test_model_exposes_typed_properties_and_notifies_changed_groups() -> None:
+    model = SimulationStateModel()
+    changed: list[str] = []
+    for group in ("frame", "fl", "fr", "a1", "tank"):
+        getattr(model, f"{group}Changed").connect(
+            lambda group=group: changed.append(group)
+        )
+
+    snapshot = StateSnapshot()
+    snapshot.wheels[Wheel.LP].lever_angle = 0.1
+    snapshot.lines[Line.A1].pressure = 120_000.0
+    assert model.update_from_snapshot(snapshot) == 2
+    assert sorted(changed) == ["a1", "fl"]
+    assert model.property("flLeverAngle") == pytest.approx(0.1)
+    assert model.property("a1Pressure") == pytest.approx(120_000.0)
+    assert model.value("fr", "leverAngle") == 0.0
+
+    # An unchanged snapshot is free: no signal reaches QML
+    assert model.update_from_snapshot(snapshot) == 0
+
+    meta = model.metaObject()
+    prop = meta.property(meta.indexOfProperty("rrPistonPosition"))
+    assert prop.typeName() == "double"
+    assert bytes(prop.notifySignal().name()) == b"rrChanged"
+
+
+@pytest.fixture
+def main_root(qapp):
+    engine = QQmlApplicationEngine()
+    engine.addImportPath(str(Path("assets/qml").resolve()))
+    engine.load(QUrl.fromLocalFile(str(Path("assets/qml/main.qml").resolve())))
+    assert engine.rootObjects(), "main.qml should produce a root object"
+    yield engine.rootObjects()[0]
+    engine.deleteLater()
+
+
+def test_bridge_binds_model_through_main_qml_to_rig(main_root) -> None:
+    model = SimulationStateModel()
+    window = SimpleNamespace(
+        _qml_root_object=main_root,
+        simulation_state_model=model,
+        is_simulation_running=False,
+    )
+    snapshot = StateSnapshot()
+    snapshot.frame.heave = 0.02
+    snapshot.wheels[Wheel.LP].lever_angle = 0.1
+    snapshot.wheels[Wheel.PZ].piston_position = 0.05
+
+    assert QMLBridge.set_simulation_state(window, snapshot)
+    scene = main_root.findChild(QObject, "simulationLoader").property("item")
+    assert scene.property("simulationModel") is model
+    rig = scene.findChild(QObject, "rigAnimation")
+    assert rig.property("frameHeave") == pytest.approx(0.02)
+    assert rig.property("flAngleRad") == pytest.approx(0.1)
+    assert rig.property("pistonRr") == pytest.approx(0.05)
+
+    # Later frames follow the model's notify signals, not the payload
+    snapshot.frame.heave = 0.03
+    assert QMLBridge.set_simulation_state(window, snapshot)
+    assert rig.property("frameHeave") == pytest.approx(0.03)
+    payload = main_root.property("pendingPythonUpdates")
+    assert "frame" not in payload["threeD"]
+    assert "leverAngles" not in payload["animation"]
@@ -106,3 +106,27 @@ def test_pause_and_reset_behaviour():
     exported = bridge.exportSeries(["pressure.a1"])
     assert exported["series"] == {}
     assert exported["oldestTimestamp"] == 0.0
+
+
+def test_export_resolution_decimates_long_histories():
+    bridge = TelemetryDataBridge(max_samples=5000)
+    bridge.setActiveMetrics([])  # no per-sample signals, only the history
+    for idx in range(6000):
+        pressure = 100000.0 + (50000.0 if idx == 4321 else idx % 10)
+        bridge.push_snapshot(_make_snapshot(idx * 0.01, pressures={Line.A1: pressure}))
+
+    raw = bridge.exportSeries(["pressure.a1"])
+    assert len(raw["series"]["pressure.a1"]) == 5000
+    assert math.isclose(raw["oldestTimestamp"], 10.0)
+
+    spy = SignalListener(bridge.exportResolutionChanged)
+    bridge.setExportResolution(200)
+    assert len(spy) == 1
+    decimated = bridge.exportSeries(["pressure.a1"])
+    points = decimated["series"]["pressure.a1"]
+    assert len(points) <= 2 * 200 + 2
+    values = [point["value"] for point in points]
+    assert max(values) == 150000.0, "min/max decimation must keep spikes"
+    assert min(values) == 100000.0
+    assert math.isclose(points[0]["timestamp"], 10.0)
+    assert math.isclose(points[-1]["timestamp"], decimated["latestTimestamp"])
@@ -0,0 +1,138 @@
+"""Batched settings writes and the write-behind persister."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.common.settings_manager import SettingsManager
+from src.core.settings_persister import SettingsPersister
+from src.core.settings_service import SettingsService
+
+
+def _write_settings(path: Path) -> Path:
+    payload = {
+        "metadata": {},
+        "current": {"simulation": {"physics_dt": 0.001, "max_steps": 10}},
+        "defaults_snapshot": {},
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def _read_current(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))["current"]
+
+
+def test_persister_coalesces_submissions_into_one_write() -> None:
+    written: list[int] = []
+    persister = SettingsPersister(written.append, interval=60.0)
+
+    for value in range(50):
+        persister.submit(value)
+    assert persister.pending
+    assert written == []
+
+    assert persister.flush(timeout=5.0)
+    assert written == [49]
+    assert persister.writes == 1
+    persister.close(timeout=5.0)
+    with pytest.raises(RuntimeError):
+        persister.submit(50)
+
+
+def test_persister_writes_off_the_calling_thread_and_reports_errors() -> None:
+    threads: list[threading.Thread] = []
+
+    def _write(payload: str) -> None:
+        threads.append(threading.current_thread())
+        if payload == "bad":
+            raise ValueError("schema violation")
+
+    persister = SettingsPersister(_write, interval=0.0)
+    persister.submit("good")
+    persister.flush(timeout=5.0)
+    persister.submit("bad")
+    with pytest.raises(ValueError):
+        persister.flush(timeout=5.0)
+
+    assert threads and all(t is not threading.current_thread() for t in threads)
+    persister.close(timeout=5.0)
+
+
+def test_service_batch_saves_once_and_rolls_back(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings_file = _write_settings(tmp_path / "app_settings.json")
+    service = SettingsService(settings_file, validate_schema=False)
+    saves: list[dict] = []
+    original_save = service.save
+    monkeypatch.setattr(
+        service,
+        "save",
+        lambda payload, **kw: saves.append(kw) or original_save(payload, **kw),
+    )
+
+    with service.batch():
+        service.set("current.simulation.physics_dt", 0.002)
+        service.update("current.simulation", {"max_steps": 20})
+        # Reads inside the block see the pending changes
+        assert service.get("current.simulation.physics_dt") == 0.002
+
+    assert len(saves) == 1
+    assert saves[0]["metadata"]["paths"] == [
+        "current.simulation.physics_dt",
+        "current.simulation",
+    ]
+    assert _read_current(settings_file)["simulation"]["max_steps"] == 20
+
+    with pytest.raises(RuntimeError):
+        with service.batch():
+            service.set("current.simulation.physics_dt", 0.5)
+            raise RuntimeError("abort")
+
+    assert len(saves) == 1
+    assert service.get("current.simulation.physics_dt") == 0.002
+
+
+def test_service_write_behind_defers_disk_writes(tmp_path: Path) -> None:
+    settings_file = _write_settings(tmp_path / "app_settings.json")
+    service = SettingsService(
+        settings_file, validate_schema=False, write_behind_interval=60.0
+    )
+
+    for step in range(1, 6):
+        service.set("current.simulation.max_steps", step)
+    assert service.get("current.simulation.max_steps") == 5
+    assert _read_current(settings_file)["simulation"]["max_steps"] == 10
+
+    service.close(timeout=5.0)
+    assert _read_current(settings_file)["simulation"]["max_steps"] == 5
+    assert not settings_file.with_suffix(".json.tmp").exists()
+
+
+def test_manager_batch_and_write_behind(tmp_path: Path) -> None:
+    settings_file = _write_settings(tmp_path / "settings.json")
+    manager = SettingsManager(settings_file=settings_file)
+    manager.enable_write_behind(interval=60.0)
+
+    with manager.batch():
+        manager.set("current.simulation.physics_dt", 0.003)
+        manager.set("current.simulation.max_steps", 30)
+    assert manager._persister is not None and manager._persister.submitted == 1
+    assert _read_current(settings_file)["simulation"]["max_steps"] == 10
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.set("current.simulation.max_steps", 99)
+            raise RuntimeError("abort")
+    assert manager.get("current.simulation.max_steps") == 30
+    assert manager._persister.submitted == 1
+
+    manager.close(timeout=5.0)
+    simulation = _read_current(settings_file)["simulation"]
+    assert simulation["physics_dt"] == 0.003
+    assert simulation["max_steps"] == 30
@@ -0,0 +1,123 @@
+"""Subtree-scoped JSON Schema validation on SettingsService writes."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.settings_service import SettingsService, SettingsValidationError
+from src.core.settings_validation import DEFAULT_REQUIRED_MATERIALS
+
+_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["metadata", "current", "defaults_snapshot"],
+    "properties": {
+        "metadata": {"type": "object"},
+        "current": {
+            "type": "object",
+            "properties": {
+                "simulation": {"$ref": "#/$defs/Simulation"},
+                "road": {
+                    "anyOf": [
+                        {"type": "object", "required": ["profile"]},
+                        {
+                            "type": "object",
+                            "properties": {"kind": {"const": "flat"}},
+                        },
+                    ]
+                },
+            },
+        },
+        "defaults_snapshot": {"type": "object"},
+    },
+    "$defs": {
+        "Simulation": {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {
+                "physics_dt": {"type": "number", "exclusiveMinimum": 0},
+                "max_steps": {"type": "integer"},
+            },
+        }
+    },
+}
+
+
+@pytest.fixture()
+def service(tmp_path: Path) -> SettingsService:
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(_SCHEMA), encoding="utf-8")
+    materials = {name: {"id": name} for name in DEFAULT_REQUIRED_MATERIALS}
+    graphics = {"materials": materials}
+    settings_path = tmp_path / "app_settings.json"
+    settings_path.write_text(
+        json.dumps(
+            {
+                "metadata": {},
+                "current": {
+                    "simulation": {"physics_dt": 0.001, "max_steps": 10},
+                    "road": {"kind": "flat"},
+                    "graphics": graphics,
+                },
+                "defaults_snapshot": {"graphics": graphics},
+            }
+        ),
+        encoding="utf-8",
+    )
+    service = SettingsService(settings_path, schema_path=schema_path)
+    service.load()
+    return service
+
+
+def test_set_validates_only_the_changed_subtree(
+    service: SettingsService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    full_runs: list[int] = []
+    original_validate = service.validate
+    monkeypatch.setattr(
+        service,
+        "validate",
+        lambda payload: full_runs.append(1) or original_validate(payload),
+    )
+
+    service.set("current.simulation.max_steps", 20)
+    service.update("current.simulation", {"physics_dt": 0.002})
+    with service.batch():
+        service.set("current.simulation.max_steps", 30)
+
+    assert full_runs == []
+    assert service.get("current.simulation.max_steps") == 30
+
+    with pytest.raises(SettingsValidationError) as exc_info:
+        service.set("current.simulation.physics_dt", -1.0)
+    assert exc_info.value.errors[0].startswith("current.simulation.physics_dt:")
+    assert service.get("current.simulation.physics_dt") == 0.002
+
+    with pytest.raises(SettingsValidationError):
+        service.set("current.simulation.unexpected", 1)
+
+
+def test_subtree_validators_follow_refs_and_stop_at_combinators(
+    service: SettingsService,
+) -> None:
+    materials = service.get("current.graphics.materials")
+    prefix, _ = service._get_subtree_validator(("current", "simulation"))
+    assert prefix == ("current", "simulation")
+
+    # anyOf constrains the whole road object, so it is validated as one unit
+    prefix, _ = service._get_subtree_validator(("current", "road", "kind"))
+    assert prefix == ("current", "road")
+
+    assert service._validation_scopes(
+        ["current.simulation.physics_dt", "current.simulation.max_steps"]
+    ) == [("metadata",), ("current", "simulation")]
+
+    with pytest.raises(SettingsValidationError):
+        service.set("current.road.kind", "bumpy")
+
+    # Cross-field material checks run whenever graphics changes
+    with pytest.raises(SettingsValidationError, match="inconsistent identifiers"):
+        service.set(f"current.graphics.materials.{min(materials)}.id", "other")
@@ -1,7 +1,13 @@
-"""Regression checks for SettingsService path splitting helpers."""
+"""Regression checks for SettingsService path splitting and path index."""
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
+
+import pytest
+
+import src.core.settings_service as settings_service_module
 from src.core.settings_service import SettingsService
 
 
@@ -36,3 +42,66 @@ def test_split_path_returns_empty_tuple_for_blank_values() -> None:
     _clear_path_cache()
 
     assert SettingsService._split_path("   ") == ()
+
+
+def _write_settings(path: Path, physics_dt: float = 0.001) -> Path:
+    payload = {
+        "metadata": {},
+        "current": {
+            "simulation": {"physics_dt": physics_dt},
+            "graphics": {"materials": {"frame": {"color": "#ffffff"}}},
+        },
+        "defaults_snapshot": {},
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_get_uses_path_index_without_redumping(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = SettingsService(
+        _write_settings(tmp_path / "app_settings.json"), validate_schema=False
+    )
+    dumps = []
+    original = settings_service_module.dump_settings
+    monkeypatch.setattr(
+        settings_service_module,
+        "dump_settings",
+        lambda payload: dumps.append(1) or original(payload),
+    )
+
+    assert service.get("current.simulation.physics_dt") == 0.001
+    assert service.get(" current . graphics.materials.frame.color") == "#ffffff"
+    assert service.get("current.simulation.missing", "fallback") == "fallback"
+    assert len(dumps) == 1
+
+
+def test_get_returns_copies_and_get_view_is_read_only(tmp_path: Path) -> None:
+    service = SettingsService(
+        _write_settings(tmp_path / "app_settings.json"), validate_schema=False
+    )
+
+    graphics = service.get("current.graphics")
+    graphics["materials"]["frame"]["color"] = "#000000"
+    assert service.get("current.graphics.materials.frame.color") == "#ffffff"
+
+    view = service.get_view("current.graphics.materials")
+    assert view is service.get_view("current.graphics.materials")
+    with pytest.raises(TypeError):
+        view["frame"]["color"] = "#000000"
+    assert service.get_view()["current"]["simulation"]["physics_dt"] == 0.001
+
+
+def test_path_index_is_invalidated_when_model_changes(tmp_path: Path) -> None:
+    settings_file = _write_settings(tmp_path / "app_settings.json")
+    service = SettingsService(settings_file, validate_schema=False)
+    assert service.get("current.simulation.physics_dt") == 0.001
+
+    service.set("current.simulation.physics_dt", 0.002)
+    assert service.get("current.simulation.physics_dt") == 0.002
+
+    _write_settings(settings_file, physics_dt=0.004)
+    assert service.get("current.simulation.physics_dt") == 0.002
+    service.reload()
+    assert service.get_view("current.simulation.physics_dt") == 0.004
@@ -0,0 +1,90 @@
+"""Fixed-step rigid-body integrator tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.physics.integrator import create_default_rigid_body, step_dynamics
+from src.physics.odes import BODY_INTEGRATION_SCHEMES, RigidBodyStepper
+from src.physics.pneumo_system import PneumaticSystem
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+DT = 1e-3
+STEPS = 200
+Y0 = np.array([0.01, 0.01, -0.01, 0.1, 0.0, 0.05])
+
+
+@pytest.fixture(scope="module")
+def setup():
+    structure, gas = build_default_system_and_network()
+    system = PneumaticSystem(structure, gas)
+    body = create_default_rigid_body()
+
+    reference = Y0.copy()
+    for index in range(STEPS):
+        reference = step_dynamics(
+            reference,
+            index * DT,
+            DT,
+            body,
+            system,
+            gas,
+            method="DOP853",
+            rtol=1e-12,
+            atol=1e-14,
+        ).y_final
+    return body, system, gas, reference
+
+
+@pytest.mark.parametrize(
+    ("scheme", "tolerance", "evaluations"),
+    [
+        ("semi_implicit_euler", 5e-4, 1),
+        ("rk4", 1e-9, 4),
+        ("implicit_midpoint", 1e-5, None),
+    ],
+)
+def test_schemes_track_reference_solution(setup, scheme, tolerance, evaluations):
+    body, system, gas, reference = setup
+    stepper = RigidBodyStepper(body, scheme)
+
+    y = Y0.copy()
+    for index in range(STEPS):
+        y = stepper.step(y, index * DT, DT, system, gas)
+
+    np.testing.assert_allclose(y, reference, atol=tolerance)
+    if evaluations is not None:
+        assert stepper.n_evaluations == evaluations
+
+
+def test_implicit_midpoint_reuses_jacobian_until_dt_changes(setup):
+    body, system, gas, _reference = setup
+    stepper = RigidBodyStepper(body, "implicit_midpoint", jacobian_refresh_steps=50)
+
+    y = Y0.copy()
+    for index in range(40):
+        y = stepper.step(y, index * DT, DT, system, gas)
+    assert stepper.jacobian_updates == 1
+
+    stepper.step(y, 0.04, 0.5 * DT, system, gas)
+    assert stepper.jacobian_updates == 2
+
+    for _ in range(50):
+        y = stepper.step(y, 0.0, 0.5 * DT, system, gas)
+    assert stepper.jacobian_updates == 3
+
+
+def test_step_does_not_modify_input(setup):
+    body, system, gas, _reference = setup
+    y = Y0.copy()
+
+    for scheme in BODY_INTEGRATION_SCHEMES:
+        RigidBodyStepper(body, scheme).step(y, 0.0, DT, system, gas)
+
+    np.testing.assert_array_equal(y, Y0)
+
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported"):
+        RigidBodyStepper(create_default_rigid_body(), "leapfrog")
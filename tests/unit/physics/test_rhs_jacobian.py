@@ -0,0 +1,86 @@
+"""Analytic Jacobian and precomputed static loads of the 3-DOF body ODE."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.physics import integrator
+from src.physics.integrator import create_default_rigid_body, step_dynamics
+from src.physics.odes import (
+    assemble_forces,
+    f_rhs,
+    f_rhs_jacobian,
+    wheel_pneumatic_forces,
+)
+from src.physics.pneumo_system import PneumaticSystem
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+Y0 = np.array([0.01, 0.01, -0.01, 0.1, 0.0, 0.05])
+
+
+@pytest.fixture(scope="module")
+def setup():
+    structure, gas = build_default_system_and_network()
+    return create_default_rigid_body(), PneumaticSystem(structure, gas), gas
+
+
+def test_jacobian_matches_finite_differences(setup) -> None:
+    body, system, gas = setup
+    f0 = f_rhs(0.0, Y0, body, system, gas)
+    step = 1e-6
+    numeric = np.column_stack(
+        [
+            (f_rhs(0.0, Y0 + step * unit, body, system, gas) - f0) / step
+            for unit in np.eye(6)
+        ]
+    )
+
+    analytic = f_rhs_jacobian(0.0, Y0, body, system, gas)
+
+    np.testing.assert_allclose(analytic, numeric, rtol=1e-6, atol=1e-6)
+
+
+def test_static_loads_and_arms_are_precomputed() -> None:
+    body = create_default_rigid_body()
+
+    expected = [body.static_load_for(name) for name in ("LP", "PP", "LZ", "PZ")]
+    np.testing.assert_array_equal(body.static_load_vector, expected)
+    assert not body.static_load_vector.flags.writeable
+    assert body.attachment_x[0] == body.attachment_points["LP"][0]
+    assert body.attachment_z[3] == body.attachment_points["PZ"][1]
+
+
+def test_precomputed_pneumatic_forces_match_resolved_pressures(setup) -> None:
+    body, system, gas = setup
+    forces = wheel_pneumatic_forces(system, gas)
+
+    resolved = assemble_forces(system, gas, Y0, body)
+    precomputed = assemble_forces(system, gas, Y0, body, forces)
+
+    np.testing.assert_array_equal(precomputed[0], resolved[0])
+    assert precomputed[1:] == resolved[1:]
+
+
+@pytest.mark.parametrize("method", ["Radau", "BDF"])
+def test_implicit_solvers_need_fewer_evaluations_with_analytic_jacobian(
+    setup, method, monkeypatch
+) -> None:
+    body, system, gas = setup
+
+    def _run() -> tuple[np.ndarray, int]:
+        y, evaluations = Y0.copy(), 0
+        for index in range(20):
+            result = step_dynamics(
+                y, index * 1e-3, 1e-3, body, system, gas, method=method
+            )
+            assert result.success
+            y, evaluations = result.y_final, evaluations + result.n_evaluations
+        return y, evaluations
+
+    analytic_state, analytic_evaluations = _run()
+    monkeypatch.setattr(integrator, "_IMPLICIT_METHODS", frozenset())
+    numeric_state, numeric_evaluations = _run()
+
+    assert analytic_evaluations < numeric_evaluations
+    np.testing.assert_allclose(analytic_state, numeric_state, atol=1e-7)
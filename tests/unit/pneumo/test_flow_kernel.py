@@ -0,0 +1,116 @@
+"""Vectorised gas network valve and flow update."""
+
+from __future__ import annotations
+
+import copy
+import logging
+
+import numpy as np
+import pytest
+
+from src.common.units import PA_ATM, R_AIR
+from src.pneumo.flow import mass_flow_orifice, mass_flow_orifice_array
+from src.pneumo.flow_kernel import VectorizedFlowKernel
+from src.pneumo.network import debug_logger
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+
+def _perturbed_network(seed: int):
+    rng = np.random.default_rng(seed)
+    system, network = build_default_system_and_network()
+    network.leak_coefficient = 1e-9
+    network.leak_reference_area = 1e-4
+    for state in network.lines.values():
+        state.p = PA_ATM * rng.uniform(0.5, 3.0)
+        state.m = state.p * state.V_curr / (R_AIR * state.T)
+    network.tank.p = PA_ATM * rng.uniform(0.5, 30.0)
+    network.tank.m = network.tank.p * network.tank.V / (R_AIR * network.tank.T)
+    return system, network
+
+
+def _assert_networks_match(expected, actual) -> None:
+    for name, state in expected.lines.items():
+        other = actual.lines[name]
+        for attr in ("m", "T", "p"):
+            assert getattr(other, attr) == pytest.approx(
+                getattr(state, attr), rel=1e-12
+            )
+    for attr in ("m", "T", "p"):
+        assert getattr(actual.tank, attr) == pytest.approx(
+            getattr(expected.tank, attr), rel=1e-12
+        )
+
+
+def test_orifice_array_matches_scalar_flow_in_every_regime() -> None:
+    rng = np.random.default_rng(0)
+    p_up = rng.uniform(0.0, 5e5, 2_000)
+    p_down = p_up * rng.uniform(0.2, 1.1, p_up.size)
+    temperature = rng.uniform(250.0, 400.0, p_up.size)
+    diameter = rng.uniform(0.0, 0.02, p_up.size)
+
+    vectorised = mass_flow_orifice_array(
+        p_up, temperature, p_down, temperature, diameter
+    )
+
+    expected = [
+        mass_flow_orifice(*args)
+        for args in zip(p_up, temperature, p_down, temperature, diameter)
+    ]
+    np.testing.assert_allclose(vectorised, expected, rtol=1e-12, atol=0.0)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_vectorized_mode_matches_scalar_update(seed: int) -> None:
+    scalar_system, scalar = _perturbed_network(seed)
+    vector_system, vectorized = copy.deepcopy((scalar_system, scalar))
+    vectorized.flow_kernel = "vectorized"
+
+    for _ in range(25):
+        expected = scalar.apply_valves_and_flows(1e-3)
+        actual = vectorized.apply_valves_and_flows(1e-3)
+
+        _assert_networks_match(scalar, vectorized)
+        for name, flows in expected["lines"].items():
+            assert actual["lines"][name] == pytest.approx(flows, rel=1e-12)
+        assert actual["relief"] == pytest.approx(expected["relief"], rel=1e-12)
+        for name, line in scalar_system.lines.items():
+            other = vector_system.lines[name]
+            assert other.cv_atmo.state_open == line.cv_atmo.state_open
+            assert other.cv_tank.state_open == line.cv_tank.state_open
+
+
+def test_kernel_steps_stacked_networks_independently() -> None:
+    pairs = [_perturbed_network(seed) for seed in range(4)]
+    references = copy.deepcopy(pairs)
+    kernel = VectorizedFlowKernel([network for _system, network in pairs])
+
+    for _ in range(10):
+        logs = kernel.apply(1e-3)
+        for (_system, reference), log in zip(references, logs):
+            expected = reference.apply_valves_and_flows(1e-3)
+            assert log["relief"] == pytest.approx(expected["relief"], rel=1e-12)
+
+    for (_system, network), (_ref_system, reference) in zip(pairs, references):
+        _assert_networks_match(reference, network)
+
+
+def test_unknown_flow_kernel_is_rejected() -> None:
+    _system, network = build_default_system_and_network()
+
+    with pytest.raises(ValueError, match="flow_kernel"):
+        type(network)(
+            lines=network.lines,
+            tank=network.tank,
+            system_ref=network.system_ref,
+            flow_kernel="simd",
+        )
+
+
+def test_debug_logger_drops_loggers_filtering_debug() -> None:
+    logger = logging.getLogger("tests.pneumo.flow_kernel")
+    logger.setLevel(logging.INFO)
+    assert debug_logger(logger) is None
+
+    logger.setLevel(logging.DEBUG)
+    assert debug_logger(logger) is logger
+    assert debug_logger(None) is None
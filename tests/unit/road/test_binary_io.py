@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.road import (
+    WHEEL_KEYS,
+    RoadConfig,
+    RoadInput,
+    SourceKind,
+    is_binary_profile,
+    load_binary_profile,
+    save_binary_profile,
+)
+from src.road.csv_io import load_csv_profile
+
+
+def _profiles(samples: int = 500) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    rng = np.random.default_rng(0)
+    time = np.linspace(0.0, (samples - 1) / 1000.0, samples)
+    return time, {wheel: rng.normal(0.0, 0.01, samples) for wheel in WHEEL_KEYS}
+
+
+def _write_csv(path: Path, time: np.ndarray, profiles: dict[str, np.ndarray]) -> Path:
+    data = np.column_stack([time] + [profiles[wheel] for wheel in WHEEL_KEYS])
+    np.savetxt(path, data, delimiter=",", fmt="%.6f", header="time,LF,RF,LR,RR")
+    # np.savetxt prefixes the header with "# "
+    path.write_text(path.read_text().replace("# ", "", 1))
+    return path
+
+
+def test_round_trip_is_memory_mapped(tmp_path: Path) -> None:
+    time, profiles = _profiles()
+    path = save_binary_profile(tmp_path / "road.psrp", time, profiles)
+
+    assert is_binary_profile(path)
+    loaded_time, table = load_binary_profile(path)
+
+    assert isinstance(table, np.memmap)
+    assert not table.flags.writeable
+    np.testing.assert_array_equal(loaded_time, time)
+    for column, wheel in enumerate(WHEEL_KEYS):
+        np.testing.assert_array_equal(table[:, column], profiles[wheel])
+
+
+def test_float32_storage_halves_file_size(tmp_path: Path) -> None:
+    time, profiles = _profiles()
+    wide = save_binary_profile(tmp_path / "wide.psrp", time, profiles)
+    narrow = save_binary_profile(
+        tmp_path / "narrow.psrp", time, profiles, dtype=np.float32
+    )
+
+    header = 64
+    assert narrow.stat().st_size - header == (wide.stat().st_size - header) // 2
+    _, table = load_binary_profile(narrow)
+    assert table.dtype == np.float32
+    np.testing.assert_allclose(table[:, 0], profiles["LF"], rtol=1e-6)
+
+
+def test_invalid_containers_are_rejected(tmp_path: Path) -> None:
+    time, profiles = _profiles()
+    profiles["RR"][3] = np.nan
+    with pytest.raises(ValueError, match="finite"):
+        save_binary_profile(tmp_path / "nan.psrp", time, profiles)
+
+    text = tmp_path / "road.csv"
+    text.write_text("time,z\n0,0\n")
+    assert not is_binary_profile(text)
+    with pytest.raises(ValueError, match="Not a binary road profile"):
+        load_binary_profile(text)
+
+    path = save_binary_profile(tmp_path / "road.psrp", *_profiles())
+    with open(path, "ab") as f:
+        f.write(b"\0" * 8)
+    with pytest.raises(ValueError, match="size mismatch"):
+        load_binary_profile(path)
+
+
+def test_csv_is_converted_once_and_mapped_afterwards(tmp_path: Path) -> None:
+    csv_path = _write_csv(tmp_path / "measured.csv", *_profiles(2_000))
+    cache_dir = tmp_path / "cache"
+
+    expected_time, expected = load_csv_profile(str(csv_path), use_cache=False)
+    first_time, first = load_csv_profile(str(csv_path), cache_dir=cache_dir)
+    entries = sorted(cache_dir.glob("*.psrp"))
+    second_time, second = load_csv_profile(str(csv_path), cache_dir=cache_dir)
+
+    assert len(entries) == 1
+    assert sorted(cache_dir.glob("*.psrp")) == entries
+    assert isinstance(second["LF"], np.memmap)
+    np.testing.assert_array_equal(first_time, expected_time)
+    np.testing.assert_array_equal(second_time, expected_time)
+    for wheel in WHEEL_KEYS:
+        np.testing.assert_array_equal(second[wheel], expected[wheel])
+
+    # Different conversion parameters and edited content get their own entries
+    load_csv_profile(str(csv_path), resample_hz=500.0, cache_dir=cache_dir)
+    _write_csv(csv_path, *_profiles(1_000))
+    edited_time, _ = load_csv_profile(str(csv_path), cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.psrp"))) == 3
+    assert edited_time.size < expected_time.size
+
+
+def test_road_input_maps_binary_profile(tmp_path: Path) -> None:
+    time, profiles = _profiles()
+    path = save_binary_profile(tmp_path / "road.psrp", time, profiles)
+
+    road = RoadInput()
+    road.configure(RoadConfig(source=SourceKind.CSV, csv_path=str(path)))
+    road.prime()
+
+    t = time[123]
+    assert road.get_wheel_excitation(t)["LF"] == pytest.approx(profiles["LF"][123])
+    assert isinstance(road._profile_table, np.memmap)
+
+
+def test_time_grid_must_be_uniform_and_increasing(tmp_path: Path) -> None:
+    time, profiles = _profiles()
+    jittered = time.copy()
+    jittered[100] += 0.4e-3
+    with pytest.raises(ValueError, match="not uniform"):
+        save_binary_profile(tmp_path / "jitter.psrp", jittered, profiles)
+
+    reversed_time = time.copy()
+    reversed_time[[10, 11]] = reversed_time[[11, 10]]
+    with pytest.raises(ValueError, match="strictly increasing"):
+        save_binary_profile(tmp_path / "reversed.psrp", reversed_time, profiles)
+
+    # Containers written by other tools are checked when they are mapped
+    path = save_binary_profile(tmp_path / "road.psrp", time, profiles)
+    records = np.memmap(path, dtype="<f8", mode="r+", offset=64, shape=(500, 5))
+    records[250, 0] = records[251, 0]
+    records.flush()
+    del records
+    with pytest.raises(ValueError, match="strictly increasing"):
+        load_binary_profile(path)
+
+
+def test_float32_rounding_of_offset_time_is_accepted(tmp_path: Path) -> None:
+    time, profiles = _profiles()
+    path = save_binary_profile(
+        tmp_path / "offset.psrp", time + 1000.0, profiles, dtype=np.float32
+    )
+
+    loaded_time, _ = load_binary_profile(path)
+    np.testing.assert_allclose(loaded_time, time + 1000.0, atol=1e-4)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.interpolate import interp1d
+
+from src.road import WHEEL_KEYS, RoadInput
+from src.road.engine import create_road_input_from_preset
+from src.road.types import CorrelationSpec, RoadConfig, SourceKind
+
+
+@pytest.fixture
+def road() -> RoadInput:
+    road_input = RoadInput()
+    road_input.configure(
+        RoadConfig(
+            source=SourceKind.ISO8608,
+            velocity=15.0,
+            duration=4.0,
+            correlation=CorrelationSpec(rho_LR=0.5, seed=3),
+        )
+    )
+    road_input.prime()
+    return road_input
+
+
+def _reference(road: RoadInput, times: np.ndarray) -> np.ndarray:
+    columns = []
+    for wheel in WHEEL_KEYS:
+        offset = road.axle_delay if wheel in ("LR", "RR") else 0.0
+        interpolator = interp1d(
+            road.time_base,
+            road.wheel_profiles[wheel],
+            bounds_error=False,
+            fill_value=0.0,
+        )
+        columns.append(interpolator(times + offset))
+    return np.column_stack(columns)
+
+
+def test_lookups_match_linear_interpolation(road: RoadInput) -> None:
+    times = np.random.default_rng(0).uniform(-0.5, road.duration + 1.0, 500)
+    expected = _reference(road, times)
+
+    displacement, _velocity = road.get_wheel_states(times)
+    np.testing.assert_allclose(displacement, expected, atol=1e-12)
+
+    for t, row in zip(times[:100], expected[:100]):
+        np.testing.assert_allclose(road.get_wheel_state(t)[0], row, atol=1e-12)
+        excitation = road.get_wheel_excitation(t)
+        assert list(excitation) == list(WHEEL_KEYS)
+        assert list(excitation.values()) == pytest.approx(row.tolist(), abs=1e-12)
+
+
+def test_velocity_is_profile_slope(road: RoadInput) -> None:
+    time_base = road.time_base
+    spacing = time_base[1] - time_base[0]
+    # Segment midpoints keep the central difference inside one segment
+    times = 0.5 * (time_base[100:2000:37] + time_base[101:2001:37])
+
+    _, velocity = road.get_wheel_states(times)
+    ahead, _ = road.get_wheel_states(times + 0.25 * spacing)
+    behind, _ = road.get_wheel_states(times - 0.25 * spacing)
+
+    front = slice(0, 2)
+    np.testing.assert_allclose(
+        (ahead - behind)[:, front] / (0.5 * spacing),
+        velocity[:, front],
+        rtol=1e-6,
+        atol=1e-9,
+    )
+    scalar = np.array([road.get_wheel_state(t)[1].copy() for t in times])
+    np.testing.assert_allclose(scalar, velocity, atol=1e-9)
+
+
+def test_wheel_state_reuses_buffer_and_honours_out(road: RoadInput) -> None:
+    first = road.get_wheel_state(1.0)
+    second = road.get_wheel_state(2.0)
+    assert first is second
+
+    out = np.empty((2, 4))
+    assert road.get_wheel_state(1.0, out=out) is out
+    assert out[0] == pytest.approx(road.get_wheel_states([1.0])[0][0])
+
+
+def test_outside_profile_is_zero(road: RoadInput) -> None:
+    state = road.get_wheel_state(-1.0)
+    assert not state.any()
+
+    displacement, velocity = road.get_wheel_states([1e6])
+    assert not displacement.any() and not velocity.any()
+
+
+def test_profile_preview_uses_vectorised_lookup() -> None:
+    road = create_road_input_from_preset("test_sine")
+    road.prime()
+
+    t_preview, profiles = road.get_profile_preview(duration=2.0, dt=0.01)
+
+    assert t_preview.shape == (200,)
+    for wheel in WHEEL_KEYS:
+        expected = [road.get_wheel_excitation(t)[wheel] for t in t_preview]
+        np.testing.assert_allclose(profiles[wheel], expected, atol=1e-12)
+
+
+def test_lookup_requires_prime() -> None:
+    road = create_road_input_from_preset("test_sine")
+
+    with pytest.raises(RuntimeError, match="not primed"):
+        road.get_wheel_state(0.0)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.road import RoadInput, StreamingRoadInput
+from src.road.engine import create_road_input_from_preset
+from src.road.streaming import _Iso8608Source
+from src.road.types import (
+    ISO8608_PARAMETERS,
+    CorrelationSpec,
+    Iso8608Class,
+    RoadConfig,
+    SourceKind,
+)
+
+
+def _iso_road(chunk_size: int = 512, rho: float = 0.6) -> StreamingRoadInput:
+    road = StreamingRoadInput(chunk_size=chunk_size)
+    road.configure(
+        RoadConfig(
+            source=SourceKind.ISO8608,
+            velocity=20.0,
+            duration=5.0,
+            correlation=CorrelationSpec(rho_LR=rho, seed=7),
+        )
+    )
+    road.prime()
+    return road
+
+
+def _series(road: StreamingRoadInput, times: np.ndarray) -> np.ndarray:
+    return np.array(
+        [
+            [road.get_wheel_excitation(t)[wheel] for wheel in ("LF", "RF", "LR", "RR")]
+            for t in times
+        ]
+    )
+
+
+def test_buffer_stays_bounded_over_long_runs() -> None:
+    road = _iso_road()
+    capacity = road.buffer_capacity
+
+    for t in np.arange(0.0, 120.0, 0.05):
+        road.get_wheel_excitation(float(t))
+
+    assert road._buffer.shape == (2, capacity)
+    assert road.get_info()["generated_until"] >= 120.0
+
+
+def test_rear_axle_uses_road_input_delay_convention() -> None:
+    road = _iso_road()
+    delay = road.axle_delay * road.sample_rate
+    offset = (delay - int(delay)) / road.sample_rate
+    times = np.arange(1.0, 4.0, 0.01)
+
+    rear = _series(road, times)[:, 2:]
+    road.prime()
+    front = _series(road, times + offset)[:, :2]
+
+    np.testing.assert_allclose(rear, front, atol=1e-12)
+
+
+def test_chunk_boundaries_are_continuous() -> None:
+    road = _iso_road(chunk_size=256)
+    values = _series(road, np.arange(0.0, 6.0, 1.0 / road.sample_rate))[:, 0]
+
+    steps = np.abs(np.diff(values))
+    assert steps.max() < 10.0 * steps.mean()
+
+
+def test_rewind_replays_identical_profile() -> None:
+    road = _iso_road()
+    times = np.arange(0.0, 3.0, 0.013)
+    first = _series(road, times)
+
+    road.get_wheel_excitation(30.0)
+    replay = _series(road, times)
+
+    np.testing.assert_array_equal(first, replay)
+
+
+def test_iso_variance_and_correlation_match_specification() -> None:
+    chunk, velocity, sample_rate, rho = 512, 20.0, 1000.0, 0.5
+    source = _Iso8608Source(
+        Iso8608Class.C, velocity, sample_rate, chunk, CorrelationSpec(rho, seed=1)
+    )
+    profile = np.hstack([np.vstack(source.generate(0, chunk)) for _ in range(1000)])
+
+    params = ISO8608_PARAMETERS[Iso8608Class.C]
+    dn = sample_rate / (2 * chunk * velocity)
+    n = dn * np.arange(1, chunk + 1)
+    expected = np.sum(params["Gd"] * (n / 0.1) ** -params["w"] * dn)
+
+    np.testing.assert_allclose((profile**2).mean(axis=1), expected, rtol=0.15)
+    assert np.corrcoef(profile)[0, 1] == pytest.approx(rho, abs=0.05)
+
+
+def test_sine_wheels_match_pregenerated_input() -> None:
+    config = RoadConfig(
+        source=SourceKind.SINE,
+        velocity=15.0,
+        duration=4.0,
+        amplitude=0.02,
+        frequency=1.5,
+        correlation=CorrelationSpec(rho_LR=1.0),
+    )
+    reference = RoadInput()
+    reference.configure(config)
+    reference.prime()
+    streaming = StreamingRoadInput(chunk_size=128)
+    streaming.configure(config)
+    streaming.prime()
+
+    for t in np.arange(0.0, 3.5, 0.037):
+        expected = reference.get_wheel_excitation(float(t))
+        actual = streaming.get_wheel_excitation(float(t))
+        for wheel in ("LF", "RF"):
+            assert actual[wheel] == pytest.approx(expected[wheel], abs=1e-5)
+        # Rear grids differ only by RoadInput's linspace spacing
+        for wheel in ("LR", "RR"):
+            assert actual[wheel] == pytest.approx(expected[wheel], abs=1e-4)
+
+
+def test_factory_returns_streaming_input_on_request() -> None:
+    road = create_road_input_from_preset("test_sine", streaming=True)
+
+    assert isinstance(road, StreamingRoadInput)
+    assert road.get_info()["streaming"] is True
+
+
+def test_csv_sources_are_rejected() -> None:
+    with pytest.raises(ValueError, match="CSV"):
+        StreamingRoadInput().configure(
+            RoadConfig(source=SourceKind.CSV, csv_path="road.csv")
+        )
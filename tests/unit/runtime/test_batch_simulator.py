@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.physics.integrator import create_default_rigid_body
+from src.physics.pneumo_system import PneumaticSystem as RuntimePneumaticSystem
+from src.pneumo.enums import Line, ThermoMode, Wheel
+from src.runtime.batch import BatchSimulator, LINE_ORDER, WHEEL_ORDER
+from src.runtime.steps.context import LeverDynamicsConfig
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+class _SineRoad:
+    def get_wheel_excitation(self, t: float) -> dict[str, float]:
+        value = 0.01 * np.sin(2.0 * np.pi * 1.5 * t)
+        return {"LF": value, "RF": -value, "LR": 0.5 * value, "RR": 0.0}
+
+
+def _make_simulator(**overrides) -> BatchSimulator:
+    structure, gas_network = build_default_system_and_network()
+    runtime_system = RuntimePneumaticSystem(structure, gas_network)
+    options = dict(
+        pneumatic_system=runtime_system,
+        gas_network=gas_network,
+        dt=0.002,
+        rigid_body=create_default_rigid_body(),
+        road_input=_SineRoad(),
+        lever_config=LeverDynamicsConfig(
+            spring_constant=50_000.0,
+            damper_coefficient=2_000.0,
+            lever_inertia=50.0 * 0.75 * 0.75,
+        ),
+        thermo_mode=ThermoMode.ISOTHERMAL,
+    )
+    options.update(overrides)
+    return BatchSimulator(**options)
+
+
+def test_batch_module_does_not_import_qt_worker() -> None:
+    code = (
+        "import sys; import src.runtime.batch; "
+        "sys.exit(int('src.runtime.sim_loop' in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_batch_run_records_time_series() -> None:
+    simulator = _make_simulator()
+
+    result = simulator.run(duration=0.1)
+
+    assert result.steps == 50
+    assert len(result) == 50
+    assert result.time[-1] == pytest.approx(0.1)
+    assert result.frame_state.shape == (50, 6)
+    assert result.line_pressures.shape == (50, len(LINE_ORDER))
+    assert np.all(np.isfinite(result.frame_state))
+    assert np.any(result.lever_angles[:, WHEEL_ORDER.index(Wheel.LP)] != 0.0)
+    assert result.integration_failures == 0
+    assert result.wall_time > 0.0
+    assert "pressure_A1" in result.as_columns()
+
+
+def test_batch_run_decimates_samples() -> None:
+    simulator = _make_simulator()
+
+    result = simulator.run(steps=40, record_every=8)
+
+    assert len(result) == 5
+    assert result.time[0] == pytest.approx(8 * simulator.dt)
+    assert result.time[-1] == pytest.approx(40 * simulator.dt)
+
+
+def test_batch_runs_are_deterministic() -> None:
+    first = _make_simulator().run(steps=60)
+    simulator = _make_simulator()
+    simulator.run(steps=30)
+    continued = simulator.run(steps=30)
+
+    np.testing.assert_allclose(first.frame_state[-1], continued.frame_state[-1])
+    np.testing.assert_allclose(first.line_pressures[-1], continued.line_pressures[-1])
+    assert simulator.gas_network.lines[Line.A1].p == pytest.approx(
+        first.line_pressures[-1, LINE_ORDER.index(Line.A1)]
+    )
+
+
+def test_batch_simulator_rejects_invalid_dt() -> None:
+    structure, gas_network = build_default_system_and_network()
+    with pytest.raises(ValueError):
+        BatchSimulator(
+            pneumatic_system=RuntimePneumaticSystem(structure, gas_network),
+            gas_network=gas_network,
+            dt=0.0,
+        )
+
+
+def test_batch_simulator_uses_fixed_step_body_integrator() -> None:
+    simulator = _make_simulator()
+    assert simulator.state.body_stepper is not None
+    assert simulator.state.body_stepper.scheme == "rk4"
+    assert simulator.state.body_stepper.params is simulator.rigid_body
+
+    midpoint = _make_simulator(body_integrator="implicit_midpoint")
+    assert midpoint.state.body_stepper is not None
+    assert midpoint.state.body_stepper.scheme == "implicit_midpoint"
+
+    assert _make_simulator(body_integrator="radau").state.body_stepper is None
+    with pytest.raises(ValueError, match="body integrator"):
+        _make_simulator(body_integrator="rk45")
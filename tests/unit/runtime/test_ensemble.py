@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.common.units import PA_ATM, R_AIR
+from src.physics.integrator import create_default_rigid_body
+from src.physics.odes import BODY_INTEGRATION_SCHEMES
+from src.physics.pneumo_system import PneumaticSystem as RuntimePneumaticSystem
+from src.pneumo.enums import ThermoMode
+from src.pneumo.thermo import PolytropicParameters
+from src.road.engine import create_road_input_from_preset
+from src.runtime.batch import BatchSimulator
+from src.runtime.ensemble import EnsembleMember, EnsembleSimulator
+from src.runtime.steps.context import LeverDynamicsConfig
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+_LEVER_CONFIG = LeverDynamicsConfig(
+    spring_constant=50_000.0,
+    damper_coefficient=2_000.0,
+    damper_threshold=50.0,
+    lever_inertia=50.0 * 0.75 * 0.75,
+)
+
+
+class _SineRoad:
+    def get_wheel_excitation(self, t: float) -> dict[str, float]:
+        value = 0.01 * np.sin(2.0 * np.pi * 1.5 * t)
+        return {"LF": value, "RF": -value, "LR": 0.5 * value, "RR": 0.0}
+
+
+def _member_parts(seed: int):
+    rng = np.random.default_rng(seed)
+    structure, gas_network = build_default_system_and_network()
+    gas_network.polytropic_params = PolytropicParameters(40.0, 0.05)
+    for state in gas_network.lines.values():
+        state.p = PA_ATM * rng.uniform(1.5, 4.0)
+        state.m = state.p * state.V_curr / (R_AIR * state.T)
+    rigid_body = create_default_rigid_body()
+    rigid_body.M *= rng.uniform(0.8, 1.2)
+    return RuntimePneumaticSystem(structure, gas_network), gas_network, rigid_body
+
+
+def _ensemble(seeds, **overrides) -> EnsembleSimulator:
+    members = [EnsembleMember(*_member_parts(seed)) for seed in seeds]
+    options = dict(
+        dt=0.002,
+        road_input=_SineRoad(),
+        lever_config=_LEVER_CONFIG,
+        thermo_mode=ThermoMode.POLYTROPIC,
+    )
+    options.update(overrides)
+    return EnsembleSimulator(members, **options)
+
+
+@pytest.mark.parametrize("thermo_mode", list(ThermoMode))
+def test_members_match_batch_simulator(thermo_mode: ThermoMode) -> None:
+    seeds = (0, 1, 2)
+    result = _ensemble(seeds, thermo_mode=thermo_mode).run(steps=60)
+
+    for column, seed in enumerate(seeds):
+        system, gas_network, rigid_body = _member_parts(seed)
+        reference = BatchSimulator(
+            pneumatic_system=system,
+            gas_network=gas_network,
+            dt=0.002,
+            rigid_body=rigid_body,
+            road_input=_SineRoad(),
+            lever_config=_LEVER_CONFIG,
+            thermo_mode=thermo_mode,
+        ).run(steps=60)
+
+        np.testing.assert_allclose(
+            result.lever_angles[:, column], reference.lever_angles, atol=1e-12
+        )
+        np.testing.assert_allclose(
+            result.line_pressures[:, column], reference.line_pressures, rtol=1e-9
+        )
+        np.testing.assert_allclose(
+            result.frame_state[:, column], reference.frame_state, atol=1e-9
+        )
+        np.testing.assert_allclose(
+            result.tank_pressure[:, column], reference.tank_pressure, rtol=1e-9
+        )
+
+
+@pytest.mark.parametrize("scheme", BODY_INTEGRATION_SCHEMES)
+def test_body_integrator_matches_batch_simulator(scheme: str) -> None:
+    seeds = (0, 1)
+    result = _ensemble(seeds, body_integrator=scheme).run(steps=60)
+
+    for column, seed in enumerate(seeds):
+        system, gas_network, rigid_body = _member_parts(seed)
+        reference = BatchSimulator(
+            pneumatic_system=system,
+            gas_network=gas_network,
+            dt=0.002,
+            rigid_body=rigid_body,
+            road_input=_SineRoad(),
+            lever_config=_LEVER_CONFIG,
+            body_integrator=scheme,
+            thermo_mode=ThermoMode.POLYTROPIC,
+        ).run(steps=60)
+
+        np.testing.assert_allclose(
+            result.frame_state[:, column], reference.frame_state, atol=1e-9
+        )
+
+
+def test_radau_body_integrator_is_rejected() -> None:
+    with pytest.raises(ValueError, match="body integrator"):
+        _ensemble((0,), body_integrator="radau")
+
+
+def test_result_shapes_and_member_independence() -> None:
+    simulator = _ensemble(range(4))
+
+    result = simulator.run(steps=30, record_every=3)
+
+    assert len(result) == 10
+    assert result.members == 4
+    assert result.frame_state.shape == (10, 4, 6)
+    assert result.lever_angles.shape == (10, 4, 4)
+    assert result.line_pressures.shape == (10, 4, 4)
+    assert result.tank_pressure.shape == (10, 4)
+    assert result.integration_failures.tolist() == [0, 0, 0, 0]
+    assert result.member_steps_per_second > 0.0
+    # Different masses and initial pressures produce different trajectories.
+    assert not np.allclose(result.frame_state[:, 0], result.frame_state[:, 1])
+    assert not np.allclose(result.line_pressures[:, 0], result.line_pressures[:, 1])
+
+
+def test_master_isolation_requires_instant_equalisation() -> None:
+    system, gas_network, rigid_body = _member_parts(0)
+    gas_network.master_equalization_diameter = 0.004
+
+    with pytest.raises(ValueError, match="master isolation"):
+        EnsembleSimulator(
+            [EnsembleMember(system, gas_network, rigid_body)],
+            dt=0.002,
+            master_isolation_open=True,
+        )
+
+
+def test_array_road_lookup_matches_dict_excitation() -> None:
+    road = create_road_input_from_preset("test_sine")
+    road.prime()
+
+    class _DictOnly:
+        def get_wheel_excitation(self, t: float) -> dict[str, float]:
+            return road.get_wheel_excitation(t)
+
+    array_result = _ensemble((0, 1), road_input=road).run(steps=40)
+    dict_result = _ensemble((0, 1), road_input=_DictOnly()).run(steps=40)
+
+    np.testing.assert_array_equal(array_result.lever_angles, dict_result.lever_angles)
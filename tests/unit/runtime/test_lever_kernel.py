@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.physics.integrator import create_default_rigid_body
+from src.physics.pneumo_system import PneumaticSystem as RuntimePneumaticSystem
+from src.pneumo.enums import ThermoMode
+from src.runtime.batch import BatchSimulator
+from src.runtime.steps.context import LeverDynamicsConfig
+from src.runtime.steps.lever_kernel import WHEEL_ORDER, VectorizedLeverKernel
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+_BASE_CONFIG = LeverDynamicsConfig(
+    spring_constant=50_000.0,
+    damper_coefficient=2_000.0,
+    damper_threshold=50.0,
+    lever_inertia=50.0 * 0.75 * 0.75,
+)
+
+
+class _SineRoad:
+    def get_wheel_excitation(self, t: float) -> dict[str, float]:
+        value = 0.01 * np.sin(2.0 * np.pi * 1.5 * t)
+        return {"LF": value, "RF": -value, "LR": 0.5 * value, "RR": 0.0}
+
+
+def _make_simulator(lever_config: LeverDynamicsConfig) -> BatchSimulator:
+    structure, gas_network = build_default_system_and_network()
+    return BatchSimulator(
+        pneumatic_system=RuntimePneumaticSystem(structure, gas_network),
+        gas_network=gas_network,
+        dt=0.002,
+        rigid_body=create_default_rigid_body(),
+        road_input=_SineRoad(),
+        lever_config=lever_config,
+        thermo_mode=ThermoMode.ISOTHERMAL,
+    )
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"integrator_method": "euler"},
+        {"include_pneumatics": False, "include_dampers": False},
+    ],
+)
+def test_vectorized_kernel_matches_scalar_path(overrides) -> None:
+    results = {}
+    for kernel in ("scalar", "vectorized"):
+        config = replace(_BASE_CONFIG, kinematics_kernel=kernel, **overrides)
+        results[kernel] = _make_simulator(config).run(steps=100)
+
+    np.testing.assert_allclose(
+        results["vectorized"].lever_angles,
+        results["scalar"].lever_angles,
+        atol=1e-7,
+    )
+    np.testing.assert_allclose(
+        results["vectorized"].line_pressures,
+        results["scalar"].line_pressures,
+        rtol=1e-6,
+    )
+
+
+def test_displacement_matches_lever_geometry() -> None:
+    structure, gas_network = build_default_system_and_network()
+    system = RuntimePneumaticSystem(structure, gas_network)
+    kernel = VectorizedLeverKernel(system)
+    angles = np.array([-0.3, -0.05, 0.1, 0.4])
+
+    expected = [
+        system.cylinders[wheel].spec.lever_geom.angle_to_displacement(angle)
+        for wheel, angle in zip(WHEEL_ORDER, angles)
+    ]
+    displacement, derivative = kernel.displacement_and_derivative(angles)
+
+    np.testing.assert_allclose(displacement, expected, rtol=1e-12, atol=1e-15)
+    expected_derivative = [
+        system.cylinders[wheel].spec.lever_geom.mechanical_advantage(angle)
+        for wheel, angle in zip(WHEEL_ORDER, angles)
+    ]
+    np.testing.assert_allclose(derivative, expected_derivative, rtol=1e-6)
+
+
+def test_kernel_broadcasts_over_leading_axes() -> None:
+    structure, gas_network = build_default_system_and_network()
+    kernel = VectorizedLeverKernel(RuntimePneumaticSystem(structure, gas_network))
+    angles = np.linspace(-0.2, 0.2, 12).reshape(3, 4)
+
+    stacked = kernel.displacement(angles)
+
+    for row, expected in zip(angles, stacked):
+        np.testing.assert_array_equal(kernel.displacement(row), expected)
+
+
+def test_unknown_kernel_is_rejected() -> None:
+    simulator = _make_simulator(replace(_BASE_CONFIG, kinematics_kernel="simd"))
+
+    with pytest.raises(ValueError, match="Unsupported kinematics kernel"):
+        simulator.run(steps=1)
+
+
+def test_stacked_kernel_matches_cylinder_volumes() -> None:
+    systems = []
+    for _ in range(2):
+        structure, gas_network = build_default_system_and_network()
+        systems.append(RuntimePneumaticSystem(structure, gas_network))
+    kernel = VectorizedLeverKernel.stack(
+        VectorizedLeverKernel(system) for system in systems
+    )
+    angles = np.array([[-0.3, -0.05, 0.1, 0.4], [0.2, 0.0, -0.15, 0.6]])
+
+    position, _head_pen, _rod_pen = kernel.piston_state(angles)
+    head, rod = kernel.chamber_volumes(position)
+
+    assert kernel.min_angle_flags().shape == (2, 4)
+    for row, system in enumerate(systems):
+        system.update_system_from_lever_angles(dict(zip(WHEEL_ORDER, angles[row])))
+        for col, wheel in enumerate(WHEEL_ORDER):
+            cylinder = system.cylinders[wheel]
+            assert position[row, col] == pytest.approx(cylinder.x, abs=1e-15)
+            assert head[row, col] == pytest.approx(cylinder.vol_head(), rel=1e-12)
+            assert rod[row, col] == pytest.approx(cylinder.vol_rod(), rel=1e-12)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.physics.integrator import create_default_rigid_body
+from src.physics.pneumo_system import PneumaticSystem as RuntimePneumaticSystem
+from src.pneumo.enums import ThermoMode
+from src.runtime.batch import BatchSimulator
+from src.runtime.steps.context import LeverDynamicsConfig
+from src.runtime.steps.lever_kernel import WHEEL_ORDER, VectorizedLeverKernel
+from src.runtime.steps.lever_table import LeverKinematicsTable, lever_table_for
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+_BASE_CONFIG = LeverDynamicsConfig(
+    spring_constant=50_000.0,
+    damper_coefficient=2_000.0,
+    damper_threshold=50.0,
+    lever_inertia=50.0 * 0.75 * 0.75,
+)
+
+
+class _SineRoad:
+    def get_wheel_excitation(self, t: float) -> dict[str, float]:
+        value = 0.05 * np.sin(2.0 * np.pi * 1.5 * t)
+        return {"LF": value, "RF": -value, "LR": 0.5 * value, "RR": 0.0}
+
+
+def _make_kernel() -> VectorizedLeverKernel:
+    structure, gas_network = build_default_system_and_network()
+    return VectorizedLeverKernel(RuntimePneumaticSystem(structure, gas_network))
+
+
+@pytest.mark.parametrize(("method", "tolerance"), [("cubic", 1e-9), ("linear", 1e-6)])
+def test_table_meets_error_bound(method, tolerance) -> None:
+    kernel = _make_kernel()
+    table = lever_table_for(kernel, method, tolerance)
+
+    assert table.within_tolerance
+    angles = np.linspace(-1.5, 1.5, 1001)[:, None] * np.ones(4)
+    expected, expected_rate = kernel.displacement_and_derivative(angles)
+    displacement, rate = table.evaluate(angles)
+    assert np.abs(displacement - expected).max() <= tolerance
+    np.testing.assert_allclose(
+        rate, expected_rate, atol=1e-3 if method == "linear" else 1e-6
+    )
+
+    recovered = kernel.displacement(table.angle_for_displacement(expected))
+    assert np.abs(recovered - expected).max() <= tolerance
+
+
+def test_scalar_curve_matches_lever_geometry() -> None:
+    kernel = _make_kernel()
+    table = lever_table_for(kernel)
+
+    for index, wheel in enumerate(WHEEL_ORDER):
+        lever = kernel.pneumatic_system.cylinders[wheel].spec.lever_geom
+        curve = table.curve(index)
+        displacement, rate = curve.evaluate(0.2)
+        assert displacement == pytest.approx(lever.angle_to_displacement(0.2), abs=1e-9)
+        assert rate == pytest.approx(lever.mechanical_advantage(0.2), rel=1e-6)
+        assert curve.evaluate(0.01, min_angle_active=True)[1] == 0.0
+        target = 0.15
+        assert lever.angle_to_displacement(curve.angle_for(target)) == pytest.approx(
+            target, abs=1e-9
+        )
+
+
+def test_table_is_rebuilt_only_for_new_geometry() -> None:
+    kernel = _make_kernel()
+    table = lever_table_for(kernel)
+
+    assert lever_table_for(_make_kernel()) is table
+    assert kernel.use_lookup_table("cubic") is table
+
+    kernel.y_tail = kernel.y_tail * 1.1
+    rebuilt = lever_table_for(kernel)
+    assert rebuilt is not table
+    assert kernel.use_lookup_table("off") is None
+
+
+def test_table_inverse_replaces_newton_solve() -> None:
+    kernel = _make_kernel()
+    initial = np.array([0.6, -0.7, 0.9, -0.5])
+    target = np.copysign(kernel.half_travel, initial)
+    active = np.ones(4, dtype=bool)
+
+    newton = kernel.solve_angle_for_displacement(target, initial, active)
+    kernel.use_lookup_table("cubic")
+    lookup = kernel.solve_angle_for_displacement(target, initial, active)
+
+    np.testing.assert_allclose(lookup, newton, atol=1e-7)
+
+
+@pytest.mark.parametrize("kernel", ["scalar", "vectorized"])
+def test_lookup_tables_match_exact_kinematics(kernel) -> None:
+    results = {}
+    for lookup in ("off", "cubic"):
+        config = replace(
+            _BASE_CONFIG, kinematics_kernel=kernel, kinematics_lookup=lookup
+        )
+        structure, gas_network = build_default_system_and_network()
+        simulator = BatchSimulator(
+            pneumatic_system=RuntimePneumaticSystem(structure, gas_network),
+            gas_network=gas_network,
+            dt=0.002,
+            rigid_body=create_default_rigid_body(),
+            road_input=_SineRoad(),
+            lever_config=config,
+            thermo_mode=ThermoMode.ISOTHERMAL,
+        )
+        results[lookup] = simulator.run(steps=100)
+
+    np.testing.assert_allclose(
+        results["cubic"].lever_angles, results["off"].lever_angles, atol=1e-7
+    )
+
+
+@pytest.mark.parametrize("options", [{"method": "spline"}, {"tolerance": 0.0}])
+def test_invalid_table_options_are_rejected(options) -> None:
+    kernel = _make_kernel()
+    with pytest.raises(ValueError):
+        LeverKinematicsTable(kernel.displacement_and_derivative, (4,), **options)
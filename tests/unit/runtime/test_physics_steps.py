@@ -7,7 +7,7 @@ import pytest
 
 from src.common.units import PA_ATM, T_AMBIENT
 from src.physics.integrator import create_default_rigid_body
-from src.physics.odes import create_initial_conditions
+from src.physics.odes import RigidBodyStepper, create_initial_conditions
 from src.pneumo.cylinder import CylinderSpec, CylinderState
 from src.pneumo.enums import (
     CheckValveKind,
@@ -32,6 +32,7 @@ from src.runtime.steps import (
 )
 from src.runtime.steps.kinematics import integrate_lever_state
 from src.runtime.steps.context import LeverDynamicsConfig
+from src.runtime.steps.trace import StepTrace
 from src.runtime.sync import PerformanceMetrics
 
 
@@ -397,6 +398,55 @@ def test_integrate_body_advances_state(step_state: PhysicsStepState) -> None:
     assert step_state.latest_frame_accel.shape == (3,)
 
 
+def test_step_trace_covers_kinematics_and_body(
+    step_state: PhysicsStepState, caplog: pytest.LogCaptureFixture
+) -> None:
+    logger = logging.getLogger("physics-step-trace-test")
+    logger.setLevel(logging.DEBUG)
+    step_state.logger = logger
+    step_state.trace = StepTrace(logger, subsystems=["kinematics", "body"])
+    step_state.trace.begin_step(0)
+    road_inputs = {"LF": 0.01, "RF": -0.005, "LR": 0.0, "RR": 0.002}
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        compute_kinematics(step_state, road_inputs)
+        update_gas_state(step_state)
+        integrate_body(step_state)
+
+    messages = [
+        record.getMessage() for record in caplog.records if record.name == logger.name
+    ]
+    assert len(messages) == 2
+    assert messages[0].startswith("Lever kinematics")
+    assert messages[1].startswith("Rigid body")
+
+
+def test_integrate_body_with_fixed_step_stepper_matches_radau(
+    step_state: PhysicsStepState,
+) -> None:
+    road_inputs = {"LF": 0.01, "RF": -0.005, "LR": 0.0, "RR": 0.002}
+    step_state.prev_road_inputs = dict(step_state.last_road_inputs)
+    compute_kinematics(step_state, road_inputs)
+    update_gas_state(step_state)
+
+    initial_state = step_state.physics_state.copy()
+    integrate_body(step_state)
+    radau_state = step_state.physics_state.copy()
+
+    step_state.physics_state = initial_state
+    step_state.body_stepper = RigidBodyStepper(step_state.rigid_body, "rk4")
+    integrate_body(step_state)
+
+    np.testing.assert_allclose(step_state.physics_state, radau_state, atol=1e-7)
+    performance = step_state.performance
+    assert performance.integration_failures == 0
+    assert performance.integrator_method == "rk4"
+    assert performance.integration_steps == 2
+    summary = performance.get_summary()
+    assert summary["integrator"] == "rk4"
+    assert summary["avg_integration_time_ms"] > 0.0
+
+
 def test_free_oscillation_without_damping(step_state: PhysicsStepState) -> None:
     step_state.lever_config = replace(
         step_state.lever_config,
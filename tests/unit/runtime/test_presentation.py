@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.pneumo.enums import Line, Wheel
+from src.runtime.presentation import StateInterpolator
+from src.runtime.sim_loop import PhysicsWorker
+from src.runtime.state import StateSnapshot
+
+
+def _snapshot(sim_time: float, published_at: float, value: float) -> StateSnapshot:
+    snapshot = StateSnapshot(timestamp=published_at, simulation_time=sim_time)
+    snapshot.frame.heave = value
+    snapshot.wheels[Wheel.LP].lever_angle = value
+    snapshot.lines[Line.A1].pressure = 100_000.0 + value
+    snapshot.tank.pressure = 200_000.0 + value
+    return snapshot
+
+
+def test_interpolator_blends_two_latest_states_at_render_time() -> None:
+    interpolator = StateInterpolator()
+    first = _snapshot(0.0, published_at=10.0, value=0.0)
+    interpolator.push(first)
+    assert interpolator.sample(10.5) is first
+
+    second = _snapshot(0.1, published_at=10.1, value=1.0)
+    interpolator.push(second)
+    # Rendering trails one publish interval: the new state is reached 0.1 s later
+    assert interpolator.sample(10.1).frame.heave == pytest.approx(0.0)
+    halfway = interpolator.sample(10.15)
+    assert halfway.frame.heave == pytest.approx(0.5)
+    assert halfway.wheels[Wheel.LP].lever_angle == pytest.approx(0.5)
+    assert halfway.lines[Line.A1].pressure == pytest.approx(100_000.5)
+    assert halfway.tank.pressure == pytest.approx(200_000.5)
+    assert halfway.simulation_time == pytest.approx(0.05)
+    assert second.frame.heave == 1.0  # published snapshots are never mutated
+    assert interpolator.sample(10.5) is second
+
+
+def test_interpolator_spans_the_wall_clock_publish_interval() -> None:
+    interpolator = StateInterpolator()
+    # Half-speed simulation: 0.1 s of physics published 0.2 s apart
+    interpolator.push(_snapshot(0.0, published_at=10.0, value=0.0))
+    interpolator.push(_snapshot(0.1, published_at=10.2, value=1.0))
+
+    assert interpolator.alpha(10.3) == pytest.approx(0.5)
+    assert interpolator.sample(10.3).frame.heave == pytest.approx(0.5)
+    assert interpolator.alpha(10.4) == pytest.approx(1.0)
+
+
+def test_interpolator_drops_history_on_reset_and_keeps_repeated_states() -> None:
+    interpolator = StateInterpolator()
+    interpolator.push(_snapshot(1.0, published_at=1.0, value=1.0))
+    interpolator.push(_snapshot(1.1, published_at=1.1, value=2.0))
+
+    repeated = _snapshot(1.1, published_at=2.0, value=2.0)
+    interpolator.push(repeated)
+    assert interpolator.alpha(1.15) == pytest.approx(0.0)
+
+    reset = _snapshot(0.0, published_at=3.0, value=0.0)
+    interpolator.push(reset)
+    assert interpolator.sample(3.0) is reset
+
+
+@pytest.mark.usefixtures("qapp")
+def test_worker_publishes_at_configured_rate_and_on_demand(qtbot, monkeypatch) -> None:
+    # Persisted physics settings are irrelevant: stepping is stubbed below
+    monkeypatch.setattr(
+        PhysicsWorker,
+        "_load_initial_settings",
+        lambda self: setattr(self, "dt_physics", 1e-3),
+    )
+    worker = PhysicsWorker()
+    qtbot.addCleanup(worker.deleteLater)
+    worker.dt_physics = 0.001
+    worker.set_state_publish_rate(50.0)
+    worker.is_running = True
+    worker.timing_accumulator.update = lambda: 1  # type: ignore[assignment]
+
+    def _step() -> None:
+        worker.simulation_time += worker.dt_physics
+        worker.step_counter += 1
+
+    worker._execute_physics_step = _step  # type: ignore[assignment]
+    worker._create_state_snapshot = lambda: SimpleNamespace(  # type: ignore[assignment]
+        simulation_time=worker.simulation_time, validate=lambda: True
+    )
+    published: list[float] = []
+    worker.state_ready.connect(
+        lambda snapshot: published.append(snapshot.simulation_time)
+    )
+
+    for _ in range(100):
+        worker._physics_step()
+    assert published == pytest.approx([0.001, 0.021, 0.041, 0.061, 0.081])
+
+    worker.request_state()
+    worker._physics_step()
+    assert published[-1] == pytest.approx(0.101)
+
+    worker.is_running = False
+    worker.is_configured = True
+    worker.request_state()
+    assert len(published) == 7
+
+    worker.set_state_publish_rate(None)
+    assert worker.state_publish_hz is None
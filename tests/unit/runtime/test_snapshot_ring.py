@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.pneumo.enums import Line, ThermoMode, Wheel
+from src.runtime.sim_loop import PhysicsWorker, SimulationManager
+from src.runtime.snapshot_ring import (
+    SNAPSHOT_DTYPE,
+    SnapshotRing,
+    snapshot_from_record,
+)
+from src.runtime.state import StateSnapshot
+
+
+def _snapshot(step: int) -> StateSnapshot:
+    snapshot = StateSnapshot(
+        simulation_time=step * 1e-3,
+        step_number=step,
+        thermo_mode=ThermoMode.ADIABATIC,
+        master_isolation_open=True,
+    )
+    snapshot.frame.heave = 0.01 * step
+    snapshot.wheels[Wheel.PZ].lever_angle = -0.002 * step
+    snapshot.wheels[Wheel.PZ].lever_angle_max = 0.3
+    snapshot.wheels[Wheel.LP].stop_rod_engaged = True
+    snapshot.lines[Line.B2].pressure = 2.0e5 + step
+    snapshot.tank.volume_min = 1e-3
+    snapshot.aggregates.integration_steps = step
+    return snapshot
+
+
+def test_record_round_trip_preserves_snapshot() -> None:
+    ring = SnapshotRing(4)
+    snapshot = _snapshot(7)
+
+    assert ring.latest() is None
+    assert ring.write(snapshot) == 1
+
+    restored = snapshot_from_record(ring.latest())
+    assert restored.frame == snapshot.frame
+    assert restored.wheels == snapshot.wheels
+    assert restored.lines == snapshot.lines
+    assert restored.tank == snapshot.tank
+    assert restored.tank.pressure_max is None
+    assert restored.aggregates == snapshot.aggregates
+    assert restored.timestamp == snapshot.timestamp
+    assert restored.thermo_mode == "ADIABATIC"
+    assert restored.master_isolation_open is True
+
+
+def test_readers_get_views_of_published_records() -> None:
+    ring = SnapshotRing(4)
+    ring.write(_snapshot(1))
+
+    latest = ring.latest()
+    ring.records[0]["step_number"] = 99
+    assert latest["step_number"] == 99
+
+    (window,) = ring.since(0)
+    assert np.shares_memory(window, ring.records)
+    assert window["seq"].tolist() == [1]
+
+
+def test_since_returns_wrapped_range_in_order() -> None:
+    ring = SnapshotRing(5)
+    for step in range(1, 12):
+        ring.write(_snapshot(step))
+
+    views = ring.since(7)
+    assert len(views) == 2
+    assert np.concatenate(views)["step_number"].tolist() == [8, 9, 10, 11]
+
+    # Only capacity - 1 records are handed out; the next write reuses the oldest
+    assert np.concatenate(ring.since(0))["seq"].tolist() == [8, 9, 10, 11]
+    assert ring.since(11) == ()
+    assert ring.overwritten(7)
+    assert not ring.overwritten(8)
+
+
+def test_copy_latest_detaches_from_ring() -> None:
+    ring = SnapshotRing(2)
+    ring.write(_snapshot(1))
+
+    copy = ring.copy_latest()
+    ring.write(_snapshot(2))
+    ring.write(_snapshot(3))
+
+    assert copy.dtype == SNAPSHOT_DTYPE
+    assert copy["step_number"][0] == 1
+    assert ring.copy_latest(out=copy) is copy
+    assert copy["step_number"][0] == 3
+
+
+def test_shared_ring_is_visible_to_attached_reader() -> None:
+    ring = SnapshotRing(8, shared=True)
+    try:
+        reader = SnapshotRing.attach(ring.name)
+        try:
+            assert reader.capacity == 8
+            ring.write(_snapshot(5))
+            assert reader.head == 1
+            assert reader.latest()["frame"]["heave"] == pytest.approx(0.05)
+        finally:
+            reader.close()
+    finally:
+        ring.close()
+
+
+def test_invalid_capacity_is_rejected() -> None:
+    with pytest.raises(ValueError, match="capacity"):
+        SnapshotRing(0)
+
+
+@pytest.mark.usefixtures("qapp")
+def test_simulation_manager_ring_is_opt_in(qtbot, monkeypatch) -> None:
+    monkeypatch.setattr(
+        PhysicsWorker,
+        "_load_initial_settings",
+        lambda self: setattr(self, "dt_physics", 1e-3),
+    )
+    manager = SimulationManager()
+    qtbot.addCleanup(manager.deleteLater)
+    assert manager.snapshot_ring is None
+    assert manager.physics_worker.snapshot_ring is None
+
+    ring = manager.enable_snapshot_ring(8)
+    assert manager.physics_worker.snapshot_ring is ring
+    assert manager.enable_snapshot_ring() is ring
+    assert ring.capacity == 8
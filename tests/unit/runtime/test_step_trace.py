@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from src.runtime.steps.trace import TRACE_SUBSYSTEMS, StepTrace, step_logger
+
+
+@pytest.fixture
+def trace_logger() -> logging.Logger:
+    logger = logging.getLogger("tests.runtime.step_trace")
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_filtered_debug_level_mutes_every_subsystem(trace_logger) -> None:
+    trace_logger.setLevel(logging.INFO)
+    trace = StepTrace(trace_logger)
+
+    assert trace.begin_step(0) is False
+    assert all(trace.logger_for(name) is None for name in TRACE_SUBSYSTEMS)
+
+
+def test_sampling_traces_one_step_in_n(trace_logger) -> None:
+    trace = StepTrace(trace_logger, sample_every=4)
+
+    traced = [step for step in range(10) if trace.begin_step(step)]
+
+    assert traced == [0, 4, 8]
+    trace.begin_step(9)
+    assert trace.logger_for("gas") is None
+
+
+def test_subsystem_toggles_select_loggers(trace_logger) -> None:
+    trace = StepTrace(trace_logger, subsystems=["Gas"])
+    trace.begin_step(0)
+
+    assert trace.logger_for("gas") is trace_logger
+    assert trace.logger_for("pneumatics") is None
+
+    trace.configure(subsystems=())
+    assert trace.begin_step(0) is False
+
+
+def test_step_logger_prefers_attached_trace(trace_logger) -> None:
+    state = SimpleNamespace(logger=trace_logger, trace=None)
+    assert step_logger(state, "gas") is trace_logger
+
+    state.trace = StepTrace(trace_logger, sample_every=2)
+    state.trace.begin_step(1)
+    assert step_logger(state, "gas") is None
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"sample_every": 0}, {"subsystems": ["gas", "solver"]}],
+)
+def test_invalid_configuration_is_rejected(trace_logger, options) -> None:
+    with pytest.raises(ValueError):
+        StepTrace(trace_logger, **options)
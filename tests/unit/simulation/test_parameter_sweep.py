@@ -0,0 +1,201 @@
+"""Parameter sweep expansion, execution and persistence."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.cli import sweep as sweep_cli
+from src.common import settings_manager as settings_module
+from src.simulation.sweep import (
+    METRIC_NAMES,
+    SweepBaseline,
+    build_simulator,
+    expand_grid,
+    latin_hypercube,
+    run_sweep,
+    write_results,
+)
+from tests.helpers.pneumo_network import build_default_system_and_network
+
+
+@pytest.fixture
+def baseline() -> SweepBaseline:
+    return SweepBaseline(
+        duration=0.04,
+        dt=2e-3,
+        road_preset="test_sine",
+        system_factory=build_default_system_and_network,
+    )
+
+
+def test_expand_grid_is_full_factorial() -> None:
+    cases = expand_grid(
+        {"receiver_volume": [0.002, 0.003, 0.004], "thermo_mode": ["ISOTHERMAL"]}
+    )
+
+    assert len(cases) == 3
+    assert cases[0] == {"receiver_volume": 0.002, "thermo_mode": "ISOTHERMAL"}
+
+
+def test_unknown_parameter_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unsupported sweep parameter"):
+        expand_grid({"not_a_parameter": [1.0]})
+
+
+def test_latin_hypercube_uses_every_stratum_once() -> None:
+    cases = latin_hypercube(
+        {"spring_constant": (10_000.0, 90_000.0), "receiver_volume": (0.002, 0.004)},
+        8,
+        seed=3,
+    )
+
+    springs = np.array([case["spring_constant"] for case in cases])
+    strata = np.floor((springs - 10_000.0) / 10_000.0).astype(int)
+    assert sorted(strata.tolist()) == list(range(8))
+    assert cases == latin_hypercube(
+        {"spring_constant": (10_000.0, 90_000.0), "receiver_volume": (0.002, 0.004)},
+        8,
+        seed=3,
+    )
+
+
+def test_default_factory_builds_system_from_application_settings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings_path = tmp_path / "app_settings.json"
+    payload = json.loads(
+        Path("config/baseline/app_settings.json").read_text(encoding="utf-8")
+    )
+    payload["current"]["geometry"]["wheel_mass"] = 40.0
+    payload["current"]["modes"]["physics"].update(
+        spring_constant=42_000.0,
+        lever_inertia_multiplier=2.0,
+        kinematics_kernel="scalar",
+        body_integrator="implicit_midpoint",
+    )
+    settings_path.write_text(json.dumps(payload), encoding="utf-8")
+    settings = settings_module.SettingsManager(settings_path)
+    monkeypatch.setattr(settings_module, "_settings_manager", settings)
+
+    default = SweepBaseline(duration=0.02, dt=2e-3)
+    simulator = build_simulator({}, default)
+    gas_network = simulator.gas_network
+
+    assert gas_network.tank.V == pytest.approx(
+        settings.get("pneumatic.receiver_volume")
+    )
+    assert gas_network.relief_min_threshold == pytest.approx(
+        settings.get("pneumatic.relief_min_pressure")
+    )
+    assert gas_network.leak_coefficient == pytest.approx(
+        settings.get("pneumatic.leak_coefficient")
+    )
+    assert gas_network.master_equalization_diameter == pytest.approx(
+        settings.get("pneumatic.diagonal_coupling_dia")
+    )
+    assert simulator.body_integrator == "implicit_midpoint"
+
+    lever_config = simulator.state.lever_config
+    assert lever_config.spring_constant == pytest.approx(42_000.0)
+    assert lever_config.damper_coefficient == pytest.approx(
+        settings.get("modes.physics.damper_coefficient")
+    )
+    assert lever_config.damper_threshold == pytest.approx(
+        settings.get("modes.physics.damper_force_threshold_n")
+    )
+    assert lever_config.lever_inertia == pytest.approx(
+        40.0 * settings.get("geometry.lever_length") ** 2 * 2.0
+    )
+    assert lever_config.kinematics_kernel == "scalar"
+    assert lever_config.kinematics_lookup == "off"
+
+    with_dead_zone = build_simulator(
+        {}, replace(default, dead_zone_head_m3=1e-5, dead_zone_rod_m3=1e-5)
+    )
+    assert with_dead_zone.pneumatic_system._dead_zone_head_fraction > 0.0
+
+    columns = run_sweep(expand_grid({"receiver_volume": [0.002, 0.003]}), default)
+    assert columns["status"].tolist() == ["ok", "ok"]
+
+
+def test_run_sweep_returns_one_row_per_case(baseline: SweepBaseline) -> None:
+    cases = expand_grid(
+        {"receiver_volume": [0.002, 0.004], "thermo_mode": ["ISOTHERMAL", "ADIABATIC"]}
+    )
+
+    columns = run_sweep(cases, baseline, workers=1)
+
+    assert columns["case"].tolist() == [0, 1, 2, 3]
+    assert columns["status"].tolist() == ["ok"] * 4
+    assert columns["receiver_volume"].tolist() == [0.002, 0.002, 0.004, 0.004]
+    for name in METRIC_NAMES:
+        assert columns[name].shape == (4,)
+    assert np.all(columns["peak_line_pressure"] > 0.0)
+    assert np.all(columns["relief_mass"] >= 0.0)
+
+
+def test_process_pool_matches_inline_execution(baseline: SweepBaseline) -> None:
+    cases = expand_grid({"spring_constant": [20_000.0, 60_000.0]})
+
+    inline = run_sweep(cases, baseline, workers=1)
+    pooled = run_sweep(cases, baseline, workers=2)
+
+    for name in ("peak_line_pressure", "rms_heave", "rms_roll", "rms_pitch"):
+        np.testing.assert_array_equal(inline[name], pooled[name])
+
+
+def test_failing_case_is_reported_without_aborting(baseline: SweepBaseline) -> None:
+    columns = run_sweep(
+        [{"thermo_mode": "ISOTHERMAL"}, {"thermo_mode": "BOGUS"}],
+        baseline,
+        workers=1,
+    )
+
+    assert columns["status"].tolist() == ["ok", "error"]
+    assert "thermo_mode" in columns["error"][1]
+    assert np.isnan(columns["rms_heave"][1])
+
+
+def test_baseline_body_integrator_reaches_the_simulator(
+    baseline: SweepBaseline,
+) -> None:
+    simulator = build_simulator(
+        {}, replace(baseline, body_integrator="semi_implicit_euler")
+    )
+
+    assert simulator.body_integrator == "semi_implicit_euler"
+    assert simulator.state.body_stepper is not None
+    assert simulator.state.body_stepper.scheme == "semi_implicit_euler"
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".csv"])
+def test_write_results_round_trip(tmp_path: Path, suffix: str) -> None:
+    columns = {
+        "case": np.arange(2),
+        "receiver_volume": np.array([0.002, 0.004]),
+        "status": np.array(["ok", "ok"]),
+    }
+
+    target = write_results(columns, tmp_path / f"results{suffix}")
+
+    if suffix == ".npz":
+        with np.load(target) as stored:
+            np.testing.assert_array_equal(stored["receiver_volume"], [0.002, 0.004])
+    else:
+        lines = target.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "case,receiver_volume,status"
+        assert len(lines) == 3
+
+
+def test_cli_rejects_mixed_designs(capsys) -> None:
+    exit_code = sweep_cli.run(
+        ["--grid", "receiver_volume=0.002,0.003", "--lhs", "spring_constant=1:2"]
+    )
+
+    assert exit_code == 1
+    assert "either --grid or --lhs" in capsys.readouterr().out
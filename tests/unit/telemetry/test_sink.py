@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import gzip
+import json
+import time
+from pathlib import Path
+
+from src.telemetry import TelemetrySink
+from tools.telemetry_exporter import load_events
+
+
+def _record(index: int) -> str:
+    return json.dumps(
+        {
+            "schema_version": "telemetry_event_v1",
+            "channel": "user",
+            "event": f"event_{index}",
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "payload": {"index": index},
+        }
+    )
+
+
+def test_sink_batches_records_and_keeps_handles_open(tmp_path: Path) -> None:
+    sink = TelemetrySink(tmp_path, flush_interval=0.05)
+    for index in range(50):
+        assert sink.submit("user_actions.jsonl", _record(index))
+    assert sink.flush(timeout=5.0)
+
+    lines = (tmp_path / "user_actions.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["event"] for line in lines] == [
+        f"event_{index}" for index in range(50)
+    ]
+    assert sink.stats.written == 50
+    assert sink.stats.batches < 50
+    sink.close(timeout=5.0)
+
+
+def test_sink_collects_a_steady_stream_for_the_full_interval(tmp_path: Path) -> None:
+    sink = TelemetrySink(tmp_path, flush_interval=0.1)
+    started = time.monotonic()
+    for index in range(200):  # ~500 Hz for ~0.4 s
+        sink.submit("user_actions.jsonl", _record(index))
+        time.sleep(0.002)
+    elapsed = time.monotonic() - started
+    assert sink.flush(timeout=5.0)
+
+    assert sink.stats.written == 200
+    # One batch per interval (plus the final flush), not one per record
+    assert sink.stats.batches <= elapsed / 0.1 + 2
+    sink.close(timeout=5.0)
+
+
+def test_sink_writes_full_batches_without_waiting(tmp_path: Path) -> None:
+    sink = TelemetrySink(tmp_path, flush_interval=60.0, batch_size=10)
+    for index in range(10):
+        sink.submit("user_actions.jsonl", _record(index))
+    deadline = time.monotonic() + 5.0
+    while sink.stats.written < 10 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Written long before the 60 s interval, without an explicit flush
+    assert sink.stats.written == 10
+    assert sink.stats.batches == 1
+    sink.close(timeout=5.0)
+
+
+def test_sink_drops_when_queue_is_full_or_closed(tmp_path: Path) -> None:
+    sink = TelemetrySink(tmp_path, max_queue=3, flush_interval=0.0)
+    with sink._condition:  # hold the writer off while filling the queue
+        accepted = [sink.submit("events.jsonl", _record(i)) for i in range(5)]
+    assert accepted == [True, True, True, False, False]
+    assert sink.stats.dropped == 2
+
+    sink.close(timeout=5.0)
+    assert not sink.submit("events.jsonl", _record(99))
+    assert sink.stats.dropped == 3
+    assert sink.stats.written == 3
+
+
+def test_sink_rotates_and_compresses_segments(tmp_path: Path) -> None:
+    line = _record(0)
+    sink = TelemetrySink(
+        tmp_path, flush_interval=0.0, max_bytes=len(line) * 2 + 2, compress=True
+    )
+    for index in range(6):
+        sink.submit("user_actions.jsonl", _record(index))
+        sink.flush(timeout=5.0)
+    sink.close(timeout=5.0)
+
+    segments = sorted(tmp_path.glob("user_actions.*.jsonl.gz"))
+    assert sink.stats.rotations == len(segments) >= 2
+    with gzip.open(segments[0], "rt", encoding="utf-8") as handle:
+        assert json.loads(handle.readline())["event"] == "event_0"
+
+    bundle = load_events(tmp_path)
+    assert sorted(event.record.event for event in bundle.events) == [
+        f"event_{index}" for index in range(6)
+    ]
@@ -20,6 +20,7 @@ def test_user_action_routed_to_jsonl(tmp_path) -> None:
         context={"source": "toolbar"},
     )
     assert target.name == "user_actions.jsonl"
+    assert tracker.flush(timeout=5.0)
     payload = _read_last_payload(target)
     assert payload["event"] == "open_panel"
     assert payload["channel"] == "user"
@@ -33,6 +34,7 @@ def test_simulation_event_routed_to_jsonl(tmp_path) -> None:
         "step_completed", metadata={"step": 42}, context={"dt": 0.01}
     )
     assert target.name == "simulation_events.jsonl"
+    assert tracker.flush(timeout=5.0)
     payload = _read_last_payload(target)
     assert payload["event"] == "step_completed"
     assert payload["channel"] == "simulation"
@@ -0,0 +1,183 @@
+"""Full/delta QML snapshot frames and their use in QMLBridge."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.pneumo.enums import Line, Wheel
+from src.runtime.state import StateSnapshot
+from src.ui.qml_bridge import QMLBridge
+from src.ui.qml_snapshot_encoder import SnapshotEncoder
+
+
+def _snapshot() -> StateSnapshot:
+    snapshot = StateSnapshot()
+    snapshot.simulation_time = 0.0
+    snapshot.timestamp = 0.0
+    snapshot.frame.heave = 0.01
+    snapshot.wheels[Wheel.LP].lever_angle = 0.05
+    snapshot.lines[Line.A1].pressure = 120_000.0
+    snapshot.lines[Line.A1].flow_atmo = 0.06
+    snapshot.lines[Line.B1].pressure = 118_000.0
+    snapshot.lines[Line.B1].flow_tank = 0.04
+    snapshot.tank.pressure = 130_000.0
+    snapshot.tank.flow_min = 0.05
+    return snapshot
+
+
+class RecordingRoot:
+    def __init__(self) -> None:
+        self.pushed: list[dict] = []
+        self.fail = False
+
+    def setProperty(self, name: str, value: object) -> None:  # noqa: N802 - Qt style
+        if self.fail:
+            raise RuntimeError("rejected")
+        assert name == "pendingPythonUpdates"
+        self.pushed.append(value)
+
+
+def test_full_payload_publishes_shared_values_under_every_path() -> None:
+    payload = SnapshotEncoder.full_payload(_snapshot(), is_running=True)
+
+    animation = payload["animation"]
+    three_d = payload["threeD"]
+    assert animation["isRunning"] is True
+    assert animation["leverAngles"]["fl"] == three_d["wheels"]["fl"]["leverAngle"]
+    assert animation["linePressures"]["a1"] == 120_000.0
+    assert three_d["flowNetwork"]["lines"]["a1"]["pressure"] == 120_000.0
+    assert three_d["receiver"] == three_d["flowNetwork"]["receiver"]
+    assert three_d["valves"]["relief"] == three_d["flowNetwork"]["relief"]
+    assert three_d["lines"]["b1"]["animationSpeed"] == pytest.approx(0.04 / 0.06)
+    assert three_d["flowNetwork"]["maxReliefIntensity"] == pytest.approx(0.05)
+    # Lines without flow still carry a speed so deltas never leave stale values
+    assert three_d["lines"]["a2"]["animationSpeed"] == 0.0
+    assert set(three_d["wheels"]) == {"fl", "fr", "rl", "rr"}
+
+
+def test_delta_frames_carry_only_changes_beyond_quantum() -> None:
+    encoder = SnapshotEncoder(keyframe_interval=0)
+    first = encoder.encode(_snapshot())
+    assert first.full
+    encoder.acknowledge(first)
+
+    assert not encoder.encode(_snapshot())
+
+    snapshot = _snapshot()
+    snapshot.lines[Line.A1].pressure += 0.1  # below the pressure quantum
+    snapshot.wheels[Wheel.LP].lever_angle = 0.06
+    delta = encoder.encode(snapshot)
+    assert not delta.full
+    assert delta.payload == {
+        "animation": {"leverAngles": {"fl": 0.06}},
+        "threeD": {"wheels": {"fl": {"leverAngle": 0.06}}},
+    }
+    encoder.acknowledge(delta)
+
+    # Unsent drift accumulates against the acknowledged baseline
+    snapshot.lines[Line.A1].pressure += 0.5
+    drifted = encoder.encode(snapshot)
+    assert drifted.payload["animation"]["linePressures"] == {"a1": 120_000.6}
+    assert drifted.payload["threeD"]["receiver"]["pressures"] == {"a1": 120_000.6}
+
+
+def test_keyframe_interval_and_reset_force_full_frames() -> None:
+    encoder = SnapshotEncoder(keyframe_interval=2)
+    encoder.acknowledge(encoder.encode(_snapshot()))
+    encoder.acknowledge(encoder.encode(_snapshot()))
+    encoder.acknowledge(encoder.encode(_snapshot()))
+    assert encoder.encode(_snapshot()).full
+
+    encoder = SnapshotEncoder()
+    encoder.acknowledge(encoder.encode(_snapshot()))
+    encoder.reset()
+    assert not encoder.synchronised
+    assert encoder.encode(_snapshot()).full
+
+
+def test_bridge_pushes_deltas_and_resyncs_after_failure_or_new_root() -> None:
+    root = RecordingRoot()
+    window = SimpleNamespace(
+        _qml_root_object=root,
+        is_simulation_running=True,
+        _suppress_qml_failure_dialog=True,
+        status_bar=None,
+        event_logger=None,
+    )
+
+    assert QMLBridge.set_simulation_state(window, _snapshot())
+    assert QMLBridge.set_simulation_state(window, _snapshot())
+    assert len(root.pushed) == 1  # nothing changed, nothing pushed
+    assert "flowNetwork" in root.pushed[0]["threeD"]
+
+    moved = _snapshot()
+    moved.simulation_time = 0.5
+    assert QMLBridge.set_simulation_state(window, moved)
+    assert root.pushed[-1] == {
+        "animation": {"simulationTime": 0.5},
+        "threeD": {"flowNetwork": {"timestamp": 0.5}},
+    }
+
+    moved.simulation_time = 1.0
+    root.fail = True
+    assert not QMLBridge.set_simulation_state(window, moved)
+    root.fail = False
+    assert QMLBridge.set_simulation_state(window, moved)
+    assert "wheels" in root.pushed[-1]["threeD"]
+
+    window._qml_root_object = replacement = RecordingRoot()
+    assert QMLBridge.set_simulation_state(window, moved)
+    assert "wheels" in replacement.pushed[0]["threeD"]
+
+
+def test_missing_wheel_keeps_following_fields_aligned() -> None:
+    snapshot = _snapshot()
+    del snapshot.wheels[Wheel.LP]
+    snapshot.wheels[Wheel.PP].lever_angle = 0.07
+    snapshot.master_isolation_open = True
+
+    payload = SnapshotEncoder.full_payload(snapshot, is_running=True)
+
+    animation = payload["animation"]
+    three_d = payload["threeD"]
+    assert animation["isRunning"] is True
+    assert three_d["wheels"]["fl"] == {
+        "leverAngle": 0.0,
+        "pistonPosition": 0.0,
+        "pistonVelocity": 0.0,
+        "joint": {"x": 0.0, "y": 0.0, "z": 0.0},
+        "forces": {"pneumatic": 0.0, "spring": 0.0, "damper": 0.0},
+    }
+    assert three_d["wheels"]["fr"]["leverAngle"] == 0.07
+    assert animation["leverAngles"] == {"fl": 0.0, "fr": 0.07, "rl": 0.0, "rr": 0.0}
+    assert animation["linePressures"]["a1"] == 120_000.0
+    assert animation["linePressures"]["b1"] == 118_000.0
+    assert three_d["lines"]["a1"]["flows"]["fromAtmosphere"] == 0.06
+    assert three_d["lines"]["b1"]["direction"] == "exhaust"
+    assert three_d["lines"]["a2"]["valves"] == {
+        "atmosphereOpen": False,
+        "tankOpen": False,
+    }
+    assert animation["tankPressure"] == 130_000.0
+    assert three_d["tank"]["pressure"] == 130_000.0
+    assert three_d["tank"]["flows"]["min"] == 0.05
+    assert three_d["valves"]["masterIsolationOpen"] is True
+    assert three_d["flowNetwork"]["maxReliefIntensity"] == pytest.approx(0.05)
+
+
+def test_batch_path_passes_qml_ready_simulation_payload_through() -> None:
+    root = RecordingRoot()
+    window = SimpleNamespace(_qml_update_queue={}, _qml_root_object=root)
+    simulation = {"levers": {"fl": 0.05}, "frame": {"heaveRate": 0.0}}
+
+    QMLBridge.queue_update(window, "simulation", simulation)
+    QMLBridge.queue_update(window, "lighting", {"key_light": {"cast_shadow": True}})
+    QMLBridge.flush_updates(window)
+
+    pushed = root.pushed[-1]
+    # No deepcopy and no sanitise walk for the per-frame category
+    assert pushed["simulation"]["levers"] is simulation["levers"]
+    assert pushed["lighting"]["keyLight"]["castShadow"] is True
+    assert window._pending_batch_ack["payload"]["simulation"] is pushed["simulation"]
@@ -0,0 +1,79 @@
+"""Copy-on-write settings trees, snapshots and read-only views."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.common.settings_manager import SettingsManager, SettingsSnapshot
+
+
+@pytest.fixture()
+def manager(tmp_path: Path) -> SettingsManager:
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text(
+        json.dumps(
+            {
+                "metadata": {},
+                "current": {
+                    "simulation": {"physics_dt": 0.001},
+                    "road": {"profiles": [{"name": "flat"}]},
+                },
+                "defaults_snapshot": {"simulation": {"physics_dt": 0.001}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    return SettingsManager(settings_file=settings_file)
+
+
+def test_set_keeps_earlier_snapshots_and_shares_untouched_sections(
+    manager: SettingsManager,
+) -> None:
+    before = manager.snapshot()
+    manager.set("current.simulation.physics_dt", 0.002, auto_save=False)
+    after = manager.snapshot()
+
+    assert isinstance(before, SettingsSnapshot)
+    assert before.get("current.simulation.physics_dt") == 0.001
+    assert after.get("current.simulation.physics_dt") == 0.002
+    # Only the dictionaries along the changed path were copied
+    assert before._sections[1]["road"] is after._sections[1]["road"]
+    assert before._sections[2] is after._sections[2]
+
+    manager.restore(before, auto_save=False)
+    assert manager.get("current.simulation.physics_dt") == 0.001
+    assert manager.is_dirty
+
+
+def test_get_view_is_read_only_and_get_still_detaches(
+    manager: SettingsManager,
+) -> None:
+    view = manager.get_view("current.road")
+    assert view["profiles"][0]["name"] == "flat"
+    assert view["profiles"] == [{"name": "flat"}]
+    with pytest.raises(TypeError):
+        view["profiles"] = []  # type: ignore[index]
+    with pytest.raises(TypeError):
+        view["profiles"][0]["name"] = "bumpy"  # type: ignore[index]
+
+    detached = manager.get("current.road")
+    detached["profiles"].append({"name": "bumpy"})
+    assert len(manager.get_view("current.road.profiles")) == 1
+    assert view.to_dict() == {"profiles": [{"name": "flat"}]}
+    assert manager.get_view("current.missing", "fallback") == "fallback"
+
+
+def test_category_helpers_do_not_mutate_published_versions(
+    manager: SettingsManager,
+) -> None:
+    before = manager.snapshot()
+    manager.set_category("simulation", {"physics_dt": 0.005}, auto_save=False)
+    manager.reset_to_defaults(category="simulation", auto_save=False)
+    manager.save_current_as_defaults(auto_save=False)
+
+    assert before.get("current.simulation.physics_dt") == 0.001
+    assert manager.get("current.simulation.physics_dt") == 0.001
+    assert manager.get("defaults_snapshot.road.profiles") == [{"name": "flat"}]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.ui.main_window_pkg.render_scheduler import RenderScheduler
+from src.ui.qml_bridge import QMLBridge
+
+
+@pytest.mark.usefixtures("qapp")
+def test_scheduler_ticks_on_demand_and_idles_without_activity() -> None:
+    ticks: list[int] = []
+    animating = {"value": False}
+    scheduler = RenderScheduler(lambda: ticks.append(1))
+    scheduler.add_activity(lambda: animating["value"])
+    assert not scheduler.is_active()
+
+    scheduler.request_frame()
+    assert scheduler.is_active()
+    scheduler._on_timeout()
+    assert len(ticks) == 1
+    assert not scheduler.is_active()  # nothing left to draw → zero ticks
+
+    animating["value"] = True
+    scheduler.request_frame()
+    scheduler._on_timeout()
+    scheduler._on_timeout()
+    assert scheduler.is_active()
+    animating["value"] = False
+    scheduler._on_timeout()
+    assert not scheduler.is_active()
+    assert scheduler.tick_count == 4
+
+    # Pending QML batches wake the loop
+    window = SimpleNamespace(_qml_update_queue={}, render_scheduler=scheduler)
+    QMLBridge.queue_update(window, "camera", {"distance": 4.0})
+    assert scheduler.is_active()
+    scheduler.stop()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_scheduler_adapts_target_rate_to_frame_cost() -> None:
+    scheduler = RenderScheduler(lambda: None)
+    assert scheduler.target_hz == 60.0
+
+    for _ in range(5):
+        scheduler._adapt(0.001)
+    assert scheduler.target_hz == 120.0
+
+    for _ in range(30):
+        scheduler._adapt(0.012)
+    assert scheduler.target_hz == 30.0
+    assert scheduler.frame_cost == pytest.approx(0.012, rel=0.05)
+
+    capped = RenderScheduler(lambda: None, max_hz=60.0)
+    for _ in range(5):
+        capped._adapt(0.0001)
+    assert capped.target_hz == 60.0
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import importlib.util
 import json
 import sys
@@ -76,7 +77,11 @@ class TelemetryBundle:
 
 
 def _read_jsonl(path: Path) -> Iterable[str]:
-    with path.open("r", encoding="utf-8") as handle:
+    if path.suffix == ".gz":
+        opener = gzip.open(path, "rt", encoding="utf-8")
+    else:
+        opener = path.open("r", encoding="utf-8")
+    with opener as handle:
         for line in handle:
             stripped = line.strip()
             if stripped:
@@ -93,7 +98,9 @@ def load_events(source: Path, *, strict: bool = False) -> TelemetryBundle:
             "telemetry schema helpers are unavailable; ensure src/telemetry is on PYTHONPATH"
         )
 
-    for file_path in sorted(source.glob("*.jsonl")):
+    # Rotated segments may be gzip compressed by the telemetry sink
+    files = [*source.glob("*.jsonl"), *source.glob("*.jsonl.gz")]
+    for file_path in sorted(files):
         count = 0
         for index, raw_line in enumerate(_read_jsonl(file_path), start=1):
             try: